@@ -505,15 +505,17 @@ class InternalApiClient:
         self,
         tool_id: str,
         query: str,
-        top_k: int = 5
+        top_k: int = 5,
+        offset: int = 0
     ) -> Dict[str, Any]:
         """
-        调用 Search Tool 执行语义向量检索
+        调用 Search Tool 执行混合检索（向量 + 关键词）
         
         Args:
             tool_id: Tool ID
             query: 搜索查询
             top_k: 返回结果数量
+            offset: 跳过的结果数量（分页）
             
         Returns:
             搜索结果
@@ -522,7 +524,8 @@ class InternalApiClient:
             url = f"{self.base_url}/internal/tools/{tool_id}/search"
             payload = {
                 "query": query,
-                "top_k": top_k
+                "top_k": top_k,
+                "offset": offset
             }
             response = await self._client.post(url, json=payload)
             response.raise_for_status()
@@ -196,6 +196,7 @@ def _build_agent_tools_list(config: dict[str, Any]) -> list[mcp_types.Tool]:
                         "properties": {
                             "query": {"type": "string", "description": "Search query"},
                             "top_k": {"type": "integer", "description": "Number of results to return", "default": 5},
+                            "offset": {"type": "integer", "description": "Number of ranked results to skip (pagination)", "default": 0},
                         },
                         "required": ["query"],
                         "additionalProperties": False,
@@ -526,7 +527,8 @@ def build_starlette_app(*, json_response: bool = True) -> Starlette:
                     if tool_type == "search":
                         query = arguments.get("query", "")
                         top_k = arguments.get("top_k", 5)
-                        result = await rpc_client.search_tool_query(tool_id, query, top_k)
+                        offset = arguments.get("offset", 0)
+                        result = await rpc_client.search_tool_query(tool_id, query, top_k, offset)
                     else:
                         return [mcp_types.TextContent(type="text", text=f"Error: unsupported custom tool type: {tool_type}")]
 
@@ -0,0 +1,108 @@
+"""Recall / latency benchmark for the local vector store.
+
+Loads clustered random vectors (a rough stand-in for real embeddings;
+``--clusters 0`` for isotropic noise, the worst case for IVF) into a
+temporary ``LocalVectorStore`` namespace, then compares IVF search against exact (brute-force) search: recall@k over
+a set of queries and p50 / p95 latency for both.
+
+Use it to pick ``LOCAL_VECTOR_STORE_IVF_MIN_ROWS`` / ``_NPROBE`` for a
+deployment's namespace sizes.
+
+Run
+---
+    cd backend
+    python scripts/benchmark_local_vector_store.py --rows 100000 --dim 1536 --nprobe 16
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.infra.turbopuffer.local_store import LocalVectorStore
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _sample(rng, centers, count: int, dim: int):
+    if centers is None:
+        return rng.standard_normal((count, dim), dtype=np.float32)
+    picks = centers[rng.integers(0, len(centers), size=count)]
+    return picks + 0.5 * rng.standard_normal((count, dim), dtype=np.float32)
+
+
+async def run(
+    rows: int, dim: int, queries: int, top_k: int, nprobe: int, batch: int, clusters: int
+) -> None:
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((clusters, dim), dtype=np.float32) if clusters else None
+    with tempfile.TemporaryDirectory() as root:
+        store = LocalVectorStore(root=root, ivf_min_rows=1, nprobe=nprobe)
+
+        t0 = time.perf_counter()
+        for start in range(0, rows, batch):
+            vecs = _sample(rng, centers, min(batch, rows - start), dim)
+            await store.write(
+                "bench",
+                upsert_rows=[
+                    {"id": start + i, "vector": v.tolist(), "bucket": (start + i) % 10}
+                    for i, v in enumerate(vecs)
+                ],
+            )
+        load_s = time.perf_counter() - t0
+        print(f"loaded rows={rows} dim={dim} in {load_s:.1f}s ({rows / load_s:.0f} rows/s)")
+
+        # First IVF query builds the index
+        t0 = time.perf_counter()
+        await store.hint_cache_warm("bench")
+        print(f"IVF build: {time.perf_counter() - t0:.2f}s")
+
+        qs = _sample(rng, centers, queries, dim)
+        exact_ms: list[float] = []
+        ivf_ms: list[float] = []
+        recalls: list[float] = []
+        for q in qs:
+            t0 = time.perf_counter()
+            exact = await store.query("bench", rank_by=("vector", "ANN", q.tolist()), top_k=top_k, exact=True)
+            exact_ms.append((time.perf_counter() - t0) * 1000)
+
+            t0 = time.perf_counter()
+            approx = await store.query("bench", rank_by=("vector", "ANN", q.tolist()), top_k=top_k)
+            ivf_ms.append((time.perf_counter() - t0) * 1000)
+
+            truth = {r.id for r in exact.rows}
+            recalls.append(len(truth & {r.id for r in approx.rows}) / max(1, len(truth)))
+
+        print(f"{'mode':>6}  {'p50 ms':>8}  {'p95 ms':>8}  {'recall@' + str(top_k):>10}")
+        print(f"{'exact':>6}  {statistics.median(exact_ms):>8.2f}  {_percentile(exact_ms, 0.95):>8.2f}  {1.0:>10.3f}")
+        print(f"{'ivf':>6}  {statistics.median(ivf_ms):>8.2f}  {_percentile(ivf_ms, 0.95):>8.2f}  {statistics.mean(recalls):>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, default=16)
+    parser.add_argument("--batch", type=int, default=5_000)
+    parser.add_argument("--clusters", type=int, default=1_000)
+    args = parser.parse_args()
+    asyncio.run(
+        run(args.rows, args.dim, args.queries, args.top_k, args.nprobe, args.batch, args.clusters)
+    )
+
+
+if __name__ == "__main__":
+    main()
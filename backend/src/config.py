@@ -165,6 +165,16 @@ class Settings(BaseSettings):
     SANDBOX_DOWNLOAD_CONCURRENCY: int = 10
     # Large file streaming threshold (bytes); files exceeding this size use streaming transfer
     SANDBOX_LARGE_FILE_THRESHOLD: int = 50 * 1024 * 1024  # 50MB
+    # Host-local content-addressed blob cache shared by sandbox sessions
+    # (defaults to <SANDBOX_TMPDIR or system tmp>/puppyone-blob-cache)
+    SANDBOX_BLOB_CACHE_DIR: str | None = None
+    SANDBOX_BLOB_CACHE_MAX_BYTES: int = 10 * 1024 * 1024 * 1024  # 10GB
+    # Warm Docker container pool: idle containers kept ready per mount mode (rw / ro); 0 disables
+    SANDBOX_POOL_SIZE: int = 0
+    SANDBOX_POOL_IMAGE: str = "json-sandbox"
+    # Recycled containers are destroyed after this many sessions or this long idle (seconds)
+    SANDBOX_POOL_MAX_USES: int = 20
+    SANDBOX_POOL_IDLE_TTL: int = 600
 
     # Workspace Provider configuration
     # - "auto": Auto-detect platform (macOS -> APFS Clone, Linux -> OverlayFS, other -> full copy)
@@ -258,6 +268,23 @@ class Settings(BaseSettings):
     # Search Tool indexing (async)
     # - Only used for async indexing wait_for timeout control, preventing background tasks from hanging indefinitely
     SEARCH_INDEX_TIMEOUT_SECONDS: int = 120
+    # Search Tool retrieval
+    # - "hybrid": ANN + BM25 (one multi_query) fused with RRF; "vector": ANN only
+    # - SEARCH_RERANK_MODEL: optional local cross-encoder (sentence-transformers), empty = off
+    # - top_k is capped per page; deeper results are reached with offset
+    SEARCH_DEFAULT_MODE: str = "hybrid"
+    SEARCH_RRF_K: int = 60
+    SEARCH_MAX_TOP_K: int = 20
+    SEARCH_MAX_DEPTH: int = 200
+    SEARCH_RERANK_MODEL: str = ""
+    # Search query caches (per process, see src/infra/search/query_cache.py)
+    # - query embeddings by (model, normalized query); size 0 disables
+    # - ranked pages by (namespace watermark, query, page); dropped when the namespace is re-indexed
+    SEARCH_QUERY_EMBEDDING_CACHE_SIZE: int = 4096
+    SEARCH_QUERY_EMBEDDING_CACHE_TTL_SECONDS: int = 3600
+    SEARCH_RESULT_CACHE_ENABLED: bool = True
+    SEARCH_RESULT_CACHE_SIZE: int = 1024
+    SEARCH_RESULT_CACHE_TTL_SECONDS: int = 60
 
     # MUT/Git-native version engine hardening.
     # Protocol mode falls open only in development/test by default; production
@@ -266,12 +293,23 @@ class Settings(BaseSettings):
     MUT_VERSION_OUTBOX_ENABLED: bool = True
     MUT_VERSION_OUTBOX_INTERVAL_SECONDS: int = 30
     MUT_VERSION_OUTBOX_BATCH_SIZE: int = 50
+    # Distinct projects replayed in parallel per outbox batch
+    MUT_VERSION_OUTBOX_PROJECT_CONCURRENCY: int = 4
     MUT_OBJECT_GC_ENABLED: bool = False
     MUT_OBJECT_GC_DRY_RUN: bool = True
     MUT_OBJECT_GC_INTERVAL_SECONDS: int = 60 * 60
     MUT_OBJECT_GC_RETENTION_SECONDS: int = 7 * 24 * 60 * 60
     MUT_OBJECT_GC_MAX_PROJECTS_PER_RUN: int = 25
     MUT_OBJECT_GC_MAX_DELETE_PER_PROJECT: int = 1000
+    # Group commit: fold concurrent operations on one scope into a single
+    # publish. Operations arriving within the window (or while the previous
+    # group is publishing) share one commit.
+    MUT_GROUP_COMMIT_ENABLED: bool = False
+    MUT_GROUP_COMMIT_WINDOW_MS: int = 5
+    MUT_GROUP_COMMIT_MAX_OPS: int = 64
+    # Recently built project roots (and the scope map each projects) kept per
+    # process, so the next root is grafted incrementally. 0 = always rebuild.
+    MUT_ROOT_PROJECTION_MEMO_SIZE: int = 256
 
     # DB Connector sensitive config encryption (AES-256-GCM)
     # Base64-encoded string of 32-byte key
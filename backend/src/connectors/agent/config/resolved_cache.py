@@ -0,0 +1,155 @@
+"""
+Resolved Agent Cache
+
+Everything a chat turn needs before the first token — the agent row, its
+bash accesses and its search tools (tool rows + node types from the MUT
+tree) — resolved once and kept in process memory. Authorization is not
+cached: ``verify_access`` runs on every turn, so a membership or access
+change takes effect immediately.
+
+Entries are keyed by agent id and a per-agent config version. The version
+is bumped by every invalidation, so a resolution that raced an edit is
+never stored. Invalidation sources:
+- agent / agent_bash edits (AgentConfigService)
+- agent_tool binding edits (AgentMcpService) and tool edits (ToolService)
+- commits touching a bound path (post-push hook)
+
+Edits made by another worker process are not seen, so entries also expire
+after ``RESOLVED_AGENT_TTL_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+from src.connectors.agent.config.models import Agent
+
+
+RESOLVED_AGENT_TTL_SECONDS = 60.0
+RESOLVED_AGENT_MAX_ENTRIES = 1024
+
+
+@dataclass
+class ResolvedAgent:
+    """Per-turn agent configuration, resolved from DB + MUT tree."""
+    agent: Agent
+    version: int
+    bash_tools: list[dict] = field(default_factory=list)  # [{path, readonly}, ...]
+    search_tools: Optional[dict[str, Any]] = None  # {claude_tool_name: SearchToolConfig}; None = not resolved yet
+    resolved_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def project_id(self) -> str:
+        return self.agent.project_id
+
+    @property
+    def tool_ids(self) -> set[str]:
+        return {t.tool_id for t in self.agent.tools}
+
+    @property
+    def bound_paths(self) -> list[str]:
+        paths = [t["path"] for t in self.bash_tools]
+        paths.extend(cfg.path for cfg in (self.search_tools or {}).values())
+        return paths
+
+
+def _paths_overlap(a: str, b: str) -> bool:
+    a, b = a.strip("/"), b.strip("/")
+    if not a or not b or a == b:
+        return True
+    return a.startswith(b + "/") or b.startswith(a + "/")
+
+
+class ResolvedAgentCache:
+    """Thread-safe (post-push hooks run in worker threads) resolved agent cache."""
+
+    def __init__(
+        self,
+        ttl: float = RESOLVED_AGENT_TTL_SECONDS,
+        max_entries: int = RESOLVED_AGENT_MAX_ENTRIES,
+    ):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: dict[str, ResolvedAgent] = {}
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def version(self, agent_id: str) -> int:
+        with self._lock:
+            return self._versions.get(agent_id, 0)
+
+    def get(self, agent_id: str) -> Optional[ResolvedAgent]:
+        with self._lock:
+            entry = self._entries.get(agent_id)
+            if entry is None:
+                return None
+            stale = (
+                entry.version != self._versions.get(agent_id, 0)
+                or time.monotonic() - entry.resolved_at > self._ttl
+            )
+            if stale:
+                del self._entries[agent_id]
+                return None
+            return entry
+
+    def put(self, resolved: ResolvedAgent) -> bool:
+        """Store ``resolved`` unless the agent was invalidated since its version was read."""
+        agent_id = resolved.agent.id
+        with self._lock:
+            if resolved.version != self._versions.get(agent_id, 0):
+                return False
+            if agent_id not in self._entries and len(self._entries) >= self._max_entries:
+                oldest = min(self._entries.values(), key=lambda e: e.resolved_at)
+                del self._entries[oldest.agent.id]
+            self._entries[agent_id] = resolved
+            return True
+
+    def invalidate_agent(self, agent_id: str) -> None:
+        with self._lock:
+            self._versions[agent_id] = self._versions.get(agent_id, 0) + 1
+            self._entries.pop(agent_id, None)
+
+    def invalidate_tool(self, tool_id: str) -> None:
+        with self._lock:
+            agent_ids = [aid for aid, e in self._entries.items() if tool_id in e.tool_ids]
+        for agent_id in agent_ids:
+            self.invalidate_agent(agent_id)
+
+    def invalidate_paths(self, project_id: str, paths: Iterable[str]) -> None:
+        """Drop agents of ``project_id`` bound at, above or below any of ``paths``."""
+        changed = list(paths)
+        if not changed:
+            return
+        with self._lock:
+            agent_ids = [
+                aid for aid, e in self._entries.items()
+                if e.project_id == project_id
+                and any(_paths_overlap(b, c) for b in e.bound_paths for c in changed)
+            ]
+        for agent_id in agent_ids:
+            self.invalidate_agent(agent_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            for agent_id in list(self._entries):
+                self._versions[agent_id] = self._versions.get(agent_id, 0) + 1
+            self._entries.clear()
+
+
+_cache: Optional[ResolvedAgentCache] = None
+
+
+def get_resolved_agent_cache() -> ResolvedAgentCache:
+    global _cache
+    if _cache is None:
+        _cache = ResolvedAgentCache()
+    return _cache
+
+
+def invalidate_resolved_agent(agent_id: Optional[str]) -> None:
+    """Best-effort hook for agent config writers."""
+    if agent_id:
+        get_resolved_agent_cache().invalidate_agent(agent_id)
@@ -8,6 +8,7 @@ from typing import List, Optional
 
 from src.connectors.agent.config.models import Agent, AgentBash
 from src.connectors.agent.config.repository import AgentRepository
+from src.connectors.agent.config.resolved_cache import invalidate_resolved_agent
 from src.connectors.agent.config.schemas import AgentBashCreate
 
 
@@ -134,6 +135,7 @@ class AgentConfigService:
             task_path=task_path,
             external_config=external_config,
         )
+        invalidate_resolved_agent(agent_id)
         if agent:
             agent.bash_accesses = self._repo.get_bash_by_agent_id(agent_id)
         return agent
@@ -143,7 +145,9 @@ class AgentConfigService:
         # Verify access
         if not self._repo.verify_access(agent_id, user_id):
             return False
-        return self._repo.delete(agent_id)
+        deleted = self._repo.delete(agent_id)
+        invalidate_resolved_agent(agent_id)
+        return deleted
 
     def _clear_default_agent(self, project_id: str):
         """Clear the current default Agent for the project."""
@@ -166,11 +170,13 @@ class AgentConfigService:
         if not self._repo.verify_access(agent_id, user_id):
             return None
 
-        return self._repo.create_bash(
+        bash = self._repo.create_bash(
             agent_id=agent_id,
             path=path,
             readonly=readonly,
         )
+        invalidate_resolved_agent(agent_id)
+        return bash
 
     def update_bash(
         self,
@@ -185,10 +191,12 @@ class AgentConfigService:
         if not self._repo.verify_access(bash.agent_id, user_id):
             return None
 
-        return self._repo.update_bash(
+        updated = self._repo.update_bash(
             bash_id=bash_id,
             readonly=readonly,
         )
+        invalidate_resolved_agent(bash.agent_id)
+        return updated
 
     def remove_bash(self, bash_id: str, user_id: str) -> bool:
         """Delete Bash access permission."""
@@ -199,7 +207,9 @@ class AgentConfigService:
         if not self._repo.verify_access(bash.agent_id, user_id):
             return False
 
-        return self._repo.delete_bash(bash_id)
+        deleted = self._repo.delete_bash(bash_id)
+        invalidate_resolved_agent(bash.agent_id)
+        return deleted
 
     def sync_bash(
         self,
@@ -229,6 +239,7 @@ class AgentConfigService:
             )
             result.append(new_bash)
 
+        invalidate_resolved_agent(agent_id)
         return result
 
     # ============================================
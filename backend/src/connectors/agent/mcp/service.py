@@ -14,6 +14,7 @@ from typing import List, Optional
 
 from src.connectors.agent.config.models import Agent, AgentTool
 from src.connectors.agent.config.repository import AgentRepository
+from src.connectors.agent.config.resolved_cache import invalidate_resolved_agent
 from src.tool.repository import ToolRepositoryBase, ToolRepositorySupabase
 from src.infra.supabase.dependencies import get_supabase_repository
 from src.infra.mcp_server.cache_invalidator import invalidate_mcp_cache
@@ -154,6 +155,7 @@ class McpV3Service:
         # Invalidate MCP cache
         if agent.mcp_api_key:
             invalidate_mcp_cache(agent.mcp_api_key)
+        invalidate_resolved_agent(agent_id)
 
         return binding
 
@@ -188,6 +190,7 @@ class McpV3Service:
         # Invalidate MCP cache
         if agent.mcp_api_key:
             invalidate_mcp_cache(agent.mcp_api_key)
+        invalidate_resolved_agent(agent_id)
 
         return result
 
@@ -225,6 +228,7 @@ class McpV3Service:
         # Invalidate MCP cache
         if agent.mcp_api_key:
             invalidate_mcp_cache(agent.mcp_api_key)
+        invalidate_resolved_agent(agent_id)
 
         return updated
 
@@ -251,6 +255,7 @@ class McpV3Service:
         # Invalidate MCP cache
         if agent.mcp_api_key:
             invalidate_mcp_cache(agent.mcp_api_key)
+        invalidate_resolved_agent(agent_id)
 
         return True
 
@@ -16,6 +16,7 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+import os
 import time
 from dataclasses import dataclass, field
 from typing import Optional, Any
@@ -31,14 +32,20 @@ class SandboxFile:
 
     ``base_commit_id`` snapshots the MUT commit this file was cloned at
     so write-back can be traced to a specific point-in-time snapshot.
+
+    ``blob_hash`` + ``project_id`` mark a file whose bytes are hydrated
+    by hash (see ``mut_engine.services.blob_hydrator``) instead of being
+    carried in ``content``.
     """
     path: str
-    content: str | None = None
+    content: str | bytes | None = None
     s3_key: str | None = None
     content_type: str = "application/octet-stream"
     mut_path: str | None = None
     node_type: str | None = None
     base_commit_id: str = ""
+    blob_hash: str | None = None
+    project_id: str = ""
 
 
 @dataclass
@@ -54,6 +61,14 @@ class SandboxData:
 IDLE_TIMEOUT_SECONDS = 4 * 60  # 4 minutes
 
 
+def _content_type_for(node_type: str | None) -> str:
+    if node_type == "json":
+        return "application/json"
+    if node_type == "markdown":
+        return "text/markdown"
+    return "text/plain"
+
+
 async def prepare_sandbox_data(
     ops,
     project_id: str,
@@ -62,7 +77,11 @@ async def prepare_sandbox_data(
     """Prepare files from MUT tree for sandbox mounting.
 
     Reads the MUT tree at `path` and returns SandboxFile objects
-    suitable for sandbox_service.start_with_files().
+    suitable for sandbox_service.start_with_files(). Only the tree is
+    walked here — files carry their ``blob_hash`` and the sandbox
+    hydrates the raw bytes itself, concurrently and through the shared
+    blob cache. The single-JSON case still reads content because
+    ``sandbox_service.start`` takes the parsed document.
     """
 
     entry = ops.stat(project_id, path)
@@ -76,34 +95,40 @@ async def prepare_sandbox_data(
         children = ops.list_tree(project_id, path)
         files: list[SandboxFile] = []
         for child in children:
-            if child.type == "folder":
+            if child.type == "folder" or not child.content_hash:
                 continue
             relative = child.path
             if relative.startswith(path + "/"):
                 relative = relative[len(path) + 1:]
-            try:
-                raw = ops.read_file(project_id, child.path)
-                text = raw.decode("utf-8", errors="replace")
-            except Exception:
-                continue
             files.append(SandboxFile(
                 path=f"/workspace/{relative}",
-                content=text,
-                content_type="application/json" if child.type == "json" else "text/markdown" if child.type == "markdown" else "text/plain",
+                content_type=_content_type_for(child.type),
                 mut_path=child.path,
                 node_type=child.type,
+                blob_hash=child.content_hash,
+                project_id=project_id,
             ))
         return SandboxData(files=files, node_type="folder", root_path=path, root_node_name=node_name)
 
-    raw = ops.read_file(project_id, path)
-    text = raw.decode("utf-8", errors="replace")
-    sf = SandboxFile(
-        path=f"/workspace/{node_name}" if node_type != "json" else "/workspace/data.json",
-        content=text,
-        content_type="application/json" if node_type == "json" else "text/markdown" if node_type == "markdown" else "text/plain",
-        mut_path=path,
-        node_type=node_type,
-    )
+    if node_type == "json":
+        sf = SandboxFile(
+            path="/workspace/data.json",
+            content=ops.read_file(project_id, path),
+            content_type=_content_type_for(node_type),
+            mut_path=path,
+            node_type=node_type,
+            blob_hash=entry.content_hash,
+            project_id=project_id,
+        )
+    else:
+        sf = SandboxFile(
+            path=f"/workspace/{node_name}",
+            content_type=_content_type_for(node_type),
+            mut_path=path,
+            node_type=node_type,
+            blob_hash=entry.content_hash,
+            project_id=project_id,
+        )
     return SandboxData(files=[sf], node_type=node_type, root_path=path, root_node_name=node_name)
 
 
@@ -195,6 +220,98 @@ class AgentSandboxRegistry:
 
 # ── Write-back ────────────────────────────────────────────
 
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+async def sync_back_workspace(
+    sandbox_service,
+    sandbox_session_id: str,
+    project_id: str,
+    scope_path: str,
+    *,
+    who: str,
+    message: str,
+    repo_manager=None,
+) -> Optional[tuple[list[str], list[str]]]:
+    """Commit a sandbox's workspace changes as one diffed MUT write.
+
+    Diffs the host workspace against the manifest snapshotted at
+    hydration (only files whose size/mtime moved are re-hashed), then
+    publishes the changed set through a single ``MutOps.bulk_write`` —
+    or, when any changed file is above SANDBOX_LARGE_FILE_THRESHOLD,
+    stages blobs one at a time and commits them with ``bulk_write_refs``
+    so the batch never sits in memory at once. The manifest is advanced
+    in place, so the next turn diffs against what was just committed.
+
+    ``message`` gets the change counts appended.
+
+    Returns (modified_paths, deleted_paths), or None when the sandbox
+    has no host-visible workspace (callers fall back to
+    ``_read_modified_files`` + ``push_and_finalize``).
+    """
+    local = sandbox_service.local_workspace(sandbox_session_id)
+    if local is None:
+        return None
+    workspace_dir, manifest = local
+
+    from src.config import settings
+    from src.mut_engine.services.blob_hydrator import diff_workspace
+    from src.mut_engine.services.ops import MutOps
+
+    diff = await asyncio.to_thread(diff_workspace, workspace_dir, manifest)
+    if diff.is_empty:
+        return [], []
+
+    scope = scope_path.strip("/") if scope_path else ""
+
+    def to_mut_path(rel: str) -> str:
+        return f"{scope}/{rel}" if scope else rel
+
+    if repo_manager is None:
+        from src.mut_engine.dependencies import get_repo_manager_standalone
+        repo_manager = get_repo_manager_standalone()
+    ops = MutOps(repo_manager)
+
+    # Last writer wins, as with a direct bulk_write; surface concurrent edits
+    for rel in [*diff.changed, *diff.deleted]:
+        prior = manifest.get(rel)
+        if prior is None:
+            continue
+        current = await asyncio.to_thread(ops.stat, project_id, to_mut_path(rel))
+        if current is not None and current.content_hash and current.content_hash != prior.hash:
+            logger.warning(
+                f"[AgentSandbox] {to_mut_path(rel)} changed upstream since hydration; "
+                f"sandbox version overwrites it"
+            )
+
+    deleted = [to_mut_path(rel) for rel in diff.deleted]
+    message = f"{message} ({len(diff.changed)} modified, {len(deleted)} deleted)"
+    threshold = settings.SANDBOX_LARGE_FILE_THRESHOLD
+    if any(entry.size > threshold for entry in diff.changed.values()):
+        refs = {}
+        for rel in diff.changed:
+            data = await asyncio.to_thread(_read_bytes, os.path.join(workspace_dir, rel))
+            refs[to_mut_path(rel)] = await ops.stage_blob_from_bytes(project_id, data)
+            del data
+        await ops.bulk_write_refs(
+            project_id, refs, who=who, deleted=deleted, message=message,
+            verify_blobs=False,
+        )
+    else:
+        files = {
+            to_mut_path(rel): await asyncio.to_thread(_read_bytes, os.path.join(workspace_dir, rel))
+            for rel in diff.changed
+        }
+        await ops.bulk_write(project_id, files, who=who, deleted=deleted, message=message)
+
+    for rel in diff.deleted:
+        manifest.pop(rel, None)
+    manifest.update(diff.changed)
+    return [to_mut_path(rel) for rel in diff.changed], deleted
+
+
 async def writeback_and_destroy(
     session: AgentSandboxSession,
     sandbox_service,
@@ -207,14 +324,32 @@ async def writeback_and_destroy(
 
     if not session.readonly and session.project_id:
         try:
-            modified, deleted = await _read_modified_files(
+            synced = await sync_back_workspace(
                 sandbox_service,
                 session.sandbox_session_id,
-                session.cloned_files,
-                "/workspace",
+                session.project_id,
                 session.scope_path,
+                who=f"agent:{session.agent_id}",
+                message="Agent write-back",
+                repo_manager=session.repo_manager,
             )
-            if modified or deleted:
+            if synced is not None:
+                modified_paths, deleted_paths = synced
+                if modified_paths or deleted_paths:
+                    logger.info(
+                        f"[AgentSandbox] Synced back: modified={len(modified_paths)} deleted={len(deleted_paths)}"
+                    )
+                updated_nodes.extend(_updated_node_infos(modified_paths))
+                modified, deleted = {}, []
+            else:
+                modified, deleted = await _read_modified_files(
+                    sandbox_service,
+                    session.sandbox_session_id,
+                    session.cloned_files,
+                    "/workspace",
+                    session.scope_path,
+                )
+            if (modified or deleted) and session.mut_client:
                 from src.mut_engine.services.hooks import push_and_finalize
                 push_result = await push_and_finalize(
                     session.mut_client,
@@ -229,13 +364,7 @@ async def writeback_and_destroy(
                     f"[AgentSandbox] MUT push: commit={push_result.get('commit_id')} "
                     f"merged={push_result.get('merged', False)} modified={len(modified)} deleted={len(deleted)}"
                 )
-                for path in modified:
-                    node_name = path.rsplit("/", 1)[-1] if "/" in path else path
-                    updated_nodes.append({
-                        "nodeId": path,
-                        "nodeName": node_name,
-                        "mergeStrategy": "mut_push",
-                    })
+                updated_nodes.extend(_updated_node_infos(modified))
         except Exception as e:
             logger.error(f"[AgentSandbox] Write-back failed: {e}")
 
@@ -247,6 +376,17 @@ async def writeback_and_destroy(
     return updated_nodes
 
 
+def _updated_node_infos(paths) -> list[dict]:
+    return [
+        {
+            "nodeId": path,
+            "nodeName": path.rsplit("/", 1)[-1] if "/" in path else path,
+            "mergeStrategy": "mut_push",
+        }
+        for path in paths
+    ]
+
+
 async def _read_modified_files(
     sandbox_service,
     sandbox_session_id: str,
@@ -29,6 +29,7 @@ from src.connectors.agent.schemas import AgentRequest
 from src.config import settings
 from src.connectors.agent.chat.service import ChatService
 from src.connectors.agent.config.service import AgentConfigService
+from src.connectors.agent.config.resolved_cache import ResolvedAgent, get_resolved_agent_cache
 from src.connectors.agent.sandbox_session import SandboxFile, SandboxData, prepare_sandbox_data
 from src.mut_engine.services.ops import MutOps
 from src.platform.analytics.service import log_context_access, log_bash_execution
@@ -354,17 +355,41 @@ class AgentService:
                 if sandbox_data and sandbox_data.node_path_map:
                     agent_identity = f"agent:{agent.id}" if agent else "agent:unknown"
 
-                    from src.connectors.agent.sandbox_session import _read_modified_files
+                    from src.connectors.agent.sandbox_session import _read_modified_files, sync_back_workspace
                     from src.mut_engine.dependencies import get_repo_manager_standalone
                     from src.mut_engine.services.ephemeral_client import MutEphemeralClient
 
-                    modified_files = await _read_modified_files(
-                        sandbox_service,
-                        sandbox_session_id,
-                        {},
-                        "/workspace",
-                        "",
-                    )
+                    root_path = sandbox_data.root_path or ""
+                    if sandbox_data.node_type != "folder":
+                        root_path = root_path.rsplit("/", 1)[0] if "/" in root_path else ""
+                    synced = None
+                    try:
+                        synced = await sync_back_workspace(
+                            sandbox_service,
+                            sandbox_session_id,
+                            agent.project_id,
+                            root_path,
+                            who=agent_identity,
+                            message="Schedule Agent write-back",
+                        )
+                    except Exception as e:
+                        logger.warning(f"[ScheduleAgent] MUT sync-back failed: {e}")
+                        synced = ([], [])
+                    if synced is not None:
+                        modified_files = {}
+                        for path in synced[0]:
+                            result["updated_nodes"].append({
+                                "nodeId": path,
+                                "nodeName": path.rsplit("/", 1)[-1] if "/" in path else path,
+                            })
+                    else:
+                        modified_files, _ = await _read_modified_files(
+                            sandbox_service,
+                            sandbox_session_id,
+                            {},
+                            "/workspace",
+                            "",
+                        )
                     if modified_files:
                         try:
                             repo_manager = get_repo_manager_standalone()
@@ -379,7 +404,7 @@ class AgentService:
                                 },
                             }
                             client = MutEphemeralClient(repo_manager, agent.project_id, mut_auth)
-                            await asyncio.to_thread(client.clone)
+                            await asyncio.to_thread(client.clone_lite)
                             from src.mut_engine.services.hooks import push_and_finalize
                             push_result = await push_and_finalize(
                                 client,
@@ -416,6 +441,92 @@ class AgentService:
             logger.error(f"[ScheduleAgent] Execution failed: {e}")
             return {"status": "failed", "error": str(e)}
 
+    def _resolve_agent(
+        self,
+        agent_id: str,
+        user_id: str,
+        agent_config_service: AgentConfigService,
+    ) -> ResolvedAgent:
+        """Agent row + bash accesses for a chat turn, served from the resolved cache.
+
+        Raises ValueError if the agent does not exist and PermissionError
+        if ``user_id`` may not use it. Only configuration is cached; access
+        is checked on every call so revocations apply immediately.
+        """
+        cache = get_resolved_agent_cache()
+        resolved = cache.get(agent_id)
+        if resolved is None:
+            version = cache.version(agent_id)
+            agent = agent_config_service.get_agent(agent_id)
+            if not agent:
+                logger.warning(f"[Agent] Agent not found: agent_id={agent_id}")
+                raise ValueError(f"Agent not found: {agent_id}")
+            resolved = ResolvedAgent(
+                agent=agent,
+                version=version,
+                bash_tools=[{"path": b.path, "readonly": b.readonly} for b in agent.bash_accesses],
+            )
+            cache.put(resolved)
+
+        # Verify access via project (the Agent model has no user_id field)
+        if not agent_config_service.verify_access(agent_id, user_id):
+            logger.warning(f"[Agent] Unauthorized: agent_id={agent_id}, user_id={user_id}")
+            raise PermissionError(f"Not authorized to use agent: {agent_id}")
+        return resolved
+
+    def _resolve_search_tools(
+        self,
+        resolved: ResolvedAgent,
+        tool_service,
+        ops: MutOps | None,
+    ) -> dict[str, SearchToolConfig]:
+        """Search tools bound via agent_tool, with node types from the MUT tree (cached on ``resolved``)."""
+        if resolved.search_tools is not None:
+            return resolved.search_tools
+
+        agent = resolved.agent
+        search_tools_map: dict[str, SearchToolConfig] = {}
+        used_names: set[str] = set()
+        for agent_tool_binding in agent.tools:
+            if not agent_tool_binding.enabled:
+                continue
+
+            # Load full info from tool table
+            tool_info = tool_service.get_by_id(agent_tool_binding.tool_id)
+            if not tool_info or tool_info.type != "search":
+                continue
+
+            # Get node info to determine search type
+            try:
+                node = ops.stat(agent.project_id, tool_info.path) if ops else None
+                if not node:
+                    continue
+            except Exception:
+                continue
+
+            # Generate a Claude-compatible tool name (avoid conflicts)
+            base_name = _sanitize_tool_name(tool_info.name)
+            claude_name = f"search_{base_name}"
+            if claude_name in used_names:
+                claude_name = f"search_{base_name}_{tool_info.id[:8]}"
+            used_names.add(claude_name)
+
+            search_tools_map[claude_name] = SearchToolConfig(
+                tool_id=tool_info.id,
+                path=tool_info.path,
+                project_id=tool_info.project_id or agent.project_id,
+                node_type=node.type or "json",
+                name=tool_info.name,
+                description=tool_info.description or f"Search in {tool_info.name}",
+                claude_tool_name=claude_name,
+            )
+            logger.info(f"[Agent] Loaded search tool: {claude_name} (tool_id={tool_info.id}, node_type={node.type})")
+
+        # Only cache a complete resolution (ops available to stat the nodes)
+        if ops is not None:
+            resolved.search_tools = search_tools_map
+        return search_tools_map
+
     async def stream_events(
         self,
         request: AgentRequest,
@@ -443,34 +554,19 @@ class AgentService:
         logger.info(f"[Agent DEBUG] agent_id={request.agent_id}, active_tool_ids={request.active_tool_ids}, user_id={current_user.user_id if current_user else None}")
 
         # New version: if agent_id exists, read configuration from agent_bash table
+        # (resolved once per config version; see ResolvedAgentCache)
+        search_tools_map: dict[str, SearchToolConfig] = {}  # {claude_tool_name: SearchToolConfig}
+        resolved: ResolvedAgent | None = None
+
         if request.agent_id and current_user and agent_config_service:
             try:
-                agent = agent_config_service.get_agent(request.agent_id)
-                logger.info(f"[Agent DEBUG] Got agent: {agent.id if agent else None}, project_id={agent.project_id if agent else None}")
-
-                # Verify access: check whether the user has permission to access this Agent via project_id
-                # Note: the Agent model has no user_id field; verification goes through the project table
-                has_access = False
-                if agent:
-                    has_access = agent_config_service.verify_access(request.agent_id, current_user.user_id)
-                    logger.info(f"[Agent DEBUG] Access check: has_access={has_access}")
-
-                if agent and has_access:
-                    logger.info(f"[Agent] Found agent config: id={agent.id}, bash_accesses={len(agent.bash_accesses)}")
-                    # Collect all Bash access permissions (in the new architecture all bash_accesses are terminal accesses)
-                    for bash in agent.bash_accesses:
-                        bash_tools.append({
-                            "path": bash.path,
-                            "readonly": bash.readonly,
-                        })
-                        logger.info(f"[Agent] Found bash access from agent_bash: path={bash.path}")
-                    logger.info(f"[Agent] Total bash accesses collected: {len(bash_tools)}")
-                else:
-                    logger.warning(f"[Agent] Agent not found or unauthorized: agent_id={request.agent_id}, has_access={has_access}")
-                    if not agent:
-                        raise ValueError(f"Agent not found: {request.agent_id}")
-                    if not has_access:
-                        raise PermissionError(f"Not authorized to use agent: {request.agent_id}")
+                resolved = self._resolve_agent(
+                    request.agent_id,
+                    current_user.user_id,
+                    agent_config_service,
+                )
+                bash_tools = list(resolved.bash_tools)
+                logger.info(f"[Agent] Found agent config: id={resolved.agent.id}, bash_accesses={len(bash_tools)}")
             except (ValueError, PermissionError):
                 raise  # Let these propagate to the SSE error handler
             except Exception as e:
@@ -481,51 +577,11 @@ class AgentService:
         # See architecture: agents → agent_bash (data access) + agent_tool (tool bindings)
 
         # ========== 1b. Collect Search Tools (from agent_tool bindings) ==========
-        search_tools_map: dict[str, SearchToolConfig] = {}  # {claude_tool_name: SearchToolConfig}
-
-        if request.agent_id and current_user and agent_config_service and tool_service and search_service:
+        if resolved and tool_service and search_service:
             try:
-                agent_for_tools = agent_config_service.get_agent(request.agent_id)
-
-                if agent_for_tools and agent_for_tools.tools:
-                    used_names: set[str] = set()
-                    for agent_tool_binding in agent_for_tools.tools:
-                        if not agent_tool_binding.enabled:
-                            continue
-
-                        # Load full info from tool table
-                        tool_info = tool_service.get_by_id(agent_tool_binding.tool_id)
-                        if not tool_info or tool_info.type != "search":
-                            continue
-
-                        # Get node info to determine search type
-                        try:
-                            node = ops.stat(agent_for_tools.project_id, tool_info.path) if ops else None
-                            if not node:
-                                continue
-                        except Exception:
-                            continue
-
-                        # Generate a Claude-compatible tool name (avoid conflicts)
-                        base_name = _sanitize_tool_name(tool_info.name)
-                        claude_name = f"search_{base_name}"
-                        if claude_name in used_names:
-                            claude_name = f"search_{base_name}_{tool_info.id[:8]}"
-                        used_names.add(claude_name)
-
-                        search_tools_map[claude_name] = SearchToolConfig(
-                            tool_id=tool_info.id,
-                            path=tool_info.path,
-                            project_id=tool_info.project_id or agent_for_tools.project_id,
-                            node_type=node.type or "json",
-                            name=tool_info.name,
-                            description=tool_info.description or f"Search in {tool_info.name}",
-                            claude_tool_name=claude_name,
-                        )
-                        logger.info(f"[Agent] Loaded search tool: {claude_name} (tool_id={tool_info.id}, node_type={node.type})")
-
-                    if search_tools_map:
-                        logger.info(f"[Agent] Total search tools: {len(search_tools_map)}")
+                search_tools_map = self._resolve_search_tools(resolved, tool_service, ops)
+                if search_tools_map:
+                    logger.info(f"[Agent] Total search tools: {len(search_tools_map)}")
             except Exception as e:
                 logger.warning(f"[Agent] Failed to load search tools: {e}", exc_info=True)
 
@@ -607,11 +663,7 @@ class AgentService:
             node_path_map: dict = {}  # {path: {path, node_type, readonly}}
 
             # Determine project_id from agent config
-            _agent_project_id = ""
-            if request.agent_id and agent_config_service:
-                _agent_obj = agent_config_service.get_agent(request.agent_id)
-                if _agent_obj:
-                    _agent_project_id = _agent_obj.project_id
+            _agent_project_id = resolved.project_id if resolved else ""
 
             for i, tool in enumerate(bash_tools):
                 try:
@@ -749,7 +801,11 @@ class AgentService:
                     mut_client = None
                     cloned_files = {}
                     repo_manager = None
-                    if _agent_project_id and not sandbox_readonly:
+                    if _agent_project_id and not sandbox_readonly and sandbox_service.local_workspace(sandbox_session_id) is not None:
+                        # Host workspace + manifest: write-back diffs locally, no clone needed
+                        from src.mut_engine.dependencies import get_repo_manager_standalone
+                        repo_manager = get_repo_manager_standalone()
+                    elif _agent_project_id and not sandbox_readonly:
                         from src.mut_engine.dependencies import get_repo_manager_standalone
                         from src.mut_engine.services.ephemeral_client import MutEphemeralClient
                         repo_manager = get_repo_manager_standalone()
@@ -814,6 +870,11 @@ class AgentService:
                             "description": "Number of results to return (default 5, max 20)",
                             "default": 5,
                         },
+                        "offset": {
+                            "type": "integer",
+                            "description": "Skip this many ranked results to page past the first top_k (default 0)",
+                            "default": 0,
+                        },
                     },
                     "required": ["query"],
                 },
@@ -1107,6 +1168,7 @@ class AgentService:
                     stc = search_tools_map[tool_name]
                     query = tool_input.get("query", "")
                     top_k = tool_input.get("top_k", 5)
+                    offset = tool_input.get("offset", 0)
 
                     exec_start = time_module.time()
                     try:
@@ -1116,6 +1178,7 @@ class AgentService:
                                 folder_path=stc.path,
                                 query=query,
                                 top_k=top_k,
+                                offset=offset,
                             )
                         else:
                             results = await search_service.search_scope(
@@ -1124,6 +1187,7 @@ class AgentService:
                                 tool_json_path="",
                                 query=query,
                                 top_k=top_k,
+                                offset=offset,
                             )
                         exec_latency = int((time_module.time() - exec_start) * 1000)
                         output = json.dumps(results, ensure_ascii=False, indent=2)
@@ -1193,6 +1257,7 @@ class AgentService:
         if use_bash and sandbox_service and sandbox_session_id:
             from src.connectors.agent.sandbox_session import (
                 get_agent_sandbox_registry,
+                sync_back_workspace,
                 _read_modified_files,
             )
             agent_sandbox_registry = get_agent_sandbox_registry()
@@ -1201,15 +1266,40 @@ class AgentService:
             live_session = agent_sandbox_registry.get(chat_key)
 
             updated_nodes = []
-            if live_session and live_session.mut_client and not live_session.readonly:
+            if live_session and live_session.project_id and not live_session.readonly:
                 try:
-                    modified, deleted = await _read_modified_files(
+                    synced = await sync_back_workspace(
                         sandbox_service,
                         live_session.sandbox_session_id,
-                        live_session.cloned_files,
-                        "/workspace",
+                        live_session.project_id,
                         live_session.scope_path,
+                        who=f"agent:{request.agent_id}",
+                        message="Agent chat write-back",
+                        repo_manager=live_session.repo_manager,
                     )
+                    if synced is not None:
+                        modified_paths, deleted_paths = synced
+                        if modified_paths or deleted_paths:
+                            logger.info(
+                                f"[Agent] MUT sync-back: modified={len(modified_paths)} deleted={len(deleted_paths)}"
+                            )
+                        for path in modified_paths:
+                            updated_nodes.append({
+                                "nodeId": path,
+                                "nodeName": path.rsplit("/", 1)[-1] if "/" in path else path,
+                                "mergeStrategy": "mut_push",
+                            })
+                        modified, deleted = {}, []
+                    elif live_session.mut_client:
+                        modified, deleted = await _read_modified_files(
+                            sandbox_service,
+                            live_session.sandbox_session_id,
+                            live_session.cloned_files,
+                            "/workspace",
+                            live_session.scope_path,
+                        )
+                    else:
+                        modified, deleted = {}, []
                     if modified or deleted:
                         from src.mut_engine.services.hooks import push_and_finalize
                         push_result = await push_and_finalize(
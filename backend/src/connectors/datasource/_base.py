@@ -8,6 +8,11 @@ Three-layer architecture:
 
 Connector only has ONE core method: fetch().
 It does NOT know who triggered it or how data is stored.
+
+Connectors declaring Capability.INCREMENTAL may also implement
+fetch_changes(config, credentials, cursor, etags) → ChangeSet, which
+returns only what changed since a persisted cursor (Gmail history ID,
+Drive changes token, Calendar sync token, ...).
 """
 
 from abc import ABC, abstractmethod
@@ -77,6 +82,37 @@ class FetchResult:
     files: Optional[dict[str, bytes]] = None
 
 
+# ============================================================
+# ChangeSet (returned by fetch_changes)
+# ============================================================
+
+@dataclass
+class ChangeSet:
+    """
+    Returned by connector.fetch_changes() — the delta since ``cursor``.
+
+    ``files`` and ``deleted`` are paths relative to the sync mount point,
+    same as ``FetchResult.files``. ``etags`` carries per-item validators
+    for the files the connector reports; SyncEngine drops any file whose
+    etag matches the one it persisted last time, so connectors may report
+    a whole page of items without forcing a rewrite.
+
+    ``full_resync=True`` means the connector cannot express the delta
+    (first run, expired cursor, aggregate single-file output): SyncEngine
+    falls back to fetch() and persists ``cursor`` afterwards.
+    """
+    cursor: str
+    files: dict[str, bytes] = field(default_factory=dict)
+    deleted: list[str] = field(default_factory=list)
+    etags: dict[str, str] = field(default_factory=dict)
+    full_resync: bool = False
+    summary: Optional[str] = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.full_resync and not self.files and not self.deleted
+
+
 # ============================================================
 # PushResult (returned by push)
 # ============================================================
@@ -156,6 +192,7 @@ class BaseConnector(ABC):
       - fetch()  — core data retrieval method
 
     Subclasses MAY override:
+      - fetch_changes() — incremental pull (with Capability.INCREMENTAL)
       - push()         — for bidirectional sync
       - list_resources() / setup_trigger() / teardown_trigger()
     """
@@ -187,6 +224,30 @@ class BaseConnector(ABC):
           - Manage OAuth token refresh (SyncEngine handles that)
         """
 
+    async def fetch_changes(
+        self,
+        config: dict,
+        credentials: Credentials,
+        cursor: Optional[str],
+        etags: dict[str, str],
+    ) -> Optional[ChangeSet]:
+        """
+        Pull only what changed since ``cursor``.
+
+        Args:
+            config:      Same as fetch().
+            credentials: Same as fetch().
+            cursor:      Value returned by the previous ChangeSet, or
+                         None on the first incremental run.
+            etags:       Per-item etags persisted from earlier ChangeSets.
+
+        Returns:
+            A ChangeSet, or None to make SyncEngine use fetch() for this
+            run. The default returns None, so connectors without an
+            incremental API keep whole-snapshot behaviour.
+        """
+        return None
+
     async def pull(self, sync: "Sync") -> "FetchResult":
         """Pull latest data from external source.
 
@@ -15,6 +15,12 @@ converge into a single execute() call. The engine:
   6. If changed → MutOps.write_file() or MutOps.bulk_write() at the sync path
   7. Updates the sync record (remote_hash, last_sync_commit_id)
 
+Connectors with Capability.INCREMENTAL are asked for a ChangeSet first
+(fetch_changes with the persisted cursor + per-item etags). A non-empty
+delta is applied as ONE MutOps.bulk_write commit; an empty delta skips
+the run without downloading anything; full_resync falls through to
+steps 4-7. The cursor and etags live under ``config[SYNC_STATE_KEY]``.
+
 All data writes go through MutOps.
 """
 
@@ -24,13 +30,18 @@ import json
 import posixpath
 from typing import Any, Optional
 
-from src.connectors.datasource._base import AuthRequirement
+from src.connectors.datasource._base import AuthRequirement, Capability, ChangeSet
 from src.connectors.datasource.registry import ConnectorRegistry
 from src.connectors.datasource.repository import SyncRepository
 from src.connectors.datasource.run_repository import SyncRunRepository
 from src.utils.logger import log_info, log_error, log_debug
 
 
+# Key in ``sync.config`` holding incremental state:
+#   {"cursor": "<provider cursor>", "etags": {"<rel path>": "<etag>"}}
+SYNC_STATE_KEY = "_sync_state"
+
+
 def _join_mount_path(base_path: str | None, relative_path: str) -> str:
     """Join a sync mount with a connector-owned relative file path."""
     base = (base_path or "").strip("/")
@@ -110,9 +121,23 @@ class SyncEngine:
                 required=spec.auth != AuthRequirement.OPTIONAL_OAUTH,
             )
 
+            changes: Optional[ChangeSet] = None
+            if spec.capabilities & Capability.INCREMENTAL:
+                state = (sync.config or {}).get(SYNC_STATE_KEY) or {}
+                changes = await connector.fetch_changes(
+                    sync.config or {},
+                    credentials,
+                    state.get("cursor"),
+                    dict(state.get("etags") or {}),
+                )
+                if changes is not None and not changes.full_resync:
+                    return await self._apply_changes(sync, changes, run)
+
             result = await connector.fetch(sync.config or {}, credentials)
 
             if result.content_hash and result.content_hash == sync.remote_hash:
+                if changes is not None:
+                    self._save_sync_state(sync, changes)
                 self.sync_repo.update_status(sync_id, "active")
                 log_debug(
                     f"[SyncEngine] No changes for {sync.provider} sync {sync_id}"
@@ -162,6 +187,8 @@ class SyncEngine:
 
             new_commit_id = write_result.commit_id
 
+            if changes is not None:
+                self._save_sync_state(sync, changes)
             self.sync_repo.update_sync_point(
                 sync_id=sync.id,
                 last_sync_commit_id=new_commit_id,
@@ -197,6 +224,101 @@ class SyncEngine:
                 )
             return None
 
+    async def _apply_changes(self, sync, changes: ChangeSet, run) -> Optional[dict]:
+        """Apply an incremental ChangeSet as a single bulk_write commit.
+
+        Files whose etag matches the persisted one are dropped first, so
+        connectors can report a whole page without forcing rewrites.
+        Called inside execute()'s try block — errors propagate there.
+        """
+        state = (sync.config or {}).get(SYNC_STATE_KEY) or {}
+        known_etags = state.get("etags") or {}
+        files = {
+            rel_path: content
+            for rel_path, content in changes.files.items()
+            if not (
+                rel_path in changes.etags
+                and known_etags.get(rel_path) == changes.etags[rel_path]
+            )
+        }
+        deleted = list(changes.deleted)
+
+        if not files and not deleted:
+            self._save_sync_state(sync, changes)
+            self.sync_repo.update_status(sync.id, "active")
+            log_debug(
+                f"[SyncEngine] No changes for {sync.provider} sync {sync.id} "
+                f"(cursor={changes.cursor})"
+            )
+            if run and self.run_repo:
+                self.run_repo.complete(
+                    run.id, status="skipped",
+                    result_summary="No changes detected",
+                )
+            return None
+
+        external_resource_id = (sync.config or {}).get("external_resource_id", "")
+        operator = f"sync:{sync.provider}:{external_resource_id}"
+        summary = changes.summary or (
+            f"{len(files)} changed, {len(deleted)} deleted in {sync.provider}"
+        )
+
+        from src.mut_engine.dependencies import create_mut_ops
+        ops = create_mut_ops()
+
+        write_result = await ops.bulk_write(
+            sync.project_id,
+            {
+                _join_mount_path(sync.path, rel_path): _to_bytes(content)
+                for rel_path, content in files.items()
+            },
+            who=operator,
+            deleted=[_join_mount_path(sync.path, p) for p in deleted],
+            message=summary,
+        )
+        new_commit_id = write_result.commit_id
+
+        self._save_sync_state(sync, changes)
+        self.sync_repo.update_sync_point(
+            sync_id=sync.id,
+            last_sync_commit_id=new_commit_id,
+        )
+
+        log_info(
+            f"[SyncEngine] {sync.provider}:{external_resource_id} → "
+            f"{sync.path} incremental commit={new_commit_id} "
+            f"({len(files)} changed, {len(deleted)} deleted)"
+        )
+
+        if run and self.run_repo:
+            self.run_repo.complete(
+                run.id, status="success",
+                result_summary=summary,
+            )
+
+        return {
+            "access_point_id": sync.id,
+            "path": sync.path or "",
+            "provider": sync.provider,
+            "commit_id": new_commit_id,
+            "summary": summary,
+            "run_id": run.id if run else None,
+        }
+
+    def _save_sync_state(self, sync, changes: ChangeSet) -> None:
+        """Persist the ChangeSet cursor and merged etags into sync.config."""
+        config = dict(sync.config or {})
+        state = config.get(SYNC_STATE_KEY) or {}
+        if changes.full_resync:
+            etags = dict(changes.etags)
+        else:
+            etags = {**(state.get("etags") or {}), **changes.etags}
+            for rel_path in changes.deleted:
+                etags.pop(rel_path, None)
+        config[SYNC_STATE_KEY] = {"cursor": changes.cursor, "etags": etags}
+        self.sync_repo.update_config(sync.id, config)
+        sync.config = config
+
     async def execute_all(
         self,
         provider: Optional[str] = None,
@@ -320,7 +442,6 @@ class SyncEngine:
             log_error(f"[SyncEngine] push: no connector for provider {sync.provider}")
             return None
 
-        from src.connectors.datasource._base import Capability
         spec = connector.spec()
         if not (spec.capabilities & Capability.PUSH):
             log_debug(f"[SyncEngine] push skipped: {sync.provider} has no PUSH capability")
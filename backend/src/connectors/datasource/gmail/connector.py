@@ -4,6 +4,8 @@ Gmail Connector - Process Gmail imports via Google Gmail API.
 Architecture:
 - All emails are stored as a single JSON file in the MUT tree
 - Agent can use jq to query the JSON structure
+- Scheduled runs check the mailbox history ID first (fetch_changes) and
+  only re-download messages when the mailbox actually changed
 """
 
 from typing import TYPE_CHECKING
@@ -25,6 +27,7 @@ from src.connectors.datasource._base import (
     Capability,
     AuthRequirement,
     TriggerMode,
+    ChangeSet,
     FetchResult,
     Credentials,
     ConfigField,
@@ -42,12 +45,14 @@ class GmailConnector(BaseConnector):
 
     GMAIL_MESSAGES_URL = "https://gmail.googleapis.com/gmail/v1/users/me/messages"
     GMAIL_MESSAGE_URL = "https://gmail.googleapis.com/gmail/v1/users/me/messages/{id}"
+    GMAIL_PROFILE_URL = "https://gmail.googleapis.com/gmail/v1/users/me/profile"
+    GMAIL_HISTORY_URL = "https://gmail.googleapis.com/gmail/v1/users/me/history"
 
     def spec(self) -> ConnectorSpec:
         return ConnectorSpec(
             provider="gmail",
             display_name="Gmail",
-            capabilities=Capability.PULL,
+            capabilities=Capability.PULL | Capability.INCREMENTAL,
             supported_directions=["inbound"],
             default_trigger=TriggerMode.POLL,
             default_node_type="json",
@@ -144,6 +149,60 @@ class GmailConnector(BaseConnector):
             summary=f"Fetched {len(emails)} emails from {user_email}",
         )
 
+    async def fetch_changes(
+        self,
+        config: dict,
+        credentials: Credentials,
+        cursor: Optional[str],
+        etags: dict[str, str],
+    ) -> ChangeSet:
+        """Check the mailbox history since ``cursor`` (a Gmail history ID).
+
+        The output is one aggregate JSON file filtered by query and
+        max_results, so any mailbox change is answered with full_resync.
+        The win is the common case: no history records → no message
+        downloads at all. An expired history ID (404) also resyncs.
+        """
+        headers = {"Authorization": f"Bearer {credentials.access_token}"}
+
+        if not cursor:
+            return ChangeSet(
+                cursor=await self._fetch_history_id(headers),
+                full_resync=True,
+            )
+
+        params: dict[str, Any] = {"startHistoryId": cursor, "maxResults": 500}
+        latest = cursor
+        while True:
+            response = await self.client.get(
+                self.GMAIL_HISTORY_URL, headers=headers, params=params,
+            )
+            if response.status_code == 404:
+                return ChangeSet(
+                    cursor=await self._fetch_history_id(headers),
+                    full_resync=True,
+                )
+            response.raise_for_status()
+            data = response.json()
+            latest = str(data.get("historyId") or latest)
+            if data.get("history"):
+                # Re-read the head ID *before* fetch() runs so anything
+                # that lands during the download is picked up next time.
+                return ChangeSet(
+                    cursor=await self._fetch_history_id(headers),
+                    full_resync=True,
+                )
+            page_token = data.get("nextPageToken")
+            if not page_token:
+                return ChangeSet(cursor=latest)
+            params["pageToken"] = page_token
+
+    async def _fetch_history_id(self, headers: dict) -> str:
+        """Return the mailbox's current history ID."""
+        response = await self.client.get(self.GMAIL_PROFILE_URL, headers=headers)
+        response.raise_for_status()
+        return str(response.json().get("historyId", ""))
+
     async def _fetch_email_ids(
         self,
         access_token: str,
@@ -7,6 +7,8 @@ Context Publish API
 
 from __future__ import annotations
 
+import hashlib
+
 from fastapi import APIRouter, Depends, Query, Request, status
 from fastapi.responses import JSONResponse
 
@@ -17,6 +19,7 @@ from src.context_publish.schemas import PublishCreate, PublishOut, PublishUpdate
 from src.context_publish.service import ContextPublishService
 from src.platform.auth.dependencies import get_current_user
 from src.platform.auth.models import CurrentUser
+from src.utils.http_cache import compute_etag, not_modified_response, set_validator
 
 router = APIRouter(prefix="/publishes", tags=["publishes"])
 public_router = APIRouter(tags=["publishes"])
@@ -129,8 +132,19 @@ def delete_publish(
 )
 def get_public_json(
     publish_key: str,
+    request: Request,
     svc: ContextPublishService = Depends(get_context_publish_service),
 ):
     # Return raw JSON (do not wrap in ApiResponse)
     data = svc.get_public_json(publish_key)
-    return JSONResponse(content=data)
+    response = JSONResponse(content=data)
+
+    # The publish serves live table data, so it is not immutable: cache for
+    # as long as the service caches the publish, then revalidate by body hash
+    etag = compute_etag(hashlib.sha1(response.body).hexdigest())
+    cache_control = f"public, max-age={settings.PUBLISH_CACHE_TTL_SECONDS}, must-revalidate"
+    cached = not_modified_response(request, etag, cache_control)
+    if cached is not None:
+        return cached
+    set_validator(response, etag, cache_control)
+    return response
@@ -7,7 +7,7 @@ This layer persists to Supabase/Postgres table: public.chunks
 from __future__ import annotations
 
 import time
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence
 
 from src.infra.chunking.config import ChunkingConfig
 from src.infra.chunking.schemas import Chunk, ChunkCreate, EnsureChunksResult
@@ -15,6 +15,9 @@ from src.infra.chunking.service import ChunkingService, compute_content_hash
 from src.infra.supabase.exceptions import handle_supabase_error
 from src.utils.logger import log_info
 
+# (path, json_pointer, content_hash): identifies one chunked node version
+ChunkKey = tuple[str, str, str]
+
 
 class ChunkRepository:
     def __init__(self, client: Any):
@@ -63,6 +66,67 @@ class ChunkRepository:
         )
         return [Chunk(**row) for row in (resp.data or [])]
 
+    def get_by_hashes(
+        self,
+        keys: Sequence[ChunkKey],
+        *,
+        hashes_per_query: int = 100,
+        page_size: int = 1000,
+    ) -> dict[ChunkKey, list[Chunk]]:
+        """
+        Batch variant of get_by_hash: chunks for many (path, json_pointer, content_hash) keys.
+
+        PostgREST has no tuple IN, so each query filters ``path IN`` and
+        ``content_hash IN`` (pointers can be long; they stay out of the URL) and
+        rows are matched to keys here. Hashes are sent ``hashes_per_query`` at a
+        time to bound the URL length; results are paged past the row limit.
+        Returns only keys that have chunks, each list ordered by chunk_index.
+        """
+        wanted = set(keys)
+        if not wanted:
+            return {}
+
+        probe = self._client.table("chunks").select("*")
+        if not hasattr(probe, "in_"):
+            out: dict[ChunkKey, list[Chunk]] = {}
+            for path, pointer, content_hash in wanted:
+                rows = self.get_by_hash(
+                    path=path, json_pointer=pointer, content_hash=content_hash
+                )
+                if rows:
+                    out[(path, pointer, content_hash)] = rows
+            return out
+
+        paths = sorted({k[0] for k in wanted})
+        hashes = sorted({k[2] for k in wanted})
+        found: dict[ChunkKey, list[Chunk]] = {}
+        for i in range(0, len(hashes), hashes_per_query):
+            batch = hashes[i : i + hashes_per_query]
+            offset = 0
+            while True:
+                resp = (
+                    self._client.table("chunks")
+                    .select("*")
+                    .in_("path", paths)
+                    .in_("content_hash", batch)
+                    .order("id")
+                    .range(offset, offset + page_size - 1)
+                    .execute()
+                )
+                rows = resp.data or []
+                for row in rows:
+                    chunk = Chunk(**row)
+                    key = (chunk.path, chunk.json_pointer, chunk.content_hash)
+                    if key in wanted:
+                        found.setdefault(key, []).append(chunk)
+                if len(rows) < page_size:
+                    break
+                offset += page_size
+
+        for chunks in found.values():
+            chunks.sort(key=lambda c: c.chunk_index)
+        return found
+
     def bulk_create(self, chunks: list[ChunkCreate]) -> list[Chunk]:
         if not chunks:
             return []
@@ -73,6 +137,15 @@ class ChunkRepository:
         except Exception as e:
             raise handle_supabase_error(e, "create chunks")
 
+    def bulk_create_batched(
+        self, chunks: list[ChunkCreate], *, batch_size: int = 500
+    ) -> list[Chunk]:
+        """bulk_create in ``batch_size`` inserts (keeps request bodies bounded)."""
+        out: list[Chunk] = []
+        for i in range(0, len(chunks), batch_size):
+            out.extend(self.bulk_create(chunks[i : i + batch_size]))
+        return out
+
 
 def ensure_chunks_for_pointer(
     *,
@@ -179,3 +252,115 @@ def ensure_chunks_for_pointer(
         chunks=created_sorted,
         meta={"total_chunks": total},
     )
+
+
+def ensure_chunks_for_pointers(
+    *,
+    repo: ChunkRepository,
+    service: Optional[ChunkingService] = None,
+    nodes: Sequence[tuple[str, str, str]],
+    config: Optional[ChunkingConfig] = None,
+    insert_batch_size: int = 500,
+) -> list[EnsureChunksResult]:
+    """
+    Batch variant of ensure_chunks_for_pointer for many (path, json_pointer, content) nodes,
+    e.g. every large string of a document or of several files.
+
+    One hash lookup pass (get_by_hashes) and batched inserts replace the
+    per-node get_by_hash + bulk_create round trips. Results are returned in
+    input order; duplicate nodes share one set of chunks.
+    """
+    t0 = time.perf_counter()
+    if not nodes:
+        return []
+
+    cfg = config or ChunkingConfig()
+    svc = service or ChunkingService()
+
+    keys: list[ChunkKey] = []
+    content_by_key: dict[ChunkKey, str] = {}
+    for path, json_pointer, content in nodes:
+        svc.validate_content_limits(
+            content,
+            max_content_size_chars=cfg.max_content_size_chars,
+            max_chunks_per_node=cfg.max_chunks_per_node,
+            config=cfg,
+        )
+        key = (path, json_pointer, compute_content_hash(content))
+        keys.append(key)
+        content_by_key.setdefault(key, content)
+
+    t1 = time.perf_counter()
+    existing = repo.get_by_hashes(list(content_by_key))
+    log_info(
+        f"[ensure_chunks_batch] lookup done: nodes={len(nodes)} unique={len(content_by_key)} "
+        f"found={len(existing)} elapsed_ms={int((time.perf_counter() - t1) * 1000)}"
+    )
+
+    creates: List[ChunkCreate] = []
+    missing = [k for k in content_by_key if k not in existing]
+    for path, json_pointer, content_hash in missing:
+        segments = svc.chunk_text(
+            content_by_key[(path, json_pointer, content_hash)],
+            chunk_size_chars=cfg.chunk_size_chars,
+            chunk_overlap_chars=cfg.chunk_overlap_chars,
+        )
+        total = len(segments)
+        for idx, seg in enumerate(segments):
+            creates.append(
+                ChunkCreate(
+                    path=path,
+                    json_pointer=json_pointer,
+                    chunk_index=idx,
+                    total_chunks=total,
+                    chunk_text=seg.text,
+                    char_start=seg.char_start,
+                    char_end=seg.char_end,
+                    content_hash=content_hash,
+                )
+            )
+
+    created_by_key: dict[ChunkKey, list[Chunk]] = {}
+    if creates:
+        t2 = time.perf_counter()
+        created = repo.bulk_create_batched(creates, batch_size=insert_batch_size)
+        for c in created:
+            created_by_key.setdefault((c.path, c.json_pointer, c.content_hash), []).append(c)
+        for chunks in created_by_key.values():
+            chunks.sort(key=lambda c: c.chunk_index)
+        log_info(
+            f"[ensure_chunks_batch] bulk_create done: nodes={len(missing)} created={len(created)} "
+            f"elapsed_ms={int((time.perf_counter() - t2) * 1000)}"
+        )
+
+    results: list[EnsureChunksResult] = []
+    for key in keys:
+        path, json_pointer, content_hash = key
+        if key in existing:
+            results.append(
+                EnsureChunksResult(
+                    path=path,
+                    json_pointer=json_pointer,
+                    content_hash=content_hash,
+                    created=False,
+                    chunks=existing[key],
+                )
+            )
+        else:
+            chunks = created_by_key.get(key, [])
+            results.append(
+                EnsureChunksResult(
+                    path=path,
+                    json_pointer=json_pointer,
+                    content_hash=content_hash,
+                    created=True,
+                    chunks=chunks,
+                    meta={"total_chunks": len(chunks)},
+                )
+            )
+
+    log_info(
+        f"[ensure_chunks_batch] done: nodes={len(nodes)} created_chunks={len(creates)} "
+        f"total_ms={int((time.perf_counter() - t0) * 1000)}"
+    )
+    return results
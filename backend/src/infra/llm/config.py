@@ -80,6 +80,40 @@ class LLMConfig(BaseSettings):
         description="Batch size for embedding generation (1-2048, default 100)",
     )
 
+    # Embedding backend: "openrouter" (remote API) or "local" (CPU process pool)
+    embedding_backend: str = Field(
+        default="openrouter",
+        description="Embedding backend: 'openrouter' or 'local'",
+    )
+
+    # Local backend settings (the model must output embedding_dimensions vectors)
+    local_embedding_model: str = Field(
+        default="BAAI/bge-m3",
+        description="HuggingFace / sentence-transformers model for the local backend",
+    )
+    local_embedding_workers: int = Field(
+        default=1, description="Worker processes in the local embedding pool"
+    )
+    local_embedding_threads: int | None = Field(
+        default=None, description="torch CPU threads per local embedding worker"
+    )
+    local_embedding_quantize: bool = Field(
+        default=False, description="int8 dynamic quantization for the local model"
+    )
+    local_embedding_max_batch: int = Field(
+        default=64, description="Max texts per local inference batch (across callers)"
+    )
+    local_embedding_batch_wait_ms: int = Field(
+        default=5, description="How long concurrent local requests wait to share a batch"
+    )
+    local_embedding_allow_truncation: bool = Field(
+        default=False,
+        description=(
+            "Cut larger local model vectors to embedding_dimensions "
+            "(only for Matryoshka-trained models)"
+        ),
+    )
+
     # Request timeout settings
     llm_timeout: int = Field(
         default=60, description="Timeout for LLM API calls in seconds"
@@ -116,8 +150,19 @@ class LLMConfig(BaseSettings):
             return 100
         return v
 
+    @field_validator("embedding_backend")
+    @classmethod
+    def _validate_embedding_backend(cls, v: str) -> str:
+        v = (v or "openrouter").strip().lower()
+        if v not in {"openrouter", "local"}:
+            raise ValueError("embedding_backend must be 'openrouter' or 'local'")
+        return v
+
     @model_validator(mode="after")
     def _warn_if_embedding_config_suspicious(self) -> "LLMConfig":
+        if self.embedding_backend == "local":
+            return self
+
         # API key presence validation (non-blocking)
         if not os.environ.get("OPENROUTER_API_KEY"):
             logger.warning(
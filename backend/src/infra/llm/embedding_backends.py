@@ -0,0 +1,345 @@
+"""
+Embedding Backends
+
+Pluggable inference backends for EmbeddingService.
+
+- "openrouter" (default): remote API, implemented by EmbeddingService itself
+- "local": in-process CPU inference in a dedicated process pool, so
+  self-hosted deployments can index without an external service
+
+The local backend loads the model once per worker process
+(sentence-transformers from the ``local-embedding`` extra when installed,
+otherwise the qllama HuggingFace provider from tools/puppy_model) and
+coalesces texts from concurrent callers into shared batches before
+submitting them to the pool.
+
+The model's output dimension must match ``embedding_dimensions`` (the
+Turbopuffer namespace schema); ``start()`` checks this once and fails with
+a configuration error otherwise. Cutting larger vectors down (prefix + L2
+renormalize) is only meaningful for Matryoshka-trained models, so it
+happens only with ``allow_truncation``.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.infra.llm.exceptions import InvalidResponseError, LLMError
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBackend(ABC):
+    """Turns a batch of validated texts into vectors (input order preserved)."""
+
+    name: str = ""
+
+    @abstractmethod
+    async def embed(self, texts: list[str], model: str) -> list[list[float]]:
+        ...
+
+    async def start(self) -> None:
+        """Validate configuration eagerly (app startup); optional."""
+        return None
+
+    async def aclose(self) -> None:
+        return None
+
+
+# ============================================================
+# Worker process side
+# ============================================================
+
+_worker_model = None
+_worker_encode = None
+_worker_dimension: Optional[int] = None
+
+
+def _init_worker(model_name: str, num_threads: Optional[int], quantize: bool) -> None:
+    """Pool initializer: load the model once per worker process."""
+    global _worker_model, _worker_encode, _worker_dimension
+
+    if num_threads:
+        os.environ.setdefault("OMP_NUM_THREADS", str(num_threads))
+
+    try:
+        from sentence_transformers import SentenceTransformer
+
+        if num_threads:
+            import torch
+
+            torch.set_num_threads(num_threads)
+        model = SentenceTransformer(model_name, device="cpu")
+        if quantize:
+            import torch
+
+            model = torch.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        _worker_model = model
+
+        def _encode(texts: list[str]) -> list[list[float]]:
+            return _worker_model.encode(
+                texts, batch_size=len(texts), convert_to_numpy=True
+            ).tolist()
+
+        _worker_encode = _encode
+        _worker_dimension = model.get_sentence_embedding_dimension()
+        return
+    except ImportError:
+        pass
+
+    from qllama.providers.huggingface import HuggingFaceProvider
+
+    _worker_model = HuggingFaceProvider(
+        device="cpu", quantize=quantize, num_threads=num_threads
+    )
+
+    def _encode(texts: list[str]) -> list[list[float]]:
+        return _worker_model.embed(model_name, texts, batch_size=len(texts))
+
+    _worker_encode = _encode
+    _worker_dimension = None
+
+
+def _encode_in_worker(texts: list[str]) -> list[list[float]]:
+    return _worker_encode(texts)
+
+
+def _model_dimension_in_worker() -> int:
+    if _worker_dimension:
+        return _worker_dimension
+    return len(_worker_encode(["dimension probe"])[0])
+
+
+def fit_dimension(vector: list[float], dimensions: Optional[int]) -> list[float]:
+    """Cut a vector to ``dimensions`` and L2-renormalize it."""
+    if not dimensions or len(vector) == dimensions:
+        return vector
+    if len(vector) < dimensions:
+        raise InvalidResponseError(
+            "embedding",
+            f"Local model dimension {len(vector)} is smaller than configured {dimensions}",
+        )
+    head = vector[:dimensions]
+    norm = math.sqrt(sum(x * x for x in head)) or 1.0
+    return [x / norm for x in head]
+
+
+# ============================================================
+# Local backend
+# ============================================================
+
+
+@dataclass
+class _Pending:
+    texts: list[str]
+    future: asyncio.Future = field(repr=False)
+
+
+@dataclass
+class _LoopQueue:
+    """Batching state of one event loop (futures and tasks are loop-bound)."""
+    pending: list[_Pending] = field(default_factory=list)
+    queued_texts: int = 0
+    flush_task: asyncio.Task | None = None
+    wakeup: asyncio.Event | None = None
+    inflight: set[asyncio.Task] = field(default_factory=set)
+
+
+class LocalEmbeddingBackend(EmbeddingBackend):
+    """
+    CPU embedding backend running in a dedicated process pool.
+
+    Concurrent ``embed`` calls are queued; a flusher waits up to
+    ``batch_wait_ms`` (or until ``max_batch`` texts are queued), runs them
+    as one pool job and hands every caller its slice of the result. The
+    singleton is shared by every event loop in the process, so each loop
+    batches separately; the process pool is shared.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        model_name: str,
+        *,
+        dimensions: Optional[int] = None,
+        workers: int = 1,
+        num_threads: Optional[int] = None,
+        quantize: bool = False,
+        max_batch: int = 64,
+        batch_wait_ms: int = 5,
+        allow_truncation: bool = False,
+    ):
+        self.model_name = model_name
+        self.dimensions = dimensions
+        self.allow_truncation = allow_truncation
+        self.workers = max(1, workers)
+        self.num_threads = num_threads
+        self.quantize = quantize
+        self.max_batch = max(1, max_batch)
+        self.batch_wait = max(0, batch_wait_ms) / 1000.0
+
+        self._executor: ProcessPoolExecutor | None = None
+        self._queues: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopQueue] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._queues_lock = threading.Lock()
+        self._model_dimension: Optional[int] = None
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            logger.info(
+                "Starting local embedding pool: model=%s, workers=%s, threads=%s, quantize=%s",
+                self.model_name,
+                self.workers,
+                self.num_threads,
+                self.quantize,
+            )
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.model_name, self.num_threads, self.quantize),
+            )
+        return self._executor
+
+    async def start(self) -> None:
+        """Load the model in the pool and check its dimension against the config.
+
+        Raises ``LLMError`` when they differ, unless the model is larger and
+        truncation was explicitly allowed.
+        """
+        if not self.dimensions or self._model_dimension is not None:
+            return
+        loop = asyncio.get_running_loop()
+        native = await loop.run_in_executor(self._ensure_executor(), _model_dimension_in_worker)
+        if native != self.dimensions and not (self.allow_truncation and native > self.dimensions):
+            raise LLMError(
+                f"Local embedding model {self.model_name} produces {native}-dimensional "
+                f"vectors but embedding_dimensions is {self.dimensions}. Set "
+                f"EMBEDDING_DIMENSIONS={native} (and reindex), pick a model with "
+                f"{self.dimensions} dimensions, or set LOCAL_EMBEDDING_ALLOW_TRUNCATION=true "
+                f"if the model is Matryoshka-trained."
+            )
+        if native != self.dimensions:
+            logger.warning(
+                "Truncating %s embeddings from %s to %s dimensions",
+                self.model_name,
+                native,
+                self.dimensions,
+            )
+        self._model_dimension = native
+
+    def _loop_queue(self, loop: asyncio.AbstractEventLoop) -> _LoopQueue:
+        with self._queues_lock:
+            queue = self._queues.get(loop)
+            if queue is None:
+                queue = self._queues[loop] = _LoopQueue()
+            return queue
+
+    async def embed(self, texts: list[str], model: str) -> list[list[float]]:
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        queue = self._loop_queue(loop)
+        pending = _Pending(list(texts), loop.create_future())
+        queue.pending.append(pending)
+        queue.queued_texts += len(texts)
+
+        if queue.flush_task is None or queue.flush_task.done():
+            queue.wakeup = asyncio.Event()
+            queue.flush_task = loop.create_task(self._flush_loop(queue))
+        if queue.queued_texts >= self.max_batch and queue.wakeup is not None:
+            queue.wakeup.set()
+
+        return await pending.future
+
+    async def _flush_loop(self, queue: _LoopQueue) -> None:
+        while queue.pending:
+            if queue.queued_texts < self.max_batch and self.batch_wait:
+                try:
+                    await asyncio.wait_for(queue.wakeup.wait(), timeout=self.batch_wait)
+                except asyncio.TimeoutError:
+                    pass
+            queue.wakeup.clear()
+
+            batch: list[_Pending] = []
+            count = 0
+            while queue.pending and (
+                not batch or count + len(queue.pending[0].texts) <= self.max_batch
+            ):
+                item = queue.pending.pop(0)
+                batch.append(item)
+                count += len(item.texts)
+            queue.queued_texts -= count
+
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            queue.inflight.add(task)
+            task.add_done_callback(queue.inflight.discard)
+
+    async def _run_batch(self, batch: list[_Pending]) -> None:
+        texts = [t for item in batch for t in item.texts]
+        try:
+            await self.start()
+            loop = asyncio.get_running_loop()
+            vectors = await loop.run_in_executor(
+                self._ensure_executor(), _encode_in_worker, texts
+            )
+            vectors = [[float(x) for x in v] for v in vectors]
+            if self.allow_truncation:
+                vectors = [fit_dimension(v, self.dimensions) for v in vectors]
+            if len(vectors) != len(texts):
+                raise InvalidResponseError(
+                    "embedding",
+                    f"Expected {len(texts)} embeddings, got {len(vectors)}",
+                )
+        except Exception as e:
+            error = e if isinstance(e, LLMError) else LLMError(
+                f"Local embedding error: {e!s}", original_error=e
+            )
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(error)
+            return
+
+        offset = 0
+        for item in batch:
+            n = len(item.texts)
+            if not item.future.done():
+                item.future.set_result(vectors[offset : offset + n])
+            offset += n
+
+    async def aclose(self) -> None:
+        queue = self._queues.get(asyncio.get_running_loop())
+        if queue is not None and queue.inflight:
+            await asyncio.gather(*queue.inflight, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def create_embedding_backend(config) -> EmbeddingBackend | None:
+    """Build the configured backend; None means EmbeddingService's OpenRouter path."""
+    backend = (config.embedding_backend or "openrouter").lower()
+    if backend == "openrouter":
+        return None
+    if backend == "local":
+        return LocalEmbeddingBackend(
+            config.local_embedding_model,
+            dimensions=config.embedding_dimensions,
+            workers=config.local_embedding_workers,
+            num_threads=config.local_embedding_threads,
+            quantize=config.local_embedding_quantize,
+            max_batch=config.local_embedding_max_batch,
+            batch_wait_ms=config.local_embedding_batch_wait_ms,
+            allow_truncation=config.local_embedding_allow_truncation,
+        )
+    raise ValueError(f"Unknown embedding backend: {config.embedding_backend}")
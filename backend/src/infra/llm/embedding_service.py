@@ -5,6 +5,8 @@ Core service for generating embeddings via OpenRouter (using OpenAI client).
 
 Uses the OpenAI client to call the OpenRouter embedding API directly,
 avoiding the issue where litellm does not support OpenRouter embeddings.
+With ``embedding_backend="local"`` the same API is served by a local CPU
+model instead (see embedding_backends.py).
 """
 
 import asyncio
@@ -13,6 +15,7 @@ import os
 from typing import Any, Optional
 
 from src.infra.llm.config import llm_config
+from src.infra.llm.embedding_backends import EmbeddingBackend, create_embedding_backend
 from src.infra.llm.exceptions import (
     APIKeyError,
     InvalidInputError,
@@ -36,7 +39,7 @@ class EmbeddingService:
     # OpenAI embedding token limit example (used for input pre-check to avoid hard-to-diagnose batch errors)
     _DEFAULT_MAX_INPUT_TOKENS = 8191
 
-    def __init__(self):
+    def __init__(self, backend: EmbeddingBackend | None = None):
         self.config = llm_config
         self.default_model = self.config.default_embedding_model
         self.supported_models = self.config.supported_embedding_models
@@ -45,12 +48,34 @@ class EmbeddingService:
 
         self._client_loaded = False
         self._async_client = None
+        self._backend = backend or create_embedding_backend(self.config)
+
+        if self._backend is not None:
+            # Local models are addressed as "local/<model>"; OpenRouter names do not apply
+            self.default_model = f"local/{self.config.local_embedding_model}"
+            self.supported_models = [self.default_model]
+            logger.info(
+                "EmbeddingService initialized with %s backend: %s",
+                self._backend.name,
+                self.default_model,
+            )
+            return
 
         logger.info(
             "EmbeddingService initialized with default model: %s (OpenAI client not loaded yet)",
             self.default_model,
         )
 
+    async def start(self) -> None:
+        """Load and validate the backend (local model dimension); no-op for OpenRouter."""
+        if self._backend is not None:
+            await self._backend.start()
+
+    async def aclose(self) -> None:
+        """Release backend resources (local process pool)."""
+        if self._backend is not None:
+            await self._backend.aclose()
+
     def _ensure_client(self) -> None:
         """
         Ensure the OpenAI client is loaded (lazy initialization).
@@ -165,8 +190,16 @@ class EmbeddingService:
         self, texts: list[str], model: str
     ) -> list[list[float]]:
         """
-        Call the OpenRouter embedding API (with retries).
+        Call the OpenRouter embedding API (with retries), or the configured
+        local backend.
         """
+        if self._backend is not None:
+            embeddings = await self._backend.embed(texts, model)
+            return self._extract_embeddings(
+                {"data": [{"embedding": e} for e in embeddings]},
+                expected_count=len(texts),
+            )
+
         self._ensure_client()
 
         # Convert model name (strip openrouter/ prefix)
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import AsyncIterator, Callable, TypeVar
+from typing import AsyncIterator, BinaryIO, Callable, TypeVar
 
 import boto3
 from botocore.exceptions import ClientError
@@ -193,6 +193,47 @@ class S3Service:
             self._handle_client_error(e, "upload_file")
             raise  # Never reached, but required by type checker
 
+    async def upload_fileobj(
+        self,
+        key: str,
+        fileobj: BinaryIO,
+        size: int,
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> FileUploadResponse:
+        """
+        Upload ``size`` bytes read from a seekable file object.
+
+        Like ``upload_file``, but large files are read one part at a time
+        (from offset 0), so the upload never holds more than one part in
+        memory. Use this for request uploads that Starlette already spooled
+        to disk.
+
+        Raises:
+            S3FileSizeExceededError: File size exceeded
+            S3OperationError: Upload failed
+        """
+        if size > self.max_file_size:
+            raise S3FileSizeExceededError(size, self.max_file_size)
+
+        if size <= self.multipart_threshold:
+            fileobj.seek(0)
+            content = await asyncio.to_thread(fileobj.read, size)
+            return await self.upload_file(key, content, content_type, metadata)
+
+        logger.info(
+            f"File size ({size} bytes) exceeds threshold ({self.multipart_threshold} bytes), "
+            f"using multipart upload for {key}"
+        )
+
+        def read_part(offset: int, length: int) -> bytes:
+            fileobj.seek(offset)
+            return fileobj.read(length)
+
+        return await self._upload_multipart(
+            key, size, read_part, content_type, metadata
+        )
+
     async def _upload_file_multipart(
         self,
         key: str,
@@ -212,7 +253,23 @@ class S3Service:
         Returns:
             FileUploadResponse: Upload result
         """
-        file_size = len(content)
+        return await self._upload_multipart(
+            key,
+            len(content),
+            lambda offset, length: content[offset : offset + length],
+            content_type,
+            metadata,
+        )
+
+    async def _upload_multipart(
+        self,
+        key: str,
+        file_size: int,
+        read_part: Callable[[int, int], bytes],
+        content_type: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> FileUploadResponse:
+        """Multipart upload of ``file_size`` bytes supplied by ``read_part(offset, length)``."""
         upload_id = None
 
         try:
@@ -227,7 +284,7 @@ class S3Service:
             while offset < file_size:
                 # Calculate current part size
                 chunk_size = min(self.multipart_chunksize, file_size - offset)
-                chunk_data = content[offset : offset + chunk_size]
+                chunk_data = await asyncio.to_thread(read_part, offset, chunk_size)
 
                 # Upload part
                 etag = await self.upload_part(key, upload_id, part_number, chunk_data)
@@ -132,3 +132,18 @@ class SandboxBase(ABC):
     async def stop_all(self) -> None:
         """Stop all sandbox sessions (used during service shutdown)"""
         ...
+
+    async def maintain(self) -> None:
+        """Periodic housekeeping (e.g. warm pool refill), driven by the sandbox reaper job"""
+        return None
+
+    def local_workspace(self, session_id: str) -> Optional[tuple[str, dict]]:
+        """
+        Host-visible workspace of a session, if the backend has one
+
+        Returns:
+            (workspace_dir, manifest) where manifest is the live
+            {relative_path: ManifestEntry} snapshot taken at hydration, or
+            None when files can only be read back through the sandbox
+        """
+        return None
@@ -0,0 +1,273 @@
+"""Warm container pool for the Docker sandbox
+
+Starting a container and waiting for it to answer ``echo ready`` costs
+seconds (much more on the alpine fallback, which installs packages).
+The pool keeps ``SANDBOX_POOL_SIZE`` idle containers per mount mode,
+each already running with its own empty host directory bind-mounted at
+/workspace. A session claims one and hydrates files straight into that
+directory — the bind mount makes them visible inside the container
+immediately, so no container start is on the request path.
+
+On release a container is reset (stray processes killed, /tmp cleared,
+workspace scrubbed down to the files its manifest still vouches for)
+and parked with affinity to the project it served. Only that project
+can claim it again, and the surviving workspace lets the next hydration
+skip unchanged blobs. The next session may run under a different agent
+or scope, so a container is recycled only if its writable layer is
+exactly as it was after warm-up (``docker diff``, outside /tmp); a
+session that wrote anywhere else — $HOME, caches, package installs — gets
+its container destroyed instead. Recycled containers are destroyed after
+SANDBOX_POOL_MAX_USES sessions or SANDBOX_POOL_IDLE_TTL seconds idle;
+``maintain`` (driven by the sandbox_reaper job) enforces that and
+refills the fresh pool.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.config import settings
+
+
+# Reset a recycled container: kill everything but PID 1 and clear /tmp
+_RESET_SCRIPT = (
+    'for p in $(ps -o pid= 2>/dev/null); do '
+    '[ "$p" != 1 ] && [ "$p" != $$ ] && kill -9 "$p" 2>/dev/null; '
+    'done; rm -rf /tmp/* /tmp/.[!.]* 2>/dev/null; true'
+)
+
+# Wiped by _RESET_SCRIPT, so changes below it don't block recycling
+_RESET_PATHS = ("/tmp",)
+
+# Fallback when the host cannot scrub files created as root inside the container
+_WIPE_WORKSPACE_SCRIPT = "find /workspace -mindepth 1 -delete 2>/dev/null; true"
+
+
+@dataclass
+class PooledContainer:
+    """A pool-managed container and its bind-mounted workspace"""
+    container_id: str
+    slot_dir: str  # Host directory owned by the pool (contains workspace/)
+    readonly: bool
+    project_id: Optional[str] = None  # Affinity: set once the container served a project
+    uses: int = 0
+    released_at: float = field(default_factory=time.time)
+    manifest: dict = field(default_factory=dict)  # Hydration manifest kept across sessions
+    layer: frozenset = frozenset()  # `docker diff` entries right after warm-up
+
+    @property
+    def workspace_dir(self) -> str:
+        return os.path.join(self.slot_dir, "workspace")
+
+
+class DockerContainerPool:
+    """
+    Pre-warmed Docker containers, split into read-only and writable lanes
+
+    Args:
+        sandbox: Owning DockerSandbox (provides docker command helpers)
+        size: Fresh idle containers kept per lane
+        image: Container image to warm
+        max_uses: Sessions a container may serve before it is destroyed
+        idle_ttl: Seconds a recycled container may sit idle
+    """
+
+    def __init__(
+        self,
+        sandbox,
+        size: Optional[int] = None,
+        image: Optional[str] = None,
+        max_uses: Optional[int] = None,
+        idle_ttl: Optional[float] = None,
+    ):
+        self._sandbox = sandbox
+        self.size = settings.SANDBOX_POOL_SIZE if size is None else size
+        self.image = image or settings.SANDBOX_POOL_IMAGE
+        self.max_uses = settings.SANDBOX_POOL_MAX_USES if max_uses is None else max_uses
+        self.idle_ttl = settings.SANDBOX_POOL_IDLE_TTL if idle_ttl is None else idle_ttl
+        self._idle: dict[bool, list[PooledContainer]] = {False: [], True: []}
+        self._starting: dict[bool, int] = {False: 0, True: 0}
+        self._refill_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0 and not self._closed
+
+    def idle_count(self, readonly: bool, project_id: Optional[str] = None) -> int:
+        return sum(1 for c in self._idle[readonly] if c.project_id == project_id)
+
+    def claim(self, readonly: bool, project_id: Optional[str] = None) -> Optional[PooledContainer]:
+        """
+        Take an idle container for a new session
+
+        A container recycled for ``project_id`` is preferred (its workspace
+        still holds that project's files); otherwise a fresh one is tagged
+        with the project. Returns None when the lane is empty — the caller
+        should cold-start instead. Triggers a background refill either way.
+        """
+        if not self.enabled:
+            return None
+        lane = self._idle[readonly]
+        picked: Optional[PooledContainer] = None
+        if project_id:
+            picked = next((c for c in lane if c.project_id == project_id), None)
+        if picked is None:
+            picked = next((c for c in lane if c.project_id is None), None)
+        if picked is not None:
+            lane.remove(picked)
+            picked.project_id = project_id
+        self._schedule_refill()
+        return picked
+
+    async def release(self, container: PooledContainer) -> None:
+        """
+        Return a container after its session ended
+
+        Resets it and parks it with project affinity, or destroys it when
+        it is worn out, the pool is closed, or the reset fails.
+        """
+        container.uses += 1
+        if self._closed or container.uses >= self.max_uses or not container.project_id:
+            await self._destroy(container)
+            return
+
+        returncode, _, _ = await self._sandbox._run_docker_command(
+            "exec", container.container_id, "sh", "-c", _RESET_SCRIPT,
+            timeout=10.0,
+        )
+        if returncode != 0:
+            await self._destroy(container)
+            return
+
+        # Anything the session wrote outside /workspace and /tmp would be
+        # visible to the next session, possibly another agent's scope
+        if await self._layer_changes(container.container_id) != container.layer:
+            await self._destroy(container)
+            return
+
+        from src.mut_engine.services.blob_hydrator import scrub_workspace
+
+        try:
+            container.manifest = await asyncio.to_thread(
+                scrub_workspace, container.workspace_dir, container.manifest,
+            )
+        except OSError:
+            container.manifest = {}
+            if container.readonly:
+                await self._destroy(container)
+                return
+            # Writable sessions may leave root-owned files the host cannot
+            # remove; wipe from inside the container and start clean.
+            await self._sandbox._run_docker_command(
+                "exec", container.container_id, "sh", "-c", _WIPE_WORKSPACE_SCRIPT,
+                timeout=10.0,
+            )
+            try:
+                await asyncio.to_thread(scrub_workspace, container.workspace_dir, {})
+            except OSError as e:
+                print(f"[DockerPool] Workspace scrub failed for {container.container_id[:12]}: {e}")
+                await self._destroy(container)
+                return
+
+        container.released_at = time.time()
+        self._idle[container.readonly].append(container)
+
+    async def maintain(self) -> None:
+        """Destroy stale recycled containers and top up the fresh pool"""
+        if not self.enabled:
+            return
+        now = time.time()
+        for lane in self._idle.values():
+            stale = [
+                c for c in lane
+                if c.project_id is not None and now - c.released_at > self.idle_ttl
+            ]
+            for c in stale:
+                lane.remove(c)
+                await self._destroy(c)
+        await self.refill()
+
+    async def refill(self) -> None:
+        """Start containers until each lane has ``size`` fresh idle containers"""
+        if not self.enabled or not await self._sandbox._check_docker_available():
+            return
+        starts = []
+        for readonly in (False, True):
+            missing = self.size - self.idle_count(readonly) - self._starting[readonly]
+            starts.extend(self._start_one(readonly) for _ in range(max(0, missing)))
+        if starts:
+            await asyncio.gather(*starts)
+
+    async def shutdown(self) -> None:
+        """Destroy all idle containers; in-use ones are destroyed on release"""
+        self._closed = True
+        if self._refill_task and not self._refill_task.done():
+            self._refill_task.cancel()
+        for lane in self._idle.values():
+            while lane:
+                await self._destroy(lane.pop())
+
+    def _schedule_refill(self) -> None:
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self.refill())
+
+    async def _start_one(self, readonly: bool) -> None:
+        self._starting[readonly] += 1
+        slot_dir = tempfile.mkdtemp(
+            prefix=f"sandbox-pool-{uuid.uuid4().hex[:8]}-",
+            dir=self._sandbox._get_sandbox_temp_root(),
+        )
+        try:
+            workspace_dir = os.path.join(slot_dir, "workspace")
+            os.makedirs(workspace_dir, exist_ok=True)
+            mount_option = f"{workspace_dir}:/workspace"
+            if readonly:
+                mount_option += ":ro"
+            success, container_id, error = await self._sandbox._try_start_container(
+                ["-v", mount_option], image=self.image,
+            )
+        except Exception as e:
+            success, container_id, error = False, "", str(e)
+        finally:
+            self._starting[readonly] -= 1
+
+        if not success:
+            print(f"[DockerPool] Failed to warm container: {error}")
+            shutil.rmtree(slot_dir, ignore_errors=True)
+            return
+
+        container = PooledContainer(container_id=container_id, slot_dir=slot_dir, readonly=readonly)
+        layer = await self._layer_changes(container_id)
+        if self._closed or layer is None:
+            await self._destroy(container)
+            return
+        container.layer = layer
+        self._idle[readonly].append(container)
+
+    async def _layer_changes(self, container_id: str) -> Optional[frozenset]:
+        """`docker diff` entries (kind, path) outside the reset paths; None on error"""
+        returncode, stdout, _ = await self._sandbox._run_docker_command(
+            "diff", container_id, timeout=10.0,
+        )
+        if returncode != 0:
+            return None
+        changes = set()
+        for line in stdout.splitlines():
+            kind, _, path = line.strip().partition(" ")
+            if not path or any(path == p or path.startswith(p + "/") for p in _RESET_PATHS):
+                continue
+            changes.add((kind, path))
+        return frozenset(changes)
+
+    async def _destroy(self, container: PooledContainer) -> None:
+        try:
+            await self._sandbox._run_docker_command("stop", container.container_id, timeout=10.0)
+        except Exception as e:
+            print(f"[DockerPool] Error stopping container {container.container_id[:12]}: {e}")
+        shutil.rmtree(container.slot_dir, ignore_errors=True)
@@ -8,12 +8,13 @@ import shutil
 import tempfile
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Optional
 
 from src.config import settings
 
 from .base import SandboxBase, SandboxSession
+from .docker_pool import DockerContainerPool, PooledContainer
 
 
 # Docker session timeout (seconds)
@@ -25,6 +26,9 @@ class DockerSession(SandboxSession):
     """Docker sandbox session data"""
     container_id: str = ""
     temp_path: str = ""  # Temporary file or directory path
+    workspace_dir: str = ""
+    manifest: dict = field(default_factory=dict)  # {relative_path: ManifestEntry} of hydrated blobs
+    pooled: Optional[PooledContainer] = None  # Set when the container was claimed from the warm pool
 
 
 class DockerSandbox(SandboxBase):
@@ -36,14 +40,21 @@ class DockerSandbox(SandboxBase):
     - Multi-file mounting
     - Command execution
     - File reading
+    - Warm container pool (SANDBOX_POOL_SIZE > 0)
     """
 
-    def __init__(self, session_timeout: float = DEFAULT_DOCKER_SESSION_TIMEOUT):
+    def __init__(
+        self,
+        session_timeout: float = DEFAULT_DOCKER_SESSION_TIMEOUT,
+        pool: Optional[DockerContainerPool] = None,
+    ):
         """
         Initialize Docker sandbox service
 
         Args:
             session_timeout: Session timeout in seconds, default 10 minutes
+            pool: Warm container pool, defaults to one built from settings
+                  (disabled when SANDBOX_POOL_SIZE is 0)
         """
         self._sessions: dict[str, DockerSession] = {}
         self._lock = threading.Lock()  # For fast synchronous access
@@ -53,6 +64,7 @@ class DockerSandbox(SandboxBase):
         self._docker_available: Optional[bool] = None
         self._docker_check_time: float = 0  # Last check time
         self._docker_cache_ttl: float = 60.0  # Cache TTL (seconds)
+        self._pool = pool or DockerContainerPool(self)
 
     def _get_sandbox_temp_root(self) -> str:
         """
@@ -226,7 +238,8 @@ class DockerSandbox(SandboxBase):
     async def _try_start_container(
         self,
         mount_args: list[str],
-        use_custom_image: bool = True
+        use_custom_image: bool = True,
+        image: str = "json-sandbox",
     ) -> tuple[bool, str, str]:
         """
         Attempt to start a Docker container
@@ -234,6 +247,7 @@ class DockerSandbox(SandboxBase):
         Args:
             mount_args: List of mount arguments
             use_custom_image: Whether to use a custom image
+            image: Custom image name
 
         Returns:
             (success, container_id, error_message)
@@ -242,8 +256,8 @@ class DockerSandbox(SandboxBase):
         resource_args = ["--memory=128m", "--cpus=0.5", "--pids-limit=100"]
 
         if use_custom_image:
-            # Try using the custom json-sandbox image
-            args = ["run", "-d", "--rm", *resource_args, *mount_args, "json-sandbox"]
+            # Try using the custom image (json-sandbox by default)
+            args = ["run", "-d", "--rm", *resource_args, *mount_args, image]
             returncode, stdout, stderr = await self._run_docker_command(*args, timeout=30.0)
 
             if returncode == 0:
@@ -257,7 +271,7 @@ class DockerSandbox(SandboxBase):
                     return (False, "", "Container started but not ready")
 
             # Custom image not found, fall back to alpine
-            print("[DockerSandbox] json-sandbox image not found, falling back to alpine:3.19")
+            print(f"[DockerSandbox] {image} image not found, falling back to alpine:3.19")
 
         # Use alpine:3.19 and install jq and bash
         args = ["run", "-d", "--rm", *resource_args, *mount_args, "alpine:3.19", "sh", "-c", "apk add --no-cache jq bash >/dev/null 2>&1 && tail -f /dev/null"]
@@ -305,6 +319,19 @@ class DockerSandbox(SandboxBase):
             if session_exists:
                 await self._stop_internal(session_id)
 
+        # Warm pool: write data.json into a pooled container's bound workspace
+        pooled = self._pool.claim(readonly)
+        if pooled is not None:
+            try:
+                with open(os.path.join(pooled.workspace_dir, "data.json"), "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+            except Exception as e:
+                await self._pool.release(pooled)
+                return {"success": False, "error": f"Failed to create temp file: {e}"}
+            self._record_pooled_session(session_id, pooled, readonly)
+            print(f"[DockerSandbox] Started session {session_id} on pooled container {pooled.container_id[:12]}, readonly: {readonly}")
+            return {"success": True}
+
         # Create temporary JSON file
         temp_file_path = self._create_temp_json_file(session_id)
 
@@ -385,16 +412,42 @@ class DockerSandbox(SandboxBase):
             if session_exists:
                 await self._stop_internal(session_id)
 
-        # Create temporary directory to store all files
-        temp_dir = self._create_temp_workspace_dir(session_id)
-        workspace_dir = os.path.join(temp_dir, "workspace")
-        os.makedirs(workspace_dir, exist_ok=True)
+        # Warm pool: claim a running container whose workspace is already bind-mounted,
+        # preferring one that last served the same project (its files are reused)
+        pooled = self._pool.claim(readonly, _single_project_id(files))
+        if pooled is not None:
+            temp_dir = ""
+            workspace_dir = pooled.workspace_dir
+            previous = pooled.manifest
+        else:
+            # Create temporary directory to store all files
+            temp_dir = self._create_temp_workspace_dir(session_id)
+            workspace_dir = os.path.join(temp_dir, "workspace")
+            os.makedirs(workspace_dir, exist_ok=True)
+            previous = None
+
+        # MUT blobs are hydrated by hash through the shared blob cache;
+        # hard links are only used when the mount is read-only
+        from .file_utils import hydrate_blob_files, prepare_files_for_docker_sandbox
+        files, manifest, written_paths, all_failures = await hydrate_blob_files(
+            files, workspace_dir, link=readonly, previous=previous
+        )
 
         # Use the dedicated Docker file preparation function, large files are streamed directly to disk
-        from .file_utils import prepare_files_for_docker_sandbox
-        written_paths, all_failures = await prepare_files_for_docker_sandbox(
+        more_written, more_failures = await prepare_files_for_docker_sandbox(
             files, workspace_dir, s3_service
         )
+        written_paths.extend(more_written)
+        all_failures.extend(more_failures)
+
+        if pooled is not None:
+            pooled.manifest = manifest
+            self._record_pooled_session(session_id, pooled, readonly)
+            print(f"[DockerSandbox] Started session {session_id} with {len(written_paths)} files written on pooled container {pooled.container_id[:12]}, readonly: {readonly}")
+            result: dict[str, Any] = {"success": True}
+            if all_failures:
+                result["warnings"] = all_failures
+            return result
 
         # Build mount arguments
         mount_option = f"{workspace_dir}:/workspace"
@@ -422,16 +475,44 @@ class DockerSandbox(SandboxBase):
                 created_at=now,
                 last_activity=now,
                 container_id=container_id,
-                temp_path=temp_dir  # Save the entire temporary directory
+                temp_path=temp_dir,  # Save the entire temporary directory
+                workspace_dir=workspace_dir,
+                manifest=manifest,
             )
 
         print(f"[DockerSandbox] Started session {session_id} with {len(written_paths)} files written, container: {container_id[:12]}, readonly: {readonly}")
 
-        result: dict[str, Any] = {"success": True}
+        result = {"success": True}
         if all_failures:
             result["warnings"] = all_failures
         return result
 
+    def _record_pooled_session(self, session_id: str, pooled: PooledContainer, readonly: bool) -> None:
+        now = time.time()
+        with self._lock:
+            self._sessions[session_id] = DockerSession(
+                sandbox=pooled.container_id,
+                readonly=readonly,
+                created_at=now,
+                last_activity=now,
+                container_id=pooled.container_id,
+                workspace_dir=pooled.workspace_dir,
+                manifest=pooled.manifest,
+                pooled=pooled,
+            )
+
+    def local_workspace(self, session_id: str) -> Optional[tuple[str, dict]]:
+        """Bind-mounted workspace and its hydration manifest (multi-file sessions only)"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+        if not session or not session.workspace_dir or not session.manifest:
+            return None
+        return session.workspace_dir, session.manifest
+
+    async def maintain(self) -> None:
+        """Recycle stale pooled containers and refill the warm pool"""
+        await self._pool.maintain()
+
     async def exec(self, session_id: str, command: str) -> dict:
         """
         Execute a command in the sandbox
@@ -547,6 +628,15 @@ class DockerSandbox(SandboxBase):
         if not session:
             return False  # Already does not exist
 
+        # Pooled container: hand it back for reset/recycling instead of stopping it
+        if session.pooled is not None:
+            try:
+                await self._pool.release(session.pooled)
+            except Exception as e:
+                print(f"[DockerSandbox] Error releasing pooled container {session_id}: {e}")
+            print(f"[DockerSandbox] Stopped session {session_id}")
+            return True
+
         # Stop container
         try:
             await self._run_docker_command(
@@ -616,6 +706,8 @@ class DockerSandbox(SandboxBase):
             for session_id in session_ids:
                 await self._stop_internal(session_id)
 
+            await self._pool.shutdown()
+
         if self._cleanup_task and not self._cleanup_task.done():
             self._cleanup_task.cancel()
             try:
@@ -624,3 +716,14 @@ class DockerSandbox(SandboxBase):
                 pass
 
         print("[DockerSandbox] All sessions stopped")
+
+
+def _single_project_id(files: list) -> Optional[str]:
+    """Project all blob-backed files belong to, or None when mixed/absent (no pool affinity)"""
+    project_ids = {
+        (f.get("project_id") if isinstance(f, dict) else getattr(f, "project_id", None)) or None
+        for f in files
+    }
+    if len(project_ids) == 1:
+        return project_ids.pop()
+    return None
@@ -48,6 +48,17 @@ async def download_files_parallel(
             if content is not None:
                 return (path, content, None)
 
+            # Content-addressed MUT blob: read through the shared blob cache
+            blob_hash = f.get("blob_hash") if isinstance(f, dict) else getattr(f, "blob_hash", None)
+            project_id = f.get("project_id") if isinstance(f, dict) else getattr(f, "project_id", None)
+            if blob_hash and project_id:
+                try:
+                    from src.mut_engine.services.blob_hydrator import get_blob_cache
+                    store = _get_project_store(project_id)
+                    return (path, await get_blob_cache().read(store, blob_hash), None)
+                except Exception as e:
+                    return (path, None, f"Failed to hydrate blob {blob_hash[:12]}: {e}")
+
             # Download from S3
             if s3_key and s3_service:
                 try:
@@ -76,6 +87,85 @@ async def download_files_parallel(
     return list(results)
 
 
+def _get_project_store(project_id: str):
+    """ObjectStore holding a project's MUT blobs."""
+    from src.mut_engine.dependencies import get_repo_manager_standalone
+    return get_repo_manager_standalone().get_repo(project_id).store
+
+
+def _field(f: Any, name: str) -> Any:
+    return f.get(name) if isinstance(f, dict) else getattr(f, name, None)
+
+
+def _workspace_relative(path: str) -> str:
+    if path.startswith("/workspace/"):
+        return path[len("/workspace/"):]
+    if path.startswith("/"):
+        return path[1:]
+    return path
+
+
+async def hydrate_blob_files(
+    files: list,
+    workspace_dir: str,
+    link: bool = False,
+    previous: Optional[dict] = None,
+) -> tuple[list, dict, list[str], list[dict]]:
+    """
+    Hydrate blob-backed files into a Docker workspace from the blob cache
+
+    Files that carry a ``blob_hash`` are streamed from the project's object
+    store into the shared on-disk cache, then hard-linked (read-only mounts)
+    or copied into the workspace. Inline content is ignored for them so
+    every MUT file lands in the manifest that write-back diffs against.
+
+    Args:
+        files: List of SandboxFile
+        workspace_dir: Local workspace directory
+        link: Hard-link from the cache instead of copying
+        previous: Manifest left in ``workspace_dir`` by an earlier session;
+                  only honoured when all files come from one project
+
+    Returns:
+        (remaining_files, manifest, written_paths, failed_files)
+        - remaining_files: Files that are not blob-backed, for the regular path
+        - manifest: {relative_path: ManifestEntry} of hydrated files
+    """
+    from src.mut_engine.services.blob_hydrator import hydrate_workspace
+
+    remaining: list = []
+    by_project: dict[str, dict[str, str]] = {}
+    for f in files:
+        blob_hash, project_id, path = _field(f, "blob_hash"), _field(f, "project_id"), _field(f, "path")
+        if blob_hash and project_id and path:
+            by_project.setdefault(project_id, {})[_workspace_relative(path)] = blob_hash
+        else:
+            remaining.append(f)
+
+    manifest: dict = {}
+    written_paths: list[str] = []
+    failed_files: list[dict] = []
+    if previous and len(by_project) != 1:
+        # Leftovers from a recycled workspace can't be diffed per project; start clean
+        from src.mut_engine.services.blob_hydrator import scrub_workspace
+        await asyncio.to_thread(scrub_workspace, workspace_dir, {})
+        previous = None
+    for project_id, entries in by_project.items():
+        try:
+            store = _get_project_store(project_id)
+        except Exception as e:
+            failed_files.extend({"path": p, "error": str(e)} for p in entries)
+            continue
+        result = await hydrate_workspace(
+            store, entries, workspace_dir, link=link, previous=previous
+        )
+        manifest.update(result.manifest)
+        written_paths.extend(os.path.join(workspace_dir, p) for p in result.written)
+        failed_files.extend(result.failed)
+
+    return remaining, manifest, written_paths, failed_files
+
+
 async def _get_file_size(s3_service: Any, s3_key: str) -> Optional[int]:
     """Get S3 file size"""
     try:
@@ -84,6 +84,14 @@ class SandboxService:
         """Stop all sandbox sessions"""
         await self._impl.stop_all()
 
+    async def maintain(self) -> None:
+        """Periodic housekeeping (warm pool recycling/refill)"""
+        await self._impl.maintain()
+
+    def local_workspace(self, session_id: str) -> Optional[tuple[str, dict]]:
+        """Host workspace directory + hydration manifest, if available"""
+        return self._impl.local_workspace(session_id)
+
     @property
     def sandbox_type(self) -> str:
         """Return the currently used sandbox type"""
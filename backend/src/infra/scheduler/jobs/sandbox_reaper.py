@@ -2,7 +2,8 @@
 Sandbox reaper job — periodically check for idle sandbox sessions
 and perform write-back + cleanup.
 
-Runs every 60s, reaps sessions idle for >= 4 minutes.
+Runs every 60s, reaps sessions idle for >= 4 minutes, then lets the
+sandbox backend recycle/refill its warm container pool.
 """
 
 from loguru import logger
@@ -21,13 +22,11 @@ async def reap_idle_sandboxes():
 
     registry = get_agent_sandbox_registry()
     idle_sessions = registry.get_idle_sessions()
-
-    if not idle_sessions:
-        return
-
-    logger.info(f"[SandboxReaper] Found {len(idle_sessions)} idle sessions to reap")
     sandbox_service = get_sandbox_service()
 
+    if idle_sessions:
+        logger.info(f"[SandboxReaper] Found {len(idle_sessions)} idle sessions to reap")
+
     for session in idle_sessions:
         try:
             updated = await writeback_and_destroy(session, sandbox_service)
@@ -47,3 +46,9 @@ async def reap_idle_sandboxes():
                 f"[SandboxReaper] Failed to reap {session.sandbox_session_id}: {e}"
             )
             registry.remove(session.chat_session_id)
+
+    # Reaped containers went back to the pool; recycle stale ones and refill
+    try:
+        await sandbox_service.maintain()
+    except Exception as e:
+        logger.warning(f"[SandboxReaper] Sandbox pool maintenance failed: {e}")
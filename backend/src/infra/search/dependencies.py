@@ -6,7 +6,7 @@ from src.mut_engine.dependencies import create_mut_ops
 from src.infra.llm.embedding_service import EmbeddingService
 from src.infra.search.service import SearchService
 from src.infra.supabase.client import SupabaseClient
-from src.infra.turbopuffer.service import TurbopufferSearchService
+from src.infra.turbopuffer.dependencies import get_turbopuffer_search_service
 from src.platform.project.dependencies import get_project_service
 
 _search_service: SearchService | None = None
@@ -25,6 +25,6 @@ def get_search_service() -> SearchService:
             project_service=get_project_service(),
             chunking_service=ChunkingService(),
             embedding_service=EmbeddingService(),
-            turbopuffer_service=TurbopufferSearchService(),
+            turbopuffer_service=get_turbopuffer_search_service(),
         )
     return _search_service
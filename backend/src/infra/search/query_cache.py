@@ -0,0 +1,166 @@
+"""
+Search query caches
+
+Agents tend to repeat the same (or trivially re-spaced) search queries many
+times within a session. Two process-wide caches cut the repeat cost:
+
+- QueryEmbeddingCache: query vector by (embedding model, normalized query),
+  so a repeat skips the embedding API call. Vectors for a given model never
+  go stale; the TTL only bounds memory for one-off queries.
+- SearchResultCache: one ranked page by (namespace, index watermark, query,
+  top_k, offset, mode). SearchService bumps a namespace's watermark after
+  every write to it, so entries from before a re-index are never served.
+  Writes made by another worker process are not seen, so entries also expire
+  after ``SEARCH_RESULT_CACHE_TTL_SECONDS``.
+
+cachetools caches are not thread-safe; all access goes through a lock.
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+import threading
+import unicodedata
+from typing import Any, Hashable, Optional
+
+import cachetools
+
+from src.config import settings
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """NFKC + collapsed whitespace; case is kept (embedding models are case-sensitive)."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", query or "")).strip()
+
+
+class QueryEmbeddingCache:
+    """LRU + TTL cache of query embeddings."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._enabled = max_entries > 0
+        self._cache: cachetools.TTLCache = cachetools.TTLCache(
+            maxsize=max(1, max_entries), ttl=ttl_seconds
+        )
+        self._lock = threading.Lock()
+
+    def get(self, model: str, query: str) -> Optional[list[float]]:
+        if not self._enabled:
+            return None
+        with self._lock:
+            return self._cache.get((model, normalize_query(query)))
+
+    def put(self, model: str, query: str, vector: list[float]) -> None:
+        if not self._enabled:
+            return
+        with self._lock:
+            self._cache[(model, normalize_query(query))] = vector
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class _WatermarkLRU(cachetools.LRUCache):
+    """Namespace watermarks; evicting one raises the floor for unknown namespaces."""
+
+    def __init__(self, maxsize: int, counter: itertools.count):
+        super().__init__(maxsize=maxsize)
+        self._counter = counter
+        self.floor = 0
+
+    def popitem(self):
+        item = super().popitem()
+        # An evicted namespace must not fall back to a mark it had before
+        self.floor = next(self._counter)
+        return item
+
+
+class SearchResultCache:
+    """
+    Ranked search pages keyed by namespace watermark.
+
+    Callers read ``watermark(namespace)`` before querying and pass it to
+    ``put``; a page whose namespace was written in between is dropped.
+    Marks come from one counter, so they never repeat for a namespace even
+    after its mark was evicted from the bounded watermark map.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, enabled: bool = True):
+        self._enabled = enabled and max_entries > 0
+        self._cache: cachetools.TTLCache = cachetools.TTLCache(
+            maxsize=max(1, max_entries), ttl=ttl_seconds
+        )
+        self._counter = itertools.count(1)
+        self._watermarks = _WatermarkLRU(max(1, max_entries), self._counter)
+        self._lock = threading.Lock()
+
+    def _mark(self, namespace: str) -> int:
+        return self._watermarks.get(namespace, self._watermarks.floor)
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def watermark(self, namespace: str) -> int:
+        with self._lock:
+            return self._mark(namespace)
+
+    def get(self, namespace: str, key: Hashable) -> Any | None:
+        if not self._enabled:
+            return None
+        with self._lock:
+            mark = self._mark(namespace)
+            return self._cache.get((namespace, mark, key))
+
+    def put(self, namespace: str, watermark: int, key: Hashable, value: Any) -> bool:
+        if not self._enabled:
+            return False
+        with self._lock:
+            if watermark != self._mark(namespace):
+                return False
+            self._cache[(namespace, watermark, key)] = value
+            return True
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        """Bump the watermark; older entries become unreachable and age out."""
+        with self._lock:
+            self._watermarks[namespace] = next(self._counter)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._watermarks.clear()
+
+
+_embedding_cache: QueryEmbeddingCache | None = None
+_result_cache: SearchResultCache | None = None
+_singleton_lock = threading.Lock()
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    global _embedding_cache
+    if _embedding_cache is None:
+        with _singleton_lock:
+            if _embedding_cache is None:
+                _embedding_cache = QueryEmbeddingCache(
+                    max_entries=settings.SEARCH_QUERY_EMBEDDING_CACHE_SIZE,
+                    ttl_seconds=settings.SEARCH_QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+                )
+    return _embedding_cache
+
+
+def get_search_result_cache() -> SearchResultCache:
+    global _result_cache
+    if _result_cache is None:
+        with _singleton_lock:
+            if _result_cache is None:
+                _result_cache = SearchResultCache(
+                    max_entries=settings.SEARCH_RESULT_CACHE_SIZE,
+                    ttl_seconds=settings.SEARCH_RESULT_CACHE_TTL_SECONDS,
+                    enabled=settings.SEARCH_RESULT_CACHE_ENABLED,
+                )
+    return _result_cache
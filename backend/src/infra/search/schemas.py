@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -11,7 +11,9 @@ class SearchToolQueryInput(BaseModel):
 
     Constraints:
     - query is required and must be non-empty (server-side strip validation)
-    - top_k is optional, default 5, max 20
+    - top_k is optional, default 5, max 20 per page
+    - offset pages past the first top_k results
+    - mode: "hybrid" (ANN + BM25) or "vector"; server default when omitted
     """
 
     query: str = Field(
@@ -26,6 +28,17 @@ class SearchToolQueryInput(BaseModel):
         description="Number of results to return (optional, default 5, max 20)",
         examples=[5, 10],
     )
+    offset: int = Field(
+        default=0,
+        ge=0,
+        le=180,
+        description="Number of ranked results to skip (pagination, optional)",
+        examples=[0, 20],
+    )
+    mode: Optional[Literal["hybrid", "vector"]] = Field(
+        default=None,
+        description="Retrieval mode (optional): hybrid = vector + keyword, vector = vector only",
+    )
 
 
 class SearchChunk(BaseModel):
@@ -3,23 +3,42 @@ from __future__ import annotations
 import asyncio
 import datetime as dt
 import hashlib
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
 
+from src.config import settings
 from src.infra.chunking.config import ChunkingConfig
-from src.infra.chunking.repository import ChunkRepository, ensure_chunks_for_pointer
+from src.infra.chunking.repository import ChunkRepository, ensure_chunks_for_pointers
 from src.infra.chunking.schemas import Chunk
 from src.infra.chunking.service import ChunkingService, iter_large_string_nodes_for_chunking
 from src.mut_engine.services.ops import MutOps
 from src.mut_engine.services.tree_reader import MutEntry
 from src.infra.llm.embedding_service import EmbeddingService
+from src.infra.search.query_cache import (
+    QueryEmbeddingCache,
+    SearchResultCache,
+    get_query_embedding_cache,
+    get_search_result_cache,
+    normalize_query,
+)
 from src.infra.s3.service import S3Service
 from src.infra.turbopuffer.schemas import TurbopufferRow
+from src.infra.turbopuffer.dependencies import create_vector_store
 from src.infra.turbopuffer.service import TurbopufferSearchService
 from src.platform.project.service import ProjectService
 from src.exceptions import NotFoundException, ErrorCode
-from src.utils.logger import log_info, log_error
+from src.utils.logger import log_info, log_error, log_warning
+
+if TYPE_CHECKING:
+    from src.infra.turbopuffer.local_store import LocalVectorStore
+
+
+# Chunk text is stored on each row so turbopuffer can BM25-rank it
+_FTS_ATTRIBUTE = "content"
+_SEARCH_SCHEMA = {_FTS_ATTRIBUTE: {"type": "string", "full_text_search": True}}
+SEARCH_MODES = ("hybrid", "vector")
 
 
 def _normalize_json_pointer(pointer: str) -> str:
@@ -108,6 +127,44 @@ def reciprocal_rank_fusion(
     ]
 
 
+def _row_score(row: TurbopufferRow) -> float:
+    """Prefer score; otherwise construct a monotonic score from distance (closer = higher)."""
+    if row.score is not None:
+        return float(row.score)
+    if row.distance is not None:
+        try:
+            return 1.0 / (1.0 + float(row.distance))
+        except (TypeError, ValueError):
+            return 0.0
+    return 0.0
+
+
+def _row_chunk_id(row: TurbopufferRow) -> int | None:
+    cid = (row.attributes or {}).get("chunk_id")
+    try:
+        return int(cid) if cid is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+_rerankers: dict[str, Any] = {}
+_reranker_lock = threading.Lock()
+
+
+def _get_reranker(model_name: str) -> Any | None:
+    """Load (once) the local cross-encoder; None when sentence-transformers is missing."""
+    with _reranker_lock:
+        if model_name not in _rerankers:
+            try:
+                from sentence_transformers import CrossEncoder
+
+                _rerankers[model_name] = CrossEncoder(model_name, device="cpu")
+            except Exception as e:
+                log_warning(f"[search] reranker unavailable: model={model_name} error={e}")
+                _rerankers[model_name] = None
+        return _rerankers[model_name]
+
+
 @dataclass(frozen=True)
 class SearchIndexStats:
     nodes_count: int
@@ -129,7 +186,7 @@ class SearchService:
     """
     Search Tool core capabilities:
     - index_tool: (path, json_path) scope -> chunking -> embedding -> turbopuffer upsert
-    - search_tool: ANN -> structured output (chunk_text backfilled from DB)
+    - search_tool: ANN + BM25 -> RRF (-> optional cross-encoder rerank) -> structured output
     """
 
     def __init__(
@@ -141,7 +198,9 @@ class SearchService:
         chunking_service: ChunkingService | None = None,
         chunking_config: ChunkingConfig | None = None,
         embedding_service: EmbeddingService | None = None,
-        turbopuffer_service: TurbopufferSearchService | None = None,
+        turbopuffer_service: TurbopufferSearchService | LocalVectorStore | None = None,
+        embedding_cache: QueryEmbeddingCache | None = None,
+        result_cache: SearchResultCache | None = None,
     ) -> None:
         self._ops = ops
         self._chunk_repo = chunk_repo
@@ -149,7 +208,9 @@ class SearchService:
         self._chunking_service = chunking_service or ChunkingService()
         self._chunking_config = chunking_config or ChunkingConfig()
         self._embedding = embedding_service or EmbeddingService()
-        self._tp = turbopuffer_service or TurbopufferSearchService()
+        self._tp = turbopuffer_service or create_vector_store()
+        self._embedding_cache = embedding_cache or get_query_embedding_cache()
+        self._result_cache = result_cache or get_search_result_cache()
 
     def _ensure_project_access(self, *, project_id: str, user_id: str) -> None:
         if not self._project_service.verify_project_access(project_id, user_id):
@@ -186,10 +247,150 @@ class SearchService:
         return f"{file_path[:12]}_{pointer_hash}_{content_hash[:8]}_{chunk_index}"
 
     async def ensure_namespace_schema(self, *, namespace: str) -> None:
-        # Kept for compatibility: current implementation no longer relies on turbopuffer BM25, so no schema needed.
-        # If BM25 is reintroduced in the future, update_schema can be restored here.
-        _ = namespace
-        return None
+        # Hybrid search BM25-ranks the chunk text; writes also pass this schema
+        await self._tp.update_schema(namespace, schema=_SEARCH_SCHEMA)
+
+    async def _embed_query(self, query: str) -> list[float]:
+        model = str(getattr(self._embedding, "default_model", "") or "")
+        vec = self._embedding_cache.get(model, query)
+        if vec is None:
+            vec = await self._embedding.generate_embedding(query)
+            self._embedding_cache.put(model, query, vec)
+        return vec
+
+    async def _retrieve(
+        self,
+        *,
+        namespace: str,
+        query: str,
+        top_k: int,
+        offset: int,
+        mode: str | None,
+        log_tag: str,
+    ) -> tuple[list[tuple[TurbopufferRow, float]], dict[int, str]]:
+        """
+        Rank one page of rows for ``query``.
+
+        - hybrid: ANN and BM25 in a single multi_query, fused with RRF; falls
+          back to ANN when the namespace has no full-text index yet
+        - vector: ANN only
+        - SEARCH_RERANK_MODEL set: the fused candidates are re-scored by a
+          local cross-encoder before paging
+
+        Returns the page [offset, offset + top_k) and chunk_text by chunk id.
+        Pages are cached until the namespace is next written (see query_cache).
+        """
+        mode = (mode or settings.SEARCH_DEFAULT_MODE or "hybrid").lower()
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"mode must be one of {', '.join(SEARCH_MODES)}")
+
+        timings: dict[str, int] = {}
+        depth = min(settings.SEARCH_MAX_DEPTH, offset + top_k)
+        if depth <= offset:
+            return [], {}
+
+        cache_key = (normalize_query(query), top_k, offset, mode, settings.SEARCH_RERANK_MODEL)
+        watermark = self._result_cache.watermark(namespace)
+        cached = self._result_cache.get(namespace, cache_key)
+        if cached is not None:
+            log_info(
+                f"[{log_tag}] namespace={namespace} mode={mode} offset={offset} top_k={top_k} "
+                f"results={len(cached[0])} cache=hit"
+            )
+            return cached
+
+        t = time.perf_counter()
+        query_vec = await self._embed_query(query)
+        timings["embed_ms"] = int((time.perf_counter() - t) * 1000)
+
+        t = time.perf_counter()
+        ranked: list[tuple[TurbopufferRow, float]] | None = None
+        if mode == "hybrid":
+            fetch = min(settings.SEARCH_MAX_DEPTH, max(2 * depth, 20))
+            try:
+                resp = await self._tp.multi_query(
+                    namespace,
+                    queries=[
+                        {
+                            "rank_by": ("vector", "ANN", query_vec),
+                            "top_k": fetch,
+                            "include_attributes": True,
+                        },
+                        {
+                            "rank_by": (_FTS_ATTRIBUTE, "BM25", query),
+                            "top_k": fetch,
+                            "include_attributes": True,
+                        },
+                    ],
+                )
+                ranked = reciprocal_rank_fusion(
+                    [item.rows for item in resp.results], k=settings.SEARCH_RRF_K
+                )
+            except Exception as e:
+                # Namespaces indexed before hybrid search have no full-text index
+                log_warning(
+                    f"[{log_tag}] hybrid query failed, falling back to ANN: namespace={namespace} error={e}"
+                )
+                mode = "vector"
+        if ranked is None:
+            resp = await self._tp.query(
+                namespace,
+                rank_by=("vector", "ANN", query_vec),
+                top_k=depth,
+                include_attributes=True,
+            )
+            ranked = [(r, _row_score(r)) for r in resp.rows or []]
+        timings["query_ms"] = int((time.perf_counter() - t) * 1000)
+
+        reranker = (
+            _get_reranker(settings.SEARCH_RERANK_MODEL)
+            if settings.SEARCH_RERANK_MODEL
+            else None
+        )
+        candidates = ranked if reranker is not None else ranked[offset:depth]
+
+        t = time.perf_counter()
+        chunk_text_by_id = await self._chunk_texts([row for row, _ in candidates])
+        timings["backfill_ms"] = int((time.perf_counter() - t) * 1000)
+
+        if reranker is not None and candidates:
+            t = time.perf_counter()
+            pairs = [
+                (query, chunk_text_by_id.get(_row_chunk_id(row), "")) for row, _ in candidates
+            ]
+            scores = await asyncio.to_thread(reranker.predict, pairs)
+            candidates = sorted(
+                ((row, float(score)) for (row, _), score in zip(candidates, scores)),
+                key=lambda x: x[1],
+                reverse=True,
+            )[offset:depth]
+            timings["rerank_ms"] = int((time.perf_counter() - t) * 1000)
+
+        stages = " ".join(f"{k}={v}" for k, v in timings.items())
+        log_info(
+            f"[{log_tag}] namespace={namespace} mode={mode} offset={offset} top_k={top_k} "
+            f"results={len(candidates)} {stages}"
+        )
+        self._result_cache.put(namespace, watermark, cache_key, (candidates, chunk_text_by_id))
+        return candidates, chunk_text_by_id
+
+    async def _chunk_texts(self, rows: list[TurbopufferRow]) -> dict[int, str]:
+        """chunk_text by chunk id: from the row's full-text attribute, else from DB."""
+        out: dict[int, str] = {}
+        missing: list[int] = []
+        for r in rows:
+            cid = _row_chunk_id(r)
+            if cid is None:
+                continue
+            text = (r.attributes or {}).get(_FTS_ATTRIBUTE)
+            if isinstance(text, str):
+                out[cid] = text
+            else:
+                missing.append(cid)
+        if missing:
+            chunks = await asyncio.to_thread(self._chunk_repo.get_by_ids, missing)
+            out.update({int(c.id): c.chunk_text for c in chunks})
+        return out
 
     async def index_scope(
         self,
@@ -250,22 +451,14 @@ class SearchService:
 
         # 3) Ensure chunks (idempotent)
         t3 = time.perf_counter()
-        all_chunks: list[Chunk] = []
-        for i, n in enumerate(nodes):
-            ensured = await asyncio.to_thread(
-                ensure_chunks_for_pointer,
-                repo=self._chunk_repo,
-                service=self._chunking_service,
-                path=path,
-                json_pointer=n.json_pointer,
-                content=n.content,
-                config=self._chunking_config,
-            )
-            all_chunks.extend(list(ensured.chunks))
-            if (i + 1) % 10 == 0:
-                log_info(
-                    f"[index_scope] step3_chunking_progress: path={path} processed={i + 1}/{len(nodes)}"
-                )
+        ensured_all = await asyncio.to_thread(
+            ensure_chunks_for_pointers,
+            repo=self._chunk_repo,
+            service=self._chunking_service,
+            nodes=[(path, n.json_pointer, n.content) for n in nodes],
+            config=self._chunking_config,
+        )
+        all_chunks: list[Chunk] = [c for ensured in ensured_all for c in ensured.chunks]
         log_info(
             f"[index_scope] step3_ensure_chunks: path={path} chunks_count={len(all_chunks)} elapsed_ms={int((time.perf_counter() - t3) * 1000)}"
         )
@@ -316,6 +509,7 @@ class SearchService:
                     "char_end": c.char_end,
                     "content_hash": c.content_hash,
                     "chunk_id": int(c.id),
+                    _FTS_ATTRIBUTE: c.chunk_text,
                 }
             )
 
@@ -326,7 +520,9 @@ class SearchService:
             namespace,
             upsert_rows=upsert_rows,
             distance_metric="cosine_distance",
+            schema=_SEARCH_SCHEMA,
         )
+        self._result_cache.invalidate_namespace(namespace)
         log_info(
             f"[index_scope] step5_turbopuffer_done: path={path} elapsed_ms={int((time.perf_counter() - t5) * 1000)}"
         )
@@ -364,6 +560,17 @@ class SearchService:
             indexed_chunks_count=len(all_chunks),
         )
 
+    @staticmethod
+    def _page_params(top_k: int, offset: int) -> tuple[int, int]:
+        top_k = int(top_k)
+        if top_k <= 0:
+            raise ValueError("top_k must be > 0")
+        top_k = min(top_k, settings.SEARCH_MAX_TOP_K)
+        offset = int(offset or 0)
+        if offset < 0:
+            raise ValueError("offset must be >= 0")
+        return top_k, offset
+
     async def search_scope(
         self,
         *,
@@ -372,47 +579,31 @@ class SearchService:
         tool_json_path: str,
         query: str,
         top_k: int = 5,
+        offset: int = 0,
+        mode: str | None = None,
     ) -> list[dict[str, Any]]:
         """
-        Execute ANN vector search on namespace, returning rows (chunk_text backfilled from DB).
+        Search the scope namespace (hybrid or ANN, see ``_retrieve``), returning
+        rows with chunk_text. ``top_k`` is capped per page; use ``offset`` to page.
         """
         q = (query or "").strip()
         if not q:
             raise ValueError("query must be non-empty")
-
-        top_k = int(top_k)
-        if top_k <= 0:
-            raise ValueError("top_k must be > 0")
-        if top_k > 20:
-            top_k = 20
+        top_k, offset = self._page_params(top_k, offset)
 
         namespace = self.build_namespace(project_id=project_id, path=path)
-
-        query_vec = await self._embedding.generate_embedding(q)
-        resp = await self._tp.query(
-            namespace,
-            rank_by=("vector", "ANN", query_vec),
+        ranked, chunk_text_by_id = await self._retrieve(
+            namespace=namespace,
+            query=q,
             top_k=top_k,
-            include_attributes=True,
+            offset=offset,
+            mode=mode,
+            log_tag="search_scope",
         )
-        rows = resp.rows or []
         scope_base = _normalize_json_pointer(tool_json_path)
 
-        # Batch backfill chunk_text (avoid storing redundant large fields in turbopuffer)
-        chunk_ids: list[int] = []
-        for r in rows[:top_k]:
-            attrs = r.attributes or {}
-            cid = attrs.get("chunk_id")
-            try:
-                if cid is not None:
-                    chunk_ids.append(int(cid))
-            except (TypeError, ValueError):
-                pass
-        chunks = await asyncio.to_thread(self._chunk_repo.get_by_ids, chunk_ids)
-        chunk_text_by_id = {int(c.id): c.chunk_text for c in chunks}
-
         out: list[dict[str, Any]] = []
-        for r in rows[:top_k]:
+        for r, score in ranked:
             attrs = r.attributes or {}
             json_pointer = str(attrs.get("json_pointer") or "")
             json_pointer = _normalize_json_pointer(json_pointer)
@@ -420,26 +611,7 @@ class SearchService:
 
             # Only return fields useful for the Agent
             # Remove internal fields: path, content_hash, turbopuffer_namespace, turbopuffer_doc_id, char_start, char_end
-            cid = attrs.get("chunk_id")
-            chunk_id_int: int | None = None
-            try:
-                if cid is not None:
-                    chunk_id_int = int(cid)
-            except (TypeError, ValueError):
-                chunk_id_int = None
-
-            # Prefer score; otherwise construct a monotonic score from distance (closer = higher)
-            score = None
-            if r.score is not None:
-                score = float(r.score)
-            elif r.distance is not None:
-                try:
-                    dist = float(r.distance)
-                    score = 1.0 / (1.0 + dist)
-                except (TypeError, ValueError):
-                    score = 0.0
-            else:
-                score = 0.0
+            chunk_id_int = _row_chunk_id(r)
 
             out.append(
                 {
@@ -643,19 +815,15 @@ class SearchService:
 
         # 3) Ensure chunks (idempotent)
         t3 = time.perf_counter()
-        all_chunks: list[Chunk] = []
         file_id = file_node.path
-        for n in nodes:
-            ensured = await asyncio.to_thread(
-                ensure_chunks_for_pointer,
-                repo=self._chunk_repo,
-                service=self._chunking_service,
-                path=file_id,
-                json_pointer=n.json_pointer,
-                content=n.content,
-                config=self._chunking_config,
-            )
-            all_chunks.extend(list(ensured.chunks))
+        ensured_all = await asyncio.to_thread(
+            ensure_chunks_for_pointers,
+            repo=self._chunk_repo,
+            service=self._chunking_service,
+            nodes=[(file_id, n.json_pointer, n.content) for n in nodes],
+            config=self._chunking_config,
+        )
+        all_chunks: list[Chunk] = [c for ensured in ensured_all for c in ensured.chunks]
 
         log_info(
             f"[_index_file_node] ensure_chunks: file={file_node.path} chunks={len(all_chunks)} "
@@ -700,6 +868,7 @@ class SearchService:
                     "char_end": c.char_end,
                     "content_hash": c.content_hash,
                     "chunk_id": int(c.id),
+                    _FTS_ATTRIBUTE: c.chunk_text,
                     "file_path": file_id,
                     "file_mut_path": file_node.path,
                     "file_name": file_node.name,
@@ -711,7 +880,9 @@ class SearchService:
             namespace,
             upsert_rows=upsert_rows,
             distance_metric="cosine_distance",
+            schema=_SEARCH_SCHEMA,
         )
+        self._result_cache.invalidate_namespace(namespace)
         log_info(
             f"[_index_file_node] turbopuffer: file={file_node.path} rows={len(upsert_rows)} "
             f"elapsed_ms={int((time.perf_counter() - t5) * 1000)}"
@@ -754,6 +925,8 @@ class SearchService:
         folder_path: str,
         query: str,
         top_k: int = 5,
+        offset: int = 0,
+        mode: str | None = None,
     ) -> list[dict[str, Any]]:
         """
         Search in a folder namespace, returning results with file path information.
@@ -761,44 +934,25 @@ class SearchService:
         q = (query or "").strip()
         if not q:
             raise ValueError("query must be non-empty")
-
-        top_k = int(top_k)
-        if top_k <= 0:
-            raise ValueError("top_k must be > 0")
-        if top_k > 20:
-            top_k = 20
+        top_k, offset = self._page_params(top_k, offset)
 
         namespace = self.build_folder_namespace(
             project_id=project_id, folder_path=folder_path
         )
 
-        # 1) Generate query embedding and search
-        query_vec = await self._embedding.generate_embedding(q)
-        resp = await self._tp.query(
-            namespace,
-            rank_by=("vector", "ANN", query_vec),
+        # 1) Rank (query embedding + ANN/BM25) and fetch chunk_text
+        ranked, chunk_text_by_id = await self._retrieve(
+            namespace=namespace,
+            query=q,
             top_k=top_k,
-            include_attributes=True,
+            offset=offset,
+            mode=mode,
+            log_tag="search_folder",
         )
-        rows = resp.rows or []
-
-        # 2) Batch fetch chunk_text from DB
-        chunk_ids: list[int] = []
-        for r in rows[:top_k]:
-            attrs = r.attributes or {}
-            cid = attrs.get("chunk_id")
-            try:
-                if cid is not None:
-                    chunk_ids.append(int(cid))
-            except (TypeError, ValueError):
-                pass
 
-        chunks = await asyncio.to_thread(self._chunk_repo.get_by_ids, chunk_ids)
-        chunk_text_by_id = {int(c.id): c.chunk_text for c in chunks}
-
-        # 3) Build output with file information
+        # 2) Build output with file information
         out: list[dict[str, Any]] = []
-        for r in rows[:top_k]:
+        for r, score in ranked:
             attrs = r.attributes or {}
 
             # Extract file information
@@ -810,25 +964,7 @@ class SearchService:
             # Extract chunk information
             json_pointer = str(attrs.get("json_pointer") or "")
             json_pointer = _normalize_json_pointer(json_pointer)
-
-            cid = attrs.get("chunk_id")
-            chunk_id_int: int | None = None
-            try:
-                if cid is not None:
-                    chunk_id_int = int(cid)
-            except (TypeError, ValueError):
-                chunk_id_int = None
-
-            # Calculate score
-            score = 0.0
-            if r.score is not None:
-                score = float(r.score)
-            elif r.distance is not None:
-                try:
-                    dist = float(r.distance)
-                    score = 1.0 / (1.0 + dist)
-                except (TypeError, ValueError):
-                    score = 0.0
+            chunk_id_int = _row_chunk_id(r)
 
             out.append(
                 {
@@ -0,0 +1,175 @@
+"""
+Async PostgREST client pool.
+
+The sync Supabase client blocks whichever thread calls it. MUT's hot paths
+(scope state reads, the publish RPC) run inside async request handlers, so
+they either block the event loop or take a slot in the default thread pool
+that S3 transfers also need. This module provides a native async PostgREST
+client instead:
+
+- ``async_postgrest()``: one pooled ``httpx.AsyncClient`` per long-lived
+  event loop (opened by the app / worker lifespan), HTTP/2 so concurrent
+  queries are multiplexed over a few pooled connections instead of one
+  TCP+TLS connection each; short-lived loops get a scoped client that is
+  closed after use
+- ``BatchLoader``, which coalesces point lookups issued in the same loop
+  tick (e.g. several ``aget_scope_state`` calls of one request) into a
+  single ``in.(...)`` query
+
+Pool size: SUPABASE_ASYNC_MAX_CONNECTIONS (default 20).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Generic, Hashable, Iterable, TypeVar
+
+import httpx
+from postgrest import AsyncPostgrestClient
+
+from src.infra.supabase.client import trust_env_proxy
+
+
+# Long-lived pooled clients, one per loop that opted in with
+# ``open_async_postgrest`` (the API app and the ARQ worker). Other loops —
+# ``asyncio.run`` / ``new_event_loop`` in scheduler jobs and ephemeral
+# clients — get a client scoped to each ``async_postgrest()`` block, so
+# nothing outlives them.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncPostgrestClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _max_connections() -> int:
+    try:
+        return max(1, int(os.environ.get("SUPABASE_ASYNC_MAX_CONNECTIONS", "20")))
+    except ValueError:
+        return 20
+
+
+def _new_client() -> AsyncPostgrestClient:
+    url: str = os.environ.get("SUPABASE_URL", "")
+    key: str = os.environ.get("SUPABASE_KEY", "")
+    if not url or not key:
+        raise ValueError("SUPABASE_URL and SUPABASE_KEY environment variables must be set")
+
+    limit = _max_connections()
+    rest_url = f"{url.rstrip('/')}/rest/v1"
+    headers = {
+        "apikey": key,
+        "Authorization": f"Bearer {key}",
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+    http_client = httpx.AsyncClient(
+        base_url=rest_url,
+        headers=headers,
+        http2=True,
+        limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+        timeout=10,
+        trust_env=trust_env_proxy(),
+        follow_redirects=True,
+    )
+    return AsyncPostgrestClient(rest_url, headers=headers, http_client=http_client)
+
+
+async def open_async_postgrest() -> None:
+    """Pool a client on the running loop until ``close_async_postgrest`` (app / worker startup)."""
+    loop = asyncio.get_running_loop()
+    if loop not in _clients:
+        _clients[loop] = _new_client()
+
+
+async def close_async_postgrest() -> None:
+    """Close the running loop's pooled client (app / worker shutdown)."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def async_postgrest() -> AsyncIterator[AsyncPostgrestClient]:
+    """PostgREST client for the running loop.
+
+    The loop's pooled client when it has one; otherwise a client that is
+    closed when the block exits.
+    """
+    client = _clients.get(asyncio.get_running_loop())
+    if client is not None:
+        yield client
+        return
+    client = _new_client()
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesce concurrent point lookups into one bulk fetch.
+
+    ``load(key)`` calls made before the loop yields are collected and
+    resolved by a single ``fetch_many(keys)`` call, which returns
+    ``{key: value}``; missing keys resolve to ``default``.
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[list[K]], Awaitable[dict[K, V]]],
+        default: V,
+    ):
+        self._fetch_many = fetch_many
+        self._default = default
+        self._pending: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[K, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> V:
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(loop)
+        if batch is None:
+            batch = {}
+            self._pending[loop] = batch
+            loop.call_soon(self._dispatch, loop)
+        future = batch.get(key)
+        if future is None:
+            future = loop.create_future()
+            batch[key] = future
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> dict[K, V]:
+        keys = list(dict.fromkeys(keys))
+        values = await asyncio.gather(*(self.load(k) for k in keys))
+        return dict(zip(keys, values))
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        batch = self._pending.pop(loop, None)
+        if batch:
+            task = loop.create_task(self._resolve(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: dict[K, asyncio.Future]) -> None:
+        try:
+            found = await self._fetch_many(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(key, self._default))
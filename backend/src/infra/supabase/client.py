@@ -4,13 +4,51 @@ Supabase client.
 Provides a singleton Supabase client to avoid duplicate connections.
 """
 
+import asyncio
 import os
+import traceback
 from typing import Optional
 import httpx
 from supabase import create_client, Client
 from supabase.client import ClientOptions
 
 
+_TRUTHY = {"1", "true", "yes", "y", "on"}
+
+
+def trust_env_proxy() -> bool:
+    """
+    By default, do not trust environment proxy variables (HTTP_PROXY/HTTPS_PROXY/ALL_PROXY)
+    to avoid proxy-induced Supabase (PostgREST) TLS handshake errors, e.g.:
+      [SSL: UNEXPECTED_EOF_WHILE_READING] EOF occurred in violation of protocol
+    If Supabase should use the environment proxy, set:
+      SUPABASE_TRUST_ENV_PROXY=true
+    """
+    return os.environ.get("SUPABASE_TRUST_ENV_PROXY", "").strip().lower() in _TRUTHY
+
+
+def _flag_blocking_request(request: httpx.Request) -> None:
+    """Log sync DB requests issued from an event loop thread (they stall every coroutine)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    from src.utils.logger import log_warning
+
+    stack = "".join(traceback.format_stack(limit=12)[:-1])
+    log_warning(
+        f"[Supabase] blocking {request.method} {request.url.path} on the event loop; "
+        f"use the async backend or asyncio.to_thread\n{stack}"
+    )
+
+
+def _blocking_debug_hooks() -> dict:
+    """Request hooks for SUPABASE_BLOCKING_DEBUG=true (off by default)."""
+    if os.environ.get("SUPABASE_BLOCKING_DEBUG", "").strip().lower() in _TRUTHY:
+        return {"request": [_flag_blocking_request]}
+    return {}
+
+
 class SupabaseClient:
     """Supabase client singleton class"""
 
@@ -31,21 +69,6 @@ class SupabaseClient:
             if not url or not key:
                 raise ValueError("SUPABASE_URL and SUPABASE_KEY environment variables must be set")
 
-            # By default, do not trust environment proxy variables (HTTP_PROXY/HTTPS_PROXY/ALL_PROXY)
-            # to avoid proxy-induced Supabase (PostgREST) TLS handshake errors, e.g.:
-            #   [SSL: UNEXPECTED_EOF_WHILE_READING] EOF occurred in violation of protocol
-            # If Supabase should use the environment proxy, set:
-            #   SUPABASE_TRUST_ENV_PROXY=true
-            trust_env_proxy = os.environ.get(
-                "SUPABASE_TRUST_ENV_PROXY", ""
-            ).strip().lower() in {
-                "1",
-                "true",
-                "yes",
-                "y",
-                "on",
-            }
-
             self._client = create_client(
                 url,
                 key,
@@ -53,7 +76,10 @@ class SupabaseClient:
                     postgrest_client_timeout=10,
                     storage_client_timeout=30,
                     schema="public",
-                    httpx_client=httpx.Client(trust_env=trust_env_proxy),
+                    httpx_client=httpx.Client(
+                        trust_env=trust_env_proxy(),
+                        event_hooks=_blocking_debug_hooks(),
+                    ),
                 ),
             )
 
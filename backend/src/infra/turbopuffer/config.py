@@ -33,13 +33,24 @@ class TurbopufferConfig(BaseSettings):
     # Reserved for future extension (e.g. custom base_url / timeout), not required in this version
     timeout_seconds: float = Field(default=30.0, alias="TURBOPUFFER_TIMEOUT_SECONDS")
 
+    # Vector store backend: "turbopuffer" (managed) or "local" (embedded, see local_store.py)
+    backend: str = Field(default="turbopuffer", alias="VECTOR_STORE_BACKEND")
+    local_path: str = Field(default="./data/vector_store", alias="LOCAL_VECTOR_STORE_PATH")
+    # Namespaces with at least this many rows are searched through an IVF index
+    local_ivf_min_rows: int = Field(default=20000, alias="LOCAL_VECTOR_STORE_IVF_MIN_ROWS")
+    local_ivf_nprobe: int = Field(default=16, alias="LOCAL_VECTOR_STORE_IVF_NPROBE")
+
     @property
     def configured(self) -> bool:
         return bool(self.api_key and self.api_key.strip())
 
+    @property
+    def use_local(self) -> bool:
+        return (self.backend or "").strip().lower() == "local"
+
     @model_validator(mode="after")
     def _warn_if_missing_key(self) -> TurbopufferConfig:
-        if not self.configured:
+        if not self.configured and not self.use_local:
             logger.warning(
                 "TURBOPUFFER_API_KEY is not set. Turbopuffer calls may fail at runtime."
             )
@@ -7,11 +7,16 @@ Follows existing project pattern: uses module-level global variables to store si
 from __future__ import annotations
 
 import threading
+from typing import TYPE_CHECKING
 
 from src.infra.turbopuffer.config import TurbopufferConfig, turbopuffer_config
 from src.infra.turbopuffer.service import TurbopufferSearchService
 
-_service: TurbopufferSearchService | None = None
+if TYPE_CHECKING:
+    # local_store needs numpy and fcntl (POSIX); import it only when selected.
+    from src.infra.turbopuffer.local_store import LocalVectorStore
+
+_service: TurbopufferSearchService | LocalVectorStore | None = None
 _service_lock = threading.Lock()
 
 
@@ -19,10 +24,22 @@ def get_turbopuffer_config() -> TurbopufferConfig:
     return turbopuffer_config
 
 
-def get_turbopuffer_search_service() -> TurbopufferSearchService:
+def create_vector_store(
+    config: TurbopufferConfig | None = None,
+) -> TurbopufferSearchService | LocalVectorStore:
+    """Build the configured vector store (VECTOR_STORE_BACKEND)."""
+    config = config or turbopuffer_config
+    if config.use_local:
+        from src.infra.turbopuffer.local_store import LocalVectorStore
+
+        return LocalVectorStore(config=config)
+    return TurbopufferSearchService(config=config)
+
+
+def get_turbopuffer_search_service() -> TurbopufferSearchService | LocalVectorStore:
     global _service
     if _service is None:
         with _service_lock:
             if _service is None:
-                _service = TurbopufferSearchService(config=turbopuffer_config)
+                _service = create_vector_store(turbopuffer_config)
     return _service
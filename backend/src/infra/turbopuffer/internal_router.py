@@ -13,6 +13,7 @@ from typing import Any
 from fastapi import APIRouter, Body, Depends, Query, status
 
 from src.common_schemas import ApiResponse
+from src.infra.search.query_cache import get_search_result_cache
 from src.infra.turbopuffer.config import TurbopufferConfig
 from src.infra.turbopuffer.dependencies import (
     get_turbopuffer_config,
@@ -86,6 +87,7 @@ async def write_raw(
     svc: TurbopufferSearchService = Depends(get_turbopuffer_search_service),
 ):
     resp = await svc.write_raw(namespace, payload)
+    get_search_result_cache().invalidate_namespace(namespace)
     return ApiResponse.success(data=resp.model_dump(), message="Write successful")
 
 
@@ -165,6 +167,7 @@ async def delete_namespace(
     svc: TurbopufferSearchService = Depends(get_turbopuffer_search_service),
 ):
     await svc.delete_namespace(namespace)
+    get_search_result_cache().invalidate_namespace(namespace)
     return ApiResponse.success(data=None, message="Successfully deleted namespace")
 
 
@@ -179,4 +182,5 @@ async def delete_all(
     svc: TurbopufferSearchService = Depends(get_turbopuffer_search_service),
 ):
     await svc.delete_all(namespace)
+    get_search_result_cache().invalidate_namespace(namespace)
     return ApiResponse.success(data=None, message="Successfully deleted all documents")
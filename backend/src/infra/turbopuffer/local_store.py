@@ -0,0 +1,848 @@
+"""
+LocalVectorStore
+
+Embedded, on-disk drop-in for TurbopufferSearchService (same async surface
+used by SearchService: write / query / multi_query / delete_all / schema),
+for on-prem installs and CI that cannot reach turbopuffer.
+
+Layout per namespace (under TurbopufferConfig.local_path):
+- vectors.f32: float32 matrix [capacity, dim], memory-mapped; rows are
+  L2-normalized on write so cosine similarity is a single mat-vec product
+- rows.jsonl: append-only log of upserts / deletes (id, slot, attributes),
+  replayed on load and compacted when mostly dead
+- meta.json: dim, capacity, distance metric, schema
+- .lock: flock(2) target; reads take it shared, writes exclusive
+
+Several processes (API workers, ARQ) may open the same root. Every operation
+holds the namespace's file lock and first catches up with changes made by
+other processes: new log lines are replayed from the last offset it read,
+and a compaction or meta rewrite (new inode) triggers a full reload. Locking
+uses fcntl, so the store is POSIX-only.
+
+Search:
+- exact: vectorized cosine over all live (and filter-matching) rows
+- IVF-Flat: above ``ivf_min_rows`` rows, k-means centroids partition the
+  rows (each list keeps a contiguous in-memory copy of its vectors); a query
+  probes the ``nprobe`` nearest lists. Rows written later are assigned to
+  their nearest centroid; the index is rebuilt once the row count doubles
+- BM25 over attributes declared ``full_text_search`` in the schema
+- filters: turbopuffer tuple syntax (Eq / NotEq / In / NotIn / Lt / Lte /
+  Gt / Gte / Glob, And / Or / Not)
+
+Requires numpy (optional dependency; only imported when this store is used).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fcntl
+import fnmatch
+import json
+import logging
+import math
+import os
+import re
+import shutil
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from src.infra.turbopuffer.config import TurbopufferConfig, turbopuffer_config
+from src.infra.turbopuffer.exceptions import (
+    TurbopufferConfigError,
+    TurbopufferNotFound,
+    TurbopufferRequestError,
+)
+from src.infra.turbopuffer.schemas import (
+    TurbopufferListNamespacesResponse,
+    TurbopufferMultiQueryItem,
+    TurbopufferMultiQueryResponse,
+    TurbopufferNamespaceInfo,
+    TurbopufferQueryResponse,
+    TurbopufferRow,
+    TurbopufferWriteResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+_INITIAL_CAPACITY = 1024
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy as np
+    except Exception as e:
+        raise TurbopufferConfigError("numpy is required for the local vector store") from e
+    return np
+
+
+def _tokenize(text: str) -> list[str]:
+    return [t.lower() for t in _TOKEN_RE.findall(text or "")]
+
+
+def _safe_dirname(namespace: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]", lambda m: f"%{ord(m.group()):06x}", namespace)
+
+
+def _unsafe_dirname(dirname: str) -> str:
+    return re.sub(r"%([0-9a-f]{6})", lambda m: chr(int(m.group(1), 16)), dirname)
+
+
+@contextlib.contextmanager
+def _flock(path: Path, *, exclusive: bool) -> Iterator[None]:
+    """Hold an advisory lock on ``path/.lock`` (shared or exclusive)."""
+    with open(path / ".lock", "a+b") as f:
+        fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _file_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _match_filter(attrs: dict[str, Any], flt: Any) -> bool:
+    """Evaluate a turbopuffer-style filter tuple against one row's attributes."""
+    if flt is None:
+        return True
+    if isinstance(flt, (list, tuple)) and len(flt) == 2 and flt[0] in ("And", "Or"):
+        parts = [_match_filter(attrs, f) for f in flt[1]]
+        return all(parts) if flt[0] == "And" else any(parts)
+    if isinstance(flt, (list, tuple)) and len(flt) == 2 and flt[0] == "Not":
+        return not _match_filter(attrs, flt[1])
+    if not isinstance(flt, (list, tuple)) or len(flt) != 3:
+        raise TurbopufferRequestError(f"Unsupported filter: {flt!r}", status_code=400)
+
+    name, op, value = flt
+    actual = attrs.get(name)
+    try:
+        if op == "Eq":
+            return actual == value
+        if op == "NotEq":
+            return actual != value
+        if op == "In":
+            return actual in value
+        if op == "NotIn":
+            return actual not in value
+        if op == "Lt":
+            return actual is not None and actual < value
+        if op == "Lte":
+            return actual is not None and actual <= value
+        if op == "Gt":
+            return actual is not None and actual > value
+        if op == "Gte":
+            return actual is not None and actual >= value
+        if op == "Glob":
+            return isinstance(actual, str) and fnmatch.fnmatchcase(actual, value)
+    except TypeError:
+        return False
+    raise TurbopufferRequestError(f"Unsupported filter operator: {op}", status_code=400)
+
+
+class _Namespace:
+    """One namespace: memory-mapped vectors + row log + optional IVF index."""
+
+    def __init__(self, path: Path, *, ivf_min_rows: int, nprobe: int) -> None:
+        self.np = _import_numpy()
+        self.path = path
+        self.lock = threading.RLock()
+        self.ivf_min_rows = ivf_min_rows
+        self.nprobe = nprobe
+
+        self.dim = 0
+        self.capacity = 0
+        self.distance_metric = "cosine_distance"
+        self.schema: dict[str, Any] = {}
+        self.matrix = None
+
+        self.ids: list[Any] = []  # slot -> id (None = free)
+        self.attrs: list[dict[str, Any] | None] = []
+        self.id_to_slot: dict[Any, int] = {}
+        self.free: list[int] = []
+        self.dead = 0
+        self.version = 0
+
+        self._ivf: dict[str, Any] | None = None
+        self._fts: dict[str, Any] = {}
+        self._live: tuple[int, Any, Any] | None = None  # (version, live slots, alive mask)
+
+        # On-disk state this instance has applied: (meta.json, rows.jsonl) keys,
+        # and (inode, byte offset) of rows.jsonl read so far. Loaded lazily by _sync.
+        self._seen: tuple[Any, Any] | None = None
+        self._log_pos: tuple[int, int] | None = None
+
+    # ----- persistence -----
+
+    @property
+    def live_count(self) -> int:
+        return len(self.id_to_slot)
+
+    def _meta_path(self) -> Path:
+        return self.path / "meta.json"
+
+    def _write_meta(self) -> None:
+        tmp = self.path / "meta.json.tmp"
+        tmp.write_text(
+            json.dumps(
+                {
+                    "dim": self.dim,
+                    "capacity": self.capacity,
+                    "distance_metric": self.distance_metric,
+                    "schema": self.schema,
+                }
+            )
+        )
+        os.replace(tmp, self._meta_path())
+
+    def _open_matrix(self, capacity: int) -> None:
+        np = self.np
+        vec_path = self.path / "vectors.f32"
+        if self.matrix is not None:
+            self.matrix.flush()
+            self.matrix = None
+        size = capacity * self.dim * 4
+        with open(vec_path, "ab") as f:
+            if f.tell() < size:
+                f.truncate(size)
+        self.matrix = np.memmap(vec_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+        self.capacity = capacity
+
+    def _reset(self) -> None:
+        self.close()
+        self.dim = 0
+        self.capacity = 0
+        self.schema = {}
+        self.ids = []
+        self.attrs = []
+        self.id_to_slot = {}
+        self.free = []
+        self.dead = 0
+        self._log_pos = None
+
+    def _load_meta(self) -> None:
+        meta = json.loads(self._meta_path().read_text())
+        self.dim = int(meta["dim"])
+        self.distance_metric = meta.get("distance_metric") or "cosine_distance"
+        self.schema = meta.get("schema") or {}
+        if self.dim and (self.matrix is None or int(meta["capacity"]) != self.capacity):
+            self._open_matrix(int(meta["capacity"]))
+
+    def _replay_log(self, offset: int) -> None:
+        log_path = self.path / "rows.jsonl"
+        if not log_path.exists():
+            return
+        with open(log_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if entry["op"] == "upsert":
+                    self._set_slot(entry["slot"], entry["id"], entry.get("attrs") or {})
+                else:
+                    self._drop(entry["id"])
+            self._log_pos = (os.fstat(f.fileno()).st_ino, f.tell())
+        self.free = [i for i, doc_id in enumerate(self.ids) if doc_id is None]
+
+    def _sync(self) -> None:
+        """Catch up with whatever other processes wrote since this instance last looked."""
+        seen = (_file_key(self._meta_path()), _file_key(self.path / "rows.jsonl"))
+        if seen == self._seen:
+            return
+        meta_key, rows_key = seen
+        pos = self._log_pos
+        if meta_key is None:
+            self._reset()
+        elif rows_key is not None and pos is not None and pos[0] == rows_key[0] and rows_key[1] >= pos[1]:
+            self._load_meta()
+            self._replay_log(pos[1])
+        else:
+            self._reset()
+            self._load_meta()
+            self._replay_log(0)
+        self._seen = seen
+        if self._log_pos is None:
+            self._log_pos = (rows_key[0], rows_key[1]) if rows_key else None
+        self.version += 1
+        self._fts.clear()
+        self._ivf = None
+
+    @contextlib.contextmanager
+    def locked(self, *, exclusive: bool) -> Iterator[None]:
+        """Serialize against threads and other processes, syncing from disk first."""
+        with self.lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with _flock(self.path, exclusive=exclusive):
+                self._sync()
+                try:
+                    yield
+                finally:
+                    if exclusive:
+                        # Everything on disk now was written (or replayed) by us
+                        rows_key = _file_key(self.path / "rows.jsonl")
+                        self._seen = (_file_key(self._meta_path()), rows_key)
+                        self._log_pos = (rows_key[0], rows_key[1]) if rows_key else None
+
+    def _append_log(self, entries: list[dict[str, Any]]) -> None:
+        with open(self.path / "rows.jsonl", "a", encoding="utf-8") as f:
+            for e in entries:
+                f.write(json.dumps(e, ensure_ascii=False, default=str) + "\n")
+
+    def _compact_if_needed(self) -> None:
+        if self.dead < 1024 or self.dead < self.live_count:
+            return
+        tmp = self.path / "rows.jsonl.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for doc_id, slot in self.id_to_slot.items():
+                f.write(
+                    json.dumps(
+                        {"op": "upsert", "id": doc_id, "slot": slot, "attrs": self.attrs[slot]},
+                        ensure_ascii=False,
+                        default=str,
+                    )
+                    + "\n"
+                )
+        os.replace(tmp, self.path / "rows.jsonl")
+        self.dead = 0
+
+    # ----- row bookkeeping -----
+
+    def _set_slot(self, slot: int, doc_id: Any, attrs: dict[str, Any]) -> None:
+        while len(self.ids) <= slot:
+            self.ids.append(None)
+            self.attrs.append(None)
+        old = self.id_to_slot.get(doc_id)
+        if old is not None and old != slot:
+            self.ids[old] = None
+            self.attrs[old] = None
+        if self.ids[slot] is not None and self.ids[slot] != doc_id:
+            self.id_to_slot.pop(self.ids[slot], None)
+        self.ids[slot] = doc_id
+        self.attrs[slot] = attrs
+        self.id_to_slot[doc_id] = slot
+
+    def _drop(self, doc_id: Any) -> bool:
+        slot = self.id_to_slot.pop(doc_id, None)
+        if slot is None:
+            return False
+        self.ids[slot] = None
+        self.attrs[slot] = None
+        self.dead += 1
+        return True
+
+    def _alloc_slot(self) -> int:
+        if self.free:
+            return self.free.pop()
+        slot = len(self.ids)
+        if slot >= self.capacity:
+            self._open_matrix(max(_INITIAL_CAPACITY, self.capacity * 2))
+        self.ids.append(None)
+        self.attrs.append(None)
+        return slot
+
+    # ----- write -----
+
+    def write(
+        self,
+        *,
+        upsert_rows: list[dict[str, Any]] | None,
+        deletes: list[Any] | None,
+        distance_metric: str | None,
+        schema: dict[str, Any] | None,
+    ) -> TurbopufferWriteResponse:
+        np = self.np
+        upsert_rows = upsert_rows or []
+        deletes = deletes or []
+
+        if distance_metric:
+            if distance_metric != "cosine_distance":
+                raise TurbopufferRequestError(
+                    f"Local vector store only supports cosine_distance, got {distance_metric}",
+                    status_code=400,
+                )
+            self.distance_metric = distance_metric
+        if schema:
+            self.schema.update(schema)
+
+        if upsert_rows and not self.dim:
+            first = upsert_rows[0].get("vector")
+            if not first:
+                raise TurbopufferRequestError("upsert rows must include a vector", status_code=400)
+            self.dim = len(first)
+            self._open_matrix(_INITIAL_CAPACITY)
+
+        log: list[dict[str, Any]] = []
+        written_slots: list[int] = []
+        if upsert_rows:
+            vectors = np.asarray([r.get("vector") for r in upsert_rows], dtype=np.float32)
+            if vectors.ndim != 2 or vectors.shape[1] != self.dim:
+                raise TurbopufferRequestError(
+                    f"Vector dimension mismatch: expected {self.dim}", status_code=400
+                )
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1.0, norms)
+
+            for row, vec in zip(upsert_rows, vectors):
+                doc_id = row["id"]
+                slot = self.id_to_slot.get(doc_id)
+                if slot is None:
+                    slot = self._alloc_slot()
+                else:
+                    self.dead += 1  # superseded log line
+                written_slots.append(slot)
+                attrs = {k: v for k, v in row.items() if k not in ("id", "vector")}
+                self.matrix[slot] = vec
+                self._set_slot(slot, doc_id, attrs)
+                log.append({"op": "upsert", "id": doc_id, "slot": slot, "attrs": attrs})
+
+        deleted = 0
+        for doc_id in deletes:
+            slot = self.id_to_slot.get(doc_id)
+            if self._drop(doc_id):
+                self.free.append(slot)
+                deleted += 1
+                log.append({"op": "delete", "id": doc_id})
+
+        if self.matrix is not None:
+            self.matrix.flush()
+        self._append_log(log)
+        self._write_meta()
+        self._compact_if_needed()
+
+        self.version += 1
+        self._fts.clear()
+        self._ivf_assign(written_slots)
+
+        return TurbopufferWriteResponse(
+            rows_affected=len(upsert_rows) + deleted,
+            rows_upserted=len(upsert_rows),
+            rows_deleted=deleted,
+        )
+
+    # ----- IVF -----
+
+    def _ivf_assign(self, slots: list[int]) -> None:
+        ivf = self._ivf
+        if ivf is None or not slots:
+            return
+        np = self.np
+        vecs = self.matrix[slots]
+        nearest = np.argmax(vecs @ ivf["centroids"].T, axis=1)
+        assign = ivf["assign"]
+        if len(assign) < len(self.ids):
+            grown = np.full(len(self.ids), -1, dtype=np.int32)
+            grown[: len(assign)] = assign
+            assign = ivf["assign"] = grown
+        assign[slots] = nearest
+        # The list copies now hold stale vectors for these slots; score them from the mapping
+        ivf["extra"].update(slots)
+
+    def _ensure_ivf(self) -> dict[str, Any] | None:
+        n = self.live_count
+        if n < self.ivf_min_rows:
+            self._ivf = None
+            return None
+        if self._ivf is not None and n < 2 * self._ivf["built_rows"]:
+            return self._ivf
+
+        np = self.np
+        live = np.fromiter(self.id_to_slot.values(), dtype=np.int64)
+        data = np.asarray(self.matrix[live])
+        nlist = max(1, int(math.sqrt(n) / 2))
+        rng = np.random.default_rng(0)
+        sample = data[rng.choice(n, size=min(n, nlist * 64), replace=False)]
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)].copy()
+        for _ in range(10):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = sample[labels == c]
+                if len(members):
+                    centroid = members.mean(axis=0)
+                    centroids[c] = centroid / (np.linalg.norm(centroid) or 1.0)
+
+        assign = np.full(len(self.ids), -1, dtype=np.int32)
+        for start in range(0, len(live), 8192):
+            chunk = live[start : start + 8192]
+            assign[chunk] = np.argmax(data[start : start + 8192] @ centroids.T, axis=1)
+        # IVF-Flat: live slots grouped by centroid, with a contiguous copy of
+        # their vectors so a probe reads a few dense blocks. Slots written
+        # after the build are tracked in "extra" and scored from the mapping.
+        sort = np.argsort(assign[live], kind="stable")
+        order = live[sort]
+        bounds = np.searchsorted(assign[order], np.arange(nlist + 1))
+        self._ivf = {
+            "centroids": centroids,
+            "assign": assign,
+            "order": order,
+            "vectors": data[sort],
+            "bounds": bounds,
+            "extra": set(),
+            "built_rows": n,
+        }
+        logger.info("LocalVectorStore: built IVF index path=%s rows=%s lists=%s", self.path, n, nlist)
+        return self._ivf
+
+    # ----- query -----
+
+    def _live_slots(self) -> tuple[Any, Any]:
+        """(sorted live slots, alive mask over all slots), cached per write version."""
+        np = self.np
+        if self._live is None or self._live[0] != self.version:
+            live = np.fromiter(self.id_to_slot.values(), dtype=np.int64)
+            live.sort()
+            alive = np.zeros(len(self.ids), dtype=bool)
+            alive[live] = True
+            self._live = (self.version, live, alive)
+        return self._live[1], self._live[2]
+
+    def _ivf_probe(self, ivf: dict[str, Any], q: Any) -> tuple[Any, Any]:
+        """(slots, cosine similarities) for the ``nprobe`` lists nearest to ``q``."""
+        np = self.np
+        alive = self._live_slots()[1]
+        probe = np.argsort(-(ivf["centroids"] @ q))[: self.nprobe]
+        order, vectors, bounds = ivf["order"], ivf["vectors"], ivf["bounds"]
+        slots = np.concatenate([order[bounds[c] : bounds[c + 1]] for c in probe])
+        sims = np.concatenate([vectors[bounds[c] : bounds[c + 1]] @ q for c in probe])
+        keep = alive[slots]
+
+        extra = ivf["extra"]
+        if extra:
+            keep &= ~np.isin(slots, np.fromiter(extra, dtype=np.int64))
+            slots, sims = slots[keep], sims[keep]
+            rewritten = np.fromiter(extra, dtype=np.int64)
+            probed = np.zeros(len(ivf["centroids"]), dtype=bool)
+            probed[probe] = True
+            rewritten = rewritten[alive[rewritten] & probed[ivf["assign"][rewritten]]]
+            if len(rewritten):
+                slots = np.concatenate([slots, rewritten])
+                sims = np.concatenate([sims, np.asarray(self.matrix[rewritten]) @ q])
+            return slots, sims
+        return slots[keep], sims[keep]
+
+    def _candidate_slots(self, filters: Any) -> Any:
+        np = self.np
+        if filters is None:
+            return self._live_slots()[0]
+        slots = [
+            slot
+            for slot in self.id_to_slot.values()
+            if _match_filter(self.attrs[slot], filters)
+        ]
+        return np.asarray(sorted(slots), dtype=np.int64)
+
+    def _ann(self, vector: list[float], top_k: int, filters: Any, exact: bool) -> list[tuple[int, float]]:
+        np = self.np
+        if not self.dim or not self.id_to_slot:
+            return []
+        q = np.asarray(vector, dtype=np.float32)
+        if q.shape != (self.dim,):
+            raise TurbopufferRequestError(
+                f"Query vector dimension mismatch: expected {self.dim}", status_code=400
+            )
+        q = q / (np.linalg.norm(q) or 1.0)
+
+        slots = sims = None
+        ivf = None if exact else self._ensure_ivf()
+        if ivf is not None:
+            probed, probed_sims = self._ivf_probe(ivf, q)
+            if filters is not None:
+                allowed = np.isin(probed, self._candidate_slots(filters))
+                probed, probed_sims = probed[allowed], probed_sims[allowed]
+            if len(probed) >= top_k:
+                slots, sims = probed, probed_sims
+        if slots is None:
+            slots = self._candidate_slots(filters)
+            if not len(slots):
+                return []
+            if len(slots) == self.live_count and self.live_count > 0.5 * len(self.ids):
+                # Mostly-live, unfiltered scan: one mat-vec over the whole mapping
+                # beats gathering rows into a copy first
+                sims = (self.matrix[: len(self.ids)] @ q)[slots]
+            else:
+                sims = np.asarray(self.matrix[slots]) @ q
+        k = min(top_k, len(slots))
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top])]
+        return [(int(slots[i]), float(1.0 - sims[i])) for i in top]
+
+    def _bm25(self, attr: str, query: str, top_k: int, filters: Any) -> list[tuple[int, float]]:
+        cfg = self.schema.get(attr) or {}
+        if not (isinstance(cfg, dict) and cfg.get("full_text_search")):
+            raise TurbopufferRequestError(
+                f"Attribute {attr} is not full-text indexed", status_code=400
+            )
+        index = self._fts.get(attr)
+        if index is None:
+            postings: dict[str, dict[int, int]] = {}
+            lengths: dict[int, int] = {}
+            for slot in self.id_to_slot.values():
+                tokens = _tokenize(str((self.attrs[slot] or {}).get(attr) or ""))
+                lengths[slot] = len(tokens)
+                for term, tf in Counter(tokens).items():
+                    postings.setdefault(term, {})[slot] = tf
+            avgdl = (sum(lengths.values()) / len(lengths)) if lengths else 0.0
+            index = self._fts[attr] = {"postings": postings, "lengths": lengths, "avgdl": avgdl}
+
+        n = len(index["lengths"])
+        k1, b = 1.2, 0.75
+        scores: dict[int, float] = {}
+        for term in set(_tokenize(query)):
+            docs = index["postings"].get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            for slot, tf in docs.items():
+                norm = k1 * (1 - b + b * index["lengths"][slot] / (index["avgdl"] or 1.0))
+                scores[slot] = scores.get(slot, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        ranked = sorted(
+            (
+                (slot, score)
+                for slot, score in scores.items()
+                if filters is None or _match_filter(self.attrs[slot], filters)
+            ),
+            key=lambda x: x[1],
+            reverse=True,
+        )
+        return ranked[:top_k]
+
+    def _row(self, slot: int, include_attributes: Any, *, distance=None, score=None) -> TurbopufferRow:
+        attrs = self.attrs[slot] or {}
+        if include_attributes is True:
+            selected = dict(attrs)
+        elif isinstance(include_attributes, list):
+            selected = {k: attrs[k] for k in include_attributes if k in attrs}
+        else:
+            selected = {}
+        return TurbopufferRow(id=self.ids[slot], distance=distance, score=score, attributes=selected)
+
+    def query(
+        self,
+        *,
+        rank_by: Any,
+        top_k: int,
+        filters: Any,
+        include_attributes: Any,
+        exact: bool = False,
+    ) -> TurbopufferQueryResponse:
+        if rank_by is None:
+            slots = self._candidate_slots(filters)[:top_k]
+            return TurbopufferQueryResponse(
+                rows=[self._row(int(s), include_attributes) for s in slots]
+            )
+        if not isinstance(rank_by, (list, tuple)) or len(rank_by) != 3:
+            raise TurbopufferRequestError(f"Unsupported rank_by: {rank_by!r}", status_code=400)
+
+        attr, kind, value = rank_by
+        if attr == "vector" and kind == "ANN":
+            hits = self._ann(value, top_k, filters, exact)
+            rows = [self._row(s, include_attributes, distance=d) for s, d in hits]
+        elif kind == "BM25":
+            hits = self._bm25(attr, str(value), top_k, filters)
+            rows = [self._row(s, include_attributes, score=sc) for s, sc in hits]
+        else:
+            raise TurbopufferRequestError(f"Unsupported rank_by: {rank_by!r}", status_code=400)
+        return TurbopufferQueryResponse(rows=rows)
+
+    def close(self) -> None:
+        if self.matrix is not None:
+            self.matrix.flush()
+            self.matrix = None
+
+
+class LocalVectorStore:
+    """Async turbopuffer-compatible store over per-namespace memory-mapped matrices."""
+
+    def __init__(
+        self,
+        config: TurbopufferConfig | None = None,
+        *,
+        root: str | os.PathLike[str] | None = None,
+        ivf_min_rows: int | None = None,
+        nprobe: int | None = None,
+    ) -> None:
+        self._config = config or turbopuffer_config
+        self._root = Path(root or self._config.local_path)
+        self._ivf_min_rows = ivf_min_rows or self._config.local_ivf_min_rows
+        self._nprobe = nprobe or self._config.local_ivf_nprobe
+        self._namespaces: dict[str, _Namespace] = {}
+        self._lock = threading.Lock()
+
+    def _ns(self, namespace: str, *, create: bool = False) -> _Namespace:
+        with self._lock:
+            ns = self._namespaces.get(namespace)
+            if ns is None:
+                path = self._root / _safe_dirname(namespace)
+                if not create and not (path / "meta.json").exists():
+                    raise TurbopufferNotFound(f"Namespace not found: {namespace}")
+                ns = _Namespace(path, ivf_min_rows=self._ivf_min_rows, nprobe=self._nprobe)
+                self._namespaces[namespace] = ns
+            return ns
+
+    async def _call(
+        self,
+        namespace: str,
+        fn: Callable[[_Namespace], Any],
+        *,
+        create: bool = False,
+        exclusive: bool = False,
+    ) -> Any:
+        def run() -> Any:
+            ns = self._ns(namespace, create=create)
+            if not create and not ns.path.exists():
+                raise TurbopufferNotFound(f"Namespace not found: {namespace}")
+            with ns.locked(exclusive=exclusive or create):
+                return fn(ns)
+
+        return await asyncio.to_thread(run)
+
+    async def write(
+        self,
+        namespace: str,
+        *,
+        upsert_rows: list[dict[str, Any]] | None = None,
+        deletes: list[int | str] | None = None,
+        distance_metric: str | None = None,
+        schema: dict[str, Any] | None = None,
+        **unsupported: Any,
+    ) -> TurbopufferWriteResponse:
+        extra = {k for k, v in unsupported.items() if v is not None}
+        if extra:
+            raise TurbopufferRequestError(
+                f"Local vector store does not support: {', '.join(sorted(extra))}",
+                status_code=400,
+            )
+        return await self._call(
+            namespace,
+            lambda ns: ns.write(
+                upsert_rows=upsert_rows,
+                deletes=deletes,
+                distance_metric=distance_metric,
+                schema=schema,
+            ),
+            create=True,
+        )
+
+    async def query(
+        self,
+        namespace: str,
+        *,
+        rank_by: Any | None = None,
+        top_k: int = 10,
+        filters: Any | None = None,
+        include_attributes: list[str] | bool | None = None,
+        exact: bool = False,
+        **_: Any,
+    ) -> TurbopufferQueryResponse:
+        return await self._call(
+            namespace,
+            lambda ns: ns.query(
+                rank_by=rank_by,
+                top_k=top_k,
+                filters=filters,
+                include_attributes=include_attributes,
+                exact=exact,
+            ),
+        )
+
+    async def multi_query(
+        self,
+        namespace: str,
+        *,
+        queries: list[dict[str, Any]],
+        **_: Any,
+    ) -> TurbopufferMultiQueryResponse:
+        def run(ns: _Namespace) -> TurbopufferMultiQueryResponse:
+            results = []
+            for q in queries:
+                resp = ns.query(
+                    rank_by=q.get("rank_by"),
+                    top_k=int(q.get("top_k") or 10),
+                    filters=q.get("filters"),
+                    include_attributes=q.get("include_attributes"),
+                )
+                results.append(TurbopufferMultiQueryItem(rows=resp.rows))
+            return TurbopufferMultiQueryResponse(results=results)
+
+        return await self._call(namespace, run)
+
+    async def delete_all(self, namespace: str) -> None:
+        def run() -> None:
+            with self._lock:
+                ns = self._namespaces.pop(namespace, None)
+            if ns is not None:
+                with ns.lock:
+                    ns.close()
+            path = self._root / _safe_dirname(namespace)
+            if not path.exists():
+                return
+            with _flock(path, exclusive=True):
+                shutil.rmtree(path, ignore_errors=True)
+
+        await asyncio.to_thread(run)
+
+    async def delete_namespace(self, namespace: str) -> None:
+        await self.delete_all(namespace)
+
+    async def schema(self, namespace: str) -> Any:
+        return await self._call(namespace, lambda ns: dict(ns.schema))
+
+    async def update_schema(self, namespace: str, *, schema: dict[str, Any]) -> Any:
+        def run(ns: _Namespace) -> dict[str, Any]:
+            ns.schema.update(schema)
+            ns._fts.clear()
+            ns._write_meta()
+            return dict(ns.schema)
+
+        return await self._call(namespace, run, create=True)
+
+    async def metadata(self, namespace: str) -> dict[str, Any]:
+        return await self._call(
+            namespace,
+            lambda ns: {
+                "schema": dict(ns.schema),
+                "approx_row_count": ns.live_count,
+                "dimensions": ns.dim,
+                "distance_metric": ns.distance_metric,
+            },
+        )
+
+    async def hint_cache_warm(self, namespace: str) -> dict[str, Any]:
+        await self._call(namespace, lambda ns: ns._ensure_ivf())
+        return {"status": "ok"}
+
+    async def list_namespaces(
+        self,
+        *,
+        prefix: str | None = None,
+        cursor: str | None = None,
+        page_size: int | None = None,
+    ) -> TurbopufferListNamespacesResponse:
+        def run() -> list[str]:
+            if not self._root.exists():
+                return []
+            return sorted(
+                _unsafe_dirname(p.name)
+                for p in self._root.iterdir()
+                if (p / "meta.json").exists()
+            )
+
+        names = [n for n in await asyncio.to_thread(run) if not prefix or n.startswith(prefix)]
+        if cursor:
+            names = [n for n in names if n > cursor]
+        next_cursor = None
+        if page_size and len(names) > page_size:
+            names = names[:page_size]
+            next_cursor = names[-1]
+        return TurbopufferListNamespacesResponse(
+            namespaces=[TurbopufferNamespaceInfo(id=n) for n in names],
+            next_cursor=next_cursor,
+        )
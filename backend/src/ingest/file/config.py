@@ -70,6 +70,11 @@ class ETLConfig(BaseSettings):
         default=3, description="Maximum attempts for OCR stage"
     )
 
+    etl_ocr_result_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse parsed markdown for sources with the same content hash and OCR provider",
+    )
+
     etl_postprocess_max_attempts: int = Field(
         default=3, description="Maximum attempts for postprocess stage"
     )
@@ -95,6 +100,20 @@ class ETLConfig(BaseSettings):
         default=20, description="Maximum number of chunks for chunked strategies"
     )
 
+    etl_postprocess_chunk_concurrency: int = Field(
+        default=4, description="Concurrent LLM calls when summarizing chunks"
+    )
+
+    etl_postprocess_max_reduce_levels: int = Field(
+        default=3,
+        description="Maximum rounds of re-summarizing chunk summaries that are still over the chunk threshold",
+    )
+
+    etl_postprocess_chunk_cache_ttl_seconds: int = Field(
+        default=7 * 24 * 3600,
+        description="TTL for cached chunk summaries (0 disables the cache)",
+    )
+
     etl_global_rule_enabled: bool = Field(
         default=True, description="Enable built-in global default ETL rule"
     )
@@ -21,7 +21,12 @@ from mut.foundation.hash import hash_bytes as mut_hash
 from src.infra.supabase.client import SupabaseClient
 from src.ingest.file.config import etl_config
 from src.ingest.file.exceptions import ETLTransformationError
-from src.ingest.file.ocr.base import OCRProvider, OCRProviderError
+from src.ingest.file.jobs.summarize import summarize_chunked
+from src.ingest.file.ocr.base import (
+    OCRProvider,
+    OCRProviderError,
+    OCRProviderTimeoutError,
+)
 from src.ingest.file.rules.engine import RuleEngine
 from src.ingest.file.rules.repository_supabase import RuleRepositorySupabase
 from src.ingest.file.state.models import ETLPhase, ETLRuntimeState
@@ -187,38 +192,54 @@ def _output_json_key(task_id: str | int, creator_id: str, project_id: str) -> st
     return f"users/{creator_id}/processed/{project_id}/{task_id}.json"
 
 
-def _chunk_text(text: str, chunk_size: int, max_chunks: int) -> list[str]:
-    if chunk_size <= 0:
-        return [text]
-    chunks: list[str] = []
-    for i in range(0, len(text), chunk_size):
-        if len(chunks) >= max_chunks:
-            break
-        chunks.append(text[i : i + chunk_size])
-    return chunks
+def _ocr_cache_key(provider: str, content_hash: str, options: dict | None = None) -> str:
+    # Keyed by source bytes + provider (+ the provider's output-affecting
+    # options), so the same document uploaded to several projects (or re-run)
+    # is OCR'd once per configuration.
+    if not options:
+        return f"etl_cache/ocr/{provider}/{content_hash}.md"
+    digest = hashlib.sha256(
+        json.dumps(options, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()[:16]
+    return f"etl_cache/ocr/{provider}/{digest}/{content_hash}.md"
 
 
-async def etl_ocr_job(ctx: dict, task_id: str | int) -> dict:
-    """
-    OCR stage: Parse document -> upload markdown artifact -> enqueue postprocess job.
+async def _source_content_hash(s3, source_key: str) -> str:
+    """Content hash of the uploaded source, computed from the stored object.
 
-    Supports multiple OCR providers (MineRU, Reducto, etc.) via pluggable OCRProvider interface.
+    The OCR cache is shared across projects, so the key must come from the
+    bytes we hold rather than the client's upload-time ``sha256`` hint: a
+    wrong (or forged) hint would otherwise read or overwrite another
+    tenant's cached result. Streams through SHA-256 (O(chunk) memory; still
+    far cheaper than a remote OCR run).
     """
+    hasher = hashlib.sha256()
+    async for chunk in s3.download_file_stream(source_key, chunk_size=64 * 1024):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _ocr_cancelled(task, latest: ETLRuntimeState | None) -> bool:
+    return bool(
+        (latest and latest.status == ETLTaskStatus.CANCELLED)
+        or task.status == ETLTaskStatus.CANCELLED
+    )
+
+
+async def _load_ocr_task(ctx: dict, task_id: str | int, job: str):
+    """Load (task, state) for an OCR job, or (None, early-return result)."""
     repo = ctx["task_repository"]
-    s3 = ctx["s3_service"]
-    ocr_provider: OCRProvider = ctx["ocr_provider"]
     state_repo: ETLStateRepositoryRedis = ctx["state_repo"]
-    queue_name: str = ctx["arq_queue_name"]
 
     task = repo.get_task(task_id)
     if not task:
-        logger.warning(f"etl_ocr_job: task not found: {task_id}")
-        return {"ok": False, "error": "task_not_found"}
+        logger.warning(f"{job}: task not found: {task_id}")
+        return None, {"ok": False, "error": "task_not_found"}
 
     # Respect DB-level cancellation as a safety net (e.g. Redis state expired)
     if task.status == ETLTaskStatus.CANCELLED:
-        logger.info(f"etl_ocr_job: task cancelled in DB, skip: {task_id}")
-        return {"ok": True, "skipped": "cancelled"}
+        logger.info(f"{job}: task cancelled in DB, skip: {task_id}")
+        return None, {"ok": True, "skipped": "cancelled"}
 
     # Runtime state init or load
     state = await state_repo.get(task_id)
@@ -232,13 +253,155 @@ async def etl_ocr_job(ctx: dict, task_id: str | int) -> dict:
         )
 
     if state.status == ETLTaskStatus.CANCELLED:
-        logger.info(f"etl_ocr_job: task cancelled, skip: {task_id}")
+        logger.info(f"{job}: task cancelled, skip: {task_id}")
+        return None, {"ok": True, "skipped": "cancelled"}
+
+    return (task, state), None
+
+
+async def _fail_ocr(
+    ctx: dict, task, state: ETLRuntimeState, *, error_stage: str, message: str
+) -> dict:
+    state.status = ETLTaskStatus.FAILED
+    state.error_stage = error_stage
+    state.error_message = message
+    state.progress = 0
+    await ctx["state_repo"].set_terminal(state)
+
+    task.status = ETLTaskStatus.FAILED
+    task.error = message
+    task.metadata.update(
+        {"error_stage": error_stage, "provider_task_id": state.provider_task_id}
+    )
+    ctx["task_repository"].update_task(task)
+    return {"ok": False, "stage": "ocr", "error": message}
+
+
+async def _ocr_failure(ctx: dict, task, state: ETLRuntimeState, exc: BaseException) -> dict:
+    """Map an OCR-stage exception to the terminal FAILED state."""
+    ocr_provider: OCRProvider = ctx["ocr_provider"]
+    task_id = state.task_id
+    if isinstance(exc, asyncio.CancelledError):
+        # ARQ enforces WorkerSettings.job_timeout via asyncio.wait_for which cancels the job task.
+        # On Python 3.12, asyncio.CancelledError inherits BaseException, so a plain `except Exception`
+        # won't run and the runtime state would stay stuck at MINERU_PARSING.
+        logger.error(f"etl_ocr_job timeout task_id={task_id}")
+        return await _fail_ocr(
+            ctx, task, state,
+            error_stage="timeout",
+            message=f"ETL OCR job timed out (>{etl_config.etl_task_timeout}s)",
+        )
+    if isinstance(exc, OCRProviderError):
+        # Handle OCR provider-specific errors
+        logger.error(f"etl_ocr_job failed task_id={task_id}: {exc}")
+        return await _fail_ocr(
+            ctx, task, state, error_stage=f"ocr_{exc.provider}", message=str(exc)
+        )
+    # Handle unexpected errors
+    logger.error(f"etl_ocr_job failed task_id={task_id}: {exc}", exc_info=exc)
+    return await _fail_ocr(
+        ctx, task, state, error_stage=f"ocr_{ocr_provider.name}", message=str(exc)
+    )
+
+
+async def _store_ocr_markdown(ctx: dict, task, state: ETLRuntimeState, parsed) -> str:
+    """Upload the markdown artifact and seed the content-hash OCR cache."""
+    s3 = ctx["s3_service"]
+    ocr_provider: OCRProvider = ctx["ocr_provider"]
+
+    state.provider_task_id = parsed.task_id
+    state.progress = max(state.progress, 40)
+    await ctx["state_repo"].set(state)
+
+    md_key = _artifact_markdown_key(state.task_id, _creator_id(task), task.project_id)
+    await s3.upload_file(
+        key=md_key,
+        content=parsed.markdown_content.encode("utf-8"),
+        content_type="text/markdown",
+        metadata={"task_id": str(state.task_id), "provider_task_id": parsed.task_id},
+    )
+    if etl_config.etl_ocr_result_cache_enabled and state.ocr_content_hash:
+        try:
+            await s3.copy_object(
+                md_key,
+                _ocr_cache_key(
+                    ocr_provider.name, state.ocr_content_hash, ocr_provider.cache_options
+                ),
+            )
+        except Exception as e:
+            logger.warning(f"OCR cache write failed task_id={state.task_id}: {e}")
+    return md_key
+
+
+async def _finish_ocr(
+    ctx: dict, task, state: ETLRuntimeState, md_key: str, started_at: float
+) -> dict:
+    """Record the markdown artifact and hand the task to postprocess."""
+    state_repo: ETLStateRepositoryRedis = ctx["state_repo"]
+    task_id = state.task_id
+
+    state.artifact_mineru_markdown_key = md_key
+    state.progress = max(state.progress, 55)
+    await state_repo.set(state)
+
+    if _ocr_cancelled(task, await state_repo.get(task_id)):
+        logger.info(
+            f"etl_ocr_job: cancelled before enqueue postprocess, skip: {task_id}"
+        )
         return {"ok": True, "skipped": "cancelled"}
 
+    # Enqueue postprocess
+    job = await ctx["redis"].enqueue_job(
+        "etl_postprocess_job", task_id, _queue_name=ctx["arq_queue_name"]
+    )
+    state.arq_job_id_postprocess = job.job_id
+    state.phase = ETLPhase.POSTPROCESS
+    state.status = ETLTaskStatus.LLM_PROCESSING
+    state.progress = max(state.progress, 60)
+    await state_repo.set(state)
+
+    elapsed = time.time() - started_at
+    return {"ok": True, "stage": "ocr", "seconds": elapsed, "markdown_key": md_key}
+
+
+async def _schedule_ocr_poll(ctx: dict, state: ETLRuntimeState) -> None:
+    ocr_provider: OCRProvider = ctx["ocr_provider"]
+    state.ocr_poll_count += 1
+    await ctx["state_repo"].set(state)
+    await ctx["redis"].enqueue_job(
+        "etl_ocr_poll_job",
+        state.task_id,
+        _queue_name=ctx["arq_queue_name"],
+        _defer_by=max(1.0, ocr_provider.poll_interval_seconds),
+        _job_id=f"etl_ocr_poll:{state.task_id}:{state.attempt_ocr}:{state.ocr_poll_count}",
+    )
+
+
+async def etl_ocr_job(ctx: dict, task_id: str | int) -> dict:
+    """
+    OCR stage: Parse document -> upload markdown artifact -> enqueue postprocess job.
+
+    Supports multiple OCR providers (MineRU, Reducto, etc.) via pluggable OCRProvider interface.
+
+    Parsed markdown is cached by (provider, source content hash); a hit skips
+    OCR entirely. Providers with a remote job queue are submitted here and
+    then checked by ``etl_ocr_poll_job``, which re-enqueues itself with a
+    deferral, so no worker slot is held while the provider is working.
+    """
+    s3 = ctx["s3_service"]
+    ocr_provider: OCRProvider = ctx["ocr_provider"]
+    state_repo: ETLStateRepositoryRedis = ctx["state_repo"]
+
+    loaded, early = await _load_ocr_task(ctx, task_id, "etl_ocr_job")
+    if loaded is None:
+        return early
+    task, state = loaded
+
     state.phase = ETLPhase.OCR
     state.status = ETLTaskStatus.MINERU_PARSING
     state.progress = max(state.progress, 10)
     state.attempt_ocr += 1
+    state.ocr_poll_count = 0
     state.touch()
     await state_repo.set(state)
 
@@ -250,120 +413,93 @@ async def etl_ocr_job(ctx: dict, task_id: str | int) -> dict:
         else:
             source_key = f"users/{_creator_id(task)}/raw/{task.project_id}/{task.filename}"
 
+        if etl_config.etl_ocr_result_cache_enabled:
+            state.ocr_content_hash = await _source_content_hash(s3, source_key)
+            cache_key = _ocr_cache_key(
+                ocr_provider.name, state.ocr_content_hash, ocr_provider.cache_options
+            )
+            if await s3.object_exists(cache_key):
+                md_key = _artifact_markdown_key(task_id, _creator_id(task), task.project_id)
+                await s3.copy_object(cache_key, md_key)
+                logger.info(
+                    f"etl_ocr_job: reused cached OCR result "
+                    f"{state.ocr_content_hash[:12]} for task {task_id}"
+                )
+                return await _finish_ocr(ctx, task, state, md_key, started_at)
+
         presigned_url = await s3.generate_presigned_download_url(
             source_key, expires_in=3600
         )
 
-        # Use pluggable OCR provider (MineRU, Reducto, etc.)
-        parsed = await ocr_provider.parse_document(
+        submission = await ocr_provider.submit_document(
             file_url=presigned_url,
             data_id=str(task_id),
         )
+        if submission.document is None:
+            state.provider_task_id = submission.task_id
+            state.ocr_submitted_at = datetime.now(UTC)
+            await _schedule_ocr_poll(ctx, state)
+            return {"ok": True, "stage": "ocr", "submitted": submission.task_id}
+        parsed = submission.document
 
         # If user cancelled while we were waiting on provider, honor cancellation and avoid overwriting terminal state.
-        latest = await state_repo.get(task_id)
-        if (
-            latest and latest.status == ETLTaskStatus.CANCELLED
-        ) or task.status == ETLTaskStatus.CANCELLED:
+        if _ocr_cancelled(task, await state_repo.get(task_id)):
             logger.info(f"etl_ocr_job: cancelled during provider wait, skip: {task_id}")
             return {"ok": True, "skipped": "cancelled"}
 
-        state.provider_task_id = parsed.task_id
-        state.progress = max(state.progress, 40)
-        await state_repo.set(state)
+        md_key = await _store_ocr_markdown(ctx, task, state, parsed)
+        return await _finish_ocr(ctx, task, state, md_key, started_at)
 
-        # Upload markdown artifact to S3
-        md_key = _artifact_markdown_key(task_id, _creator_id(task), task.project_id)
-        await s3.upload_file(
-            key=md_key,
-            content=parsed.markdown_content.encode("utf-8"),
-            content_type="text/markdown",
-            metadata={"task_id": str(task_id), "provider_task_id": parsed.task_id},
-        )
-        state.artifact_mineru_markdown_key = md_key
-        state.progress = max(state.progress, 55)
-        await state_repo.set(state)
+    except (asyncio.CancelledError, Exception) as e:
+        return await _ocr_failure(ctx, task, state, e)
 
-        latest = await state_repo.get(task_id)
-        if (
-            latest and latest.status == ETLTaskStatus.CANCELLED
-        ) or task.status == ETLTaskStatus.CANCELLED:
-            logger.info(
-                f"etl_ocr_job: cancelled before enqueue postprocess, skip: {task_id}"
-            )
-            return {"ok": True, "skipped": "cancelled"}
 
-        # Enqueue postprocess
-        job = await ctx["redis"].enqueue_job(
-            "etl_postprocess_job", task_id, _queue_name=queue_name
-        )
-        state.arq_job_id_postprocess = job.job_id
-        state.phase = ETLPhase.POSTPROCESS
-        state.status = ETLTaskStatus.LLM_PROCESSING
-        state.progress = max(state.progress, 60)
-        await state_repo.set(state)
+async def etl_ocr_poll_job(ctx: dict, task_id: str | int) -> dict:
+    """
+    OCR stage, polling half: check the submitted provider job once.
 
-        elapsed = time.time() - started_at
-        return {"ok": True, "stage": "ocr", "seconds": elapsed, "markdown_key": md_key}
+    Still running -> re-enqueue itself after the provider's poll interval.
+    Done -> upload markdown artifact and enqueue postprocess, as etl_ocr_job.
+    """
+    ocr_provider: OCRProvider = ctx["ocr_provider"]
+    state_repo: ETLStateRepositoryRedis = ctx["state_repo"]
 
-    except asyncio.CancelledError:
-        # ARQ enforces WorkerSettings.job_timeout via asyncio.wait_for which cancels the job task.
-        # On Python 3.12, asyncio.CancelledError inherits BaseException, so a plain `except Exception`
-        # won't run and the runtime state would stay stuck at MINERU_PARSING.
-        state.status = ETLTaskStatus.FAILED
-        state.error_stage = "timeout"
-        state.error_message = f"ETL OCR job timed out (>{etl_config.etl_task_timeout}s)"
-        state.progress = 0
-        await state_repo.set_terminal(state)
+    loaded, early = await _load_ocr_task(ctx, task_id, "etl_ocr_poll_job")
+    if loaded is None:
+        return early
+    task, state = loaded
 
-        task.status = ETLTaskStatus.FAILED
-        task.error = state.error_message
-        task.metadata.update(
-            {"error_stage": "timeout", "provider_task_id": state.provider_task_id}
-        )
-        repo.update_task(task)
-        logger.error(f"etl_ocr_job timeout task_id={task_id}")
-        return {"ok": False, "stage": "ocr", "error": state.error_message}
+    if state.phase != ETLPhase.OCR or not state.provider_task_id:
+        logger.info(f"etl_ocr_poll_job: nothing to poll for task {task_id}, skip")
+        return {"ok": True, "skipped": "not_polling"}
 
-    except OCRProviderError as e:
-        # Handle OCR provider-specific errors
-        state.status = ETLTaskStatus.FAILED
-        state.error_stage = f"ocr_{e.provider}"
-        state.error_message = str(e)
-        state.progress = 0
-        await state_repo.set_terminal(state)
+    started_at = time.time()
+    try:
+        submitted_at = state.ocr_submitted_at or state.updated_at
+        waited = (datetime.now(UTC) - submitted_at).total_seconds()
+        if waited > ocr_provider.max_wait_seconds:
+            raise OCRProviderTimeoutError(
+                provider=ocr_provider.name,
+                message=(
+                    f"Job {state.provider_task_id} timed out after "
+                    f"{ocr_provider.max_wait_seconds:.0f}s"
+                ),
+            )
 
-        task.status = ETLTaskStatus.FAILED
-        task.error = str(e)
-        task.metadata.update(
-            {
-                "error_stage": f"ocr_{e.provider}",
-                "provider_task_id": state.provider_task_id,
-            }
-        )
-        repo.update_task(task)
-        logger.error(f"etl_ocr_job failed task_id={task_id}: {e}")
-        return {"ok": False, "stage": "ocr", "error": str(e)}
+        parsed = await ocr_provider.poll_document(state.provider_task_id)
+        if parsed is None:
+            await _schedule_ocr_poll(ctx, state)
+            return {"ok": True, "stage": "ocr", "polling": state.ocr_poll_count}
 
-    except Exception as e:
-        # Handle unexpected errors
-        state.status = ETLTaskStatus.FAILED
-        state.error_stage = f"ocr_{ocr_provider.name}"
-        state.error_message = str(e)
-        state.progress = 0
-        await state_repo.set_terminal(state)
+        if _ocr_cancelled(task, await state_repo.get(task_id)):
+            logger.info(f"etl_ocr_poll_job: cancelled during provider wait, skip: {task_id}")
+            return {"ok": True, "skipped": "cancelled"}
 
-        task.status = ETLTaskStatus.FAILED
-        task.error = str(e)
-        task.metadata.update(
-            {
-                "error_stage": f"ocr_{ocr_provider.name}",
-                "provider_task_id": state.provider_task_id,
-            }
-        )
-        repo.update_task(task)
-        logger.error(f"etl_ocr_job failed task_id={task_id}: {e}", exc_info=True)
-        return {"ok": False, "stage": "ocr", "error": str(e)}
+        md_key = await _store_ocr_markdown(ctx, task, state, parsed)
+        return await _finish_ocr(ctx, task, state, md_key, started_at)
+
+    except (asyncio.CancelledError, Exception) as e:
+        return await _ocr_failure(ctx, task, state, e)
 
 
 async def finalize_upload_to_mut(
@@ -617,11 +753,17 @@ async def finalize_uploads_to_mut_batch(
     # Phase 1: load tasks, validate, mark RUNNING. Drop anything that
     # can't proceed before we touch S3 — failed-fast keeps the bulk
     # path from holding zombie tasks in memory.
+    #
+    # Task rows are read with one bulk query and every failure in a
+    # phase is persisted with one bulk update, both off the event loop
+    # (the Supabase client is synchronous).
     prepared: list[dict] = []  # entries that survive into the bulk push
     project_id: str | None = None
+    failed_tasks: list = []
+    tasks_by_id = await asyncio.to_thread(repo.get_tasks, task_ids)
 
     for tid in task_ids:
-        task = repo.get_task(tid)
+        task = tasks_by_id.get(str(tid))
         if not task:
             results.append(
                 {"ok": False, "task_id": str(tid), "error": "task_not_found"}
@@ -639,7 +781,7 @@ async def finalize_uploads_to_mut_batch(
             err = "Missing s3_key or mount_path in task metadata"
             task.mark_failed(err)
             task.metadata["error_stage"] = "finalize"
-            repo.update_task(task)
+            failed_tasks.append(task)
             results.append({"ok": False, "task_id": str(tid), "error": err})
             continue
 
@@ -652,7 +794,7 @@ async def finalize_uploads_to_mut_batch(
             err = f"Mixed project IDs in batch ({project_id} vs {task.project_id})"
             task.mark_failed(err)
             task.metadata["error_stage"] = "finalize"
-            repo.update_task(task)
+            failed_tasks.append(task)
             results.append({"ok": False, "task_id": str(tid), "error": err})
             continue
 
@@ -681,6 +823,9 @@ async def finalize_uploads_to_mut_batch(
             "mount_path": mount_path,
         })
 
+    if failed_tasks:
+        await asyncio.to_thread(repo.update_tasks, failed_tasks)
+        failed_tasks = []
     if not prepared:
         return results
 
@@ -757,7 +902,7 @@ async def finalize_uploads_to_mut_batch(
             )
             task.mark_failed(err)
             task.metadata["error_stage"] = "finalize_stage"
-            repo.update_task(task)
+            failed_tasks.append(task)
 
             state.status = ETLTaskStatus.FAILED
             state.error_stage = "finalize_stage"
@@ -773,13 +918,15 @@ async def finalize_uploads_to_mut_batch(
 
     sem = asyncio.Semaphore(_STAGE_PARALLEL_LIMIT)
 
-    async def _bounded_stage(entry: dict) -> None:
+    async def _bounded_stage(entry: dict) -> tuple[str, dict]:
         async with sem:
-            await _stage_one(entry)
+            return await _stage_one(entry)
 
     stage_outcomes = await asyncio.gather(
         *(_bounded_stage(e) for e in prepared),
     )
+    if failed_tasks:
+        await asyncio.to_thread(repo.update_tasks, failed_tasks)
     for kind, payload in stage_outcomes:
         if kind == "survivor":
             refs_by_path[payload["mount_path"]] = payload["blob_ref"]
@@ -826,11 +973,14 @@ async def finalize_uploads_to_mut_batch(
         )
         for entry in survivors:
             task = entry["task"]
-            state = entry["state"]
             task.mark_failed(err)
             task.metadata["error_stage"] = "finalize_push"
-            repo.update_task(task)
-
+        await asyncio.to_thread(
+            repo.update_tasks, [entry["task"] for entry in survivors]
+        )
+        for entry in survivors:
+            task = entry["task"]
+            state = entry["state"]
             state.status = ETLTaskStatus.FAILED
             state.error_stage = "finalize_push"
             state.error_message = err
@@ -843,32 +993,33 @@ async def finalize_uploads_to_mut_batch(
 
     # Phase 4: mark all survivors COMPLETED.
     #
-    # Task PATCH (Supabase REST) and Redis state writes are
-    # independent per task, so we fan them out under the same
-    # semaphore as Phase 2. ``repo.update_task`` is sync (boto-style
-    # Supabase client) so we wrap it in ``to_thread`` to actually
-    # parallelize — without that, every PATCH would serialize on
-    # the event loop's blocking call. For 3 files this saves
-    # ~600ms; for 100 files it saves ~30s.
+    # All task rows go out in one ``mark_completed_many`` upsert (off
+    # the event loop — the Supabase client is sync), instead of one
+    # PATCH per file. Redis state writes are independent per task, so
+    # they fan out under the same semaphore as Phase 2.
     elapsed = time.time() - started_at
     per_file_seconds = elapsed / len(survivors) if survivors else 0.0
 
+    completions = []
+    for entry in survivors:
+        task = entry["task"]
+        task.path = entry["mount_path"]
+        completions.append((
+            task,
+            ETLTaskResult(
+                output_path=entry["s3_key"],
+                output_size=entry["size"],
+                processing_time=per_file_seconds,
+            ),
+        ))
+    await asyncio.to_thread(repo.mark_completed_many, completions)
+
     async def _mark_completed(entry: dict) -> None:
         task = entry["task"]
         state = entry["state"]
         mount_path = entry["mount_path"]
         size = entry["size"]
 
-        task.mark_completed(
-            ETLTaskResult(
-                output_path=entry["s3_key"],
-                output_size=size,
-                processing_time=per_file_seconds,
-            )
-        )
-        task.path = mount_path
-        await asyncio.to_thread(repo.update_task, task)
-
         state.status = ETLTaskStatus.COMPLETED
         state.phase = ETLPhase.FINALIZE
         state.progress = 100
@@ -987,24 +1138,11 @@ async def etl_postprocess_job(ctx: dict, task_id: str | int) -> dict:
 
             input_text = markdown
             if strategy == "chunked-summarize":
-                chunks = _chunk_text(
+                input_text = await summarize_chunked(
+                    llm,
                     markdown,
-                    chunk_size=etl_config.etl_postprocess_chunk_size_chars,
-                    max_chunks=etl_config.etl_postprocess_max_chunks,
-                )
-                summaries: list[str] = []
-                for idx, ch in enumerate(chunks, start=1):
-                    resp = await llm.call_text_model(
-                        prompt=(
-                            "Please summarize the following document chunk into key points (retain key field names/values/table information), output plain text.\n\n"
-                            f"Chunk {idx}/{len(chunks)}:\n{ch}"
-                        ),
-                        system_prompt="You are a rigorous document summarization assistant.",
-                        response_format="text",
-                    )
-                    summaries.append(resp.content)
-                input_text = "\n\n".join(
-                    [f"## Chunk {i + 1} Summary\n{t}" for i, t in enumerate(summaries)]
+                    rule_key=str(task.rule_id),
+                    cache=ctx.get("chunk_summary_cache"),
                 )
 
             engine = RuleEngine(llm)
@@ -0,0 +1,143 @@
+"""
+Chunked-summarize postprocess strategy (map-reduce)
+
+Map: each markdown chunk is summarized by the LLM, up to
+``etl_postprocess_chunk_concurrency`` calls at a time.
+Reduce: while the joined summaries are still over the chunk threshold, they
+are packed into chunk-sized groups and summarized again, for at most
+``etl_postprocess_max_reduce_levels`` rounds. The result feeds the final
+structuring call (``RuleEngine.apply_rule``).
+
+Every summary is cached per (rule, chunk content hash), so a retried task or
+a re-uploaded document only pays for chunks that never completed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Protocol
+
+from src.ingest.file.config import etl_config
+
+SUMMARY_SYSTEM_PROMPT = "You are a rigorous document summarization assistant."
+CHUNK_SUMMARY_PROMPT = (
+    "Please summarize the following document chunk into key points "
+    "(retain key field names/values/table information), output plain text.\n\n"
+)
+REDUCE_SUMMARY_PROMPT = (
+    "Please merge the following chunk summaries of one document into a single "
+    "summary of key points (retain key field names/values/table information), "
+    "output plain text.\n\n"
+)
+
+
+class SummaryCache(Protocol):
+    async def get(self, rule_key: str, prompt: str, text: str) -> str | None: ...
+
+    async def set(self, rule_key: str, prompt: str, text: str, summary: str) -> None: ...
+
+
+def chunk_text(text: str, chunk_size: int, max_chunks: int) -> list[str]:
+    if chunk_size <= 0:
+        return [text]
+    chunks: list[str] = []
+    for i in range(0, len(text), chunk_size):
+        if len(chunks) >= max_chunks:
+            break
+        chunks.append(text[i : i + chunk_size])
+    return chunks
+
+
+def join_summaries(summaries: list[str], label: str = "Chunk") -> str:
+    return "\n\n".join(
+        [f"## {label} {i + 1} Summary\n{t}" for i, t in enumerate(summaries)]
+    )
+
+
+def _group_sections(sections: list[str], chunk_size: int) -> list[str]:
+    """Pack consecutive sections into groups of at most ``chunk_size`` chars."""
+    groups: list[str] = []
+    current: list[str] = []
+    size = 0
+    for section in sections:
+        if current and size + len(section) > chunk_size:
+            groups.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(section)
+        size += len(section) + 2
+    if current:
+        groups.append("\n\n".join(current))
+    return groups
+
+
+async def summarize_texts(
+    llm,
+    texts: list[str],
+    *,
+    prompt: str,
+    label: str,
+    rule_key: str,
+    cache: SummaryCache | None = None,
+    concurrency: int | None = None,
+) -> list[str]:
+    """Summarize ``texts`` concurrently; output order matches input order."""
+    limit = concurrency or etl_config.etl_postprocess_chunk_concurrency
+    sem = asyncio.Semaphore(max(1, limit))
+
+    async def _one(idx: int, text: str) -> str:
+        if cache is not None:
+            cached = await cache.get(rule_key, prompt, text)
+            if cached is not None:
+                return cached
+        async with sem:
+            resp = await llm.call_text_model(
+                prompt=f"{prompt}{label} {idx}/{len(texts)}:\n{text}",
+                system_prompt=SUMMARY_SYSTEM_PROMPT,
+                response_format="text",
+            )
+        if cache is not None:
+            await cache.set(rule_key, prompt, text, resp.content)
+        return resp.content
+
+    return list(
+        await asyncio.gather(*(_one(i, t) for i, t in enumerate(texts, start=1)))
+    )
+
+
+async def summarize_chunked(
+    llm,
+    markdown: str,
+    *,
+    rule_key: str,
+    cache: SummaryCache | None = None,
+) -> str:
+    """Map-reduce ``markdown`` into summary text for the structuring call."""
+    chunk_size = etl_config.etl_postprocess_chunk_size_chars
+    chunks = chunk_text(
+        markdown,
+        chunk_size=chunk_size,
+        max_chunks=etl_config.etl_postprocess_max_chunks,
+    )
+    summaries = await summarize_texts(
+        llm, chunks, prompt=CHUNK_SUMMARY_PROMPT, label="Chunk",
+        rule_key=rule_key, cache=cache,
+    )
+    text = join_summaries(summaries)
+
+    for level in range(1, etl_config.etl_postprocess_max_reduce_levels + 1):
+        if len(text) <= etl_config.etl_postprocess_chunk_threshold_chars:
+            break
+        sections = [
+            f"## {'Chunk' if level == 1 else 'Section'} {i + 1} Summary\n{t}"
+            for i, t in enumerate(summaries)
+        ]
+        groups = _group_sections(sections, chunk_size)
+        if len(groups) >= len(summaries):
+            break  # summaries are individually chunk-sized; no further reduction
+        summaries = await summarize_texts(
+            llm, groups, prompt=REDUCE_SUMMARY_PROMPT, label="Summary group",
+            rule_key=rule_key, cache=cache,
+        )
+        text = join_summaries(summaries, label="Section")
+
+    return text
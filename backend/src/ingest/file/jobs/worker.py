@@ -26,13 +26,16 @@ from arq.connections import RedisSettings
 
 from src.infra.llm.service import LLMService
 from src.infra.s3.service import S3Service
+from src.infra.supabase.async_client import close_async_postgrest, open_async_postgrest
 from src.ingest.file.config import etl_config
 from src.ingest.file.jobs.jobs import (
     etl_finalize_upload_job,
     etl_ocr_job,
+    etl_ocr_poll_job,
     etl_postprocess_job,
 )
 from src.ingest.file.ocr import get_ocr_provider
+from src.ingest.file.state.chunk_cache import ChunkSummaryCacheRedis
 from src.ingest.file.state.repository import ETLStateRepositoryRedis
 from src.ingest.file.tasks.repository import ETLTaskRepositorySupabase
 
@@ -58,8 +61,12 @@ async def startup(ctx: dict) -> None:
 
     # ETL Redis runtime state repo (shares same Redis as ARQ)
     ctx["state_repo"] = ETLStateRepositoryRedis(ctx["redis"])
+    ctx["chunk_summary_cache"] = ChunkSummaryCacheRedis(ctx["redis"])
     ctx["arq_queue_name"] = etl_config.etl_arq_queue_name
 
+    # Finalize jobs publish through MUT: pool its PostgREST client on this loop
+    await open_async_postgrest()
+
     logger.info(f"ETL ARQ worker startup complete (OCR provider: {ocr_provider.name})")
 
 
@@ -67,6 +74,7 @@ async def shutdown(ctx: dict) -> None:
     """
     Cleanup on worker shutdown.
     """
+    await close_async_postgrest()
     logger.info("ETL ARQ worker shutdown")
 
 
@@ -76,7 +84,12 @@ class WorkerSettings:
     # repo, runtime state repo) and Redis queue. It's invoked after a
     # browser-direct-to-S3 upload completes; see
     # ``ingest.file.jobs.jobs.etl_finalize_upload_job`` for the flow.
-    functions = [etl_ocr_job, etl_postprocess_job, etl_finalize_upload_job]  # noqa: RUF012
+    functions = [  # noqa: RUF012
+        etl_ocr_job,
+        etl_ocr_poll_job,
+        etl_postprocess_job,
+        etl_finalize_upload_job,
+    ]
     on_startup = startup
     on_shutdown = shutdown
     redis_settings = RedisSettings.from_dsn(etl_config.etl_redis_url)
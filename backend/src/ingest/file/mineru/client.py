@@ -387,6 +387,24 @@ class MineRUClient:
         # Wait for completion
         status = await self.wait_for_completion(task_id)
 
+        return await self.fetch_result(task_id, status)
+
+    async def fetch_result(
+        self, task_id: str, status: TaskStatusResponse
+    ) -> ParsedResult:
+        """
+        Download and extract the result of a completed task.
+
+        Args:
+            task_id: Completed task ID
+            status: Its final TaskStatusResponse
+
+        Returns:
+            ParsedResult with task_id, paths, and Markdown content
+
+        Raises:
+            MineRUAPIError: If download or extraction fails
+        """
         if not status.full_zip_url:
             raise MineRUAPIError(0, "No ZIP URL in completed task")
 
@@ -5,11 +5,12 @@ Pluggable OCR service abstraction layer.
 Supports multiple OCR providers: MineRU, Reducto, DeepSeek, etc.
 """
 
-from src.ingest.file.ocr.base import OCRProvider, ParsedDocument
+from src.ingest.file.ocr.base import OCRProvider, OCRSubmission, ParsedDocument
 from src.ingest.file.ocr.factory import OCRProviderFactory, get_ocr_provider
 
 __all__ = [
     "OCRProvider",
+    "OCRSubmission",
     "ParsedDocument",
     "OCRProviderFactory",
     "get_ocr_provider",
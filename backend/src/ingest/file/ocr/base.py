@@ -34,6 +34,19 @@ class ParsedDocument:
     metadata: dict | None = None
 
 
+@dataclass
+class OCRSubmission:
+    """
+    A document handed to a provider's remote job queue.
+
+    ``document`` is set when the provider answered synchronously and there
+    is nothing to poll.
+    """
+
+    task_id: str
+    document: ParsedDocument | None = None
+
+
 class OCRProvider(ABC):
     """
     Abstract base class for OCR providers.
@@ -41,6 +54,12 @@ class OCRProvider(ABC):
     Each provider implements:
     - parse_document(): Main method to OCR a document from URL
 
+    Providers backed by a remote job queue also override the two-step
+    submit_document() / poll_document() API, so the ETL worker can release
+    its job slot between status checks instead of sleeping inside
+    parse_document(). Other providers inherit a submit_document() that
+    parses synchronously and never leaves a job to poll.
+
     The provider handles its own:
     - Authentication
     - Task creation/polling
@@ -73,6 +92,54 @@ class OCRProvider(ABC):
             OCRProviderError: If parsing fails
         """
 
+    @property
+    def cache_options(self) -> dict:
+        """Settings that change the output (model, language, pages), for the OCR cache key."""
+        return {}
+
+    @property
+    def poll_interval_seconds(self) -> float:
+        """Suggested delay between poll_document() calls."""
+        return 5.0
+
+    @property
+    def max_wait_seconds(self) -> float:
+        """How long a submitted job may run before it is considered timed out."""
+        return 1800.0
+
+    async def submit_document(
+        self,
+        file_url: str,
+        data_id: str | None = None,
+    ) -> OCRSubmission:
+        """
+        Start parsing a document without waiting for the result.
+
+        Defaults to a synchronous parse_document(), returned as the
+        submission's document.
+
+        Raises:
+            OCRProviderError: If the job cannot be created
+        """
+        document = await self.parse_document(file_url=file_url, data_id=data_id)
+        return OCRSubmission(task_id=document.task_id, document=document)
+
+    async def poll_document(self, provider_task_id: str) -> ParsedDocument | None:
+        """
+        Check a submitted job once.
+
+        Returns:
+            ParsedDocument when the job is done, None while it is still running
+
+        Raises:
+            OCRProviderError: If the job failed
+        """
+        # The default submit_document() never leaves a job behind
+        raise OCRProviderError(
+            provider=self.name,
+            message=f"No remote job {provider_task_id} to poll",
+        )
+
     @abstractmethod
     async def health_check(self) -> bool:
         """
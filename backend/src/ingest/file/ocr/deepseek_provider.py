@@ -101,6 +101,14 @@ class DeepSeekOCRProvider(OCRProvider):
     def name(self) -> str:
         return "deepseek"
 
+    @property
+    def cache_options(self) -> dict:
+        return {
+            "model": self._model,
+            "max_tokens": self._max_tokens,
+            "max_pages": self._max_pages,
+        }
+
     def _get_headers(self) -> dict:
         if not self._api_key:
             raise OCRProviderConfigError(
@@ -13,12 +13,13 @@ from src.ingest.file.mineru.exceptions import (
     MineRUAPIKeyError,
     MineRUTimeoutError,
 )
-from src.ingest.file.mineru.schemas import MineRUModelVersion
+from src.ingest.file.mineru.schemas import MineRUModelVersion, MineRUTaskState
 from src.ingest.file.ocr.base import (
     OCRProvider,
     OCRProviderAPIError,
     OCRProviderConfigError,
     OCRProviderTimeoutError,
+    OCRSubmission,
     ParsedDocument,
 )
 
@@ -102,6 +103,68 @@ class MineRUProvider(OCRProvider):
                 status_code=getattr(e, "status_code", None),
             ) from e
 
+    @property
+    def cache_options(self) -> dict:
+        return {"model_version": MineRUModelVersion.VLM.value}
+
+    @property
+    def poll_interval_seconds(self) -> float:
+        return float(mineru_config.mineru_poll_interval)
+
+    @property
+    def max_wait_seconds(self) -> float:
+        return float(mineru_config.mineru_max_wait_time)
+
+    async def submit_document(
+        self,
+        file_url: str,
+        data_id: str | None = None,
+    ) -> OCRSubmission:
+        """Create a MineRU task and return its task ID without waiting."""
+        client = self._get_client()
+        try:
+            created = await client.create_task(
+                file_url=file_url,
+                model_version=MineRUModelVersion.VLM,
+                data_id=data_id,
+            )
+        except MineRUAPIError as e:
+            raise OCRProviderAPIError(
+                provider=self.name,
+                message=str(e),
+                status_code=getattr(e, "status_code", None),
+            ) from e
+        return OCRSubmission(task_id=created.task_id)
+
+    async def poll_document(self, provider_task_id: str) -> ParsedDocument | None:
+        """Check a MineRU task once; download the result when it is done."""
+        client = self._get_client()
+        try:
+            status = await client.get_task_status(provider_task_id)
+            if status.state == MineRUTaskState.FAILED:
+                raise OCRProviderAPIError(
+                    provider=self.name,
+                    message=f"MineRU task {provider_task_id} failed: "
+                    f"{status.err_msg or 'Unknown error'}",
+                )
+            if status.state != MineRUTaskState.COMPLETED:
+                return None
+            result = await client.fetch_result(provider_task_id, status)
+        except MineRUAPIError as e:
+            raise OCRProviderAPIError(
+                provider=self.name,
+                message=str(e),
+                status_code=getattr(e, "status_code", None),
+            ) from e
+
+        return ParsedDocument(
+            task_id=result.task_id,
+            markdown_content=result.markdown_content,
+            cache_dir=result.cache_dir,
+            markdown_path=result.markdown_path,
+            metadata={"provider": "mineru"},
+        )
+
     async def health_check(self) -> bool:
         """Check if MineRU is properly configured."""
         try:
@@ -22,11 +22,17 @@ from src.ingest.file.ocr.base import (
     OCRProviderAPIError,
     OCRProviderConfigError,
     OCRProviderTimeoutError,
+    OCRSubmission,
     ParsedDocument,
 )
 
 logger = logging.getLogger(__name__)
 
+_PARSE_OPTIONS = {
+    "output_mode": "markdown",  # Request markdown output
+    "table_output_mode": "markdown",  # Tables as markdown
+}
+
 
 class ReductoConfig(BaseSettings):
     """Configuration for Reducto API."""
@@ -125,77 +131,178 @@ class ReductoProvider(OCRProvider):
 
         async with httpx.AsyncClient(timeout=60.0) as client:
             # Step 1: Create parsing job
+            submission = await self._create_job(client, file_url, data_id, headers)
+            if submission.document is not None:
+                return submission.document
+
+            # Step 2: Poll for completion
+            markdown_content = await self._poll_job(client, submission.task_id, headers)
+
+            return ParsedDocument(
+                task_id=submission.task_id,
+                markdown_content=markdown_content,
+                metadata={"provider": "reducto", "mode": "async"},
+            )
+
+    @property
+    def cache_options(self) -> dict:
+        return dict(_PARSE_OPTIONS)
+
+    @property
+    def poll_interval_seconds(self) -> float:
+        return float(self._poll_interval)
+
+    @property
+    def max_wait_seconds(self) -> float:
+        return float(self._max_wait_time)
+
+    async def submit_document(
+        self,
+        file_url: str,
+        data_id: str | None = None,
+    ) -> OCRSubmission:
+        """Create a Reducto parse job without waiting for it."""
+        headers = self._get_headers()
+        async with httpx.AsyncClient(timeout=60.0) as client:
+            return await self._create_job(client, file_url, data_id, headers)
+
+    async def poll_document(self, provider_task_id: str) -> ParsedDocument | None:
+        """Check a Reducto job once."""
+        headers = self._get_headers()
+        async with httpx.AsyncClient(timeout=60.0) as client:
             try:
-                logger.info(f"[Reducto] Creating parse job for: {file_url[:50]}...")
-
-                # Reducto API endpoint for parsing
-                # See: https://docs.reducto.ai/api-reference/parse
-                create_response = await client.post(
-                    f"{self._base_url}/parse",
-                    headers=headers,
-                    json={
-                        "document_url": file_url,
-                        "options": {
-                            "output_mode": "markdown",  # Request markdown output
-                            "table_output_mode": "markdown",  # Tables as markdown
-                        },
-                    },
+                markdown_content = await self._check_job(client, provider_task_id, headers)
+            except httpx.HTTPError as e:
+                logger.warning(f"[Reducto] Poll error (will retry): {e}")
+                return None
+        if markdown_content is None:
+            return None
+        return ParsedDocument(
+            task_id=provider_task_id,
+            markdown_content=markdown_content,
+            metadata={"provider": "reducto", "mode": "async"},
+        )
+
+    async def _create_job(
+        self,
+        client: httpx.AsyncClient,
+        file_url: str,
+        data_id: str | None,
+        headers: dict,
+    ) -> OCRSubmission:
+        """
+        Create a parsing job.
+
+        Reducto may answer synchronously, in which case the submission
+        already carries the parsed document.
+        """
+        try:
+            logger.info(f"[Reducto] Creating parse job for: {file_url[:50]}...")
+
+            # Reducto API endpoint for parsing
+            # See: https://docs.reducto.ai/api-reference/parse
+            create_response = await client.post(
+                f"{self._base_url}/parse",
+                headers=headers,
+                json={
+                    "document_url": file_url,
+                    "options": _PARSE_OPTIONS,
+                },
+            )
+
+            if create_response.status_code == 401:
+                raise OCRProviderAPIError(
+                    provider=self.name,
+                    message="Authentication failed. Check your REDUCTO_API_KEY.",
+                    status_code=401,
+                    raw_response=create_response.text,
                 )
 
-                if create_response.status_code == 401:
-                    raise OCRProviderAPIError(
-                        provider=self.name,
-                        message="Authentication failed. Check your REDUCTO_API_KEY.",
-                        status_code=401,
-                        raw_response=create_response.text,
-                    )
-
-                if create_response.status_code != 200:
-                    raise OCRProviderAPIError(
-                        provider=self.name,
-                        message=f"Failed to create parse job: {create_response.text}",
-                        status_code=create_response.status_code,
-                        raw_response=create_response.text,
-                    )
-
-                result = create_response.json()
-
-                # Reducto may return result directly (sync) or job_id (async)
-                if "result" in result and result.get("status") == "completed":
-                    # Sync response - result is already available
-                    markdown_content = self._extract_markdown(result["result"])
-                    return ParsedDocument(
-                        task_id=result.get("job_id", data_id or "sync"),
+            if create_response.status_code != 200:
+                raise OCRProviderAPIError(
+                    provider=self.name,
+                    message=f"Failed to create parse job: {create_response.text}",
+                    status_code=create_response.status_code,
+                    raw_response=create_response.text,
+                )
+
+            result = create_response.json()
+
+            # Reducto may return result directly (sync) or job_id (async)
+            if "result" in result and result.get("status") == "completed":
+                # Sync response - result is already available
+                task_id = result.get("job_id", data_id or "sync")
+                markdown_content = self._extract_markdown(result["result"])
+                return OCRSubmission(
+                    task_id=task_id,
+                    document=ParsedDocument(
+                        task_id=task_id,
                         markdown_content=markdown_content,
                         metadata={"provider": "reducto", "mode": "sync"},
-                    )
-
-                # Async response - need to poll for result
-                job_id = result.get("job_id")
-                if not job_id:
-                    raise OCRProviderAPIError(
-                        provider=self.name,
-                        message="No job_id in response",
-                        raw_response=str(result),
-                    )
-
-                logger.info(f"[Reducto] Job created: {job_id}")
+                    ),
+                )
 
-            except httpx.HTTPError as e:
+            # Async response - need to poll for result
+            job_id = result.get("job_id")
+            if not job_id:
                 raise OCRProviderAPIError(
                     provider=self.name,
-                    message=f"HTTP error creating job: {e}",
-                ) from e
+                    message="No job_id in response",
+                    raw_response=str(result),
+                )
 
-            # Step 2: Poll for completion
-            markdown_content = await self._poll_job(client, job_id, headers)
+            logger.info(f"[Reducto] Job created: {job_id}")
+            return OCRSubmission(task_id=job_id)
 
-            return ParsedDocument(
-                task_id=job_id,
-                markdown_content=markdown_content,
-                metadata={"provider": "reducto", "mode": "async"},
+        except httpx.HTTPError as e:
+            raise OCRProviderAPIError(
+                provider=self.name,
+                message=f"HTTP error creating job: {e}",
+            ) from e
+
+    async def _check_job(
+        self,
+        client: httpx.AsyncClient,
+        job_id: str,
+        headers: dict,
+    ) -> str | None:
+        """
+        Check job status once.
+
+        Returns:
+            Extracted markdown content when completed, None while still processing
+        """
+        response = await client.get(
+            f"{self._base_url}/parse/{job_id}",
+            headers=headers,
+        )
+
+        if response.status_code != 200:
+            raise OCRProviderAPIError(
+                provider=self.name,
+                message=f"Failed to get job status: {response.text}",
+                status_code=response.status_code,
+            )
+
+        result = response.json()
+        status = result.get("status", "").lower()
+
+        if status == "completed":
+            logger.info(f"[Reducto] Job {job_id} completed")
+            return self._extract_markdown(result.get("result", {}))
+
+        if status in ("failed", "error"):
+            error_msg = result.get("error", "Unknown error")
+            raise OCRProviderAPIError(
+                provider=self.name,
+                message=f"Job failed: {error_msg}",
+                raw_response=str(result),
             )
 
+        # Still processing
+        logger.debug(f"[Reducto] Job {job_id} status: {status}")
+        return None
+
     async def _poll_job(
         self,
         client: httpx.AsyncClient,
@@ -217,36 +324,9 @@ class ReductoProvider(OCRProvider):
 
         while elapsed < self._max_wait_time:
             try:
-                response = await client.get(
-                    f"{self._base_url}/parse/{job_id}",
-                    headers=headers,
-                )
-
-                if response.status_code != 200:
-                    raise OCRProviderAPIError(
-                        provider=self.name,
-                        message=f"Failed to get job status: {response.text}",
-                        status_code=response.status_code,
-                    )
-
-                result = response.json()
-                status = result.get("status", "").lower()
-
-                if status == "completed":
-                    logger.info(f"[Reducto] Job {job_id} completed")
-                    return self._extract_markdown(result.get("result", {}))
-
-                if status in ("failed", "error"):
-                    error_msg = result.get("error", "Unknown error")
-                    raise OCRProviderAPIError(
-                        provider=self.name,
-                        message=f"Job failed: {error_msg}",
-                        raw_response=str(result),
-                    )
-
-                # Still processing
-                logger.debug(f"[Reducto] Job {job_id} status: {status}")
-
+                markdown_content = await self._check_job(client, job_id, headers)
+                if markdown_content is not None:
+                    return markdown_content
             except httpx.HTTPError as e:
                 logger.warning(f"[Reducto] Poll error (will retry): {e}")
 
@@ -12,6 +12,7 @@ Execution happens in ARQ workers; API process is responsible for:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import UTC, datetime
 from typing import Any
@@ -326,22 +327,60 @@ class ETLService:
             ):
                 return self.task_repository.get_task(task_id)
 
-            return ETLTask(
-                task_id=state.task_id,
-                created_by=state.user_id,
-                project_id=state.project_id,
-                filename=state.filename,
-                rule_id=state.rule_id,
-                status=state.status,
-                progress=state.progress,
-                created_at=state.created_at.replace(tzinfo=None),
-                updated_at=state.updated_at.replace(tzinfo=None),
-                error=state.error_message,
-                metadata=state.metadata,
-            )
+            return _task_from_state(state)
 
         return self.task_repository.get_task(task_id)
 
+    async def get_task_statuses_with_access_check(
+        self, task_ids: list[str | int], user_id: str
+    ) -> dict[str, ETLTask]:
+        """
+        Batch form of ``get_task_status_with_access_check``.
+
+        Runtime states are read concurrently and every task that falls back
+        to the DB is loaded with one ``get_tasks`` call off the event loop.
+        Stale runtime states still go through ``get_task_status`` so they
+        are reconciled the same way.
+
+        Args:
+            task_ids: Task IDs
+            user_id: User ID (string type)
+
+        Returns:
+            Tasks the user may see, keyed by task ID; missing or foreign
+            tasks are omitted rather than raising
+        """
+        ids = list(dict.fromkeys(str(t) for t in task_ids))
+        states = await asyncio.gather(*(self.state_repo.get(t) for t in ids))
+
+        tasks: dict[str, ETLTask] = {}
+        db_ids: list[str] = []
+        for task_id, state in zip(ids, states):
+            if state is None or state.status in (
+                ETLTaskStatus.COMPLETED,
+                ETLTaskStatus.FAILED,
+                ETLTaskStatus.CANCELLED,
+            ):
+                db_ids.append(task_id)
+            elif state.status in (
+                ETLTaskStatus.MINERU_PARSING,
+                ETLTaskStatus.LLM_PROCESSING,
+            ):
+                task = await self.get_task_status(task_id)
+                if task:
+                    tasks[task_id] = task
+            else:
+                tasks[task_id] = _task_from_state(state)
+
+        if db_ids:
+            tasks.update(await asyncio.to_thread(self.task_repository.get_tasks, db_ids))
+
+        return {
+            task_id: task
+            for task_id, task in tasks.items()
+            if task.created_by is None or task.created_by == user_id
+        }
+
     async def get_task_status_with_access_check(
         self, task_id: str | int, user_id: str
     ) -> ETLTask:
@@ -551,3 +590,20 @@ class ETLService:
     def get_task_count(self) -> int:
         """Task count is stored in DB; API does not track it."""
         return 0
+
+
+def _task_from_state(state: ETLRuntimeState) -> ETLTask:
+    """Non-terminal task view built from its Redis runtime state."""
+    return ETLTask(
+        task_id=state.task_id,
+        created_by=state.user_id,
+        project_id=state.project_id,
+        filename=state.filename,
+        rule_id=state.rule_id,
+        status=state.status,
+        progress=state.progress,
+        created_at=state.created_at.replace(tzinfo=None),
+        updated_at=state.updated_at.replace(tzinfo=None),
+        error=state.error_message,
+        metadata=state.metadata,
+    )
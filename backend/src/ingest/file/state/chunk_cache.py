@@ -0,0 +1,68 @@
+"""
+ETL Chunk Summary Cache (Redis)
+
+Chunk summaries from the chunked-summarize postprocess strategy, keyed by
+rule and a hash of (summarization prompt, chunk text). Retries of a task and
+re-uploads of the same document reuse completed chunks instead of paying
+for the LLM call again. Shares the ARQ Redis, like the runtime state repo.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+
+from arq.connections import ArqRedis
+
+from src.ingest.file.config import etl_config
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkSummaryCacheRedis:
+    def __init__(
+        self,
+        redis: ArqRedis,
+        *,
+        key_prefix: str | None = None,
+        ttl_seconds: int | None = None,
+    ):
+        self.redis = redis
+        self.key_prefix = (
+            key_prefix if key_prefix is not None else etl_config.etl_redis_prefix
+        )
+        self.ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else etl_config.etl_postprocess_chunk_cache_ttl_seconds
+        )
+
+    def _key(self, rule_key: str, prompt: str, text: str) -> str:
+        prefix = self.key_prefix
+        if prefix and not prefix.endswith(":"):
+            prefix = f"{prefix}:"
+        digest = hashlib.sha256(
+            prompt.encode("utf-8") + b"\0" + text.encode("utf-8")
+        ).hexdigest()
+        return f"{prefix}chunk_summary:{rule_key}:{digest}"
+
+    async def get(self, rule_key: str, prompt: str, text: str) -> str | None:
+        # Best-effort: a cache outage must not fail the postprocess stage
+        try:
+            raw = await self.redis.get(self._key(rule_key, prompt, text))
+        except Exception as e:
+            logger.warning(f"Chunk summary cache read failed: {e}")
+            return None
+        if raw is None:
+            return None
+        return raw.decode("utf-8") if isinstance(raw, bytes | bytearray) else str(raw)
+
+    async def set(self, rule_key: str, prompt: str, text: str, summary: str) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        try:
+            await self.redis.set(
+                self._key(rule_key, prompt, text), summary, ex=self.ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Chunk summary cache write failed: {e}")
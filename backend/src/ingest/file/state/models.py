@@ -43,6 +43,9 @@ class ETLRuntimeState(BaseModel):
 
     artifact_mineru_markdown_key: str | None = None
     provider_task_id: str | None = None  # e.g. mineru_task_id
+    ocr_content_hash: str | None = None  # source hash for the OCR result cache
+    ocr_submitted_at: datetime | None = None  # provider job submitted (poll mode)
+    ocr_poll_count: int = 0
 
     error_code: str | None = None
     error_message: str | None = None
@@ -4,6 +4,7 @@ ETL Task Repository
 Repository for managing ETL task persistence in the `uploads` table.
 """
 
+import json
 import logging
 import uuid
 from abc import ABC, abstractmethod
@@ -11,12 +12,17 @@ from datetime import UTC, datetime
 
 from src.infra.supabase.client import SupabaseClient
 from src.infra.supabase.exceptions import handle_supabase_error
-from src.ingest.file.tasks.models import ETLTask, ETLTaskStatus
+from src.ingest.file.tasks.models import ETLTask, ETLTaskResult, ETLTaskStatus
 
 logger = logging.getLogger(__name__)
 
 ETL_UPLOAD_TYPES = ["file_ocr", "file_postprocess"]
 
+# IDs per ``in_`` filter (keeps the query string well under URL limits)
+_BULK_READ_CHUNK = 200
+# Set on insert and never rewritten by updates
+_IMMUTABLE_COLUMNS = frozenset({"id", "created_by", "project_id", "path", "type", "created_at"})
+
 
 class ETLTaskRepositoryBase(ABC):
     """Abstract base class for ETL task repository."""
@@ -57,6 +63,56 @@ class ETLTaskRepositoryBase(ABC):
             Updated task if found, None otherwise
         """
 
+    def get_tasks(self, task_ids: list[str]) -> dict[str, ETLTask]:
+        """
+        Get several tasks by ID.
+
+        Args:
+            task_ids: Task identifiers (UUID text)
+
+        Returns:
+            Found tasks keyed by task_id; missing IDs are absent
+        """
+        tasks = {}
+        for task_id in task_ids:
+            task = self.get_task(task_id)
+            if task is not None:
+                tasks[str(task.task_id)] = task
+        return tasks
+
+    def update_tasks(self, tasks: list[ETLTask]) -> list[ETLTask]:
+        """
+        Update several existing tasks.
+
+        Args:
+            tasks: Tasks to update (each must already exist)
+
+        Returns:
+            Updated tasks
+        """
+        updated = []
+        for task in tasks:
+            result = self.update_task(task)
+            if result is not None:
+                updated.append(result)
+        return updated
+
+    def mark_completed_many(
+        self, completions: list[tuple[ETLTask, ETLTaskResult]]
+    ) -> list[ETLTask]:
+        """
+        Mark several tasks completed and persist them in one update.
+
+        Args:
+            completions: (task, result) pairs
+
+        Returns:
+            Updated tasks
+        """
+        for task, result in completions:
+            task.mark_completed(result)
+        return self.update_tasks([task for task, _ in completions])
+
     @abstractmethod
     def list_tasks(
         self,
@@ -207,6 +263,71 @@ class ETLTaskRepositorySupabase(ETLTaskRepositoryBase):
         except Exception as e:
             raise handle_supabase_error(e, "update ETL task") from e
 
+    def get_tasks(self, task_ids: list[str]) -> dict[str, ETLTask]:
+        """Get several tasks with one ``id IN (...)`` query per chunk."""
+        tasks: dict[str, ETLTask] = {}
+        unique_ids = list(dict.fromkeys(str(t) for t in task_ids))
+        for start in range(0, len(unique_ids), _BULK_READ_CHUNK):
+            chunk = unique_ids[start : start + _BULK_READ_CHUNK]
+            try:
+                response = (
+                    self.supabase.table(self.TABLE_NAME)
+                    .select("*")
+                    .in_("id", chunk)
+                    .in_("type", ETL_UPLOAD_TYPES)
+                    .execute()
+                )
+            except Exception as e:
+                logger.error(f"Error getting {len(chunk)} tasks: {e}")
+                continue
+            for row in response.data or []:
+                task = ETLTask.from_dict(row)
+                tasks[str(task.task_id)] = task
+        return tasks
+
+    def update_tasks(self, tasks: list[ETLTask]) -> list[ETLTask]:
+        """Update several tasks with one ``UPDATE ... WHERE id IN (...)`` per payload.
+
+        Only the columns a task can change are sent; result and the
+        optional timestamps are left alone unless set, as in
+        ``update_task``. Tasks whose payloads are identical share a request.
+        """
+        if any(task.task_id is None for task in tasks):
+            logger.error("Cannot update tasks without task_id")
+            tasks = [task for task in tasks if task.task_id is not None]
+        if not tasks:
+            return []
+
+        now = datetime.now(UTC).isoformat()
+        groups: dict[str, tuple[dict, list[str]]] = {}
+        for task in tasks:
+            payload = {
+                column: value
+                for column, value in task.to_dict().items()
+                if column not in _IMMUTABLE_COLUMNS
+            }
+            payload["updated_at"] = now
+            key = json.dumps(payload, sort_keys=True, default=str)
+            groups.setdefault(key, (payload, []))[1].append(str(task.task_id))
+
+        updated: list[ETLTask] = []
+        try:
+            for payload, ids in groups.values():
+                for start in range(0, len(ids), _BULK_READ_CHUNK):
+                    response = (
+                        self.supabase.table(self.TABLE_NAME)
+                        .update(payload)
+                        .in_("id", ids[start : start + _BULK_READ_CHUNK])
+                        .in_("type", ETL_UPLOAD_TYPES)
+                        .execute()
+                    )
+                    updated.extend(ETLTask.from_dict(row) for row in response.data or [])
+        except Exception as e:
+            raise handle_supabase_error(e, "update ETL tasks") from e
+
+        logger.info(f"Updated {len(updated)} tasks in {len(groups)} requests")
+        return updated
+
     def list_tasks(
         self,
         project_id: str | None = None,
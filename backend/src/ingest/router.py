@@ -17,7 +17,7 @@ import logging
 import os
 import uuid
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, BinaryIO
 
 from fastapi import (
     APIRouter,
@@ -65,11 +65,15 @@ from src.ingest.schemas import (
 )
 from src.ingest.service import IngestService
 from src.ingest.shared.task.normalizers import detect_file_ingest_type
+from src.ingest.shared.utils.json_stream import JsonStreamError, validate_json_stream
 from src.platform.auth.dependencies import get_current_user
 from src.platform.auth.models import CurrentUser
 from src.platform.project.dependencies import get_project_service
 from src.platform.project.service import ProjectService
 
+if TYPE_CHECKING:
+    from src.mut_engine.services.ops import BlobRef, MutOps
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ingest", tags=["ingest"])
@@ -136,6 +140,10 @@ async def submit_file_ingest(
     # The content tree is path-based, so new callers should use
     # `parent_path`.
     parent_id: str | None = Form(None, description="Deprecated alias for parent_path"),
+    normalize_json: bool = Form(
+        False,
+        description="Re-serialize JSON files (indent=2) instead of storing the uploaded bytes",
+    ),
 
     # Dependencies
     etl_service: ETLService = Depends(get_etl_service),
@@ -147,6 +155,11 @@ async def submit_file_ingest(
     Submit file ingest tasks.
 
     All text/JSON files are written directly to the Mut tree via MUT protocol.
+    Uploads are never read into memory whole: each part is streamed from
+    Starlette's spool file into the MUT object store (and to S3 where a raw
+    copy is kept), and the tree commit references the staged blobs by hash.
+    JSON files are checked with a streaming parser and stored byte-for-byte
+    unless `normalize_json` is set.
     Binary/OCR files go to S3 + ETL Worker (when OCR is enabled).
     When `settings.ENABLE_OCR` is False any incoming `mode="ocr_parse"`
     is downgraded to "raw" so binary/OCR-needing files end up on S3
@@ -178,13 +191,14 @@ async def submit_file_ingest(
     target_parent_path = (parent_path or parent_id or "").strip("/")
 
     items: list[IngestSubmitItem] = []
-    modified_files: dict[str, bytes] = {}
+    staged: dict[str, BlobRef] = {}
 
     for f in files:
         original_filename = f.filename or "file"
         original_basename = Path(original_filename).name
-        content = await f.read()
-        len(content)
+        # Starlette has already spooled the part to a temp file; read it
+        # from there in chunks rather than materializing it.
+        upload = f.file
 
         file_type = classify_file_type(original_basename)
 
@@ -196,15 +210,9 @@ async def submit_file_ingest(
 
         try:
             if file_type == "json":
-                try:
-                    text_content = content.decode("utf-8", errors="ignore")
-                    json_data = json.loads(text_content)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"JSON parse failed for {original_filename}: {e}")
-                    json_data = {"_raw": content.decode("utf-8", errors="ignore"), "_parse_error": str(e)}
-
-                json_bytes = json.dumps(json_data, ensure_ascii=False, indent=2).encode("utf-8")
-                modified_files[file_path] = json_bytes
+                staged[file_path] = await _stage_json_upload(
+                    ops, project_id, upload, original_filename, normalize=normalize_json
+                )
 
                 task = _create_completed_task(
                     etl_service, current_user.user_id, project_id,
@@ -213,7 +221,7 @@ async def submit_file_ingest(
                 items.append(_make_completed_item(task, original_filename, file_path))
 
             elif file_type == "text":
-                modified_files[file_path] = content
+                staged[file_path] = await ops.stage_blob_from_file(project_id, upload)
 
                 task = _create_completed_task(
                     etl_service, current_user.user_id, project_id,
@@ -223,7 +231,7 @@ async def submit_file_ingest(
 
             elif file_type == "ocr_needed" and mode == "ocr_parse":
                 s3_key = await _upload_to_s3(
-                    s3_service, project_id, original_filename, content, f.content_type
+                    s3_service, project_id, original_filename, upload, f.content_type
                 )
 
                 try:
@@ -266,7 +274,7 @@ async def submit_file_ingest(
                 #       the ETL worker, which would eventually write
                 #       to MUT itself).
                 #
-                # Without writing into `modified_files` here, the file
+                # Without staging the blob into the tree here, the file
                 # gets stashed in S3 + a "completed" task row but never
                 # appears in the explorer — the bug a user just hit:
                 # uploaded PDFs while OCR was paused, the task panel
@@ -277,10 +285,10 @@ async def submit_file_ingest(
                 # we either retire S3 for raw uploads or bring OCR
                 # back online.
                 s3_key = await _upload_to_s3(
-                    s3_service, project_id, original_filename, content, f.content_type
+                    s3_service, project_id, original_filename, upload, f.content_type
                 )
 
-                modified_files[file_path] = content
+                staged[file_path] = await ops.stage_blob_from_file(project_id, upload)
 
                 task = _create_completed_task(
                     etl_service, current_user.user_id, project_id,
@@ -306,13 +314,16 @@ async def submit_file_ingest(
                 original_filename, None, str(e)
             ))
 
-    if modified_files:
+    if staged:
         try:
-            await ops.bulk_write(
+            # Every ref was staged above in this request, so skip the
+            # per-blob HEAD verification.
+            await ops.bulk_write_refs(
                 project_id,
-                modified_files,
+                staged,
                 who=f"ingest:{current_user.user_id}",
-                message=f"Upload {len(modified_files)} file(s)",
+                message=f"Upload {len(staged)} file(s)",
+                verify_blobs=False,
             )
         except Exception as e:
             logger.error(f"MUT push failed during file ingest: {e}", exc_info=True)
@@ -322,11 +333,47 @@ async def submit_file_ingest(
 
 # === Helper Functions ===
 
+async def _stage_json_upload(
+    ops: "MutOps",
+    project_id: str,
+    upload: BinaryIO,
+    original_filename: str,
+    *,
+    normalize: bool,
+) -> "BlobRef":
+    """Stage an uploaded JSON file.
+
+    A valid document is stored as uploaded after a streaming parse check.
+    ``normalize`` — and any document the check rejects — goes through the
+    in-memory ``json.loads`` / ``json.dumps`` path instead, which is what
+    turns unparseable input into a ``{"_raw", "_parse_error"}`` wrapper.
+    """
+    if not normalize:
+        upload.seek(0)
+        try:
+            await asyncio.to_thread(validate_json_stream, upload)
+        except JsonStreamError:
+            pass
+        else:
+            return await ops.stage_blob_from_file(project_id, upload)
+
+    upload.seek(0)
+    content = await asyncio.to_thread(upload.read)
+    try:
+        json_data = json.loads(content.decode("utf-8", errors="ignore"))
+    except json.JSONDecodeError as e:
+        logger.warning(f"JSON parse failed for {original_filename}: {e}")
+        json_data = {"_raw": content.decode("utf-8", errors="ignore"), "_parse_error": str(e)}
+
+    json_bytes = json.dumps(json_data, ensure_ascii=False, indent=2).encode("utf-8")
+    return await ops.stage_blob_from_bytes(project_id, json_bytes)
+
+
 async def _upload_to_s3(
     s3_service: S3Service,
     project_id: str,
     original_filename: str,
-    content: bytes,
+    upload: BinaryIO,
     content_type: str | None,
 ) -> str:
     _, ext = os.path.splitext(original_filename)
@@ -337,9 +384,11 @@ async def _upload_to_s3(
         original_filename.encode("utf-8")
     ).decode("ascii")
 
-    await s3_service.upload_file(
+    size = upload.seek(0, os.SEEK_END)
+    await s3_service.upload_fileobj(
         key=s3_key,
-        content=content,
+        fileobj=upload,
+        size=size,
         content_type=content_type,
         metadata={
             "original_filename_b64": original_filename_b64,
@@ -1010,9 +1059,16 @@ async def complete_upload_batch(
     # ────────────────────────────────────────────────────────────────
     item_results: dict[str, UploadCompleteItemResult] = {}
     eligible: list = []  # items that survive validation
+    task_repository = etl_service.task_repository
+
+    # One bulk read (off the event loop) instead of a sync round trip
+    # per item.
+    tasks_by_id = await asyncio.to_thread(
+        task_repository.get_tasks, [item.task_id for item in request.items]
+    )
 
     for item in request.items:
-        task = etl_service.task_repository.get_task(item.task_id)
+        task = tasks_by_id.get(str(item.task_id))
         if not task or (
             task.created_by is not None
             and task.created_by != current_user.user_id
@@ -1062,15 +1118,15 @@ async def complete_upload_batch(
     _COMPLETE_PARALLEL_LIMIT = 8
     completed_task_ids_set: set = set()
     completed_lock = asyncio.Lock()
+    failed_tasks: list = []  # persisted in one bulk update after the gather
 
     async def _finalize_one(item, task):
         """Complete one multipart upload + record outcome.
 
-        Returns nothing; mutates ``item_results`` and
-        ``completed_task_ids_set`` in place. Designed to be safe
-        under ``asyncio.gather`` because each invocation only
-        touches its own task record (the task repo is
-        Supabase-backed; per-task PATCHes are independent).
+        Returns nothing; mutates ``item_results``,
+        ``completed_task_ids_set`` and ``failed_tasks`` in place.
+        Designed to be safe under ``asyncio.gather`` because each
+        invocation only touches its own task record.
         """
         parts = sorted(
             [(p.part_number, p.etag) for p in item.parts], key=lambda x: x[0]
@@ -1092,7 +1148,7 @@ async def complete_upload_batch(
                 pass
             task.mark_failed(f"Failed to finalize multipart upload: {e}")
             task.metadata["error_stage"] = "complete_multipart"
-            etl_service.task_repository.update_task(task)
+            failed_tasks.append(task)
             item_results[item.task_id] = UploadCompleteItemResult(
                 task_id=item.task_id,
                 status=IngestStatus.FAILED,
@@ -1130,6 +1186,8 @@ async def complete_upload_batch(
             *(_bounded(item, task) for item, task in eligible),
             return_exceptions=False,  # _finalize_one swallows its own errors
         )
+    if failed_tasks:
+        await asyncio.to_thread(task_repository.update_tasks, failed_tasks)
 
     # Preserve input order in completed_task_ids — the bulk finalize
     # downstream doesn't strictly require it, but it makes the
@@ -1148,7 +1206,7 @@ async def complete_upload_batch(
         try:
             batch_results = await finalize_uploads_to_mut_batch(
                 task_ids=completed_task_ids,
-                repo=etl_service.task_repository,
+                repo=task_repository,
                 s3=s3_service,
                 state_repo=etl_service.state_repo,
             )
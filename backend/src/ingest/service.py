@@ -5,7 +5,6 @@ SaaS imports now go through Bootstrap + SyncEngine (sync module).
 This service only handles file-related task queries.
 """
 
-import asyncio
 import logging
 
 from src.ingest.schemas import (
@@ -57,11 +56,19 @@ class IngestService:
 
         results = []
         if file_tasks:
-            file_results = await asyncio.gather(*[
-                self.get_task(t["task_id"], SourceType.FILE, user_id)
+            try:
+                found = await self.file_service.get_task_statuses_with_access_check(
+                    task_ids=[t["task_id"] for t in file_tasks],
+                    user_id=user_id,
+                )
+            except Exception as e:
+                logger.error(f"Batch task query failed: {e}")
+                found = {}
+            results.extend(
+                normalize_file_task(found[str(t["task_id"])])
                 for t in file_tasks
-            ], return_exceptions=True)
-            results.extend([r for r in file_results if r and not isinstance(r, Exception)])
+                if str(t["task_id"]) in found
+            )
 
         return results
 
@@ -0,0 +1,292 @@
+"""
+Incremental JSON well-formedness check.
+
+``/ingest/submit/file`` stores uploaded ``.json`` files byte-for-byte, so it
+only needs to know whether they parse — not the parsed value. Building the
+full object graph with ``json.loads`` costs several times the file size in
+memory; ``JsonStreamValidator`` instead walks the document chunk by chunk
+with a container stack and a small token buffer, so memory is bounded by
+nesting depth (and the longest number literal), not by the file.
+
+Accepts exactly what ``json.loads`` accepts on UTF-8 input, including its
+``NaN`` / ``Infinity`` extensions.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+from typing import BinaryIO
+
+_CHUNK_BYTES = 256 * 1024
+# Number literals longer than this are refused rather than buffered
+_MAX_NUMBER_CHARS = 4096
+
+_WS = re.compile(r"[ \t\n\r]*")
+_STRING_BODY = re.compile(r'[^"\\\x00-\x1f]*')
+_NUMBER_CHARS = re.compile(r"[0-9+\-.eE]*")
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?\Z")
+_NUMBER_TAIL = frozenset("0123456789+-.eE")
+_HEX = frozenset("0123456789abcdefABCDEF")
+_SIMPLE_ESCAPES = frozenset('"\\/bfnrt')
+# One complete token (after optional whitespace) for the fast path in ``_scan``
+_TOKEN = re.compile(
+    r'[ \t\n\r]*(?:([{}\[\],:])'
+    r'|("[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*")'
+    r'|(-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?|true|false|null))'
+)
+_LITERALS = {"t": "true", "f": "false", "n": "null", "N": "NaN", "I": "Infinity"}
+
+# What the parser expects next (outside of a token)
+_VALUE = 0
+_VALUE_OR_CLOSE = 1  # just after "["
+_KEY = 2  # just after "," inside an object
+_KEY_OR_CLOSE = 3  # just after "{"
+_COLON = 4
+_COMMA_OR_CLOSE = 5
+_DONE = 6
+
+
+class JsonStreamError(ValueError):
+    """The document is not valid JSON; ``position`` is a character offset."""
+
+    def __init__(self, msg: str, position: int):
+        super().__init__(f"{msg}: char {position}")
+        self.position = position
+
+
+class JsonStreamValidator:
+    """Feed bytes with ``feed`` and finish with ``close``; both raise ``JsonStreamError``."""
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")("strict")
+        self._stack: list[str] = []
+        self._expect = _VALUE
+        self._offset = 0  # characters consumed by earlier chunks
+        self._token: str | None = None  # "string" | "number" | "literal"
+        self._is_key = False
+        self._escape = 0  # 0, 1 after a backslash, 2-5 inside \uXXXX
+        self._buf = ""  # number so far, or the literal being matched
+        self._lit_pos = 0
+        self._started = False
+
+    def feed(self, data: bytes) -> None:
+        try:
+            text = self._decoder.decode(data)
+        except UnicodeDecodeError as e:
+            raise JsonStreamError(f"invalid UTF-8 ({e.reason})", self._offset) from e
+        if not self._started and text:
+            self._started = True
+            if text[0] == "\ufeff":
+                raise JsonStreamError("Unexpected UTF-8 BOM", 0)
+        self._scan(text)
+        self._offset += len(text)
+
+    def close(self) -> None:
+        try:
+            tail = self._decoder.decode(b"", final=True)
+        except UnicodeDecodeError as e:
+            raise JsonStreamError(f"invalid UTF-8 ({e.reason})", self._offset) from e
+        self._scan(tail)
+        self._offset += len(tail)
+        if self._token == "number":
+            self._end_number(self._offset)
+        if self._token is not None or self._expect != _DONE:
+            raise JsonStreamError("Unexpected end of document", self._offset)
+
+    def _fail(self, msg: str, pos: int) -> None:
+        raise JsonStreamError(msg, self._offset + pos)
+
+    def _end_value(self) -> None:
+        self._token = None
+        if self._is_key:
+            self._is_key = False
+            self._expect = _COLON
+        else:
+            self._expect = _COMMA_OR_CLOSE if self._stack else _DONE
+
+    def _end_number(self, pos: int) -> None:
+        if not _NUMBER.match(self._buf):
+            self._fail(f"Invalid number {self._buf[:32]!r}", pos - len(self._buf))
+        self._buf = ""
+        self._end_value()
+
+    def _fast(self, text: str, i: int) -> int:
+        """Consume whole, valid tokens with one regex match each.
+
+        Stops (returning the position reached) at anything it does not
+        handle — a token cut by the chunk boundary, an error, NaN/Infinity —
+        and leaves that to the character-level path in ``_scan``.
+        """
+        n = len(text)
+        stack = self._stack
+        match = _TOKEN.match
+        while True:
+            m = match(text, i)
+            if m is None:
+                return i
+            end = m.end()
+            expect = self._expect
+            punct, string, scalar = m.groups()
+            if punct is not None:
+                if punct == ":":
+                    if expect != _COLON:
+                        return i
+                    self._expect = _VALUE
+                elif punct == ",":
+                    if expect != _COMMA_OR_CLOSE:
+                        return i
+                    self._expect = _KEY if stack[-1] == "{" else _VALUE
+                elif punct == "{" or punct == "[":
+                    if expect != _VALUE and expect != _VALUE_OR_CLOSE:
+                        return i
+                    stack.append(punct)
+                    self._expect = _KEY_OR_CLOSE if punct == "{" else _VALUE_OR_CLOSE
+                else:
+                    opener = "{" if punct == "}" else "["
+                    if not stack or stack[-1] != opener or not (
+                        expect == _COMMA_OR_CLOSE
+                        or expect == (_KEY_OR_CLOSE if opener == "{" else _VALUE_OR_CLOSE)
+                    ):
+                        return i
+                    stack.pop()
+                    self._expect = _COMMA_OR_CLOSE if stack else _DONE
+            elif string is not None and (expect == _KEY or expect == _KEY_OR_CLOSE):
+                self._expect = _COLON
+            elif expect == _VALUE or expect == _VALUE_OR_CLOSE:
+                # A number running into the chunk end may continue in the next one
+                if scalar is not None and (end >= n or text[end] in _NUMBER_TAIL):
+                    return i
+                self._expect = _COMMA_OR_CLOSE if stack else _DONE
+            else:
+                return i
+            i = end
+
+    def _scan(self, text: str) -> None:
+        i, n = 0, len(text)
+        while i < n:
+            token = self._token
+            if token is None:
+                i = self._fast(text, i)
+                if i >= n:
+                    break
+            if token == "string":
+                i = self._scan_string(text, i)
+                continue
+            if token == "number":
+                m = _NUMBER_CHARS.match(text, i)
+                self._buf += m.group()
+                if len(self._buf) > _MAX_NUMBER_CHARS:
+                    self._fail("Number literal too long", i)
+                i = m.end()
+                if i < n:
+                    if self._buf == "-" and text[i] == "I":
+                        self._token, self._buf, self._lit_pos = "literal", "-Infinity", 2
+                        i += 1
+                    else:
+                        self._end_number(i)
+                continue
+            if token == "literal":
+                word, j = self._buf, self._lit_pos
+                while i < n and j < len(word):
+                    if text[i] != word[j]:
+                        self._fail(f"Expecting {word!r}", i)
+                    i += 1
+                    j += 1
+                self._lit_pos = j
+                if j == len(word):
+                    self._buf = ""
+                    self._end_value()
+                continue
+
+            i = _WS.match(text, i).end()
+            if i >= n:
+                break
+            c = text[i]
+            expect = self._expect
+            if expect in (_VALUE, _VALUE_OR_CLOSE):
+                if c == "]" and expect == _VALUE_OR_CLOSE:
+                    self._stack.pop()
+                    self._end_value()
+                elif c == "{":
+                    self._stack.append("{")
+                    self._expect = _KEY_OR_CLOSE
+                elif c == "[":
+                    self._stack.append("[")
+                    self._expect = _VALUE_OR_CLOSE
+                elif c == '"':
+                    self._token = "string"
+                elif c == "-" or "0" <= c <= "9":
+                    self._token, self._buf = "number", c
+                elif c in _LITERALS:
+                    self._token, self._buf, self._lit_pos = "literal", _LITERALS[c], 1
+                else:
+                    self._fail("Expecting value", i)
+            elif expect in (_KEY, _KEY_OR_CLOSE):
+                if c == "}" and expect == _KEY_OR_CLOSE:
+                    self._stack.pop()
+                    self._end_value()
+                elif c == '"':
+                    self._token, self._is_key = "string", True
+                else:
+                    self._fail("Expecting property name enclosed in double quotes", i)
+            elif expect == _COLON:
+                if c != ":":
+                    self._fail("Expecting ':' delimiter", i)
+                self._expect = _VALUE
+            elif expect == _COMMA_OR_CLOSE:
+                top = self._stack[-1]
+                if c == ",":
+                    self._expect = _KEY if top == "{" else _VALUE
+                elif (c == "}" and top == "{") or (c == "]" and top == "["):
+                    self._stack.pop()
+                    self._end_value()
+                else:
+                    self._fail("Expecting ',' delimiter", i)
+            else:
+                self._fail("Extra data", i)
+            i += 1
+
+    def _scan_string(self, text: str, i: int) -> int:
+        n = len(text)
+        while i < n:
+            if self._escape == 1:
+                c = text[i]
+                if c == "u":
+                    self._escape = 2
+                elif c in _SIMPLE_ESCAPES:
+                    self._escape = 0
+                else:
+                    self._fail("Invalid \\escape", i)
+                i += 1
+                continue
+            if self._escape:
+                if text[i] not in _HEX:
+                    self._fail("Invalid \\uXXXX escape", i)
+                self._escape = 0 if self._escape == 5 else self._escape + 1
+                i += 1
+                continue
+            i = _STRING_BODY.match(text, i).end()
+            if i >= n:
+                break
+            c = text[i]
+            if c == '"':
+                self._end_value()
+                return i + 1
+            if c == "\\":
+                self._escape = 1
+            else:
+                self._fail("Invalid control character", i)
+            i += 1
+        return i
+
+
+def validate_json_stream(fileobj: BinaryIO, chunk_size: int = _CHUNK_BYTES) -> None:
+    """Check that ``fileobj`` (read from its current position) holds one JSON document."""
+    validator = JsonStreamValidator()
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+        validator.feed(chunk)
+    validator.close()
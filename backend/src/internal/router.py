@@ -306,6 +306,8 @@ async def search_tool(
                 folder_path=node_path,
                 query=payload.query,
                 top_k=payload.top_k,
+                offset=payload.offset,
+                mode=payload.mode,
             )
         else:
             results = await search_service.search_scope(
@@ -314,6 +316,8 @@ async def search_tool(
                 tool_json_path=tool.json_path or "",
                 query=payload.query,
                 top_k=payload.top_k,
+                offset=payload.offset,
+                mode=payload.mode,
             )
         return {"query": payload.query, "results": results}
     except ValueError as e:
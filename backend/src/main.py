@@ -303,6 +303,32 @@ async def _init_mut_trees() -> None:
         log_error(f"❌ Mut tree initialization failed (took: {mut_init_duration * 1000:.2f}ms): {e}")
 
 
+async def _init_async_postgrest() -> None:
+    """Pool the async PostgREST client on the app loop (closed in shutdown)."""
+    try:
+        from src.infra.supabase.async_client import open_async_postgrest
+
+        await open_async_postgrest()
+    except Exception as e:
+        log_error(f"❌ Async PostgREST client initialization failed: {e}")
+
+
+async def _init_embedding_backend() -> None:
+    """Load the local embedding model and check its dimension (fails startup on mismatch)."""
+    from src.infra.llm.config import llm_config
+
+    if llm_config.embedding_backend != "local":
+        return
+    from src.infra.llm.dependencies import get_embedding_service
+
+    try:
+        await get_embedding_service().start()
+    except Exception as e:
+        log_error(f"❌ Local embedding backend misconfigured: {e}")
+        raise
+    log_info(f"✅ Local embedding model ready: {llm_config.local_embedding_model}")
+
+
 async def _shutdown_services() -> None:
     """Shutdown cleanup logic."""
     log_info("ContextBase API shutting down...")
@@ -327,6 +353,21 @@ async def _shutdown_services() -> None:
         except Exception as e:
             log_error(f"Failed to stop File Ingest service: {e}")
 
+    try:
+        from src.infra.supabase.async_client import close_async_postgrest
+
+        await close_async_postgrest()
+    except Exception as e:
+        log_error(f"Failed to close async PostgREST client: {e}")
+
+    try:
+        from src.infra.llm import dependencies as llm_dependencies
+
+        if llm_dependencies._embedding_service is not None:
+            await llm_dependencies._embedding_service.aclose()
+    except Exception as e:
+        log_error(f"Failed to close embedding backend: {e}")
+
 
 @asynccontextmanager
 async def app_lifespan(app: FastAPI):
@@ -341,6 +382,8 @@ async def app_lifespan(app: FastAPI):
 
     _log_import_times()
 
+    await _init_async_postgrest()
+    await _init_embedding_backend()
     await _init_mcp_health_check()
     await _init_scheduler()
     await _init_file_ingest()
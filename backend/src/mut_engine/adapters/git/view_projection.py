@@ -9,9 +9,9 @@ from mut.foundation.git_format import decode_commit
 
 from src.mut_engine.application.git_commit import build_git_commit, commit_tree_id
 from src.mut_engine.application.tree_objects import (
-    build_tree_from_files,
-    flatten_tree_to_bytes,
+    build_tree_from_hashes,
     is_path_excluded,
+    parallel_tree_to_flat,
 )
 
 EMPTY_TREE_ID = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
@@ -57,13 +57,14 @@ def git_view_head_commit(
     except Exception:
         root_hash = ""
     if root_hash and excludes:
-        files = flatten_tree_to_bytes(repo.store, root_hash)
+        # Filtering only drops paths: reuse the blob hashes, never the bytes
+        file_hashes = parallel_tree_to_flat(repo.store, root_hash)
         filtered = {
-            path: content
-            for path, content in files.items()
+            path: blob_hash
+            for path, blob_hash in file_hashes.items()
             if not is_path_excluded(path, excludes)
         }
-        root_hash = build_tree_from_files(repo.store, filtered)
+        root_hash = build_tree_from_hashes(repo.store, filtered)
 
     root_scope_head = repo.get_scope_head_commit_id("") or ""
     project_head = repo.get_head_commit_id() if hasattr(repo, "get_head_commit_id") else ""
@@ -193,13 +194,13 @@ def filtered_commit_tree(
     excludes: list[str],
 ) -> str:
     tree_id = commit_tree_id(repo, commit_id)
-    files = flatten_tree_to_bytes(repo.store, tree_id)
+    file_hashes = parallel_tree_to_flat(repo.store, tree_id)
     filtered = {
-        rel_path: content
-        for rel_path, content in files.items()
+        rel_path: blob_hash
+        for rel_path, blob_hash in file_hashes.items()
         if not is_path_excluded(
             f"{scope_path}/{rel_path}" if scope_path else rel_path,
             excludes,
         )
     }
-    return build_tree_from_files(repo.store, filtered)
+    return build_tree_from_hashes(repo.store, filtered)
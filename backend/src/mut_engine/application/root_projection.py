@@ -4,10 +4,21 @@ This module preserves the mature MUT subtree-graft design while making it an
 explicit application-layer primitive for Git-native writes too. Scope heads are
 the source of truth; the materialized project root is a projection rebuilt from
 that registry.
+
+Root trees are content-addressed, so a root hash produced here is forever the
+projection of the scope map it was built from. ``_ProjectionMemo`` remembers
+that map for recently built roots; when the current DB root is one of them the
+next build starts from it and grafts only the scopes whose hash changed,
+instead of regrafting every scope onto the root scope tree.
 """
 
 from __future__ import annotations
 
+import threading
+from typing import Mapping, Optional
+
+import cachetools
+
 from mut.foundation.git_format import (
     MODE_DIR,
     MODE_FILE,
@@ -16,39 +27,176 @@ from mut.foundation.git_format import (
     encode_tree,
 )
 
+from src.config import settings
+
+
+class _ProjectionMemo:
+    """LRU of ``root_hash -> scope map`` for roots built by this process."""
+
+    def __init__(self, max_entries: int):
+        self._enabled = max_entries > 0
+        self._cache: cachetools.LRUCache = cachetools.LRUCache(maxsize=max(1, max_entries))
+        self._lock = threading.Lock()
+
+    def get(self, root_hash: str) -> Optional[dict[str, str]]:
+        if not self._enabled or not root_hash:
+            return None
+        with self._lock:
+            scopes = self._cache.get(root_hash)
+        return dict(scopes) if scopes is not None else None
+
+    def put(self, root_hash: str, scopes: Mapping[str, str]) -> None:
+        if not self._enabled or not root_hash:
+            return
+        with self._lock:
+            self._cache[root_hash] = dict(scopes)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+_memo: _ProjectionMemo | None = None
+_memo_lock = threading.Lock()
+
+
+def get_projection_memo() -> _ProjectionMemo:
+    global _memo
+    if _memo is None:
+        with _memo_lock:
+            if _memo is None:
+                _memo = _ProjectionMemo(settings.MUT_ROOT_PROJECTION_MEMO_SIZE)
+    return _memo
+
 
 def build_root_from_scope_state(
     repo,
     just_pushed_scope: str,
     just_pushed_hash: str,
+    *,
+    base_root: str = "",
 ) -> str:
     """Build a complete root tree from DB scope state + the just-pushed hash.
 
-    The algorithm deliberately reads ``mut_scope_state`` rather than the
-    previous materialized root. That keeps the registry authoritative and avoids
-    data loss from partial object-store reads during concurrent scope pushes.
+    The algorithm deliberately reads ``mut_scope_state`` rather than trusting
+    the previous materialized root. That keeps the registry authoritative and
+    avoids data loss from partial object-store reads during concurrent scope
+    pushes.
+
+    ``base_root`` (the current DB root) is only used as a starting tree when
+    this process built it and so knows exactly which scope map it projects;
+    the result is identical to a full rebuild either way.
     """
 
-    scopes = repo.get_all_scope_hashes()
+    scopes = {
+        path: scope_hash
+        for path, scope_hash in repo.get_all_scope_hashes().items()
+        if scope_hash
+    }
     if just_pushed_hash:
         scopes[just_pushed_scope] = just_pushed_hash
 
-    root_scope_hash = scopes.get("", "")
-    if root_scope_hash:
-        current_root = root_scope_hash
+    memo = get_projection_memo()
+    previous = memo.get(base_root)
+    grafts = _incremental_grafts(previous, scopes) if previous is not None else None
+
+    if grafts is not None:
+        new_root = graft_subtrees(repo.store, base_root, grafts)
     else:
-        # Empty git tree: same canonical SHA-1 as ``git mktree </dev/null``.
-        current_root = repo.store.put_tree(encode_tree([]))
+        root_scope_hash = scopes.get("", "")
+        if root_scope_hash:
+            current_root = root_scope_hash
+        else:
+            # Empty git tree: same canonical SHA-1 as ``git mktree </dev/null``.
+            current_root = repo.store.put_tree(encode_tree([]))
+        new_root = graft_subtrees(
+            repo.store,
+            current_root,
+            {path: scope_hash for path, scope_hash in scopes.items() if path},
+        )
+
+    memo.put(new_root, scopes)
+    return new_root
+
+
+def _incremental_grafts(
+    previous: Mapping[str, str], scopes: Mapping[str, str]
+) -> Optional[dict[str, str]]:
+    """Grafts that turn the projection of ``previous`` into that of ``scopes``.
+
+    Returns None when only a full rebuild is correct: the root scope tree
+    changed (it is the base every scope is grafted onto), or a scope was
+    removed (whatever lay under it before it was grafted is not recoverable
+    from the old projection). A changed scope's graft overwrites its nested
+    scopes, so those are regrafted too.
+    """
+    if previous.get("", "") != scopes.get("", ""):
+        return None
+    if any(path not in scopes for path in previous):
+        return None
+
+    changed = [path for path, scope_hash in scopes.items() if previous.get(path) != scope_hash]
+    grafts: dict[str, str] = {}
+    for path, scope_hash in scopes.items():
+        if any(path == c or path.startswith(c + "/") for c in changed):
+            grafts[path] = scope_hash
+    return grafts
 
-    other_scopes = sorted(
-        ((path, scope_hash) for path, scope_hash in scopes.items() if path and scope_hash),
-        key=lambda item: (item[0].count("/"), item[0]),
-    )
 
-    for scope_path, scope_hash in other_scopes:
-        current_root = graft_subtree(repo.store, current_root, scope_path, scope_hash)
+# Trie marker for "this directory is replaced by a scope tree"; tree entry
+# names cannot be empty, so it never collides with a child name.
+_GRAFT_KEY = ""
+
+
+def graft_subtrees(store, root_hash: str, grafts: Mapping[str, str]) -> str:
+    """Graft every ``{scope_path: tree_hash}`` onto ``root_hash`` in one pass.
+
+    Equivalent to calling :func:`graft_subtree` for each scope ordered by
+    depth (parents before children), but each directory on the union of
+    the graft paths is read and written once rather than once per scope.
+    """
+    if "" in grafts:
+        root_hash = grafts[""]
+    trie: dict = {}
+    for scope_path, tree_hash in grafts.items():
+        parts = [part for part in scope_path.strip("/").split("/") if part]
+        if not parts:
+            continue
+        node = trie
+        for part in parts:
+            node = node.setdefault(part, {})
+        node[_GRAFT_KEY] = tree_hash
+    if not trie:
+        return root_hash
+    return _graft_trie(store, root_hash, trie)
+
+
+def _graft_trie(store, tree_hash: Optional[str], node: dict) -> str:
+    entries: list[TreeEntry] = []
+    if tree_hash:
+        obj_type, content = store.get_object(tree_hash)
+        if obj_type != "tree":
+            raise ValueError(
+                f"_graft_trie: object {tree_hash} is a {obj_type}, expected tree"
+            )
+        entries = list(decode_tree(content))
+
+    for name, child in node.items():
+        if name == _GRAFT_KEY:
+            continue
+        existing = next((entry for entry in entries if entry.name == name), None)
+        if _GRAFT_KEY in child:
+            base = child[_GRAFT_KEY]
+        elif existing is not None and existing.is_dir:
+            base = existing.sha1_hex
+        else:
+            base = None  # missing or a file: grafted into a fresh directory
+        nested = len(child) > (1 if _GRAFT_KEY in child else 0)
+        child_hash = _graft_trie(store, base, child) if nested else base
+        entries = [entry for entry in entries if entry.name != name]
+        entries.append(TreeEntry(name=name, mode=MODE_DIR, sha1_hex=child_hash))
 
-    return current_root
+    return store.put_tree(encode_tree(entries))
 
 
 def graft_subtree(store, old_root_hash: str, scope_path: str, new_subtree_hash: str) -> str:
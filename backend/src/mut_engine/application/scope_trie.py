@@ -0,0 +1,163 @@
+"""Per-project scope ownership trie.
+
+Every scoped write asks "which scope owns this path?": push validation
+(``validate_scope_bound_files``), ``MutOps`` write routing, bulk path
+grouping. Answering it from ``get_all_scope_hashes()`` +
+``scopes.list_all()`` costs two DB reads per call and a scan over every
+scope per path. The trie answers it in O(path depth) and is built once per
+project, then cached until a scope changes.
+
+Invalidation:
+- scope definitions created / edited / deleted (``ScopeService``,
+  ``SupabaseScopeBackend``, ``PuppyOneServerRepo.add_scope``)
+- a scope's first publish (``old_scope_hash == ""``), which creates its
+  ``mut_scope_state`` row
+
+Scope edits made by another worker process are not seen, so entries also
+expire after ``SCOPE_TRIE_TTL_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from mut.core.protocol import normalize_path
+
+
+SCOPE_TRIE_TTL_SECONDS = 30.0
+SCOPE_TRIE_MAX_PROJECTS = 512
+
+
+@dataclass
+class _Node:
+    children: dict[str, "_Node"] = field(default_factory=dict)
+    scope_path: str | None = None  # set when a scope is rooted here
+    published: bool = False  # scope has a mut_scope_state hash
+
+
+def _parts(path: str) -> list[str]:
+    return [part for part in normalize_path(path).split("/") if part]
+
+
+class ScopeTrie:
+    """Longest-prefix scope lookup over one project's scopes."""
+
+    def __init__(self, version: int = 0):
+        self.version = version
+        self.built_at = time.monotonic()
+        self._root = _Node(scope_path="")
+        self._paths: set[str] = {""}
+
+    @classmethod
+    def from_repo(cls, repo, version: int = 0) -> "ScopeTrie":
+        """Build from scope state rows and scope definitions (best effort)."""
+
+        trie = cls(version)
+        try:
+            for scope_path, scope_hash in (repo.get_all_scope_hashes() or {}).items():
+                trie.add(scope_path or "", published=bool(scope_hash))
+        except Exception:
+            pass
+        try:
+            for scope in repo.scopes.list_all():
+                trie.add(scope.get("path", ""))
+        except Exception:
+            pass
+        return trie
+
+    @property
+    def paths(self) -> list[str]:
+        return sorted(self._paths)
+
+    def add(self, scope_path: str, *, published: bool = False) -> None:
+        node = self._root
+        for part in _parts(scope_path):
+            node = node.children.setdefault(part, _Node())
+        node.scope_path = "/".join(_parts(scope_path))
+        node.published = node.published or published
+        self._paths.add(node.scope_path)
+
+    def owner(
+        self,
+        full_path: str,
+        *,
+        strict: bool = False,
+        published_only: bool = False,
+    ) -> str:
+        """Return the deepest scope containing ``full_path`` (``""`` = root).
+
+        ``strict`` skips a scope rooted exactly at ``full_path``;
+        ``published_only`` ignores scopes that were never pushed.
+        """
+
+        parts = _parts(full_path)
+        limit = len(parts) - 1 if strict else len(parts)
+        owner = ""
+        node = self._root
+        for part in parts[:limit]:
+            node = node.children.get(part)
+            if node is None:
+                break
+            if node.scope_path is not None and (node.published or not published_only):
+                owner = node.scope_path
+        return owner
+
+    def route(self, full_path: str) -> tuple[str, str]:
+        """Split a project-root path into ``(scope_path, rel_path)`` for writes."""
+
+        clean = "/".join(_parts(full_path))
+        scope_path = self.owner(clean, strict=True, published_only=True)
+        if not scope_path:
+            return "", clean
+        return scope_path, clean[len(scope_path) + 1:]
+
+
+_lock = threading.Lock()
+_tries: OrderedDict[tuple[str, int], ScopeTrie] = OrderedDict()
+_versions: dict[str, int] = {}
+
+
+def get_scope_trie(repo) -> ScopeTrie:
+    """Cached trie for ``repo``'s project, rebuilt when stale.
+
+    Keyed by project and the project's shared history backend, so a fresh
+    ``ProjectRepo`` (or test fixture) never sees another instance's scopes.
+    """
+
+    project_id = getattr(repo, "project_id", "") or ""
+    if not project_id:
+        return ScopeTrie.from_repo(repo)
+    key = (project_id, id(getattr(repo, "history", repo)))
+    with _lock:
+        version = _versions.get(project_id, 0)
+        trie = _tries.get(key)
+        if (
+            trie is not None
+            and trie.version == version
+            and time.monotonic() - trie.built_at <= SCOPE_TRIE_TTL_SECONDS
+        ):
+            _tries.move_to_end(key)
+            return trie
+
+    trie = ScopeTrie.from_repo(repo, version)
+    with _lock:
+        if _versions.get(project_id, 0) == version:
+            _tries[key] = trie
+            _tries.move_to_end(key)
+            while len(_tries) > SCOPE_TRIE_MAX_PROJECTS:
+                _tries.popitem(last=False)
+    return trie
+
+
+def invalidate_scope_trie(project_id: str | None) -> None:
+    """Drop the cached trie after a scope of ``project_id`` changed."""
+
+    if not project_id:
+        return
+    with _lock:
+        _versions[project_id] = _versions.get(project_id, 0) + 1
+        for key in [k for k in _tries if k[0] == project_id]:
+            del _tries[key]
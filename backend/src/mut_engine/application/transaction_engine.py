@@ -12,7 +12,10 @@ import asyncio
 import base64
 import hashlib
 import json
+import threading
 import time
+import weakref
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from typing import Callable
 
@@ -46,6 +49,7 @@ from src.mut_engine.domain.intents import (
 )
 from src.mut_engine.server.repo_manager import MutRepoManager
 from src.mut_engine.server.backends.s3_storage import stage_object_writes
+from src.config import settings
 from src.utils.logger import log_error, log_info, log_warning
 
 
@@ -54,6 +58,32 @@ SpliceFn = Callable[[ObjectStore, str], "tuple[str, list[tuple[str, str]]]"]
 _MAX_CAS_ATTEMPTS = 5
 
 
+@dataclass
+class _GroupMember:
+    intent: OperationWriteIntent
+    splice: SpliceFn
+    started_ms: int
+    future: asyncio.Future
+
+
+@dataclass
+class _ScopeGroup:
+    pending: list[_GroupMember] = field(default_factory=list)
+    task: asyncio.Task | None = None
+
+
+# Open group-commit queues: per event loop, then by (project_id, scope_path).
+# Engines are cheap per-request objects, so the queues live at module level.
+# Sync jobs and ephemeral clients run their own loops in worker threads; a
+# group's futures and driver task belong to one loop, so callers on another
+# loop get their own group. Weak keys let a closed thread loop take its
+# (already drained) queues with it.
+_scope_groups: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str], _ScopeGroup]
+] = weakref.WeakKeyDictionary()
+_scope_groups_lock = threading.Lock()
+
+
 class ConcurrentMutationError(RuntimeError):
     """Raised when a caller supplied a stale scope head precondition."""
 
@@ -88,8 +118,16 @@ class CrossScopeSubmissionError(PermissionError):
 class GitNativeTransactionEngine:
     """Single publish authority for operation and version submissions."""
 
-    def __init__(self, repo_manager: MutRepoManager):
+    def __init__(
+        self,
+        repo_manager: MutRepoManager,
+        *,
+        group_commit: bool | None = None,
+    ):
         self._repos = repo_manager
+        self._group_commit = (
+            settings.MUT_GROUP_COMMIT_ENABLED if group_commit is None else group_commit
+        )
 
     async def apply_operation(
         self,
@@ -102,6 +140,12 @@ class GitNativeTransactionEngine:
         scope lock. Concurrent writers may compute candidate trees in parallel;
         the SQL CAS publish is the linearization point. A losing writer reloads
         the latest scope head and recomputes on top of it.
+
+        With group commit enabled, operations on the same scope that arrive
+        together are folded into one commit and one publish instead; each
+        caller still receives its own result and change list. Operations
+        carrying a head precondition or forcing a same-tree commit always
+        commit alone.
         """
 
         started_ms = int(time.time() * 1000)
@@ -112,6 +156,13 @@ class GitNativeTransactionEngine:
             f"actor={intent.actor}",
         )
 
+        if (
+            self._group_commit
+            and intent.expected_head_commit_id is None
+            and not intent.allow_same_tree_commit
+        ):
+            return await self._apply_operation_grouped(intent, splice, started_ms)
+
         return await self._apply_operation_optimistic(
             intent=intent,
             splice=splice,
@@ -162,7 +213,7 @@ class GitNativeTransactionEngine:
 
         last_error: Exception | None = None
         for attempt in range(_MAX_CAS_ATTEMPTS):
-            old_scope_hash, current_head_commit_id = _get_scope_state(repo, scope_norm)
+            old_scope_hash, current_head_commit_id = await _aget_scope_state(repo, scope_norm)
             if (
                 intent.expected_head_commit_id is not None
                 and current_head_commit_id != intent.expected_head_commit_id
@@ -249,6 +300,207 @@ class GitNativeTransactionEngine:
             f"last error: {last_error}",
         )
 
+    async def _apply_operation_grouped(
+        self,
+        intent: OperationWriteIntent,
+        splice: SpliceFn,
+        started_ms: int,
+    ) -> TransactionResult:
+        loop = asyncio.get_running_loop()
+        key = (intent.project_id, normalize_path(intent.scope_path))
+        with _scope_groups_lock:
+            groups = _scope_groups.setdefault(loop, {})
+            group = groups.setdefault(key, _ScopeGroup())
+        member = _GroupMember(
+            intent=intent,
+            splice=splice,
+            started_ms=started_ms,
+            future=loop.create_future(),
+        )
+        group.pending.append(member)
+        if group.task is None:
+            group.task = loop.create_task(self._drive_scope_group(key, group))
+        return await member.future
+
+    async def _drive_scope_group(self, key: tuple[str, str], group: _ScopeGroup) -> None:
+        """Commit queued operations for one scope until the queue drains.
+
+        The first group waits ``MUT_GROUP_COMMIT_WINDOW_MS`` for company;
+        later groups are whatever queued up while the previous publish was
+        in flight.
+        """
+
+        batch: list[_GroupMember] = []
+        try:
+            window = max(0, settings.MUT_GROUP_COMMIT_WINDOW_MS) / 1000
+            if window:
+                await asyncio.sleep(window)
+            max_ops = max(1, settings.MUT_GROUP_COMMIT_MAX_OPS)
+            while group.pending:
+                batch = group.pending[:max_ops]
+                del group.pending[:max_ops]
+                try:
+                    await self._commit_group(batch)
+                except Exception as e:
+                    for member in batch:
+                        _settle(member, error=e)
+                batch = []
+        except asyncio.CancelledError:
+            for member in batch + group.pending:
+                if not member.future.done():
+                    member.future.cancel()
+            group.pending.clear()
+            raise
+        finally:
+            with _scope_groups_lock:
+                groups = _scope_groups.get(asyncio.get_running_loop(), {})
+                if groups.get(key) is group:
+                    del groups[key]
+
+    async def _commit_group(self, batch: list[_GroupMember]) -> None:
+        if len(batch) == 1:
+            member = batch[0]
+            result = await self._apply_operation_optimistic(
+                intent=member.intent,
+                splice=member.splice,
+                started_ms=member.started_ms,
+            )
+            _settle(member, result=result)
+            return
+
+        lead = batch[0].intent
+        repo = self._repos.get_server_repo(lead.project_id)
+        scope_norm = normalize_path(lead.scope_path)
+
+        last_error: Exception | None = None
+        for attempt in range(_MAX_CAS_ATTEMPTS):
+            old_scope_hash, current_head_commit_id = await _aget_scope_state(repo, scope_norm)
+
+            with stage_object_writes(repo.store) as object_batch:
+                new_scope_hash, outcomes = await asyncio.to_thread(
+                    _fold_group_splices,
+                    repo.store,
+                    old_scope_hash,
+                    [member.splice for member in batch],
+                )
+                applied = [
+                    (member, changes)
+                    for member, (changes, error) in zip(batch, outcomes)
+                    if changes
+                ]
+                if not applied:
+                    for member, (_, error) in zip(batch, outcomes):
+                        _settle(
+                            member,
+                            result=TransactionResult(
+                                status="ok",
+                                is_noop=True,
+                                new_scope_hash=old_scope_hash,
+                            ),
+                            error=error,
+                        )
+                    return
+
+                intents = [member.intent for member, _ in applied]
+                op_types = {i.operation_type for i in intents}
+                op_type = op_types.pop() if len(op_types) == 1 else "group_commit"
+                message = _group_commit_message(intents)
+                created_at_iso = _now_iso()
+                new_commit_id = await asyncio.to_thread(
+                    build_git_commit,
+                    repo,
+                    tree_sha=new_scope_hash,
+                    parent_sha=_git_safe_parent(repo, current_head_commit_id),
+                    who=intents[0].actor,
+                    message=message,
+                    created_at_iso=created_at_iso,
+                )
+
+                if object_batch is not None:
+                    await asyncio.to_thread(object_batch.flush)
+
+            member_changes = {
+                id(member): build_full_changes(scope_norm, changes)
+                for member, changes in applied
+            }
+            result = await self._publish_scope_update(
+                repo=repo,
+                project_id=lead.project_id,
+                scope_path=scope_norm,
+                old_scope_hash=old_scope_hash,
+                new_scope_hash=new_scope_hash,
+                commit_id=new_commit_id,
+                actor=intents[0].actor,
+                message=message,
+                op_type=op_type,
+                audit_detail={
+                    "group_size": len(intents),
+                    "operations": [
+                        {
+                            "actor": i.actor,
+                            "source_channel": i.source_channel,
+                            "operation_type": i.operation_type,
+                            **i.audit_detail,
+                        }
+                        for i in intents
+                    ],
+                },
+                changes=[c for changes in member_changes.values() for c in changes],
+                conflicts=None,
+                created_at_iso=created_at_iso,
+                cas_attempt=attempt + 1,
+                merged=False,
+                merged_changes=[],
+                defer_projection=all(i.defer_projection for i in intents),
+            )
+            if result is not None:
+                log_info(
+                    f"[version_engine][group_commit] folded {len(intents)}/{len(batch)} "
+                    f"operations commit={new_commit_id[:12]} "
+                    f"project={lead.project_id} scope={scope_norm!r}",
+                )
+                for member, (_, error) in zip(batch, outcomes):
+                    changes = member_changes.get(id(member))
+                    if changes is None:
+                        _settle(
+                            member,
+                            result=TransactionResult(
+                                status="ok",
+                                is_noop=True,
+                                new_scope_hash=new_scope_hash,
+                            ),
+                            error=error,
+                        )
+                        continue
+                    own = replace(
+                        result,
+                        paths=[c["path"] for c in changes],
+                        changes=changes,
+                    )
+                    _log_done(
+                        member.intent.operation_type,
+                        member.intent.project_id,
+                        scope_norm,
+                        own,
+                        member.started_ms,
+                    )
+                    _settle(member, result=own)
+                return
+
+            last_error = RuntimeError("CAS lost")
+            log_info(
+                f"[version_engine][group_commit] CAS lost "
+                f"(attempt {attempt + 1}/{_MAX_CAS_ATTEMPTS}) "
+                f"project={lead.project_id} scope={scope_norm!r}",
+            )
+
+        raise RuntimeError(
+            f"[version_engine][group_commit] CAS still failing "
+            f"after {_MAX_CAS_ATTEMPTS} attempts "
+            f"(project={lead.project_id}, scope={scope_norm!r}); "
+            f"last error: {last_error}",
+        )
+
     async def _submit_version_optimistic(
         self,
         intent: VersionSubmissionIntent,
@@ -267,7 +519,7 @@ class GitNativeTransactionEngine:
         last_error: Exception | None = None
         for attempt in range(_MAX_CAS_ATTEMPTS):
             promoted_objects = False
-            old_scope_hash, current_head_commit_id = _get_scope_state(repo, scope_norm)
+            old_scope_hash, current_head_commit_id = await _aget_scope_state(repo, scope_norm)
             current_files = await asyncio.to_thread(
                 _scope_files_for_head, repo, scope_norm, old_scope_hash,
             )
@@ -439,7 +691,7 @@ class GitNativeTransactionEngine:
         if not target_commit_id:
             raise ValueError("target_commit_id is required")
 
-        current_scope_hash, current_head_commit_id = _get_scope_state(repo, scope_norm)
+        current_scope_hash, current_head_commit_id = await _aget_scope_state(repo, scope_norm)
         if target_commit_id == current_head_commit_id:
             return TransactionResult(
                 status="already-at-commit",
@@ -464,7 +716,7 @@ class GitNativeTransactionEngine:
 
         last_error: Exception | None = None
         for attempt in range(_MAX_CAS_ATTEMPTS):
-            old_scope_hash, current_head_commit_id = _get_scope_state(repo, scope_norm)
+            old_scope_hash, current_head_commit_id = await _aget_scope_state(repo, scope_norm)
             current_files = await asyncio.to_thread(
                 _scope_files_for_head, repo, scope_norm, old_scope_hash,
             )
@@ -668,8 +920,8 @@ class GitNativeTransactionEngine:
             "conflict_count": len(conflicts or []),
             **(audit_detail or {}),
         }
-        published = await asyncio.to_thread(
-            repo.publish_scope_update,
+        published = await _apublish_scope_update(
+            repo,
             scope_path=scope_path,
             old_scope_hash=old_scope_hash,
             new_scope_hash=new_scope_hash,
@@ -747,6 +999,54 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="microseconds")
 
 
+def _fold_group_splices(
+    store: ObjectStore,
+    root_hash: str,
+    splices: list[SpliceFn],
+) -> tuple[str, list[tuple[list[tuple[str, str]], Exception | None]]]:
+    """Run ``splices`` in order against a running root, like ``splice_batch``.
+
+    A splice that raises or changes nothing is skipped without affecting the
+    others; its outcome is ``([], error)``.
+    """
+
+    current = root_hash
+    outcomes: list[tuple[list[tuple[str, str]], Exception | None]] = []
+    for splice in splices:
+        try:
+            new_root, changes = splice(store, current)
+        except Exception as e:
+            outcomes.append(([], e))
+            continue
+        if not changes or new_root == current:
+            outcomes.append(([], None))
+            continue
+        current = new_root
+        outcomes.append((list(changes), None))
+    return current, outcomes
+
+
+def _group_commit_message(intents: list[OperationWriteIntent]) -> str:
+    if len(intents) == 1:
+        return intents[0].message
+    lines = [f"- {i.message or i.operation_type}" for i in intents]
+    return f"{len(intents)} operations\n\n" + "\n".join(lines)
+
+
+def _settle(
+    member: _GroupMember,
+    *,
+    result: TransactionResult | None = None,
+    error: BaseException | None = None,
+) -> None:
+    if member.future.done():
+        return
+    if error is not None:
+        member.future.set_exception(error)
+    else:
+        member.future.set_result(result)
+
+
 def _commit_exists(repo, commit_id: str) -> bool:
     return bool(commit_id) and repo.store.exists(commit_id)
 
@@ -770,6 +1070,20 @@ def _get_scope_state(repo, scope_path: str) -> tuple[str, str]:
     )
 
 
+async def _aget_scope_state(repo, scope_path: str) -> tuple[str, str]:
+    aget_state = getattr(repo, "aget_scope_state", None)
+    if asyncio.iscoroutinefunction(aget_state):
+        return await aget_state(scope_path)
+    return await asyncio.to_thread(_get_scope_state, repo, scope_path)
+
+
+async def _apublish_scope_update(repo, **kwargs) -> bool:
+    apublish = getattr(repo, "apublish_scope_update", None)
+    if asyncio.iscoroutinefunction(apublish):
+        return await apublish(**kwargs)
+    return await asyncio.to_thread(lambda: repo.publish_scope_update(**kwargs))
+
+
 def _pending_conflict_id(
     project_id: str,
     scope_path: str,
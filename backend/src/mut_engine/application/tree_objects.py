@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+
 from mut.core import tree as tree_mod
 from mut.core.protocol import normalize_path
 from mut.foundation.git_format import MODE_DIR, MODE_FILE, TreeEntry, encode_tree
@@ -16,6 +20,70 @@ def flatten_tree_to_bytes(store, tree_hash: str) -> dict[str, bytes]:
     return {path: store.get(blob_hash) for path, blob_hash in flat_hashes.items()}
 
 
+def parallel_tree_to_flat(store, tree_hash: str, max_workers: int = 16) -> dict[str, str]:
+    """Concurrent ``tree_to_flat``: ``{path: blob_hash}`` without reading blobs.
+
+    Tree nodes are read one level at a time, every node of a level in
+    parallel, so a cold walk costs ``depth × per-GET latency`` rather
+    than ``node count × per-GET latency``.
+    """
+
+    result: dict[str, str] = {}
+    if not tree_hash:
+        return result
+    pending: list[tuple[str, str]] = [(tree_hash, "")]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending:
+            futures = {
+                executor.submit(tree_mod.read_tree, store, h): prefix
+                for h, prefix in pending
+            }
+            pending = []
+            for fut in as_completed(futures):
+                prefix = futures[fut]
+                for name, (typ, h) in fut.result().items():
+                    path = f"{prefix}/{name}" if prefix else name
+                    if typ == "T":
+                        pending.append((h, path))
+                    else:
+                        result[path] = h
+    return result
+
+
+def iter_blobs(
+    store,
+    file_hashes: Iterable[tuple[str, str]],
+    batch_size: int = 32,
+    max_workers: int = 16,
+) -> Iterator[tuple[str, bytes]]:
+    """Yield ``(path, blob_bytes)`` for ``(path, blob_hash)`` pairs, in order.
+
+    Blobs are fetched concurrently ``batch_size`` at a time, so at most
+    one batch of payloads is held in memory regardless of tree size.
+    """
+
+    items = iter(file_hashes)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while batch := list(islice(items, batch_size)):
+            blobs = executor.map(store.get, [blob_hash for _, blob_hash in batch])
+            yield from zip((path for path, _ in batch), blobs)
+
+
+def build_tree_from_hashes(store, file_hashes: dict[str, str]) -> str:
+    """Build a Git tree from ``{path: blob_hash}`` of blobs already in ``store``."""
+
+    nested: dict = {}
+    for path, blob_hash in file_hashes.items():
+        parts = [part for part in normalize_path(path).split("/") if part]
+        if not parts:
+            continue
+        node = nested
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+        node[parts[-1]] = ("B", blob_hash)
+    return _write_nested_tree(store, nested)
+
+
 def build_tree_from_files(store, files: dict[str, bytes]) -> str:
     """Build a Git tree object from a flat ``{path: bytes}`` mapping."""
 
@@ -97,17 +165,9 @@ def scope_owner_for_path(scope_paths: list[str], full_path: str) -> str:
 def known_scope_paths(repo) -> list[str]:
     """Best-effort list of scope paths known by definitions or state."""
 
-    paths = {""}
-    try:
-        paths.update((p or "").strip("/") for p in repo.get_all_scope_hashes().keys())
-    except Exception:
-        pass
-    try:
-        for scope in repo.scopes.list_all():
-            paths.add(normalize_path(scope.get("path", "")))
-    except Exception:
-        pass
-    return sorted(paths)
+    from src.mut_engine.application.scope_trie import get_scope_trie
+
+    return get_scope_trie(repo).paths
 
 
 def validate_scope_bound_files(
@@ -118,13 +178,15 @@ def validate_scope_bound_files(
 ) -> list[str]:
     """Return full paths that are outside scope ownership or excluded."""
 
+    from src.mut_engine.application.scope_trie import get_scope_trie
+
     scope_norm = normalize_path(scope_path)
-    scopes = known_scope_paths(repo)
+    trie = get_scope_trie(repo)
     excludes = [normalize_path(path) for path in (scope_excludes or [])]
     rejected: list[str] = []
     for rel_path in rel_paths:
         full_path = join_scope_path(scope_norm, rel_path)
-        owner = scope_owner_for_path(scopes, full_path)
+        owner = trie.owner(full_path)
         if owner != scope_norm or is_path_excluded(full_path, excludes):
             rejected.append(full_path)
     return rejected
@@ -16,6 +16,8 @@ Why this exists:
 Properties of the token:
     * Bound to (project_id, path, user_id) — can't be replayed for a
       different file or by a different user
+    * Optionally pinned to the file's blob hash — the URL then names one
+      immutable version and can be served with long-lived cache headers
     * 5-minute TTL — long enough to start the download, short enough
       that a leaked URL is mostly harmless
     * Stateless (HMAC over `JWT_SECRET`) — no DB writes, no cache
@@ -23,7 +25,7 @@ Properties of the token:
     * URL-safe base64 — drops cleanly into a query parameter
 
 Format: `<payload_b64>.<signature_b64>`
-    payload_b64  = urlsafe_b64(json({"pid","p","uid","exp"}))
+    payload_b64  = urlsafe_b64(json({"pid","p","uid","exp"[,"h"]}))
     signature_b64 = urlsafe_b64(HMAC-SHA256(secret, payload_b64))
 """
 
@@ -47,6 +49,7 @@ class DownloadTokenClaims:
     path: str
     user_id: str
     expires_at: int  # unix seconds
+    content_hash: str = ""  # blob hash the URL was signed for ("" = unpinned)
 
 
 class DownloadTokenError(Exception):
@@ -80,8 +83,9 @@ def issue_token(
     path: str,
     user_id: str,
     ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    content_hash: str = "",
 ) -> tuple[str, int]:
-    """Mint a token for `(project_id, path, user_id)`.
+    """Mint a token for `(project_id, path, user_id)`, optionally pinned to `content_hash`.
 
     Returns `(token, expires_at_unix_seconds)`.
     """
@@ -92,6 +96,8 @@ def issue_token(
         "uid": user_id,
         "exp": expires_at,
     }
+    if content_hash:
+        payload["h"] = content_hash
     payload_bytes = json.dumps(
         payload, separators=(",", ":"), sort_keys=True
     ).encode("utf-8")
@@ -145,6 +151,7 @@ def verify_token(token: str) -> DownloadTokenClaims:
             path=payload["p"],
             user_id=payload["uid"],
             expires_at=int(payload["exp"]),
+            content_hash=str(payload.get("h") or ""),
         )
     except (KeyError, TypeError, ValueError) as exc:
         raise DownloadTokenError("missing or invalid claim") from exc
@@ -14,7 +14,7 @@ import re
 from typing import Any
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 
 from src.common_schemas import ApiResponse
 from src.mut_engine.dependencies import get_mut_ops
@@ -37,6 +37,11 @@ from src.mut_engine.server.validation import (
 )
 from src.mut_engine.services.direct_writer import ConcurrentMutationError
 from src.mut_engine.services.ops import MutOps
+from src.utils.http_cache import (
+    REVALIDATE_CACHE_CONTROL,
+    compute_etag,
+    not_modified_response,
+)
 
 
 router = APIRouter(prefix="/ap-fs", tags=["access-point-fs"])
@@ -1011,6 +1016,7 @@ async def read_file(
 
 @router.get("/raw")
 async def raw_file(
+    request: Request,
     path: str = Query(..., description="File path relative to the access point scope"),
     start: int = Query(0, ge=0, description="Start byte offset"),
     limit: int | None = Query(None, ge=0, description="Maximum bytes to return"),
@@ -1028,8 +1034,25 @@ async def raw_file(
     limit = _query_optional_int(limit)
 
     full_path = _join_scope(scope["path"], rel_path)
+    etag = ""
+    body = None
     try:
-        if hasattr(ops, "read_file_range_in_scope") or hasattr(ops, "read_file_range"):
+        opener = getattr(ops, "open_file_in_scope", None)
+        if opener is not None:
+            # Streamed: only the requested slice is read, never the whole blob
+            source = await asyncio.to_thread(opener, project_id, scope["path"], rel_path)
+            # The blob hash validates every byte range of the file
+            etag = compute_etag(source.blob_hash)
+            cached = not_modified_response(request, etag)
+            if cached is not None:
+                source.close()
+                return cached
+            total = source.total_size
+            range_start = min(start, total)
+            range_end = total if limit is None else min(total, range_start + limit)
+            length = range_end - range_start
+            body = source.iter_chunks(range_start, length)
+        elif hasattr(ops, "read_file_range_in_scope") or hasattr(ops, "read_file_range"):
             blob = _ops_read_file_range(
                 ops,
                 project_id,
@@ -1040,27 +1063,38 @@ async def raw_file(
             )
             chunk = blob.content
             total = blob.total_size
+            length = len(chunk)
         else:
             content = _ops_read_file(ops, project_id, scope, rel_path)
             total = len(content)
             end = total if limit is None else min(total, start + limit)
             chunk = content[start:end]
+            length = len(chunk)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {rel_path}")
 
     headers = {
-        "Content-Length": str(len(chunk)),
+        "Content-Length": str(length),
         "Accept-Ranges": "bytes",
         "X-Puppyone-Path": rel_path,
         "X-Puppyone-Size": str(total),
     }
+    if etag:
+        headers["ETag"] = etag
+        headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
     if start or limit is not None:
-        if chunk:
-            range_end = start + len(chunk) - 1
+        if length:
+            range_end = start + length - 1
             headers["Content-Range"] = f"bytes {start}-{range_end}/{total}"
         else:
             headers["Content-Range"] = f"bytes */{total}"
 
+    if body is not None:
+        return StreamingResponse(
+            body,
+            media_type="application/octet-stream",
+            headers=headers,
+        )
     return Response(
         content=chunk,
         media_type="application/octet-stream",
@@ -27,11 +27,18 @@ from src.mut_engine.schemas import (
     TreeResponse,
 )
 from src.mut_engine.server.validation import validate_path
+from src.mut_engine.services.blob_reader import BlobSource
 from src.mut_engine.services.ops import MutOps
 from src.platform.auth.dependencies import get_current_user
 from src.platform.auth.models import CurrentUser
 from src.platform.project.dependencies import get_project_service
 from src.platform.project.service import ProjectService
+from src.utils.http_cache import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    compute_etag,
+    not_modified_response,
+)
 
 read_router = APIRouter()
 
@@ -121,26 +128,44 @@ def raw_file(
     ensure_project_access(project_service, current_user, project_id)
     clean_path = validate_path(path)
 
+    # The blob hash is a strong validator: revalidation costs one tree walk
+    entry = ops.stat(project_id, clean_path)
+    etag = _blob_etag(entry.content_hash if entry else "")
+    cached = not_modified_response(request, etag)
+    if cached is not None:
+        return cached
+
     try:
-        content = ops.read_file(project_id, clean_path)
+        blob = _open_file(ops, project_id, clean_path)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {clean_path}")
 
-    entry = ops.stat(project_id, clean_path)
     from src.mut_engine.services.tree_reader import detect_mime
     mime = detect_mime(clean_path) if entry else "application/octet-stream"
 
     filename = clean_path.rsplit("/", 1)[-1] if "/" in clean_path else clean_path
-    return _serve_file_bytes(
+    return _serve_blob(
         request=request,
-        content=content,
+        blob=blob,
         media_type=mime,
         filename=filename,
         disposition="inline",
-        cache_control="private, max-age=3600",
+        cache_control=REVALIDATE_CACHE_CONTROL,
+        etag=_blob_etag(blob.blob_hash) or etag,
     )
 
 
+def _blob_etag(content_hash: str | None) -> str:
+    return compute_etag(content_hash) if content_hash else ""
+
+
+def _signed_cache_control(claims, entry, fallback: str) -> str:
+    """Immutable caching when the signed URL is pinned to the blob it serves."""
+    if claims.content_hash and entry.content_hash == claims.content_hash:
+        return IMMUTABLE_CACHE_CONTROL
+    return fallback
+
+
 def _content_disposition_inline(filename: str) -> str:
     """Build an inline Content-Disposition that supports UTF-8 names."""
     safe_filename = filename.replace('"', "")
@@ -185,24 +210,32 @@ def _parse_byte_range(range_header: str, total: int) -> tuple[int, int] | None:
     return start, end
 
 
-def _serve_file_bytes(
+def _open_file(ops: MutOps, project_id: str, path: str) -> BlobSource:
+    opener = getattr(ops, "open_file", None)
+    if opener is not None:
+        return opener(project_id, path)
+    content = ops.read_file(project_id, path)
+    return BlobSource(blob_hash="", total_size=len(content), kind="memory", data=content)
+
+
+def _serve_blob(
     *,
     request: Request,
-    content: bytes,
+    blob: BlobSource,
     media_type: str,
     filename: str,
     disposition: str,
     cache_control: str,
+    etag: str = "",
 ) -> Response:
-    """Serve bytes with optional single-range support.
+    """Stream a blob with optional single-range support.
 
     This makes signed inline media URLs work with native browser
-    audio/video controls. The current MUT object-store read still
-    materializes the blob before slicing; the browser no longer has
-    to `fetch -> blob` the whole file before playback starts, and it
-    can issue normal seek/range requests.
+    audio/video controls. Bodies are streamed from the opened blob
+    (see ``blob_reader``): a range request reads only its slice, and a
+    full read never holds the whole file in worker memory.
     """
-    total = len(content)
+    total = blob.total_size
     if disposition == "attachment":
         content_disposition = _content_disposition_attachment(filename)
     else:
@@ -213,11 +246,14 @@ def _serve_file_bytes(
         "Cache-Control": cache_control,
         "Content-Disposition": content_disposition,
     }
+    if etag:
+        base_headers["ETag"] = etag
 
     range_header = request.headers.get("range")
     if range_header:
         parsed = _parse_byte_range(range_header, total)
         if parsed is None:
+            blob.close()
             return Response(
                 status_code=416,
                 headers={
@@ -227,20 +263,20 @@ def _serve_file_bytes(
             )
 
         start, end = parsed
-        body = content[start : end + 1]
-        return Response(
-            content=body,
+        length = end - start + 1
+        return StreamingResponse(
+            blob.iter_chunks(start, length),
             status_code=206,
             media_type=media_type,
             headers={
                 **base_headers,
-                "Content-Length": str(len(body)),
+                "Content-Length": str(length),
                 "Content-Range": f"bytes {start}-{end}/{total}",
             },
         )
 
-    return Response(
-        content=content,
+    return StreamingResponse(
+        blob.iter_chunks(),
         media_type=media_type,
         headers={
             **base_headers,
@@ -293,6 +329,14 @@ class InlineSignResponse(BaseModel):
     expires_at: int = Field(..., description="Unix timestamp when the token expires")
 
 
+def _pinned_hash(ops: MutOps, project_id: str, path: str) -> str:
+    """Blob hash to pin a signed file URL to ("" for folders / missing paths)."""
+    entry = ops.stat(project_id, path)
+    if not entry or entry.type == "folder":
+        return ""
+    return entry.content_hash or ""
+
+
 @read_router.post(
     "/{project_id}/download/sign",
     response_model=ApiResponse[DownloadSignResponse],
@@ -301,6 +345,7 @@ class InlineSignResponse(BaseModel):
 def sign_download(
     project_id: str,
     body: DownloadSignRequest,
+    ops: MutOps = Depends(get_mut_ops),
     project_service: ProjectService = Depends(get_project_service),
     current_user: CurrentUser = Depends(get_current_user),
 ):
@@ -314,6 +359,7 @@ def sign_download(
         project_id=project_id,
         path=clean_path,
         user_id=current_user.user_id,
+        content_hash=_pinned_hash(ops, project_id, clean_path),
     )
 
     url = (
@@ -334,6 +380,7 @@ def sign_download(
 def sign_inline(
     project_id: str,
     body: InlineSignRequest,
+    ops: MutOps = Depends(get_mut_ops),
     project_service: ProjectService = Depends(get_project_service),
     current_user: CurrentUser = Depends(get_current_user),
 ):
@@ -351,6 +398,7 @@ def sign_inline(
         project_id=project_id,
         path=clean_path,
         user_id=current_user.user_id,
+        content_hash=_pinned_hash(ops, project_id, clean_path),
     )
 
     url = (
@@ -387,8 +435,14 @@ def inline_file(
     if not entry or entry.type == "folder":
         raise HTTPException(status_code=404, detail=f"File not found: {clean_path}")
 
+    etag = _blob_etag(entry.content_hash)
+    cache_control = _signed_cache_control(claims, entry, "private, no-store")
+    cached = not_modified_response(request, etag, cache_control)
+    if cached is not None:
+        return cached
+
     try:
-        content = ops.read_file(project_id, clean_path)
+        blob = _open_file(ops, project_id, clean_path)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {clean_path}")
 
@@ -396,13 +450,14 @@ def inline_file(
     mime = detect_mime(clean_path) or "application/octet-stream"
     filename = entry.name or clean_path.rsplit("/", 1)[-1] or "preview"
 
-    return _serve_file_bytes(
+    return _serve_blob(
         request=request,
-        content=content,
+        blob=blob,
         media_type=mime,
         filename=filename,
         disposition="inline",
-        cache_control="private, no-store",
+        cache_control=cache_control,
+        etag=etag,
     )
 
 
@@ -481,10 +536,11 @@ def download(
                     continue
 
                 try:
-                    content = ops.read_file(project_id, e.path)
+                    blob = _open_file(ops, project_id, e.path)
                 except FileNotFoundError:
                     continue
-                zs.add(data=content, arcname=arcname)
+                # An iterable body is compressed as it is read, one piece at a time
+                zs.add(data=blob.iter_chunks(), arcname=arcname)
                 yield from zs.all_files()
 
             yield from zs.footer()
@@ -504,8 +560,14 @@ def download(
 
     # Single-file path: same bytes as /raw, but `attachment` so the
     # browser triggers a save dialog instead of trying to render it.
+    etag = _blob_etag(entry.content_hash)
+    cache_control = _signed_cache_control(claims, entry, "private, no-store")
+    cached = not_modified_response(request, etag, cache_control)
+    if cached is not None:
+        return cached
+
     try:
-        content = ops.read_file(project_id, clean_path)
+        blob = _open_file(ops, project_id, clean_path)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {clean_path}")
 
@@ -513,13 +575,14 @@ def download(
     mime = detect_mime(clean_path) or "application/octet-stream"
     filename = entry.name or clean_path.rsplit("/", 1)[-1] or "download"
 
-    return _serve_file_bytes(
+    return _serve_blob(
         request=request,
-        content=content,
+        blob=blob,
         media_type=mime,
         filename=filename,
         disposition="attachment",
-        cache_control="private, no-store",
+        cache_control=cache_control,
+        etag=etag,
     )
 
 
@@ -19,8 +19,10 @@ from __future__ import annotations
 
 import asyncio
 import threading
+from collections.abc import AsyncIterator
 from contextlib import contextmanager
 from contextvars import ContextVar
+from typing import BinaryIO
 
 import cachetools
 
@@ -160,6 +162,24 @@ class CachedStorageBackend(StorageBackend):
         end = len(data) if limit is None else min(len(data), start + limit)
         return data[start:end], len(data)
 
+    async def async_stream(self, h: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        """Yield raw loose-object bytes in chunks; cached objects in one piece.
+
+        Streamed objects are NOT added to the LRU — callers stream exactly
+        because the object is too big to want in memory.
+        """
+        with _cache_lock:
+            cached = self._cache.get(h)
+        if cached is not None:
+            yield cached
+            return
+        stream = getattr(self._inner, "async_stream", None)
+        if callable(stream):
+            async for chunk in stream(h, chunk_size):
+                yield chunk
+            return
+        yield await asyncio.to_thread(self._inner.get, h)
+
     def put(self, h: str, data: bytes) -> None:
         # Content-addressed: if the hash is already in the cache,
         # the inner backend has the same bytes (we put them there
@@ -182,6 +202,23 @@ class CachedStorageBackend(StorageBackend):
             with _cache_lock:
                 self._cache[h] = data
 
+    async def async_put_file(self, h: str, fileobj: BinaryIO, size: int) -> None:
+        """Store an already-encoded loose object from a seekable file.
+
+        Large objects are not cached on the way in — the upload path that
+        uses this is exactly the one that must not hold them in memory.
+        """
+        with _cache_lock:
+            if h in self._cache:
+                return
+        put_file = getattr(self._inner, "async_put_file", None)
+        if callable(put_file):
+            await put_file(h, fileobj, size)
+            return
+        fileobj.seek(0)
+        data = await asyncio.to_thread(fileobj.read)
+        await asyncio.to_thread(self._inner.put, h, data)
+
     def exists(self, h: str) -> bool:
         active_batch = _ACTIVE_WRITE_BATCH.get()
         if (
@@ -423,9 +460,30 @@ class S3StorageBackend(StorageBackend):
                 raise ObjectNotFoundError(f"object not found in S3: {h}") from e
             raise
 
+    async def async_stream(self, h: str, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+        """Stream the raw loose-object bytes without buffering the object."""
+        key = self._key_for(h)
+        try:
+            async for chunk in self._s3.download_file_stream(key, chunk_size=chunk_size):
+                yield chunk
+        except ObjectNotFoundError:
+            raise
+        except Exception as e:
+            if _is_not_found_error(e):
+                raise ObjectNotFoundError(f"object not found in S3: {h}") from e
+            raise
+
     async def async_put(self, h: str, data: bytes) -> None:
         await self._do_put(self._key_for(h), data)
 
+    async def async_put_file(self, h: str, fileobj: BinaryIO, size: int) -> None:
+        """Upload a loose object from a file, part by part (see ``S3Service.upload_fileobj``)."""
+        key = self._key_for(h)
+        if not await self._s3.file_exists(key):
+            await self._s3.upload_fileobj(
+                key, fileobj, size, content_type="application/octet-stream"
+            )
+
     async def async_exists(self, h: str) -> bool:
         return await self._s3.file_exists(self._key_for(h))
 
@@ -40,9 +40,10 @@ from __future__ import annotations
 
 import json
 
+from src.infra.supabase.async_client import BatchLoader, async_postgrest
 from src.infra.supabase.client import SupabaseClient
 from src.mut_engine.server.backends import safe_data as _safe_data
-from src.utils.logger import log_error, log_info
+from src.utils.logger import log_error, log_info, log_warning
 
 
 class SupabaseHistoryManager:
@@ -54,6 +55,9 @@ class SupabaseHistoryManager:
     def __init__(self, supabase: SupabaseClient, project_id: str):
         self._client = supabase.client
         self._project_id = project_id
+        self._scope_state_loader: BatchLoader[str, tuple[str, str]] = BatchLoader(
+            self.aget_scope_states, ("", ""),
+        )
 
     # ── Global Head ──
     #
@@ -200,6 +204,99 @@ class SupabaseHistoryManager:
             if row.get("scope_hash")
         }
 
+    # ── Async reads / publish (event-loop callers) ──
+    #
+    # Same queries as the sync methods above, issued through the pooled
+    # HTTP/2 PostgREST client so they neither block the loop nor occupy
+    # the default thread pool.
+
+    async def aget_scope_state(self, scope_path: str) -> tuple[str, str]:
+        """Async ``get_scope_state``; lookups in the same loop tick share one query."""
+        return await self._scope_state_loader.load(_normalize(scope_path))
+
+    async def aget_scope_states(self, scope_paths: list[str]) -> dict[str, tuple[str, str]]:
+        """Return ``{scope_path: (scope_hash, head_commit_id)}`` with one query."""
+        paths = sorted({_normalize(p) for p in scope_paths})
+        if not paths:
+            return {}
+        async with async_postgrest() as client:
+            resp = await (
+                client
+                .from_(self.SCOPE_STATE_TABLE)
+                .select("scope_path, scope_hash, head_commit_id")
+                .eq("project_id", self._project_id)
+                .in_("scope_path", paths)
+                .execute()
+            )
+        return {
+            row["scope_path"]: (
+                row.get("scope_hash", "") or "",
+                row.get("head_commit_id", "") or "",
+            )
+            for row in (_safe_data(resp) or [])
+        }
+
+    async def apublish_scope_update(
+        self,
+        *,
+        scope_path: str,
+        old_scope_hash: str,
+        new_scope_hash: str,
+        commit_id: str,
+        who: str,
+        message: str,
+        changes: list,
+        conflicts: list | None,
+        created_at_iso: str,
+        audit_event_type: str,
+        audit_agent_id: str,
+        audit_detail: dict,
+    ) -> bool:
+        """Async ``publish_scope_update`` (same RPC, same result handling)."""
+
+        scope_path = _normalize(scope_path)
+        try:
+            async with async_postgrest() as client:
+                resp = await client.rpc("publish_mut_scope_update", {
+                    "p_project_id": self._project_id,
+                    "p_scope_path": scope_path,
+                    "p_old_hash": old_scope_hash or "",
+                    "p_new_hash": new_scope_hash,
+                    "p_head_commit_id": commit_id,
+                    "p_who": who,
+                    "p_message": message or "",
+                    "p_event_type": audit_event_type,
+                    "p_changes": changes or [],
+                    "p_conflicts": _serialize_conflicts(conflicts) if conflicts else None,
+                    "p_created_at": created_at_iso or "",
+                    "p_audit_agent_id": audit_agent_id,
+                    "p_audit_detail": audit_detail or {},
+                }).execute()
+        except Exception as e:
+            log_error(
+                f"[Publish] publish_mut_scope_update RPC failed for "
+                f"scope='{scope_path}': {e}. Deploy the SQL migration first."
+            )
+            raise RuntimeError(
+                "atomic publish RPC not available — version writes require "
+                "publish_mut_scope_update. Original error: "
+                f"{e}"
+            ) from e
+        return self._publish_succeeded(resp.data)
+
+    def _publish_succeeded(self, data) -> bool:
+        if isinstance(data, bool):
+            ok = data
+        elif isinstance(data, list) and data:
+            ok = bool(data[0])
+        else:
+            ok = False
+        if ok:
+            for attr in ("_head_cid_cache", "_root_hash_cache"):
+                if hasattr(self, attr):
+                    delattr(self, attr)
+        return ok
+
     def _upsert_scope_state(self, scope_path: str, *,
                             scope_hash: str | None = None,
                             head_commit_id: str | None = None) -> None:
@@ -319,18 +416,7 @@ class SupabaseHistoryManager:
                 "p_audit_agent_id": audit_agent_id,
                 "p_audit_detail": audit_detail or {},
             }).execute()
-            data = resp.data
-            if isinstance(data, bool):
-                ok = data
-            elif isinstance(data, list) and data:
-                ok = bool(data[0])
-            else:
-                ok = False
-            if ok:
-                for attr in ("_head_cid_cache", "_root_hash_cache"):
-                    if hasattr(self, attr):
-                        delattr(self, attr)
-            return ok
+            return self._publish_succeeded(resp.data)
         except Exception as e:
             log_error(
                 f"[Publish] publish_mut_scope_update RPC failed for "
@@ -368,6 +454,28 @@ class SupabaseHistoryManager:
             on_conflict="project_id,source_commit_id",
         ).execute()
 
+    def record_version_index_bulk(self, rows: list[dict]) -> None:
+        """``record_version_index`` for many commits in one upsert."""
+
+        data = [
+            {
+                "project_id": self._project_id,
+                "scope_path": _normalize(row.get("scope_path", "")),
+                "source_commit_id": row["source_commit_id"],
+                "source_scope_hash": row.get("source_scope_hash") or "",
+                "project_root_hash": row.get("project_root_hash") or "",
+                "project_view_commit_id": row["project_view_commit_id"],
+            }
+            for row in rows
+            if row.get("source_commit_id") and row.get("project_view_commit_id")
+        ]
+        if not data:
+            return
+        self._client.table("mut_version_index").upsert(
+            data,
+            on_conflict="project_id,source_commit_id",
+        ).execute()
+
     def get_latest_project_view_commit_id(self) -> str:
         resp = (
             self._client.table("mut_version_index")
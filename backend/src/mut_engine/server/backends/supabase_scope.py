@@ -15,6 +15,7 @@ from __future__ import annotations
 from mut.server.scope_manager import ScopeBackend
 
 from src.infra.supabase.client import SupabaseClient
+from src.mut_engine.application.scope_trie import invalidate_scope_trie
 from src.utils.logger import log_error
 
 
@@ -85,6 +86,7 @@ class SupabaseScopeBackend(ScopeBackend):
                 .eq("project_id", self._project_id)
                 .execute()
             )
+            invalidate_scope_trie(self._project_id)
         except Exception as e:
             log_error(f"[ScopeBackend] put({scope_id}) failed: {e}")
 
@@ -104,6 +106,7 @@ class SupabaseScopeBackend(ScopeBackend):
                 .eq("project_id", self._project_id)
                 .execute()
             )
+            invalidate_scope_trie(self._project_id)
             return bool(resp.data)
         except Exception as e:
             log_error(f"[ScopeBackend] delete({scope_id}) failed: {e}")
@@ -15,23 +15,34 @@ Key design:
 
 from __future__ import annotations
 
+import asyncio
 import threading
-from collections import OrderedDict
+from collections.abc import Iterator, Sequence
 from typing import ClassVar
 
+import cachetools
+
 from mut.core.object_store import ObjectStore
 from mut.core.protocol import normalize_path
-from mut.core.tree import read_tree, tree_to_flat
+from mut.core.tree import read_tree
 from mut.foundation.git_format import (
     MODE_DIR, MODE_FILE, TreeEntry, encode_tree,
 )
 from mut.server.scope_manager import ScopeManager
 
+from src.mut_engine.application.scope_trie import invalidate_scope_trie
+from src.mut_engine.application.tree_objects import iter_blobs, parallel_tree_to_flat
 from src.mut_engine.server.backends.supabase_audit import SupabaseAuditManager
 from src.mut_engine.server.backends.supabase_history import SupabaseHistoryManager
 from src.utils.logger import log_error
 
 
+def _estimate_hash_map_bytes(file_hashes: dict[str, str]) -> int:
+    """Rough resident size of a ``{rel_path: blob_hash}`` map: per entry,
+    the path string, a 40-char hash string and the dict slot."""
+    return sum(len(path) for path in file_hashes) + 200 * len(file_hashes) + 64
+
+
 class PuppyOneServerRepo:
     """MUT ServerRepo adapter backed by S3 + Supabase.
 
@@ -39,21 +50,27 @@ class PuppyOneServerRepo:
     CAS on scope_hash for concurrency control — no application-level locks.
     """
 
-    # Process-wide cache for ``list_scope_files`` results, keyed by
-    # (project_id, scope_path, scope_hash). Content is immutable
-    # under the hash so entries never need invalidation. Bound size
-    # so a long-lived process doesn't grow unbounded as scopes
-    # advance — older entries fall out FIFO-style.
+    # Process-wide cache of scope file listings, keyed by
+    # (project_id, scope_path, excludes, scope_hash) → ``{rel_path:
+    # blob_hash}``. Content is immutable under the hash so entries never
+    # need invalidation. Only the path→hash map is kept — blob bytes live
+    # in the shared object cache (``CachedStorageBackend``), so a scope
+    # is never held twice — and the cache is bounded by an estimate of
+    # the maps' size rather than an entry count, since one scope can be
+    # a thousand times larger than another.
     #
     # Why class-level rather than instance-level: ``get_server_repo``
     # mints a fresh PuppyOneServerRepo on every API request, but version
     # submissions may read the same scope tree multiple times during merge/CAS
     # retry, AND the next request also benefits from the cache as long as
-    # nothing mutated the scope. Putting the dict on the class gives both
+    # nothing mutated the scope. Putting the cache on the class gives both
     # behaviours from one cache.
-    _scope_files_cache: ClassVar[OrderedDict[tuple[str, str, str], dict[str, bytes]]] = OrderedDict()
-    _scope_files_cache_lock: ClassVar[threading.Lock] = threading.Lock()
-    _SCOPE_FILES_CACHE_MAX: ClassVar[int] = 32
+    _SCOPE_HASHES_CACHE_MAX_BYTES: ClassVar[int] = 64 * 1024 * 1024
+    _scope_hashes_cache: ClassVar[cachetools.LRUCache] = cachetools.LRUCache(
+        maxsize=_SCOPE_HASHES_CACHE_MAX_BYTES,
+        getsizeof=_estimate_hash_map_bytes,
+    )
+    _scope_hashes_cache_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(
         self,
@@ -76,6 +93,10 @@ class PuppyOneServerRepo:
 
     # ── Project info ──
 
+    @property
+    def project_id(self) -> str:
+        return self._project_id
+
     def get_project_name(self) -> str:
         return self._project_name
 
@@ -83,7 +104,9 @@ class PuppyOneServerRepo:
 
     def add_scope(self, scope_id: str, path: str,
                   exclude: list | None = None) -> dict:
-        return self.scopes.add(scope_id, path, exclude)
+        scope = self.scopes.add(scope_id, path, exclude)
+        invalidate_scope_trie(self._project_id)
+        return scope
 
     # ── Global Head Commit ──
 
@@ -135,6 +158,18 @@ class PuppyOneServerRepo:
             self.get_scope_head_commit_id(scope_path) or "",
         )
 
+    async def aget_scope_state(self, scope_path: str) -> tuple[str, str]:
+        """Async ``get_scope_state`` for event-loop callers.
+
+        Uses the history backend's pooled async client when it has one;
+        other backends run the sync getter in a worker thread.
+        """
+        aget_state = getattr(self.history, "aget_scope_state", None)
+        if asyncio.iscoroutinefunction(aget_state):
+            scope_hash, head_commit_id = await aget_state(scope_path)
+            return scope_hash or "", head_commit_id or ""
+        return await asyncio.to_thread(self.get_scope_state, scope_path)
+
     def get_all_scope_hashes(self) -> dict[str, str]:
         """Snapshot of every scope's current hash for this project.
 
@@ -212,7 +247,7 @@ class PuppyOneServerRepo:
 
         publish = getattr(self.history, "publish_scope_update", None)
         if callable(publish):
-            return publish(
+            published = publish(
                 scope_path=scope_path,
                 old_scope_hash=old_scope_hash,
                 new_scope_hash=new_scope_hash,
@@ -226,6 +261,10 @@ class PuppyOneServerRepo:
                 audit_agent_id=audit_agent_id,
                 audit_detail=audit_detail,
             )
+            if published and not old_scope_hash:
+                # First publish created the scope's state row
+                invalidate_scope_trie(self._project_id)
+            return published
 
         if not self.cas_update_scope(
             scope_path,
@@ -246,8 +285,21 @@ class PuppyOneServerRepo:
         )
         self.set_head_commit_id(commit_id)
         self.record_audit(audit_event_type, audit_agent_id, audit_detail)
+        if not old_scope_hash:
+            invalidate_scope_trie(self._project_id)
         return True
 
+    async def apublish_scope_update(self, **kwargs) -> bool:
+        """Async ``publish_scope_update``; same keyword arguments."""
+
+        publish = getattr(self.history, "apublish_scope_update", None)
+        if not asyncio.iscoroutinefunction(publish):
+            return await asyncio.to_thread(lambda: self.publish_scope_update(**kwargs))
+        published = await publish(**kwargs)
+        if published and not kwargs.get("old_scope_hash"):
+            invalidate_scope_trie(self._project_id)
+        return published
+
     def record_version_index(
         self,
         *,
@@ -267,6 +319,14 @@ class PuppyOneServerRepo:
                 project_view_commit_id=project_view_commit_id,
             )
 
+    def record_version_index_bulk(self, rows: list[dict]) -> None:
+        record_bulk = getattr(self.history, "record_version_index_bulk", None)
+        if callable(record_bulk):
+            record_bulk(rows)
+            return
+        for row in rows:
+            self.record_version_index(**row)
+
     def get_latest_project_view_commit_id(self) -> str:
         latest = getattr(self.history, "get_latest_project_view_commit_id", None)
         return latest() if callable(latest) else ""
@@ -309,40 +369,53 @@ class PuppyOneServerRepo:
         Bootstrap fallback: if a legacy project has no ``scope_hash`` yet,
         navigate from ``root_hash`` as a best-effort compatibility path.
 
-        Cached on (project_id, scope_path, scope_hash). The cost we're
-        avoiding is one ``read_tree`` per tree node plus one ``store.get``
-        per blob — on a project with a 26 MB blob this was a 19-second
-        round-trip, hit repeatedly during version merge and scope reads.
-        Cache hits return in microseconds.
+        Materializes every blob of the scope; callers that can consume
+        files one at a time should use ``iter_scope_files`` instead.
+        """
+        return dict(self.iter_scope_files(scope))
+
+    def iter_scope_files(self, scope: dict) -> Iterator[tuple[str, bytes]]:
+        """Yield ``(rel_path, bytes)`` for the scope's files, in path order.
+
+        Same view as ``list_scope_files``, but blobs are fetched (and
+        dropped) in small concurrent batches, so memory stays bounded by
+        the batch rather than the scope.
+        """
+        file_hashes = self.scope_file_hashes(scope)
+        return iter_blobs(self.store, sorted(file_hashes.items()))
+
+    def scope_file_hashes(self, scope: dict) -> dict[str, str]:
+        """``{rel_path: blob_hash}`` for the scope, without reading any blob.
+
+        Cached on (project_id, scope_path, excludes, scope_hash). The cost
+        we're avoiding is one ``read_tree`` per tree node — on a cold
+        walk the nodes of each tree level are read concurrently. The
+        returned dict is shared with the cache: do not mutate it.
         """
         scope_path = normalize_path(scope.get("path", ""))
+        excludes = tuple(normalize_path(e) for e in scope.get("exclude", []))
         scope_hash = self.get_scope_hash(scope_path)
 
+        cache_key = (self._project_id, scope_path, excludes, scope_hash)
         if scope_hash:
-            cache_key = (self._project_id, scope_path, scope_hash)
-            with self._scope_files_cache_lock:
-                cached = self._scope_files_cache.get(cache_key)
-                if cached is not None:
-                    self._scope_files_cache.move_to_end(cache_key)
-                    return dict(cached)
+            with self._scope_hashes_cache_lock:
+                cached = self._scope_hashes_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        result = self._compute_scope_files(scope, scope_path, scope_hash)
+        result = self._compute_scope_file_hashes(scope_path, excludes, scope_hash)
 
         if scope_hash and result:
-            self._cache_scope_files(scope_path, scope_hash, result)
+            self._cache_scope_file_hashes(cache_key, result)
 
         return result
 
-    def _compute_scope_files(
-        self, scope: dict, scope_path: str, scope_hash: str,
-    ) -> dict[str, bytes]:
-        """Walk the tree and download every reachable blob (slow path).
-
-        Split out from ``list_scope_files`` so the cached fast-path
-        is a one-line return at the top.
-        """
+    def _compute_scope_file_hashes(
+        self, scope_path: str, excludes: tuple[str, ...], scope_hash: str,
+    ) -> dict[str, str]:
+        """Walk the tree for the scope's path→hash map (slow path)."""
         if scope_hash and self.store.exists(scope_hash):
-            return self._files_from_tree(scope_hash, scope_path, scope)
+            return self._hashes_from_tree(scope_hash, scope_path, excludes)
 
         root_hash = self.get_root_hash()
         if root_hash:
@@ -350,38 +423,35 @@ class PuppyOneServerRepo:
                 if scope_path:
                     subtree_hash = self._navigate_to_subtree(root_hash, scope_path)
                     if subtree_hash:
-                        return self._files_from_tree(subtree_hash, scope_path, scope)
+                        return self._hashes_from_tree(subtree_hash, scope_path, excludes)
                 else:
-                    return self._files_from_tree(root_hash, scope_path, scope)
+                    return self._hashes_from_tree(root_hash, scope_path, excludes)
             except Exception as e:
                 log_error(f"[ServerRepo] list_scope_files fallback from root_hash failed: {e}")
 
         return {}
 
-    def _cache_scope_files(
-        self, scope_path: str, scope_hash: str, files: dict[str, bytes],
+    def _cache_scope_file_hashes(
+        self, cache_key: tuple, file_hashes: dict[str, str],
     ) -> None:
-        """Insert into the FIFO-bounded scope-files cache. Bytes are
-        shared by reference — this is a dict-overhead cache, not a
-        bytes-copying one."""
-        cache_key = (self._project_id, scope_path, scope_hash)
-        with self._scope_files_cache_lock:
-            self._scope_files_cache[cache_key] = dict(files)
-            self._scope_files_cache.move_to_end(cache_key)
-            while len(self._scope_files_cache) > self._SCOPE_FILES_CACHE_MAX:
-                self._scope_files_cache.popitem(last=False)
-
-    def _files_from_tree(self, tree_hash: str, scope_path: str,
-                         scope: dict) -> dict[str, bytes]:
-        excludes = [normalize_path(e) for e in scope.get("exclude", [])]
-        flat = tree_to_flat(self.store, tree_hash)
-        result: dict[str, bytes] = {}
-        for rel_path, blob_hash in flat.items():
-            full_rel = f"{scope_path}/{rel_path}" if scope_path else rel_path
-            if _is_excluded(full_rel, excludes):
-                continue
-            result[rel_path] = self.store.get(blob_hash)
-        return result
+        """Insert into the byte-budgeted cache; maps larger than the whole
+        budget are simply not cached."""
+        with self._scope_hashes_cache_lock:
+            try:
+                self._scope_hashes_cache[cache_key] = file_hashes
+            except ValueError:
+                pass
+
+    def _hashes_from_tree(self, tree_hash: str, scope_path: str,
+                          excludes: tuple[str, ...]) -> dict[str, str]:
+        flat = parallel_tree_to_flat(self.store, tree_hash)
+        if not excludes:
+            return flat
+        return {
+            rel_path: blob_hash
+            for rel_path, blob_hash in flat.items()
+            if not _is_excluded(f"{scope_path}/{rel_path}" if scope_path else rel_path, excludes)
+        }
 
     def write_scope_files(self, scope: dict, files: dict[str, bytes]) -> None:
         key = _scope_key(scope)
@@ -395,16 +465,18 @@ class PuppyOneServerRepo:
 
         if key in self._pending_scope:
             scope_path, files = self._pending_scope.pop(key)
-            tree_hash = self._build_tree_from_files(files)
+            file_hashes: dict[str, str] = {}
+            tree_hash = self._build_tree_from_files(files, file_hashes)
             self._last_scope_build = (scope_path, tree_hash)
             # We just built a tree from this exact ``files`` mapping
             # under hash ``tree_hash``. Any subsequent push that hits
-            # the same scope_hash can return ``files`` directly from
-            # the cache instead of re-walking the tree and
-            # re-downloading every blob from S3. Saves the second of
-            # the two slow passes per push.
-            self._cache_scope_files(
-                normalize_path(scope_path), tree_hash, files,
+            # the same scope_hash can take the path→hash map straight
+            # from the cache instead of re-walking the tree; the blobs
+            # were just written through the shared object cache.
+            excludes = tuple(normalize_path(e) for e in scope.get("exclude", []))
+            self._cache_scope_file_hashes(
+                (self._project_id, normalize_path(scope_path), excludes, tree_hash),
+                file_hashes,
             )
             return tree_hash
 
@@ -465,7 +537,11 @@ class PuppyOneServerRepo:
             current = h
         return current
 
-    def _build_tree_from_files(self, files: dict[str, bytes]) -> str:
+    def _build_tree_from_files(
+        self, files: dict[str, bytes], file_hashes: dict[str, str] | None = None,
+    ) -> str:
+        """Write blobs and trees for ``files``; record each blob hash into
+        ``file_hashes`` when given."""
         nested: dict = {}
         for path, content in files.items():
             parts = path.split("/")
@@ -477,6 +553,8 @@ class PuppyOneServerRepo:
             # bytes — exactly what we want for file content here.
             blob_hash = self.store.put_blob(content)
             d[parts[-1]] = ("B", blob_hash)
+            if file_hashes is not None:
+                file_hashes[path] = blob_hash
         return _write_nested_tree(self.store, nested)
 
 
@@ -484,7 +562,7 @@ def _scope_key(scope: dict) -> str:
     return scope.get("id", scope.get("path", "_default"))
 
 
-def _is_excluded(full_rel: str, excludes: list[str]) -> bool:
+def _is_excluded(full_rel: str, excludes: Sequence[str]) -> bool:
     return any(
         full_rel.startswith(exc + "/") or full_rel == exc
         for exc in excludes
@@ -0,0 +1,531 @@
+"""
+Blob hydration — materialize MUT blobs into sandbox workspaces by hash.
+
+Starting an agent sandbox used to list the tree, ``read_file`` every
+blob serially into memory, decode it to a UTF-8 string (corrupting
+binaries) and then write it back out. This module replaces that path:
+
+  BlobCache
+      Host-local, content-addressed file cache (``<root>/ab/cdef...``)
+      shared by every sandbox session in the process. A blob is fetched
+      at most once per host; concurrent requests for the same hash share
+      one download. Git loose objects are inflated while streaming, so a
+      2 GB blob never sits in worker memory.
+
+  hydrate_workspace(store, {rel_path: blob_hash}, workspace_dir)
+      Places each blob into the workspace with bounded concurrency.
+      Read-only workspaces hard-link straight from the cache; writable
+      ones get a kernel-side copy so an in-place edit can never reach
+      the shared cache entry. Passing the previous ``manifest`` skips
+      files whose hash and on-disk (size, mtime) are unchanged.
+
+The returned manifest (path → hash/size/mtime) is the snapshot the
+sandbox write-back diffs against: ``diff_workspace`` stats every file
+but only re-hashes the ones whose (size, mtime) moved, so a session end
+costs O(changes) reads instead of a full-tree read-back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+import zlib
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional
+
+from src.mut_engine.services.object_compat import read_blob_compat
+from src.utils.logger import log_error, log_info
+
+_STREAM_CHUNK_BYTES = 1024 * 1024
+_RANGE_FETCH_BYTES = 16 * 1024 * 1024
+_DEFAULT_CACHE_MAX_BYTES = 10 * 1024 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """What a workspace file looked like when it was hydrated."""
+    hash: str
+    size: int
+    mtime_ns: int
+
+
+WorkspaceManifest = dict[str, ManifestEntry]
+
+
+@dataclass
+class HydrationResult:
+    manifest: WorkspaceManifest = field(default_factory=dict)
+    written: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    failed: list[dict] = field(default_factory=list)
+
+
+class _NotLooseObject(Exception):
+    """Raw bytes are not a zlib-framed Git blob (legacy raw blob)."""
+
+
+class _LooseBlobWriter:
+    """Inflate a Git loose blob chunk-by-chunk into an open file.
+
+    Verifies the object header, the declared size and the object hash
+    (hash of ``b"blob <size>\\0" + payload``) once the stream ends.
+    """
+
+    def __init__(self, fh, expected_hash: str):
+        self._fh = fh
+        self._expected = expected_hash
+        self._inflater = zlib.decompressobj()
+        self._hasher = hashlib.new("sha1" if len(expected_hash) == 40 else "sha256")
+        self._header = b""
+        self._header_done = False
+        self._declared_size = 0
+        self._written = 0
+
+    def feed(self, raw: bytes) -> None:
+        try:
+            self._consume(self._inflater.decompress(raw))
+        except zlib.error as e:
+            raise _NotLooseObject(str(e)) from e
+
+    def finish(self) -> None:
+        try:
+            self._consume(self._inflater.flush())
+        except zlib.error as e:
+            raise _NotLooseObject(str(e)) from e
+        if not self._inflater.eof or not self._header_done:
+            raise _NotLooseObject("truncated loose object")
+        if self._written != self._declared_size:
+            raise ValueError(
+                f"blob {self._expected[:12]}… size mismatch: "
+                f"header={self._declared_size} payload={self._written}"
+            )
+        if self._hasher.hexdigest() != self._expected:
+            raise ValueError(f"blob {self._expected[:12]}… failed hash verification")
+
+    def _consume(self, data: bytes) -> None:
+        if not data:
+            return
+        self._hasher.update(data)
+        if not self._header_done:
+            self._header += data
+            nul = self._header.find(b"\0")
+            if nul < 0:
+                if len(self._header) > 64:
+                    raise _NotLooseObject("missing object header")
+                return
+            kind, _, size = self._header[:nul].partition(b" ")
+            if kind != b"blob" or not size.isdigit():
+                raise _NotLooseObject(f"unexpected object header {self._header[:nul]!r}")
+            self._declared_size = int(size)
+            self._header_done = True
+            data = self._header[nul + 1:]
+            self._header = b""
+        if data:
+            self._fh.write(data)
+            self._written += len(data)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, "wb") as fh:
+        fh.write(data)
+
+
+class BlobCache:
+    """Content-addressed on-disk blob cache shared across sandbox sessions.
+
+    Entries are immutable (same hash = same bytes), so there is nothing
+    to invalidate — ``prune`` only enforces a byte budget. Hard links
+    already handed to a workspace survive pruning.
+    """
+
+    def __init__(self, root: str, max_bytes: int = _DEFAULT_CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._sync_inflight: dict[str, threading.Lock] = {}
+        self._sync_guard = threading.Lock()
+        self._approx_bytes: Optional[int] = None  # unknown until first prune walk
+        os.makedirs(root, exist_ok=True)
+
+    def path_for(self, blob_hash: str) -> str:
+        return os.path.join(self.root, blob_hash[:2], blob_hash[2:])
+
+    def contains(self, blob_hash: str) -> bool:
+        return os.path.isfile(self.path_for(blob_hash))
+
+    async def ensure(self, store, blob_hash: str) -> str:
+        """Return the cache path for ``blob_hash``, fetching it if needed."""
+        path = self.path_for(blob_hash)
+        if os.path.isfile(path):
+            return path
+        task = self._inflight.get(blob_hash)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(store, blob_hash, path))
+            self._inflight[blob_hash] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(blob_hash, None))
+        await asyncio.shield(task)
+        return path
+
+    def ensure_sync(self, store, blob_hash: str) -> str:
+        """Blocking ``ensure`` for threadpool callers (HTTP file reads).
+
+        The loose object is fetched in ``_RANGE_FETCH_BYTES`` ranged reads
+        and inflated straight to disk; threads asking for the same hash wait
+        on one fetch.
+        """
+        path = self.path_for(blob_hash)
+        if os.path.isfile(path):
+            return path
+        with self._sync_guard:
+            lock = self._sync_inflight.setdefault(blob_hash, threading.Lock())
+        try:
+            with lock:
+                if not os.path.isfile(path):
+                    self._fetch_sync(store, blob_hash, path)
+        finally:
+            with self._sync_guard:
+                if not lock.locked():
+                    self._sync_inflight.pop(blob_hash, None)
+        return path
+
+    async def read(self, store, blob_hash: str) -> bytes:
+        """Return blob bytes through the cache (for non-local sandboxes)."""
+        path = await self.ensure(store, blob_hash)
+        return await asyncio.to_thread(_read_file, path)
+
+    async def _fetch(self, store, blob_hash: str, path: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{uuid.uuid4().hex}.part"
+        try:
+            stream = getattr(getattr(store, "_backend", None), "async_stream", None)
+            streamed = False
+            if callable(stream):
+                try:
+                    await _stream_loose_blob(stream(blob_hash, _STREAM_CHUNK_BYTES), blob_hash, tmp)
+                    streamed = True
+                except _NotLooseObject:
+                    streamed = False
+            if not streamed:
+                data = await asyncio.to_thread(read_blob_compat, store, blob_hash)
+                await asyncio.to_thread(_write_bytes, tmp, data)
+            os.replace(tmp, path)
+            if self._approx_bytes is not None:
+                self._approx_bytes += os.path.getsize(path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def _fetch_sync(self, store, blob_hash: str, path: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{uuid.uuid4().hex}.part"
+        try:
+            get_range = getattr(getattr(store, "_backend", None), "get_range", None)
+            streamed = False
+            if callable(get_range):
+                try:
+                    with open(tmp, "wb") as fh:
+                        writer = _LooseBlobWriter(fh, blob_hash)
+                        offset = 0
+                        while True:
+                            raw, total = get_range(blob_hash, start=offset, limit=_RANGE_FETCH_BYTES)
+                            writer.feed(raw)
+                            offset += len(raw)
+                            if not raw or offset >= total:
+                                break
+                        writer.finish()
+                    streamed = True
+                except _NotLooseObject:
+                    streamed = False
+            if not streamed:
+                _write_bytes(tmp, read_blob_compat(store, blob_hash))
+            os.replace(tmp, path)
+            if self._approx_bytes is not None:
+                self._approx_bytes += os.path.getsize(path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def prune(self) -> int:
+        """Drop least-recently-used (atime) entries until under ``max_bytes``.
+
+        Returns the number of bytes freed. Walks the cache only when the
+        running size estimate is unknown or over budget.
+        """
+        if self._approx_bytes is not None and self._approx_bytes <= self.max_bytes:
+            return 0
+        entries: list[tuple[int, int, str]] = []
+        total = 0
+        for dirpath, _dirs, files in os.walk(self.root):
+            for name in files:
+                if name.endswith(".part"):
+                    continue
+                full = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(full)
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_atime_ns, st.st_size, full))
+                total += st.st_size
+        freed = 0
+        if total <= self.max_bytes:
+            self._approx_bytes = total
+            return 0
+        for _atime, size, full in sorted(entries):
+            if total - freed <= self.max_bytes:
+                break
+            try:
+                os.unlink(full)
+                freed += size
+            except FileNotFoundError:
+                continue
+        self._approx_bytes = total - freed
+        return freed
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+async def _stream_loose_blob(
+    chunks: AsyncIterator[bytes], blob_hash: str, dest: str,
+) -> None:
+    fh = await asyncio.to_thread(open, dest, "wb")
+    try:
+        writer = _LooseBlobWriter(fh, blob_hash)
+        async for chunk in chunks:
+            await asyncio.to_thread(writer.feed, chunk)
+        await asyncio.to_thread(writer.finish)
+    finally:
+        await asyncio.to_thread(fh.close)
+
+
+_blob_cache: Optional[BlobCache] = None
+
+
+def get_blob_cache() -> BlobCache:
+    """Process-wide BlobCache rooted next to the sandbox temp dirs.
+
+    Living on the same filesystem as the Docker workspaces is what lets
+    read-only hydration hard-link instead of copy.
+    """
+    global _blob_cache
+    if _blob_cache is None:
+        from src.config import settings
+
+        root = (settings.SANDBOX_BLOB_CACHE_DIR or "").strip()
+        if not root:
+            base = (settings.SANDBOX_TMPDIR or "").strip() or tempfile.gettempdir()
+            root = os.path.join(base, "puppyone-blob-cache")
+        _blob_cache = BlobCache(root, max_bytes=settings.SANDBOX_BLOB_CACHE_MAX_BYTES)
+    return _blob_cache
+
+
+def _safe_join(workspace_dir: str, rel_path: str) -> Optional[str]:
+    normalized = os.path.normpath(rel_path.lstrip("/"))
+    if normalized in ("", ".") or normalized.startswith(".."):
+        return None
+    return os.path.join(workspace_dir, normalized)
+
+
+def _matches(path: str, entry: ManifestEntry) -> bool:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return st.st_size == entry.size and st.st_mtime_ns == entry.mtime_ns
+
+
+def _place(cache_path: str, blob_hash: str, dest: str, link: bool) -> ManifestEntry:
+    """Put one cached blob at ``dest`` and return its manifest entry."""
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    if os.path.lexists(dest):
+        os.unlink(dest)
+    placed = False
+    if link:
+        try:
+            os.link(cache_path, dest)
+            placed = True
+        except OSError:
+            placed = False
+    if not placed:
+        shutil.copyfile(cache_path, dest)
+    st = os.stat(dest)
+    return ManifestEntry(
+        hash=blob_hash,
+        size=st.st_size,
+        mtime_ns=st.st_mtime_ns,
+    )
+
+
+@dataclass
+class WorkspaceDiff:
+    """Files that differ from a hydration manifest.
+
+    ``changed`` maps new and modified paths to their current entry (hash
+    included); ``deleted`` lists manifest paths missing from disk.
+    """
+    changed: WorkspaceManifest = field(default_factory=dict)
+    deleted: list[str] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.changed and not self.deleted
+
+
+def hash_file(path: str, algo: str = "sha1") -> str:
+    """Git blob hash of a file on disk, streamed."""
+    size = os.path.getsize(path)
+    hasher = hashlib.new(algo)
+    hasher.update(b"blob %d\0" % size)
+    with open(path, "rb") as fh:
+        while chunk := fh.read(_STREAM_CHUNK_BYTES):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def diff_workspace(workspace_dir: str, manifest: WorkspaceManifest) -> WorkspaceDiff:
+    """Compare ``workspace_dir`` against ``manifest``.
+
+    Files whose (size, mtime) match are trusted without reading. A file
+    that was touched but rewritten with identical bytes hashes equal to
+    its manifest entry and is not reported. Dot-files and dot-dirs are
+    ignored, as the agent write-back always has.
+    """
+    algo = "sha1"
+    for entry in manifest.values():
+        algo = "sha1" if len(entry.hash) == 40 else "sha256"
+        break
+
+    diff = WorkspaceDiff()
+    seen: set[str] = set()
+    for dirpath, dirnames, filenames in os.walk(workspace_dir):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if name.startswith("."):
+                continue
+            full = os.path.join(dirpath, name)
+            if os.path.islink(full) or not os.path.isfile(full):
+                continue
+            rel = os.path.relpath(full, workspace_dir).replace(os.sep, "/")
+            seen.add(rel)
+            prior = manifest.get(rel)
+            if prior is not None and _matches(full, prior):
+                continue
+            st = os.stat(full)
+            current = ManifestEntry(
+                hash=hash_file(full, algo),
+                size=st.st_size,
+                mtime_ns=st.st_mtime_ns,
+            )
+            if prior is not None and prior.hash == current.hash:
+                continue
+            diff.changed[rel] = current
+    diff.deleted = sorted(rel for rel in manifest if rel not in seen)
+    return diff
+
+
+def scrub_workspace(workspace_dir: str, manifest: WorkspaceManifest) -> WorkspaceManifest:
+    """Delete everything under ``workspace_dir`` that the manifest does not vouch for.
+
+    Files whose (size, mtime) still match their manifest entry are kept,
+    so the directory can be re-hydrated later with ``previous=`` and only
+    pay for what changed. Returns the manifest of the surviving files.
+    Raises OSError if something cannot be removed.
+    """
+    kept: WorkspaceManifest = {}
+    for dirpath, dirnames, filenames in os.walk(workspace_dir, topdown=False):
+        for name in filenames:
+            full = os.path.join(dirpath, name)
+            rel = os.path.relpath(full, workspace_dir).replace(os.sep, "/")
+            entry = manifest.get(rel)
+            if entry is not None and not os.path.islink(full) and _matches(full, entry):
+                kept[rel] = entry
+            else:
+                os.unlink(full)
+        for name in dirnames:
+            full = os.path.join(dirpath, name)
+            if os.path.islink(full):
+                os.unlink(full)
+            elif not os.listdir(full):
+                os.rmdir(full)
+    return kept
+
+
+async def hydrate_workspace(
+    store,
+    entries: dict[str, str],
+    workspace_dir: str,
+    *,
+    link: bool = False,
+    previous: Optional[WorkspaceManifest] = None,
+    concurrency: Optional[int] = None,
+    cache: Optional[BlobCache] = None,
+) -> HydrationResult:
+    """Materialize ``{rel_path: blob_hash}`` under ``workspace_dir``.
+
+    Args:
+        store:       Project ObjectStore the hashes live in.
+        link:        Hard-link from the cache. Only safe when the
+                     workspace is mounted read-only.
+        previous:    Manifest from the last hydration of this directory.
+                     Unchanged files are skipped; files that vanished from
+                     ``entries`` and were not touched locally are removed.
+        concurrency: Max blobs in flight (default SANDBOX_DOWNLOAD_CONCURRENCY).
+    """
+    if concurrency is None:
+        from src.config import settings
+
+        concurrency = settings.SANDBOX_DOWNLOAD_CONCURRENCY
+    cache = cache or get_blob_cache()
+    previous = previous or {}
+    result = HydrationResult()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def hydrate_one(rel_path: str, blob_hash: str) -> None:
+        dest = _safe_join(workspace_dir, rel_path)
+        if dest is None:
+            result.failed.append({"path": rel_path, "error": "Path traversal detected"})
+            return
+        prior = previous.get(rel_path)
+        if prior is not None and prior.hash == blob_hash and _matches(dest, prior):
+            result.manifest[rel_path] = prior
+            result.skipped.append(rel_path)
+            return
+        async with semaphore:
+            try:
+                cache_path = await cache.ensure(store, blob_hash)
+                result.manifest[rel_path] = await asyncio.to_thread(
+                    _place, cache_path, blob_hash, dest, link,
+                )
+                result.written.append(rel_path)
+            except Exception as e:
+                result.failed.append({"path": rel_path, "error": str(e)})
+
+    await asyncio.gather(*[hydrate_one(p, h) for p, h in entries.items()])
+
+    for rel_path, prior in previous.items():
+        if rel_path in entries:
+            continue
+        dest = _safe_join(workspace_dir, rel_path)
+        if dest and _matches(dest, prior):
+            try:
+                os.unlink(dest)
+                result.removed.append(rel_path)
+            except OSError:
+                pass
+
+    if result.written:
+        try:
+            freed = await asyncio.to_thread(cache.prune)
+            if freed:
+                log_info(f"[BlobHydrator] pruned {freed} bytes from blob cache")
+        except Exception as e:
+            log_error(f"[BlobHydrator] cache prune failed: {e}")
+    return result
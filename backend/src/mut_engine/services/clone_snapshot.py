@@ -0,0 +1,125 @@
+"""
+Shared, lazily loaded clone snapshots for ``MutEphemeralClient``.
+
+A full ``clone()`` used to materialize ``{rel_path: bytes}`` for the whole
+scope in every client, and the agent / sandbox / MCP paths create a client
+per operation — N concurrent sessions on one scope held N full copies.
+
+  CloneSnapshot
+      One per (project, scope, excludes, scope tree hash): the
+      ``{rel_path: blob_hash}`` map from a single tree walk, plus the
+      bytes of the blobs some client actually read. Trees are
+      content-addressed, so a snapshot never goes stale — a new scope
+      head is simply a new key.
+
+  acquire_clone_snapshot(...)
+      Returns the live snapshot for a key, walking the tree only on a
+      miss. The registry holds snapshots weakly: each client that cloned
+      keeps a reference, and the snapshot (with its loaded blobs) is
+      freed as soon as the last of them goes away.
+
+  ClonedFiles
+      The mutable ``{rel_path: bytes}`` mapping ``clone()`` hands out.
+      It copies only the path→hash map; values load through the shared
+      snapshot on access and local writes stay in the view.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Callable, Iterator, MutableMapping
+
+from src.mut_engine.services.object_compat import read_blob_compat
+
+
+class CloneSnapshot:
+    """Read-only path→hash map of one scope tree, with blobs loaded on demand."""
+
+    def __init__(self, store, tree_hash: str, file_hashes: dict[str, str]):
+        self.store = store
+        self.tree_hash = tree_hash
+        # Shared by every client on this snapshot: treat as read-only
+        self.file_hashes = file_hashes
+        self._blobs: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def blob(self, blob_hash: str) -> bytes:
+        """Bytes of ``blob_hash``, fetched once per snapshot."""
+        with self._lock:
+            data = self._blobs.get(blob_hash)
+        if data is not None:
+            return data
+        data = read_blob_compat(self.store, blob_hash)
+        with self._lock:
+            return self._blobs.setdefault(blob_hash, data)
+
+    @property
+    def loaded_blob_count(self) -> int:
+        with self._lock:
+            return len(self._blobs)
+
+
+_snapshots: weakref.WeakValueDictionary[tuple, CloneSnapshot] = weakref.WeakValueDictionary()
+_snapshots_lock = threading.Lock()
+
+
+def acquire_clone_snapshot(
+    project_id: str,
+    scope_path: str,
+    excludes: list[str],
+    tree_hash: str,
+    store,
+    build: Callable[[], dict[str, str]],
+) -> CloneSnapshot:
+    """Shared snapshot for this scope state; ``build()`` walks the tree on a miss.
+
+    Concurrent misses may both walk; the first to register wins and the
+    other's result is dropped.
+    """
+    key = (project_id, scope_path, tuple(excludes), tree_hash)
+    with _snapshots_lock:
+        snapshot = _snapshots.get(key)
+    if snapshot is not None:
+        return snapshot
+    snapshot = CloneSnapshot(store, tree_hash, build())
+    with _snapshots_lock:
+        return _snapshots.setdefault(key, snapshot)
+
+
+class ClonedFiles(MutableMapping[str, bytes]):
+    """``{rel_path: bytes}`` view over a snapshot; assignments stay local."""
+
+    def __init__(self, snapshot: CloneSnapshot, file_hashes: dict[str, str]):
+        self._snapshot = snapshot
+        self._hashes = dict(file_hashes)
+        self._local: dict[str, bytes] = {}
+
+    def __getitem__(self, path: str) -> bytes:
+        if path in self._local:
+            return self._local[path]
+        return self._snapshot.blob(self._hashes[path])
+
+    def __setitem__(self, path: str, content: bytes) -> None:
+        self._hashes.pop(path, None)
+        self._local[path] = content
+
+    def __delitem__(self, path: str) -> None:
+        if path in self._local:
+            del self._local[path]
+        else:
+            del self._hashes[path]
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._local or path in self._hashes
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._hashes
+        yield from self._local
+
+    def __len__(self) -> int:
+        return len(self._hashes) + len(self._local)
+
+    def blob_hash(self, path: str) -> str | None:
+        """Blob hash for a snapshot-backed path (None once overwritten locally)."""
+        return self._hashes.get(path)
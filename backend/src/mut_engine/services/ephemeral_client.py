@@ -8,14 +8,19 @@ and audit logging.
 
 Usage:
     client = MutEphemeralClient(repo_manager, project_id, auth_context)
-    files = client.clone()           # {rel_path: bytes}
+    files = client.clone()           # {rel_path: bytes}, loaded on access
     client.push({"foo.md": b"new"}, deleted=["old.md"])
+
+Clones are backed by a ``CloneSnapshot`` shared by every client on the
+same scope tree (see ``services.clone_snapshot``), so memory scales with
+the blobs sessions actually read, not scope size × sessions.
 """
 
 from __future__ import annotations
 
 import base64
 import asyncio
+from collections.abc import MutableMapping
 from datetime import UTC
 
 from mut.core.protocol import PROTOCOL_VERSION
@@ -23,14 +28,19 @@ from mut.foundation.git_format import (
     MODE_DIR, MODE_FILE, TreeEntry, encode_object, encode_tree, hash_object,
 )
 from mut.server.handlers import (
-    handle_clone,
     handle_negotiate,
     handle_pull,
 )
 
 from src.mut_engine.adapters.mut.push_adapter import submit_mut_push
+from src.mut_engine.application.tree_objects import parallel_tree_to_flat
 from src.mut_engine.server.repo_manager import MutRepoManager
 from src.mut_engine.server.server_repo import PuppyOneServerRepo
+from src.mut_engine.services.clone_snapshot import (
+    ClonedFiles,
+    CloneSnapshot,
+    acquire_clone_snapshot,
+)
 
 
 class MutEphemeralClient:
@@ -55,12 +65,15 @@ class MutEphemeralClient:
         self._scope: dict = {}
         self._files: dict[str, bytes] = {}
         self._object_hashes: set[str] = set()
-        # Populated by clone_lite() instead of clone(): {rel_path: blob_hash}.
+        # Populated by clone() / clone_lite(): {rel_path: blob_hash}.
         # When non-None it signals the "fast push" path — _build_snapshot
         # reuses these hashes for unchanged files instead of re-hashing
         # downloaded content. push() falls back to the legacy full-content
-        # path when this is None.
+        # path when this is None (a client that never cloned).
+        # Right after a clone this is the snapshot's own map; it is
+        # copied before the first local edit.
         self._file_hashes: dict[str, str] | None = None
+        self._snapshot: CloneSnapshot | None = None
 
     @property
     def scope(self) -> dict:
@@ -71,7 +84,9 @@ class MutEphemeralClient:
         return self._head_commit_id
 
     @property
-    def files(self) -> dict[str, bytes]:
+    def files(self) -> MutableMapping[str, bytes]:
+        if self._file_hashes is not None:
+            return ClonedFiles(self._snapshot, self._file_hashes)
         return dict(self._files)
 
     def _get_server_repo(self) -> PuppyOneServerRepo:
@@ -91,40 +106,18 @@ class MutEphemeralClient:
 
     # ── Clone ────────────────────────────────────
 
-    def clone(self) -> dict[str, bytes]:
+    def clone(self) -> MutableMapping[str, bytes]:
         """Clone the scope subtree. Returns {rel_path: content}.
 
-        Heavy: walks every reachable blob and downloads its bytes from
-        S3, then re-uploads them as base64 across the in-process clone
-        boundary. Use only when callers actually need the file content
-        (move / hard-delete need to relocate or read existing
-        files). Pure-write ops (mkdir / write_file / bulk_write / delete
-        by path) should use ``clone_lite`` instead — that builds a
-        ``{path: blob_hash}`` map by walking the tree without ever
-        touching blob bytes, which lets ``push`` reuse existing hashes
-        for unchanged files and only ship the new blob bytes.
+        The mapping is a ``ClonedFiles`` view: it holds only the
+        path→hash map from ``clone_lite`` and fetches a file's bytes the
+        first time it is read, through the snapshot shared with every
+        other client on the same scope tree. Reads, iteration and local
+        edits behave like the plain dict this used to return; the
+        download cost is paid only for files actually touched.
         """
-        repo = self._get_server_repo()
-        result = handle_clone(
-            repo, self._auth, {"protocol_version": PROTOCOL_VERSION}
-        )
-
-        self._head_commit_id = result.get("head_commit_id", "")
-        self._scope = {
-            "path": result["scope"]["path"],
-            "exclude": result["scope"].get("exclude", []),
-            "mode": result["scope"].get("mode", "rw"),
-        }
-
-        self._files = {
-            path: base64.b64decode(b64)
-            for path, b64 in result.get("files", {}).items()
-        }
-
-        self._object_hashes = set(result.get("objects", {}).keys())
-        self._file_hashes = None  # full-content path; lite map is unused
-
-        return dict(self._files)
+        self.clone_lite()
+        return self.files
 
     def clone_lite(self) -> dict[str, str]:
         """Lightweight clone: fetch ``{rel_path: blob_hash}`` only.
@@ -143,9 +136,10 @@ class MutEphemeralClient:
         and only include blob bytes for the entries actually being
         added or replaced.
 
-        Sets ``self._file_hashes``; leaves ``self._files`` empty so any
-        caller that mistakenly assumes full content fails loudly rather
-        than silently operating on empty bytes.
+        The walk is skipped when a live ``CloneSnapshot`` already covers
+        this scope tree hash. Sets ``self._file_hashes`` (shared with the
+        snapshot until the first local edit) and leaves ``self._files``
+        empty; file bytes are read through the snapshot on demand.
         """
         from mut.core.protocol import normalize_path
 
@@ -157,17 +151,26 @@ class MutEphemeralClient:
         excludes = [normalize_path(e) for e in scope.get("exclude", [])]
 
         scope_tree_hash = repo.build_scope_tree(scope)
-        flat = self._parallel_tree_walk(repo.store, scope_tree_hash)
-
-        file_hashes: dict[str, str] = {}
-        for rel_path, blob_hash in flat.items():
-            full_rel = f"{scope_path}/{rel_path}" if scope_path else rel_path
-            if any(
-                full_rel == ex or full_rel.startswith(ex + "/")
-                for ex in excludes
-            ):
-                continue
-            file_hashes[rel_path] = blob_hash
+
+        def build() -> dict[str, str]:
+            flat = self._parallel_tree_walk(repo.store, scope_tree_hash)
+            file_hashes: dict[str, str] = {}
+            for rel_path, blob_hash in flat.items():
+                full_rel = f"{scope_path}/{rel_path}" if scope_path else rel_path
+                if any(
+                    full_rel == ex or full_rel.startswith(ex + "/")
+                    for ex in excludes
+                ):
+                    continue
+                file_hashes[rel_path] = blob_hash
+            return file_hashes
+
+        # Another client on the same scope state already walked it:
+        # share that map (and any blobs it loaded) instead.
+        snapshot = acquire_clone_snapshot(
+            self._project_id, scope_path, excludes, scope_tree_hash,
+            repo.store, build,
+        )
 
         self._head_commit_id = repo.get_scope_head_commit_id(scope_path)
         self._scope = {
@@ -176,13 +179,14 @@ class MutEphemeralClient:
             "mode": scope.get("mode", "rw"),
         }
         self._files = {}
-        self._file_hashes = file_hashes
+        self._snapshot = snapshot
+        self._file_hashes = snapshot.file_hashes
         # No `objects` set — push's negotiate step queries the server for
         # which new objects are actually missing, so we don't need to
         # know what's already on the server up-front.
         self._object_hashes = set()
 
-        return dict(file_hashes)
+        return dict(snapshot.file_hashes)
 
     @staticmethod
     def _parallel_tree_walk(
@@ -201,57 +205,35 @@ class MutEphemeralClient:
         boundary collapses the wall-clock cost to ``levels × latency``,
         which is typically << 10 levels deep.
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        from mut.core.tree import read_tree
-
-        result: dict[str, str] = {}
-        if not root_hash:
-            return result
-
-        pending: list[tuple[str, str]] = [(root_hash, "")]
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            while pending:
-                futures = {
-                    executor.submit(read_tree, store, tree_hash): (tree_hash, prefix)
-                    for tree_hash, prefix in pending
-                }
-                pending = []
-                for fut in as_completed(futures):
-                    _, prefix = futures[fut]
-                    MutEphemeralClient._absorb_tree_entries(
-                        fut.result(), prefix, result, pending,
-                    )
-        return result
+        return parallel_tree_to_flat(store, root_hash, max_workers=max_workers)
 
-    @staticmethod
-    def _absorb_tree_entries(
-        entries: dict,
-        prefix: str,
-        leaf_result: dict[str, str],
-        sub_trees: list[tuple[str, str]],
-    ) -> None:
-        """Process one tree node's entries: blobs into ``leaf_result``,
-        sub-trees into ``sub_trees`` for the next BFS level.
+    # ── Pull ─────────────────────────────────────
 
-        Extracted from ``_parallel_tree_walk`` only to keep its cognitive
-        complexity below the 15-branch lint threshold; the logic is
-        otherwise unchanged.
-        """
-        for name, (typ, h) in entries.items():
-            path = f"{prefix}{name}" if not prefix else f"{prefix}/{name}"
-            if typ == "T":
-                sub_trees.append((h, path))
-            else:
-                leaf_result[path] = h
+    def refresh(self) -> MutableMapping[str, bytes]:
+        """Re-clone a cloned client from the current scope head.
 
-    # ── Pull ─────────────────────────────────────
+        Cheap when a snapshot for the new scope tree is already live.
+        Returns the full new view, like ``clone()``.
+        """
+        self.clone_lite()
+        return self.files
 
     def pull(self) -> dict[str, bytes]:
         """Pull latest changes since last known commit_id.
 
-        Returns updated files or empty dict if up-to-date.
+        Returns updated files or empty dict if up-to-date. A cloned
+        client ``refresh()``es and diffs the old and new path→hash maps,
+        so only added or changed files are read.
         """
+        if self._file_hashes is not None:
+            before = self._file_hashes
+            self.refresh()
+            return {
+                path: self._snapshot.blob(blob_hash)
+                for path, blob_hash in self._file_hashes.items()
+                if before.get(path) != blob_hash
+            }
+
         repo = self._get_server_repo()
         body = {
             "protocol_version": PROTOCOL_VERSION,
@@ -446,10 +428,9 @@ class MutEphemeralClient:
         """Update cached client state after a successful push.
 
         Three cases:
-          1. server merged with a concurrent commit → refresh from new
-              head (lite walk if we're on the hash-only path; pull() for
-              the legacy full-content path so existing-content readers
-              see merged data).
+          1. server merged with a concurrent commit → refresh from the
+              new head (``refresh()`` on the hash-only path; ``pull()``
+              for the legacy full-content path) so readers see merged data.
           2. fast path, no merge → apply the same edits to ``_file_hashes``
              so the cached host client stays consistent for the next push.
           3. legacy path, no merge → swap in the locally-merged file dict.
@@ -464,12 +445,14 @@ class MutEphemeralClient:
             or server_changed_since_clone
         ):
             if self._file_hashes is not None:
-                self.clone_lite()
+                self.refresh()
             else:
                 self.pull()
             return
 
         if self._file_hashes is not None:
+            if self._snapshot is not None and self._file_hashes is self._snapshot.file_hashes:
+                self._file_hashes = dict(self._file_hashes)
             for path, content in modified.items():
                 self._file_hashes[path] = _content_hash(content)
             for path in deleted:
@@ -482,17 +465,22 @@ class MutEphemeralClient:
 
     def read_file(self, path: str) -> bytes | None:
         """Read a single file from the cloned state."""
+        if self._file_hashes is not None:
+            blob_hash = self._file_hashes.get(path)
+            return self._snapshot.blob(blob_hash) if blob_hash else None
         return self._files.get(path)
 
     def list_files(self) -> list[str]:
         """List all file paths in the scope."""
+        if self._file_hashes is not None:
+            return sorted(self._file_hashes)
         return sorted(self._files.keys())
 
     def stat(self, path: str) -> dict | None:
         """Get basic info about a file."""
-        if path not in self._files:
+        content = self.read_file(path)
+        if content is None:
             return None
-        content = self._files[path]
         return {
             "path": path,
             "size": len(content),
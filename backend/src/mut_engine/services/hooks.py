@@ -101,25 +101,13 @@ def run_post_push_hook(
         if not entry:
             return
 
-        changes = entry.get("changes", [])
-        if isinstance(changes, str):
-            import json
-            changes = json.loads(changes)
-
-        deleted_paths = [
-            c["path"] for c in changes
-            if c.get("action") == "delete" or c.get("op") == "deleted"
-        ]
-        scope_path = (entry.get("scope_path") or "").strip("/")
-        if scope_path:
-            deleted_paths = [
-                f"{scope_path}/{p.strip('/')}" if p.strip("/") else scope_path
-                for p in deleted_paths
-            ]
+        scope_path, changes, deleted_paths = _parse_commit_entry(entry)
 
         if deleted_paths:
             post_commit_delete(project_id, deleted_paths)
 
+        _invalidate_agent_configs(project_id, scope_path, changes)
+
         # Fan out commit_update over WebSocket to subscribed clients.
         # Best-effort: a notification failure must not block the
         # commit. We schedule on the running loop if there is one;
@@ -133,6 +121,122 @@ def run_post_push_hook(
             raise
 
 
+def run_post_push_batch(
+    project_id: str,
+    repo_manager,
+    push_results: list[dict],
+    *,
+    raise_errors: bool = False,
+) -> None:
+    """Coalesced ``run_post_push_hook`` for several commits of one project.
+
+    Used by the version outbox when a burst left many rows for the same
+    project. The root projection reads the whole scope registry, so
+    replaying it per commit would rebuild the same root N times; here it is
+    built once (for the newest result), every commit is indexed against that
+    one project view in a single bulk write, and only the cheap per-commit
+    work (access-point cleanup, broadcast) runs per commit.
+
+    ``push_results`` are ordered oldest first.
+    """
+    results = []
+    for push_result in push_results:
+        if push_result.get("status", "") not in _SUCCESS_STATUSES:
+            continue
+        commit_id = push_result.get("commit_id") or push_result.get("new_commit_id") or ""
+        if commit_id:
+            results.append({**push_result, "commit_id": commit_id})
+    if not results:
+        return
+
+    try:
+        repo = repo_manager.get_server_repo(project_id)
+
+        # Like run_post_push_hook, graft before looking up history: the
+        # newest result decides the root even if its entry is missing.
+        rooted = [result for result in results if result.get("root")]
+        new_root = (
+            _update_global_root(repo, rooted[-1], record_view_index=False)
+            if rooted else ""
+        )
+
+        entries: list[tuple[dict, dict]] = []
+        for result in results:
+            entry = repo.history.get_entry(result["commit_id"])
+            if entry:
+                entries.append((result, entry))
+            else:
+                log_error(f"[PostCommit] No history entry for commit {result['commit_id']}")
+
+        grafted = [(result, entry) for result, entry in entries if result.get("root")]
+        if new_root and grafted:
+            try:
+                _record_project_view_index_batch(
+                    repo=repo, entries=grafted, project_root_hash=new_root,
+                )
+            except Exception as exc:
+                log_warning(
+                    f"[PostCommit] project-view Git index update failed "
+                    f"for {len(grafted)} commits: {exc}",
+                )
+        if not entries:
+            return
+
+        deleted_paths: list[str] = []
+        parsed = []
+        for _result, entry in entries:
+            scope_path, changes, deleted = _parse_commit_entry(entry)
+            deleted_paths.extend(deleted)
+            parsed.append((entry, scope_path, changes))
+
+        if deleted_paths:
+            post_commit_delete(project_id, list(dict.fromkeys(deleted_paths)))
+
+        for entry, scope_path, changes in parsed:
+            _invalidate_agent_configs(project_id, scope_path, changes)
+            _broadcast_commit_update(project_id, entry, changes)
+
+    except Exception as e:
+        log_error(f"[PostCommit] batched post-push hook failed for project {project_id}: {e}")
+        if raise_errors:
+            raise
+
+
+def _parse_commit_entry(entry: dict) -> tuple[str, list[dict], list[str]]:
+    """``(scope_path, changes, deleted project paths)`` of a history entry."""
+    changes = entry.get("changes", [])
+    if isinstance(changes, str):
+        import json
+        changes = json.loads(changes)
+
+    deleted_paths = [
+        c["path"] for c in changes
+        if c.get("action") == "delete" or c.get("op") == "deleted"
+    ]
+    scope_path = (entry.get("scope_path") or "").strip("/")
+    if scope_path:
+        deleted_paths = [
+            f"{scope_path}/{p.strip('/')}" if p.strip("/") else scope_path
+            for p in deleted_paths
+        ]
+    return scope_path, changes, deleted_paths
+
+
+def _invalidate_agent_configs(project_id: str, scope_path: str, changes: list[dict]) -> None:
+    """Drop resolved agent configs bound to any path this commit touched."""
+    paths = []
+    for c in changes:
+        rel = (c.get("path") or "").strip("/")
+        paths.append(f"{scope_path}/{rel}" if scope_path and rel else rel or scope_path)
+    if not paths:
+        return
+    try:
+        from src.connectors.agent.config.resolved_cache import get_resolved_agent_cache
+        get_resolved_agent_cache().invalidate_paths(project_id, paths)
+    except Exception as e:
+        log_warning(f"[PostCommit] agent config invalidation failed: {e}")
+
+
 def schedule_post_push_hook(project_id: str, repo_manager, push_result: dict) -> None:
     """Run post-commit projection work off the user request path.
 
@@ -214,9 +318,15 @@ def _broadcast_commit_update(project_id: str, entry: dict, changes: list[dict])
         log_warning(f"[PostCommit] broadcast_commit_update failed: {e}")
 
 
-def _update_global_root(repo, push_result: dict) -> None:
+def _update_global_root(
+    repo, push_result: dict, *, record_view_index: bool = True,
+) -> str:
     """Rebuild ``projects.mut_root_hash`` from DB-authoritative scope state.
 
+    Returns the published root ("" if nothing was published). With
+    ``record_view_index=False`` the caller records the project-view index
+    itself (see ``run_post_push_batch``).
+
     Architecture: "DB-Authoritative Registry + Materialized Root"
     (see ``docs/design/mut-scope-concurrency.md`` and
     ``mut-bug-checklist.md`` P0-5).
@@ -253,13 +363,13 @@ def _update_global_root(repo, push_result: dict) -> None:
     """
     scope_hash = push_result.get("root", "")
     if not scope_hash:
-        return
+        return ""
 
     commit_id = push_result["commit_id"]
     entry = repo.history.get_entry(commit_id)
     if not entry:
         log_error(f"[PostCommit] No history entry for commit {commit_id}")
-        return
+        return ""
 
     scope_path = (entry.get("scope_path") or "").strip("/")
 
@@ -283,7 +393,7 @@ def _update_global_root(repo, push_result: dict) -> None:
                 db_root = repo.history.get_root_hash() if hasattr(repo.history, "get_root_hash") else ""
 
             new_root = _build_root_from_scope_state(
-                repo, scope_path, scope_hash,
+                repo, scope_path, scope_hash, base_root=db_root,
             )
 
             if hasattr(repo, "cas_update_root_hash"):
@@ -294,26 +404,27 @@ def _update_global_root(repo, push_result: dict) -> None:
                 success = True
 
             if success:
-                try:
-                    _record_project_view_index(
-                        repo=repo,
-                        entry=entry,
-                        scope_path=scope_path,
-                        scope_hash=scope_hash,
-                        project_root_hash=new_root,
-                        source_commit_id=commit_id,
-                    )
-                except Exception as exc:
-                    log_warning(
-                        f"[PostCommit] project-view Git index update failed "
-                        f"for commit {commit_id[:12]}: {exc}",
-                    )
+                if record_view_index:
+                    try:
+                        _record_project_view_index(
+                            repo=repo,
+                            entry=entry,
+                            scope_path=scope_path,
+                            scope_hash=scope_hash,
+                            project_root_hash=new_root,
+                            source_commit_id=commit_id,
+                        )
+                    except Exception as exc:
+                        log_warning(
+                            f"[PostCommit] project-view Git index update failed "
+                            f"for commit {commit_id[:12]}: {exc}",
+                        )
                 log_info(
                     f"[PostCommit] Rebuilt global root from DB state: "
                     f"scope='{scope_path}' root={new_root[:16]} "
                     f"(attempt {attempt + 1})"
                 )
-                return
+                return new_root
 
             log_info(
                 f"[PostCommit] Root CAS lost — retrying "
@@ -332,6 +443,7 @@ def _update_global_root(repo, push_result: dict) -> None:
         f"for scope='{scope_path}' — root_hash may lag behind scope state. "
         f"Investigate S3 / DB connectivity."
     )
+    return ""
 
 
 def _record_project_view_index(
@@ -378,10 +490,70 @@ def _record_project_view_index(
     )
 
 
+def _record_project_view_index_batch(
+    *,
+    repo,
+    entries: list[tuple[dict, dict]],
+    project_root_hash: str,
+) -> None:
+    """Index several scope commits against one project view, in one write.
+
+    Every commit maps to the single project-view commit for
+    ``project_root_hash`` (built on demand, parented on the latest view),
+    except commits whose own tree already is the project root.
+    """
+
+    if not hasattr(repo, "record_version_index"):
+        return
+
+    view_commit_id = ""
+    rows: list[dict] = []
+    for result, entry in entries:
+        commit_id = result["commit_id"]
+        try:
+            source_tree = commit_tree_id(repo, commit_id)
+        except Exception:
+            source_tree = ""
+        if source_tree == project_root_hash:
+            project_view_commit_id = commit_id
+        else:
+            if not view_commit_id:
+                parent = ""
+                if hasattr(repo, "get_latest_project_view_commit_id"):
+                    parent = repo.get_latest_project_view_commit_id() or ""
+                parent = git_compatible_head_commit(repo, parent) if parent else ""
+                latest_result, latest_entry = entries[-1]
+                view_commit_id = build_git_commit(
+                    repo,
+                    tree_sha=project_root_hash,
+                    parent_sha=parent,
+                    who="puppyone-project-view",
+                    message=f"Puppyone project view for {latest_result['commit_id']}",
+                    created_at_iso=latest_entry.get("created_at") or latest_entry.get("time") or "",
+                )
+            project_view_commit_id = view_commit_id
+        rows.append({
+            "scope_path": (entry.get("scope_path") or "").strip("/"),
+            "source_commit_id": commit_id,
+            "source_scope_hash": result.get("root", ""),
+            "project_root_hash": project_root_hash,
+            "project_view_commit_id": project_view_commit_id,
+        })
+
+    record_bulk = getattr(repo, "record_version_index_bulk", None)
+    if callable(record_bulk):
+        record_bulk(rows)
+        return
+    for row in rows:
+        repo.record_version_index(**row)
+
+
 def _build_root_from_scope_state(
     repo,
     just_pushed_scope: str,
     just_pushed_hash: str,
+    *,
+    base_root: str = "",
 ) -> str:
     """Build a complete root tree from DB scope state + the just-pushed hash.
 
@@ -395,16 +567,19 @@ def _build_root_from_scope_state(
         3. Use the root scope's tree as the base — it carries any
            non-scope files (e.g. a top-level README.md). If root scope
            has never been pushed, start from the empty git tree.
-        4. Overlay each non-root scope using :func:`_graft_subtree` (a
-           local reimplementation; ``mut.server.graft`` was removed in
-           the feat/git-format-storage refactor since the upstream
-           server no longer needs scope-grafting). Sort by path depth
-           so parents are grafted before children.
+        4. Overlay each non-root scope in one multi-path pass
+           (``root_projection.graft_subtrees``, equivalent to grafting them one by one
+           with :func:`_graft_subtree` by path depth, parents first).
+
+    When ``base_root`` was built by this process, only the scopes that
+    changed since are grafted onto it (see ``root_projection``).
 
     Raises on S3 read/write failure (no silent fallback). Callers
     decide whether to retry.
     """
-    return build_root_from_scope_state(repo, just_pushed_scope, just_pushed_hash)
+    return build_root_from_scope_state(
+        repo, just_pushed_scope, just_pushed_hash, base_root=base_root,
+    )
 
 
 # ── Local graft helpers (replaces removed mut.server.graft) ───────
@@ -27,8 +27,13 @@ Usage:
 
 from __future__ import annotations
 
+import hashlib
+import os
+import zlib
 from dataclasses import dataclass, field
+from typing import BinaryIO
 
+from src.mut_engine.application.scope_trie import ScopeTrie, get_scope_trie
 from src.mut_engine.application.transaction_engine import GitNativeTransactionEngine
 from src.mut_engine.domain.intents import OperationWriteIntent
 from src.mut_engine.server.repo_manager import MutRepoManager
@@ -44,6 +49,9 @@ from src.mut_engine.services.tree_splice import (
     splice_touch,
 )
 
+# Read size when staging a file-backed blob
+_STAGE_CHUNK_BYTES = 1024 * 1024
+
 
 @dataclass
 class WriteResult:
@@ -574,6 +582,40 @@ class MutOps:
             blob_hash = await asyncio.to_thread(store.put, content)
         return BlobRef(hash=blob_hash, size=len(content))
 
+    async def stage_blob_from_file(
+        self,
+        project_id: str,
+        fileobj: BinaryIO,
+    ) -> BlobRef:
+        """Stage the whole of a seekable file (e.g. an ``UploadFile``
+        Starlette spooled to disk) as a blob without reading it into
+        memory.
+
+        One pass over the file computes the Git object id and deflates
+        the loose object into a temp file; the backend then uploads that
+        file part by part and skips the upload when the object already
+        exists. Peak memory is a chunk plus one multipart part, whatever
+        the file size. Stores whose backend cannot take a file fall back
+        to ``stage_blob_from_bytes``.
+        """
+        import asyncio
+        import tempfile
+
+        repo = self._repos.get_server_repo(project_id)
+        backend = getattr(repo.store, "_backend", None)
+        put_file = getattr(backend, "async_put_file", None)
+        if not callable(put_file):
+            fileobj.seek(0)
+            content = await asyncio.to_thread(fileobj.read)
+            return await self.stage_blob_from_bytes(project_id, content)
+
+        with tempfile.TemporaryFile() as spool:
+            blob_hash, size, stored_size = await asyncio.to_thread(
+                _spool_loose_blob, fileobj, spool,
+            )
+            await put_file(blob_hash, spool, stored_size)
+        return BlobRef(hash=blob_hash, size=size)
+
     async def bulk_write_refs(
         self,
         project_id: str,
@@ -814,6 +856,14 @@ class MutOps:
             limit=limit,
         )
 
+    def open_file(self, project_id: str, path: str):
+        return self._reader.open_file(project_id, path.strip("/"))
+
+    def open_file_in_scope(self, project_id: str, scope: str, path: str):
+        return self._reader.open_file_in_scope(
+            project_id, scope.strip("/"), path.strip("/"),
+        )
+
     def list_dir(
         self, project_id: str, path: str = "", *, include_size: bool = False
     ) -> list[MutEntry]:
@@ -1023,24 +1073,16 @@ class MutOps:
         subtree, so graft preserves the write.
         """
         clean = validate_path(path)
+        trie = self._scope_trie(project_id)
+        if trie is None:
+            return "", clean
+        return trie.route(clean)
+
+    def _scope_trie(self, project_id: str) -> ScopeTrie | None:
         try:
-            repo = self._repos.get_server_repo(project_id)
-            scopes = [
-                (scope_path or "").strip("/")
-                for scope_path in repo.get_all_scope_hashes().keys()
-            ]
+            return get_scope_trie(self._repos.get_server_repo(project_id))
         except Exception:
-            scopes = []
-
-        candidates = [
-            scope_path
-            for scope_path in scopes
-            if scope_path and clean.startswith(scope_path + "/")
-        ]
-        scope_path = max(candidates, key=len) if candidates else ""
-        if not scope_path:
-            return "", clean
-        return scope_path, clean[len(scope_path) + 1:]
+            return None
 
     def _resolve_write_target(
         self, project_id: str, path: str, explicit_scope: str,
@@ -1068,9 +1110,11 @@ class MutOps:
         """
         if not paths:
             return {}
+        trie = self._scope_trie(project_id)
         groups: dict[str, list[str]] = {}
         for p in paths:
-            scope_path, rel_path = self._select_write_scope(project_id, p)
+            clean = validate_path(p)
+            scope_path, rel_path = trie.route(clean) if trie else ("", clean)
             groups.setdefault(scope_path, []).append(rel_path)
         return groups
 
@@ -1090,6 +1134,28 @@ class MutOps:
 # ══════════════════════════════════════════════════
 
 
+def _spool_loose_blob(fileobj: BinaryIO, spool: BinaryIO) -> tuple[str, int, int]:
+    """Write ``fileobj`` to ``spool`` as a Git loose blob.
+
+    Returns ``(object id, content size, loose object size)``.
+    """
+    size = fileobj.seek(0, os.SEEK_END)
+    fileobj.seek(0)
+    header = b"blob %d\0" % size
+    hasher = hashlib.sha1(header)
+    deflater = zlib.compressobj()
+    spool.write(deflater.compress(header))
+    read = 0
+    while chunk := fileobj.read(_STAGE_CHUNK_BYTES):
+        hasher.update(chunk)
+        spool.write(deflater.compress(chunk))
+        read += len(chunk)
+    if read != size:
+        raise ValueError(f"file changed while staging ({read} of {size} bytes read)")
+    spool.write(deflater.flush())
+    return hasher.hexdigest(), size, spool.tell()
+
+
 def _to_result(
     raw,
     paths: list[str] | None = None,
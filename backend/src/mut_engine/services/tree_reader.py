@@ -15,6 +15,7 @@ from mut.core.protocol import normalize_path
 
 from src.infra.file_formats import detect_mime, detect_node_type
 from src.mut_engine.server.repo_manager import MutRepoManager
+from src.mut_engine.services.blob_reader import BlobSource, open_blob
 from src.mut_engine.services.object_compat import read_blob_compat, read_tree_compat
 from src.utils.logger import log_error
 
@@ -22,7 +23,7 @@ from src.utils.logger import log_error
 # many existing imports of `tree_reader.detect_type` keep working.
 # All format knowledge lives in `src.infra.file_formats`.
 detect_type = detect_node_type
-__all__ = ["detect_type", "detect_mime", "MutBlobRead", "MutEntry", "MutTreeReader"]
+__all__ = ["detect_type", "detect_mime", "BlobSource", "MutBlobRead", "MutEntry", "MutTreeReader"]
 
 
 _ENTRYPOINT_FILE_NAMES = {"readme.md", "start here.md"}
@@ -152,23 +153,28 @@ class MutTreeReader:
         blob_hash = self._resolve_blob(repo.store, root_hash, normalize_path(path))
         if not blob_hash:
             raise FileNotFoundError(f"File not found: {path}")
+        return self._read_blob_range(repo.store, blob_hash, start=start, limit=limit)
 
-        content = read_blob_compat(repo.store, blob_hash)
-        if start <= 0 and limit is None:
-            return MutBlobRead(
-                content=content,
-                total_size=len(content),
-                content_hash=blob_hash,
-                ranged=False,
-            )
-        safe_start = max(0, start)
-        end = len(content) if limit is None else min(len(content), safe_start + limit)
-        return MutBlobRead(
-            content=content[safe_start:end],
-            total_size=len(content),
-            content_hash=blob_hash,
-            ranged=safe_start > 0 or limit is not None,
-        )
+    def open_file_in_scope(
+        self,
+        project_id: str,
+        scope_path: str,
+        path: str,
+    ) -> BlobSource:
+        """Open a scope-relative file for streamed / ranged reads (caller closes)."""
+
+        try:
+            repo = self._repos.get_server_repo(project_id)
+            root_hash = repo.get_scope_hash(normalize_path(scope_path)) or ""
+        except Exception as e:
+            raise FileNotFoundError(f"Project {project_id} is not initialized: {e}")
+        if not root_hash:
+            raise FileNotFoundError(f"Scope {scope_path!r} has no content")
+
+        blob_hash = self._resolve_blob(repo.store, root_hash, normalize_path(path))
+        if not blob_hash:
+            raise FileNotFoundError(f"File not found: {path}")
+        return open_blob(repo.store, blob_hash)
 
     def stat_in_scope(
         self,
@@ -379,25 +385,45 @@ class MutTreeReader:
         blob_hash = self._resolve_blob(repo.store, root_hash, path)
         if not blob_hash:
             raise FileNotFoundError(f"File not found: {path}")
+        return self._read_blob_range(repo.store, blob_hash, start=start, limit=limit)
+
+    def open_file(self, project_id: str, path: str) -> BlobSource:
+        """Open a file at the project head for streamed / ranged reads (caller closes)."""
+        try:
+            repo = self._repos.get_repo(project_id)
+            root_hash = repo.history.get_root_hash()
+        except Exception as e:
+            raise FileNotFoundError(f"Project {project_id} is not initialized: {e}")
+        if not root_hash:
+            raise FileNotFoundError(f"Project {project_id} has no content")
 
+        blob_hash = self._resolve_blob(repo.store, root_hash, path)
+        if not blob_hash:
+            raise FileNotFoundError(f"File not found: {path}")
+        return open_blob(repo.store, blob_hash)
+
+    @staticmethod
+    def _read_blob_range(
+        store: ObjectStore, blob_hash: str, *, start: int, limit: int | None
+    ) -> MutBlobRead:
         if start <= 0 and limit is None:
-            content = read_blob_compat(repo.store, blob_hash)
+            content = read_blob_compat(store, blob_hash)
             return MutBlobRead(
                 content=content,
                 total_size=len(content),
                 content_hash=blob_hash,
                 ranged=False,
             )
-
-        content = read_blob_compat(repo.store, blob_hash)
+        # Ranged: large blobs are served from the inflated host cache (or
+        # S3 ranged GETs for raw legacy blobs) instead of a full decode
         safe_start = max(0, start)
-        end = len(content) if limit is None else min(len(content), safe_start + limit)
-        return MutBlobRead(
-            content=content[safe_start:end],
-            total_size=len(content),
-            content_hash=blob_hash,
-            ranged=safe_start > 0 or limit is not None,
-        )
+        with open_blob(store, blob_hash) as blob:
+            return MutBlobRead(
+                content=blob.read(safe_start, limit),
+                total_size=blob.total_size,
+                content_hash=blob_hash,
+                ranged=True,
+            )
 
     def stat(
         self, project_id: str, path: str, *, include_size: bool = False
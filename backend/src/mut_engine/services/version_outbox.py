@@ -2,64 +2,179 @@
 
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional
 
 from src.config import settings
 from src.infra.supabase.client import SupabaseClient
 from src.mut_engine.dependencies import get_repo_manager_standalone
-from src.mut_engine.services.hooks import run_post_push_hook
+from src.mut_engine.services.hooks import run_post_push_batch, run_post_push_hook
 from src.utils.logger import log_error, log_info, log_warning
 
 
+@dataclass
+class OutboxBatchStats:
+    """What one outbox pass did, plus how far behind the queue is."""
+    claimed: int = 0
+    processed: int = 0
+    failed: int = 0
+    projects: int = 0
+    elapsed_seconds: float = 0.0
+    # Age of the oldest row still unprocessed after the pass (None = unknown)
+    oldest_pending_age_seconds: Optional[float] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.processed / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "claimed": self.claimed,
+            "processed": self.processed,
+            "failed": self.failed,
+            "projects": self.projects,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 2),
+            "oldest_pending_age_seconds": self.oldest_pending_age_seconds,
+        }
+
+
 def process_version_outbox_batch(
     *,
     repo_manager=None,
     client=None,
     limit: int | None = None,
 ) -> int:
-    """Claim and replay pending version outbox rows.
+    """Claim and replay pending version outbox rows; returns rows processed.
 
     The synchronous post-commit hook gives Git clients read-your-write
     behavior. This worker is the durable repair path when projection,
     notification, or version-index work failed after the DB publish.
     """
 
+    return run_version_outbox_batch(
+        repo_manager=repo_manager, client=client, limit=limit,
+    ).processed
+
+
+def run_version_outbox_batch(
+    *,
+    repo_manager=None,
+    client=None,
+    limit: int | None = None,
+) -> OutboxBatchStats:
+    """``process_version_outbox_batch`` with lag / throughput stats.
+
+    Claimed rows are grouped by project. A project with several rows is
+    replayed through ``run_post_push_batch`` — one root projection for the
+    newest scope state and one bulk version-index write — rather than a full
+    hook per row. The claim RPC returns rows in no particular order, so each
+    project's rows are sorted by ``(created_at, id)`` first; the batch hook
+    grafts the last one as the newest. Distinct projects run concurrently, up to
+    ``MUT_VERSION_OUTBOX_PROJECT_CONCURRENCY``. All rows of a project
+    succeed or fail (and are retried) together.
+    """
+
+    stats = OutboxBatchStats()
     if not settings.MUT_VERSION_OUTBOX_ENABLED:
-        return 0
+        return stats
 
+    started = time.monotonic()
     db = client or SupabaseClient().client
     repos = repo_manager or get_repo_manager_standalone()
     rows = _claim_rows(db, limit or settings.MUT_VERSION_OUTBOX_BATCH_SIZE)
-    processed = 0
+    stats.claimed = len(rows)
 
+    groups: dict[str, list[dict[str, Any]]] = {}
     for row in rows:
-        row_id = row.get("id")
-        try:
-            payload = row.get("payload") or {}
-            project_id = row["project_id"]
-            commit_id = row["commit_id"]
-            run_post_push_hook(
-                project_id,
-                repos,
-                {
-                    "status": "ok",
-                    "commit_id": commit_id,
-                    "root": payload.get("scope_hash", ""),
-                    "merged": bool(payload.get("merged", False)),
-                    "conflicts": int(payload.get("conflicts") or 0),
-                },
-                raise_errors=True,
-            )
-            _complete_row(db, row_id)
-            processed += 1
-        except Exception as exc:
-            _fail_row(db, row_id, str(exc))
-            log_warning(f"[version-outbox] failed row {row_id}: {exc}")
+        project_id = row.get("project_id")
+        if not project_id or not row.get("commit_id"):
+            _fail_row(db, row.get("id"), "outbox row is missing project_id or commit_id")
+            stats.failed += 1
+            continue
+        groups.setdefault(project_id, []).append(row)
+    for project_rows in groups.values():
+        project_rows.sort(key=_row_order)
+    stats.projects = len(groups)
 
-    if processed:
-        log_info(f"[version-outbox] processed {processed} rows")
-    return processed
+    if groups:
+        workers = max(1, min(settings.MUT_VERSION_OUTBOX_PROJECT_CONCURRENCY, len(groups)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="version-outbox") as pool:
+            outcomes = list(pool.map(
+                lambda item: _replay_project(repos, item[0], item[1]),
+                groups.items(),
+            ))
+        for project_rows, error in outcomes:
+            for row in project_rows:
+                if error is None:
+                    _complete_row(db, row.get("id"))
+                    stats.processed += 1
+                else:
+                    _fail_row(db, row.get("id"), error)
+                    stats.failed += 1
+
+    stats.elapsed_seconds = time.monotonic() - started
+    stats.oldest_pending_age_seconds = _oldest_pending_age_seconds(db)
+    if stats.claimed:
+        lag = stats.oldest_pending_age_seconds
+        log_info(
+            f"[version-outbox] processed {stats.processed}/{stats.claimed} rows "
+            f"across {stats.projects} projects "
+            f"({stats.rows_per_second:.1f} rows/s, oldest pending "
+            f"{'unknown' if lag is None else f'{lag:.0f}s'})"
+        )
+    return stats
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _row_order(row: dict[str, Any]) -> tuple[datetime, int]:
+    """Outbox insertion order: ``created_at``, then the identity ``id``."""
+    created = _parse_timestamp(row.get("created_at"))
+    return (created or datetime.min.replace(tzinfo=timezone.utc), int(row.get("id") or 0))
+
+
+def _push_result(row: dict[str, Any]) -> dict[str, Any]:
+    payload = row.get("payload") or {}
+    return {
+        "status": "ok",
+        "commit_id": row["commit_id"],
+        "root": payload.get("scope_hash", ""),
+        "merged": bool(payload.get("merged", False)),
+        "conflicts": int(payload.get("conflicts") or 0),
+    }
+
+
+def _replay_project(
+    repos, project_id: str, rows: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """Run the post-commit hook for one project's rows; returns (rows, error)."""
+    try:
+        if len(rows) == 1:
+            run_post_push_hook(project_id, repos, _push_result(rows[0]), raise_errors=True)
+        else:
+            run_post_push_batch(
+                project_id, repos, [_push_result(row) for row in rows], raise_errors=True,
+            )
+        return rows, None
+    except Exception as exc:
+        log_warning(
+            f"[version-outbox] failed {len(rows)} rows for project {project_id}: {exc}"
+        )
+        return rows, str(exc)
 
 
 def complete_version_outbox_for_commit(
@@ -124,3 +239,26 @@ def _fail_row(client, row_id, error: str) -> None:
         "fail_mut_version_outbox",
         {"p_id": row_id, "p_error": error[:2000]},
     ).execute()
+
+
+def _oldest_pending_age_seconds(client) -> Optional[float]:
+    """Age of the oldest unprocessed row (served by the unprocessed index)."""
+    try:
+        resp = (
+            client.table("mut_version_outbox")
+            .select("created_at")
+            .is_("processed_at", "null")
+            .order("created_at")
+            .limit(1)
+            .execute()
+        )
+        rows = resp.data or []
+        if not rows:
+            return 0.0
+        created = _parse_timestamp(rows[0]["created_at"])
+        if created is None:
+            return None
+        return max(0.0, (datetime.now(timezone.utc) - created).total_seconds())
+    except Exception as exc:
+        log_warning(f"[version-outbox] lag query failed: {exc}")
+        return None
@@ -24,6 +24,8 @@ a follow-up).
 """
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -35,6 +37,9 @@ from src.repo.github_integration.repository import (
 from src.repo.github_integration.schemas import GithubSyncRunResult
 from src.utils.logger import log_error, log_info
 
+# Blobs read concurrently per batch while uploading
+_EXPORT_READ_BATCH = 16
+
 
 async def export_to_branch(
     integration: dict, *,
@@ -97,9 +102,9 @@ async def _do_export(
 ) -> GithubSyncRunResult:
     integration_id = integration["id"]
 
-    # 1. List the MUT scope's current contents.
-    files = await _list_scope_files(project_id)
-    if not files:
+    # 1. List the MUT scope's current paths (blob hashes only).
+    file_hashes = await _list_scope_file_hashes(project_id)
+    if not file_hashes:
         msg = "MUT scope is empty — nothing to export"
         await sync_log.record(
             integration_id, direction="export", status="failed",
@@ -116,9 +121,9 @@ async def _do_export(
     parent_sha = branch_info["commit"]["sha"]
     base_tree_sha = branch_info["commit"]["commit"]["tree"]["sha"]
 
-    # 3. Upload every file as a blob.
+    # 3. Upload every file as a blob, reading a few blobs at a time.
     tree_entries: list[dict] = []
-    for path, content in files.items():
+    async for path, content in _iter_scope_blobs(project_id, file_hashes):
         blob_sha = await api.create_blob(owner, repo_name, content)
         tree_entries.append({
             "path": path, "mode": "100644", "type": "blob", "sha": blob_sha,
@@ -168,30 +173,41 @@ async def _do_export(
     )
 
 
-async def _list_scope_files(project_id: str) -> dict[str, bytes]:
-    """Walk the MUT root scope and return ``{path: bytes}``.
+async def _list_scope_file_hashes(project_id: str) -> dict[str, str]:
+    """Walk the MUT root scope and return ``{path: blob_hash}``.
 
-    Uses ``tree_to_flat`` directly off the project's current root_hash
-    so we don't have to instantiate per-file readers.
+    Walks the project's current root_hash level by level; no blob is
+    read here, so memory is bounded by the path listing.
     """
-    import asyncio
-    from mut.core.tree import tree_to_flat
+    from src.mut_engine.application.tree_objects import parallel_tree_to_flat
 
     repo_manager = get_repo_manager_standalone()
     repo = repo_manager.get_server_repo(project_id)
     root_hash = await asyncio.to_thread(repo.get_root_hash) or ""
     if not root_hash:
         return {}
+    return await asyncio.to_thread(parallel_tree_to_flat, repo.store, root_hash)
+
+
+async def _iter_scope_blobs(
+    project_id: str, file_hashes: dict[str, str],
+) -> AsyncIterator[tuple[str, bytes]]:
+    """Async view of ``tree_objects.iter_blobs`` over the project's store.
+
+    Each step of the sync generator (one concurrent batch read, then its
+    items) runs in a worker thread, so the event loop never blocks on S3.
+    """
+    from src.mut_engine.application.tree_objects import iter_blobs
 
-    flat = await asyncio.to_thread(tree_to_flat, repo.store, root_hash)
-    files: dict[str, bytes] = {}
-    for path, blob_hash in flat.items():
-        # Skip the .gitignore that ``mut init`` writes if it's just
-        # the ``.mut/`` line — pushing it back to GitHub gives users
-        # a confusing dangling line in their gitignore.
-        content = await asyncio.to_thread(repo.store.get, blob_hash)
-        files[path] = content
-    return files
+    repo_manager = get_repo_manager_standalone()
+    store = repo_manager.get_server_repo(project_id).store
+    blobs = iter_blobs(store, file_hashes.items(), batch_size=_EXPORT_READ_BATCH)
+    done = object()
+    try:
+        while (item := await asyncio.to_thread(next, blobs, done)) is not done:
+            yield item
+    finally:
+        await asyncio.to_thread(blobs.close)
 
 
 def _local_head_commit_id(project_id: str) -> str:
@@ -15,6 +15,7 @@ import secrets
 from typing import Optional
 
 from src.exceptions import AppException, BusinessException, ErrorCode, NotFoundException
+from src.mut_engine.application.scope_trie import invalidate_scope_trie
 from src.repo.models import RepoScope
 from src.repo.scope_repository import RepoScopeRepository
 from src.utils.logger import log_info, log_warning
@@ -117,7 +118,7 @@ class ScopeService:
                     ),
                 )
 
-        return self._repo.insert(
+        scope = self._repo.insert(
             project_id=project_id,
             name=name,
             path=canonical,
@@ -126,6 +127,8 @@ class ScopeService:
             is_root=False,
             access_key=_mint_access_key(),
         )
+        invalidate_scope_trie(project_id)
+        return scope
 
     def ensure_root_scope(self, project_id: str) -> RepoScope:
         """Idempotent: returns the existing root scope, or creates one if
@@ -136,7 +139,7 @@ class ScopeService:
         if existing:
             return existing
         log_info(f"[scope] auto-creating root scope for project={project_id}")
-        return self._repo.insert(
+        scope = self._repo.insert(
             project_id=project_id,
             name="Root",
             path="",
@@ -145,6 +148,8 @@ class ScopeService:
             is_root=True,
             access_key=_mint_access_key(),
         )
+        invalidate_scope_trie(project_id)
+        return scope
 
     def update(
         self,
@@ -156,7 +161,10 @@ class ScopeService:
     ) -> Optional[RepoScope]:
         # `path` is intentionally not in the update signature — renaming a
         # scope's path means deleting + recreating, by design.
-        return self._repo.update(scope_id, name=name, exclude=exclude, mode=mode)
+        scope = self._repo.update(scope_id, name=name, exclude=exclude, mode=mode)
+        if scope is not None:
+            invalidate_scope_trie(scope.project_id)
+        return scope
 
     def regenerate_access_key(self, scope_id: str) -> Optional[str]:
         new_key = _mint_access_key()
@@ -188,6 +196,7 @@ class ScopeService:
                 ),
             )
         self._repo.delete(scope_id)
+        invalidate_scope_trie(scope.project_id)
 
     # ── Auto-suggest ─────────────────────────────────────────────────────
 
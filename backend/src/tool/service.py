@@ -109,6 +109,7 @@ class ToolService:
     def _invalidate_bound_agents_mcp(self, tool_id: str) -> None:
         """
         Best-effort: when a tool changes, notify all Agents bound to this tool to invalidate their MCP cache.
+        Also drops the in-process resolved agent configs that reference the tool.
 
         Based on the connection_tool table structure:
         - Find all connection_tool records bound to this tool
@@ -116,6 +117,9 @@ class ToolService:
         - Invalidate MCP cache
         """
         from src.connectors.agent.config.repository import AgentRepository
+        from src.connectors.agent.config.resolved_cache import get_resolved_agent_cache
+
+        get_resolved_agent_cache().invalidate_tool(tool_id)
 
         try:
             response = self._get_supabase_repository()._client.table("access_tools").select("access_point_id").eq("tool_id", tool_id).execute()
@@ -163,6 +167,9 @@ class ToolService:
         in the same connection (Agent or MCP).
         """
         from src.connectors.agent.config.repository import AgentRepository
+        from src.connectors.agent.config.resolved_cache import get_resolved_agent_cache
+
+        get_resolved_agent_cache().invalidate_tool(tool_id)
 
         try:
             response = self._get_supabase_repository()._client.table("access_tools").select("access_point_id").eq("tool_id", tool_id).execute()
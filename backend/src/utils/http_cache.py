@@ -0,0 +1,63 @@
+"""
+HTTP validators for read endpoints.
+
+MUT blobs are content-addressed, so a blob hash is a natural strong ETag
+for byte-serving endpoints; tag with the hash the read already resolved
+rather than walking the tree a second time. Bodies that also depend on
+other state fold it into the tag with ``compute_etag``'s variants.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# Path-addressed reads: cacheable, but revalidated on every use
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+# Content-pinned URLs (signed with the blob hash): never change
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def compute_etag(object_hash: str, *variant: object) -> str:
+    """Strong ETag for ``object_hash``, extended by anything else the body depends on."""
+    if not variant:
+        return f'"{object_hash}"'
+    payload = json.dumps(
+        [object_hash, *variant], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return f'"{hashlib.sha1(payload.encode("utf-8")).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """``If-None-Match`` check (weak comparison, as RFC 9110 specifies for it)."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def not_modified_response(
+    request: Request, etag: str, cache_control: str = REVALIDATE_CACHE_CONTROL
+) -> Response | None:
+    """A 304 for ``request`` if its ``If-None-Match`` matches ``etag``, else None."""
+    if not etag_matches(request.headers.get("if-none-match"), etag):
+        return None
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+def set_validator(
+    response: Response, etag: str, cache_control: str = REVALIDATE_CACHE_CONTROL
+) -> None:
+    if etag:
+        response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
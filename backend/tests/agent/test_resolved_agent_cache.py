@@ -0,0 +1,119 @@
+"""Tests for the resolved agent configuration cache."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.connectors.agent.config.models import Agent, AgentBash, AgentTool
+from src.connectors.agent.config.resolved_cache import ResolvedAgent, ResolvedAgentCache
+
+_NOW = datetime.now(timezone.utc)
+
+
+def _agent(agent_id: str = "a1", project_id: str = "p1", bash_path: str = "docs") -> Agent:
+    return Agent(
+        id=agent_id,
+        project_id=project_id,
+        name="agent",
+        created_at=_NOW,
+        updated_at=_NOW,
+        bash_accesses=[
+            AgentBash(id="b1", agent_id=agent_id, path=bash_path, readonly=False, created_at=_NOW),
+        ],
+        tools=[
+            AgentTool(id="t1", agent_id=agent_id, tool_id="tool-1", created_at=_NOW),
+        ],
+    )
+
+
+def _resolve(cache: ResolvedAgentCache, agent: Agent) -> ResolvedAgent:
+    resolved = ResolvedAgent(
+        agent=agent,
+        version=cache.version(agent.id),
+        bash_tools=[{"path": b.path, "readonly": b.readonly} for b in agent.bash_accesses],
+        search_tools={"search_kb": SimpleNamespace(path="kb/articles")},
+    )
+    assert cache.put(resolved)
+    return resolved
+
+
+def test_hit_until_agent_invalidated():
+    cache = ResolvedAgentCache()
+    resolved = _resolve(cache, _agent())
+
+    assert cache.get("a1") is resolved
+    cache.invalidate_agent("a1")
+    assert cache.get("a1") is None
+
+
+def test_stale_resolution_is_not_stored():
+    cache = ResolvedAgentCache()
+    agent = _agent()
+    version = cache.version("a1")
+    cache.invalidate_agent("a1")  # edit lands while the turn was resolving
+
+    assert not cache.put(ResolvedAgent(agent=agent, version=version))
+    assert cache.get("a1") is None
+
+
+def test_tool_edit_invalidates_bound_agents():
+    cache = ResolvedAgentCache()
+    _resolve(cache, _agent("a1"))
+    _resolve(cache, _agent("a2"))
+
+    cache.invalidate_tool("tool-1")
+
+    assert cache.get("a1") is None
+    assert cache.get("a2") is None
+
+
+def test_commit_invalidates_only_overlapping_paths():
+    cache = ResolvedAgentCache()
+    _resolve(cache, _agent("a1", bash_path="docs"))
+    _resolve(cache, _agent("a2", bash_path="reports"))
+    _resolve(cache, _agent("a3", project_id="p2", bash_path="docs"))
+
+    cache.invalidate_paths("p1", ["docs/readme.md"])
+    assert cache.get("a1") is None
+    assert cache.get("a2") is not None
+    assert cache.get("a3") is not None
+
+    # Search tool paths count as bound paths too
+    cache.invalidate_paths("p1", ["kb"])
+    assert cache.get("a2") is None
+
+
+def test_entries_expire_after_ttl():
+    cache = ResolvedAgentCache(ttl=0)
+    _resolve(cache, _agent())
+
+    assert cache.get("a1") is None
+
+
+def test_access_revocation_applies_on_next_turn_despite_cached_config(monkeypatch):
+    import pytest
+
+    from src.connectors.agent import service as agent_service
+
+    cache = ResolvedAgentCache()
+    monkeypatch.setattr(agent_service, "get_resolved_agent_cache", lambda: cache)
+
+    class _Config:
+        def __init__(self):
+            self.members = {"u1"}
+            self.loads = 0
+
+        def get_agent(self, agent_id):
+            self.loads += 1
+            return _agent(agent_id)
+
+        def verify_access(self, agent_id, user_id):
+            return user_id in self.members
+
+    config = _Config()
+    svc = agent_service.AgentService.__new__(agent_service.AgentService)
+    assert svc._resolve_agent("a1", "u1", config).agent.id == "a1"
+
+    config.members.clear()  # membership removed; nothing invalidates the cache
+    with pytest.raises(PermissionError):
+        svc._resolve_agent("a1", "u1", config)
+    assert config.loads == 1  # the agent config itself is still served from cache
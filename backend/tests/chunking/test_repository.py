@@ -1,7 +1,12 @@
 from unittest.mock import Mock
 
 from src.infra.chunking.config import ChunkingConfig
-from src.infra.chunking.repository import ChunkRepository, ensure_chunks_for_pointer
+from src.infra.chunking.repository import (
+    ChunkRepository,
+    ensure_chunks_for_pointer,
+    ensure_chunks_for_pointers,
+)
+from src.infra.chunking.service import compute_content_hash
 
 
 def _mock_supabase_insert_response(rows):
@@ -128,3 +133,61 @@ def test_ensure_chunks_creates_when_missing():
     assert len(res.chunks) == 2
     assert res.chunks[0].chunk_index == 0
     assert res.chunks[1].chunk_index == 1
+
+
+def _chunk_row(cid, path, pointer, content_hash, index=0, total=1, text="x"):
+    return {
+        "id": cid,
+        "created_at": "2026-01-11T00:00:00Z",
+        "updated_at": "2026-01-11T00:00:00Z",
+        "path": path,
+        "json_pointer": pointer,
+        "chunk_index": index,
+        "total_chunks": total,
+        "chunk_text": text,
+        "char_start": 0,
+        "char_end": len(text),
+        "content_hash": content_hash,
+        "turbopuffer_namespace": None,
+        "turbopuffer_doc_id": None,
+    }
+
+
+def test_ensure_chunks_batch_one_lookup_and_one_insert():
+    client = Mock()
+    table = Mock()
+    client.table.return_value = table
+    for name in ("select", "in_", "order", "range"):
+        getattr(table, name).return_value = table
+
+    hash_a = compute_content_hash("alpha")
+    hash_b = compute_content_hash("beta")
+    # The lookup also returns a row for the same hash at another pointer: not a match
+    lookup = _mock_supabase_select_response(
+        [
+            _chunk_row(1, "doc", "/a", hash_a, text="alpha"),
+            _chunk_row(2, "doc", "/other", hash_b, text="beta"),
+        ]
+    )
+    inserted = []
+
+    def insert_side_effect(payload):
+        inserted.append(payload)
+        return table
+
+    table.insert.side_effect = insert_side_effect
+    insert_resp = _mock_supabase_insert_response(
+        [_chunk_row(5, "doc", "/b", hash_b, text="beta")]
+    )
+    table.execute.side_effect = [lookup, insert_resp]
+
+    res = ensure_chunks_for_pointers(
+        repo=ChunkRepository(client),
+        nodes=[("doc", "/b", "beta"), ("doc", "/a", "alpha")],
+    )
+
+    assert [(r.json_pointer, r.created) for r in res] == [("/b", True), ("/a", False)]
+    assert [c.id for c in res[0].chunks] == [5]
+    assert [c.id for c in res[1].chunks] == [1]
+    assert table.execute.call_count == 2
+    assert len(inserted) == 1 and [p["json_pointer"] for p in inserted[0]] == ["/b"]
@@ -181,3 +181,20 @@ def test_revoke_then_public_get_404_even_if_cached(client: TestClient):
     assert resp3.status_code == 404
 
 
+
+
+def test_public_get_revalidates_with_etag(client: TestClient):
+    resp = client.post("/api/v1/publishes/", json={"table_id": "123", "json_path": ""})
+    publish_key = resp.json()["data"]["publish_key"]
+
+    first = client.get(f"/p/{publish_key}")
+    etag = first.headers["etag"]
+    assert "must-revalidate" in first.headers["cache-control"]
+
+    # 内容未变：304，无响应体
+    again = client.get(f"/p/{publish_key}", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+
+    other = client.get(f"/p/{publish_key}", headers={"If-None-Match": '"stale"'})
+    assert other.status_code == 200
@@ -0,0 +1,18 @@
+from src.utils.http_cache import compute_etag, etag_matches
+
+
+def test_compute_etag_is_the_hash_or_a_digest_of_its_variant():
+    assert compute_etag("abc123") == '"abc123"'
+    a = compute_etag("abc123", "cat", "c1", {"path": "docs"}, True)
+    assert a == compute_etag("abc123", "cat", "c1", {"path": "docs"}, True)
+    assert a != compute_etag("abc123", "cat", "c2", {"path": "docs"}, True)
+    assert a != compute_etag("abc123", "cat", "c1", {"path": "docs"}, False)
+
+
+def test_etag_matches_lists_weak_tags_and_wildcard():
+    etag = '"abc"'
+    assert etag_matches('"x", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"abcd"', etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches("*", "")
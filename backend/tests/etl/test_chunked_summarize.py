@@ -0,0 +1,81 @@
+"""chunked-summarize map-reduce: concurrency, reduction and chunk cache."""
+
+import asyncio
+
+import pytest
+
+from src.infra.llm.schemas import TextModelResponse
+from src.ingest.file.config import etl_config
+from src.ingest.file.jobs.summarize import summarize_chunked
+from src.ingest.file.state.chunk_cache import ChunkSummaryCacheRedis
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value.encode("utf-8")
+
+
+class FakeLLM:
+    def __init__(self, summary_len: int = 10):
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.summary_len = summary_len
+
+    async def call_text_model(self, prompt, system_prompt=None, response_format="text"):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return TextModelResponse(
+            content="s" * self.summary_len, model="fake", usage={}, finish_reason="stop"
+        )
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(etl_config, "etl_postprocess_chunk_size_chars", 100)
+    monkeypatch.setattr(etl_config, "etl_postprocess_max_chunks", 50)
+    monkeypatch.setattr(etl_config, "etl_postprocess_chunk_concurrency", 3)
+    monkeypatch.setattr(etl_config, "etl_postprocess_chunk_threshold_chars", 10_000)
+
+
+def test_chunks_are_summarized_concurrently_and_cached(small_chunks):
+    markdown = "".join(f"{i:0100d}" for i in range(12))
+    cache = ChunkSummaryCacheRedis(FakeRedis(), key_prefix="t", ttl_seconds=60)
+    llm = FakeLLM()
+
+    text = asyncio.run(summarize_chunked(llm, markdown, rule_key="7", cache=cache))
+
+    assert llm.calls == 12
+    assert 1 < llm.max_in_flight <= 3
+    assert text.startswith("## Chunk 1 Summary\n") and "## Chunk 12 Summary" in text
+
+    # A retry of the same document skips every completed chunk
+    retry_llm = FakeLLM()
+    assert asyncio.run(summarize_chunked(retry_llm, markdown, rule_key="7", cache=cache)) == text
+    assert retry_llm.calls == 0
+
+    # Another rule does not share the cache
+    other_llm = FakeLLM()
+    asyncio.run(summarize_chunked(other_llm, markdown, rule_key="8", cache=cache))
+    assert other_llm.calls == 12
+
+
+def test_long_summaries_are_reduced_hierarchically(small_chunks, monkeypatch):
+    monkeypatch.setattr(etl_config, "etl_postprocess_chunk_threshold_chars", 500)
+    markdown = "x" * 100 * 40
+    llm = FakeLLM(summary_len=10)
+
+    text = asyncio.run(summarize_chunked(llm, markdown, rule_key="7"))
+
+    assert len(text) <= 500
+    assert text.startswith("## Section 1 Summary\n")
+    assert llm.calls > 40
@@ -0,0 +1,105 @@
+"""finalize_uploads_to_mut_batch: bulk task reads/writes instead of per-item round trips."""
+
+import asyncio
+
+from src.ingest.file.jobs import jobs
+from src.ingest.file.tasks.models import ETLTask, ETLTaskStatus
+from src.ingest.file.tasks.repository import ETLTaskRepositoryBase
+from src.mut_engine.services.ops import BlobRef
+
+
+class CountingRepo(ETLTaskRepositoryBase):
+    def __init__(self, tasks):
+        self.tasks = {t.task_id: t for t in tasks}
+        self.calls: list[str] = []
+
+    def create_task(self, task):
+        raise NotImplementedError
+
+    def get_task(self, task_id):
+        self.calls.append("get_task")
+        return self.tasks.get(task_id)
+
+    def get_tasks(self, task_ids):
+        self.calls.append("get_tasks")
+        return {t: self.tasks[t] for t in task_ids if t in self.tasks}
+
+    def update_task(self, task):
+        self.calls.append("update_task")
+        return task
+
+    def update_tasks(self, tasks):
+        self.calls.append("update_tasks")
+        return list(tasks)
+
+    def list_tasks(self, project_id=None, status=None, limit=100, offset=0):
+        return []
+
+    def count_tasks(self, project_id=None, status=None):
+        return 0
+
+    def delete_task(self, task_id):
+        return False
+
+
+class FakeStateRepo:
+    async def get(self, task_id):
+        return None
+
+    async def set(self, state, ttl_seconds=None):
+        pass
+
+    async def set_terminal(self, state):
+        pass
+
+
+class FakeOps:
+    def __init__(self):
+        self.refs = None
+
+    async def bulk_write_refs(self, project_id, file_refs, who, message="", verify_blobs=True):
+        self.refs = file_refs
+
+
+def _task(i, **metadata):
+    return ETLTask(
+        task_id=f"t{i}",
+        created_by="u1",
+        project_id="p1",
+        filename=f"f{i}.bin",
+        status=ETLTaskStatus.PENDING,
+        metadata={"s3_key": f"raw/f{i}.bin", "mount_path": f"docs/f{i}.bin", **metadata},
+    )
+
+
+def test_batch_finalize_uses_bulk_repository_calls(monkeypatch):
+    ops = FakeOps()
+    monkeypatch.setattr("src.mut_engine.dependencies.create_mut_ops", lambda: ops)
+
+    async def fake_stage(s3, *, project_id, src_key, hash_hint=None, size_hint=None):
+        if src_key == "raw/f2.bin":
+            raise RuntimeError("copy failed")
+        return BlobRef(hash=src_key, size=1)
+
+    monkeypatch.setattr(jobs, "stage_blob_from_s3", fake_stage)
+    tasks = [_task(i) for i in range(4)]
+    tasks[3].metadata.pop("mount_path")
+    repo = CountingRepo(tasks)
+
+    results = asyncio.run(
+        jobs.finalize_uploads_to_mut_batch(
+            task_ids=["t0", "t1", "t2", "t3", "missing"],
+            repo=repo,
+            s3=None,
+            state_repo=FakeStateRepo(),
+        )
+    )
+
+    by_id = {r["task_id"]: r for r in results}
+    assert by_id["t0"]["ok"] and by_id["t1"]["ok"]
+    assert not by_id["t2"]["ok"] and not by_id["t3"]["ok"]
+    assert by_id["missing"]["error"] == "task_not_found"
+    assert set(ops.refs) == {"docs/f0.bin", "docs/f1.bin"}
+    assert tasks[0].status == ETLTaskStatus.COMPLETED and tasks[0].path == "docs/f0.bin"
+    # one read, one write per failing phase, one write for the completions
+    assert repo.calls == ["get_tasks", "update_tasks", "update_tasks", "update_tasks"]
@@ -0,0 +1,202 @@
+"""OCR stage: submit/poll jobs and the content-hash result cache."""
+
+import asyncio
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+
+from src.ingest.file.jobs.jobs import _ocr_cache_key, etl_ocr_job, etl_ocr_poll_job
+from src.ingest.file.ocr.base import OCRProvider, OCRSubmission, ParsedDocument
+from src.ingest.file.state.models import ETLPhase
+from src.ingest.file.tasks.models import ETLTask, ETLTaskStatus
+
+
+SOURCE = b"%PDF-1.7 doc"
+SOURCE_HASH = hashlib.sha256(SOURCE).hexdigest()
+
+
+class FakeS3:
+    def __init__(self):
+        self.objects: dict[str, bytes] = {"raw/doc.pdf": SOURCE}
+
+    async def object_exists(self, key):
+        return key in self.objects
+
+    async def copy_object(self, src, dst):
+        self.objects[dst] = self.objects[src]
+
+    async def upload_file(self, key, content, content_type=None, metadata=None):
+        self.objects[key] = content
+
+    async def download_file_stream(self, key, chunk_size=8192):
+        data = self.objects[key]
+        for i in range(0, len(data), chunk_size):
+            yield data[i : i + chunk_size]
+
+    async def generate_presigned_download_url(self, key, expires_in=3600):
+        return f"https://s3/{key}"
+
+
+class FakeStateRepo:
+    def __init__(self):
+        self.states = {}
+
+    async def get(self, task_id):
+        return self.states.get(task_id)
+
+    async def set(self, state, ttl_seconds=None):
+        self.states[state.task_id] = state
+
+    async def set_terminal(self, state):
+        self.states[state.task_id] = state
+
+
+class FakeTaskRepo:
+    def __init__(self, task):
+        self.task = task
+
+    def get_task(self, task_id):
+        return self.task
+
+    def update_task(self, task):
+        self.task = task
+
+
+class FakeRedis:
+    def __init__(self):
+        self.jobs = []
+
+    async def enqueue_job(self, name, *args, **kwargs):
+        self.jobs.append((name, args, kwargs))
+        return SimpleNamespace(job_id=f"job-{len(self.jobs)}")
+
+
+class PollingProvider(OCRProvider):
+    def __init__(self, polls_until_done: int = 2):
+        self.remaining = polls_until_done
+        self.submitted = 0
+
+    @property
+    def name(self):
+        return "fake"
+
+    async def parse_document(self, file_url, data_id=None):
+        raise AssertionError("polling providers must not block in parse_document")
+
+    async def submit_document(self, file_url, data_id=None):
+        self.submitted += 1
+        return OCRSubmission(task_id="remote-1")
+
+    async def poll_document(self, provider_task_id):
+        self.remaining -= 1
+        if self.remaining > 0:
+            return None
+        return ParsedDocument(task_id=provider_task_id, markdown_content="# Parsed")
+
+    async def health_check(self):
+        return True
+
+
+class SyncProvider(OCRProvider):
+    def __init__(self, options=None):
+        self.options = options or {}
+        self.parsed = 0
+
+    @property
+    def name(self):
+        return "fake"
+
+    @property
+    def cache_options(self):
+        return self.options
+
+    async def parse_document(self, file_url, data_id=None):
+        self.parsed += 1
+        return ParsedDocument(task_id="sync-1", markdown_content="# Sync")
+
+    async def health_check(self):
+        return True
+
+
+@pytest.fixture
+def ctx():
+    task = ETLTask(
+        task_id="t1",
+        created_by="u1",
+        project_id="p1",
+        filename="doc.pdf",
+        rule_id=1,
+        metadata={"s3_key": "raw/doc.pdf", "sha256": "abc123"},
+        status=ETLTaskStatus.PENDING,
+    )
+    return {
+        "task_repository": FakeTaskRepo(task),
+        "s3_service": FakeS3(),
+        "ocr_provider": PollingProvider(),
+        "state_repo": FakeStateRepo(),
+        "redis": FakeRedis(),
+        "arq_queue_name": "etl",
+    }
+
+
+def test_submit_then_poll_releases_slot_and_enqueues_postprocess(ctx):
+    result = asyncio.run(etl_ocr_job(ctx, "t1"))
+    assert result["submitted"] == "remote-1"
+
+    # Each still-running poll re-enqueues itself with a deferral
+    name, args, kwargs = ctx["redis"].jobs[-1]
+    assert name == "etl_ocr_poll_job" and kwargs["_defer_by"] >= 1
+    assert asyncio.run(etl_ocr_poll_job(ctx, "t1"))["polling"] == 2
+
+    result = asyncio.run(etl_ocr_poll_job(ctx, "t1"))
+    assert result["ok"] and result["markdown_key"]
+    assert ctx["redis"].jobs[-1][0] == "etl_postprocess_job"
+    state = ctx["state_repo"].states["t1"]
+    assert state.phase == ETLPhase.POSTPROCESS
+    assert ctx["s3_service"].objects[_ocr_cache_key("fake", SOURCE_HASH)] == b"# Parsed"
+
+
+def test_cached_ocr_result_skips_provider(ctx):
+    ctx["s3_service"].objects[_ocr_cache_key("fake", SOURCE_HASH)] = b"# Cached"
+
+    result = asyncio.run(etl_ocr_job(ctx, "t1"))
+
+    assert ctx["ocr_provider"].submitted == 0
+    assert ctx["s3_service"].objects[result["markdown_key"]] == b"# Cached"
+    assert ctx["redis"].jobs[-1][0] == "etl_postprocess_job"
+
+
+def test_client_sha256_hint_does_not_select_cache_entry(ctx):
+    # Another tenant's document is cached under its real hash; this upload
+    # claims that hash but holds different bytes
+    other_hash = hashlib.sha256(b"someone else's contract").hexdigest()
+    ctx["s3_service"].objects[_ocr_cache_key("fake", other_hash)] = b"# Not yours"
+    ctx["task_repository"].task.metadata["sha256"] = other_hash
+
+    result = asyncio.run(etl_ocr_job(ctx, "t1"))
+
+    assert result["submitted"] == "remote-1"
+    assert ctx["ocr_provider"].submitted == 1
+    assert ctx["state_repo"].states["t1"].ocr_content_hash == SOURCE_HASH
+
+
+def test_provider_without_polling_parses_synchronously(ctx):
+    ctx["ocr_provider"] = SyncProvider()
+
+    result = asyncio.run(etl_ocr_job(ctx, "t1"))
+
+    assert ctx["ocr_provider"].parsed == 1
+    assert ctx["s3_service"].objects[result["markdown_key"]] == b"# Sync"
+    assert ctx["redis"].jobs[-1][0] == "etl_postprocess_job"
+
+
+def test_ocr_cache_is_keyed_by_provider_options(ctx):
+    ctx["s3_service"].objects[_ocr_cache_key("fake", SOURCE_HASH)] = b"# Default model"
+    ctx["ocr_provider"] = SyncProvider(options={"model": "other"})
+
+    asyncio.run(etl_ocr_job(ctx, "t1"))
+
+    assert ctx["ocr_provider"].parsed == 1
+    key = _ocr_cache_key("fake", SOURCE_HASH, {"model": "other"})
+    assert ctx["s3_service"].objects[key] == b"# Sync"
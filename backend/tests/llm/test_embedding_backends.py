@@ -0,0 +1,117 @@
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infra.llm import embedding_backends
+from src.infra.llm.embedding_backends import (
+    EmbeddingBackend,
+    LocalEmbeddingBackend,
+    fit_dimension,
+)
+from src.infra.llm.embedding_service import EmbeddingService
+from src.infra.llm.exceptions import InvalidResponseError
+
+
+def _local_backend(monkeypatch, calls, **kwargs):
+    def encode(texts):
+        calls.append(list(texts))
+        return [[float(len(t)), 1.0, 0.0, 0.0] for t in texts]
+
+    monkeypatch.setattr(embedding_backends, "_worker_encode", encode)
+    backend = LocalEmbeddingBackend("test-model", **kwargs)
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(backend, "_ensure_executor", lambda: executor)
+    return backend
+
+
+def test_concurrent_callers_share_one_batch(monkeypatch):
+    calls = []
+    backend = _local_backend(monkeypatch, calls, max_batch=16, batch_wait_ms=20)
+
+    async def run():
+        return await asyncio.gather(
+            backend.embed(["a", "bb"], "m"),
+            backend.embed(["ccc"], "m"),
+        )
+
+    first, second = asyncio.run(run())
+    assert calls == [["a", "bb", "ccc"]]
+    assert [v[0] for v in first] == [1.0, 2.0]
+    assert [v[0] for v in second] == [3.0]
+
+
+def test_batches_are_capped_at_max_batch(monkeypatch):
+    calls = []
+    backend = _local_backend(monkeypatch, calls, max_batch=2, batch_wait_ms=20)
+
+    async def run():
+        return await asyncio.gather(*(backend.embed([t], "m") for t in ["a", "b", "c"]))
+
+    out = asyncio.run(run())
+    assert sorted(len(c) for c in calls) == [1, 2]
+    assert [v[0][0] for v in out] == [1.0, 1.0, 1.0]
+
+
+def test_fit_dimension_truncates_and_renormalizes():
+    out = fit_dimension([3.0, 4.0, 12.0], 2)
+    assert out == pytest.approx([0.6, 0.8])
+    assert math.isclose(sum(x * x for x in out), 1.0)
+
+    with pytest.raises(InvalidResponseError):
+        fit_dimension([1.0], 2)
+
+
+def test_service_routes_to_backend_and_validates_dimension():
+    class FakeBackend(EmbeddingBackend):
+        name = "fake"
+
+        async def embed(self, texts, model):
+            return [[0.5, 0.5] for _ in texts]
+
+    svc = EmbeddingService(backend=FakeBackend())
+    svc.dimensions = 2
+    assert svc.default_model.startswith("local/")
+    assert asyncio.run(svc.generate_embeddings_batch(["x", "y"])) == [[0.5, 0.5]] * 2
+
+    svc.dimensions = 3
+    with pytest.raises(InvalidResponseError):
+        asyncio.run(svc.generate_embedding("x"))
+
+
+def test_start_rejects_model_dimension_mismatch(monkeypatch):
+    from src.infra.llm.exceptions import LLMError
+
+    monkeypatch.setattr(embedding_backends, "_worker_dimension", 4)
+    calls = []
+    backend = _local_backend(monkeypatch, calls, dimensions=2)
+    with pytest.raises(LLMError, match="4-dimensional"):
+        asyncio.run(backend.start())
+    # Every call fails with the same configuration error instead of a per-vector one
+    with pytest.raises(LLMError, match="EMBEDDING_DIMENSIONS=4"):
+        asyncio.run(backend.embed(["a"], "m"))
+    assert calls == []
+
+
+def test_truncation_only_when_allowed(monkeypatch):
+    monkeypatch.setattr(embedding_backends, "_worker_dimension", 4)
+    backend = _local_backend(monkeypatch, [], dimensions=2, allow_truncation=True)
+
+    asyncio.run(backend.start())
+    (vector,) = asyncio.run(backend.embed(["abc"], "m"))
+    assert vector == pytest.approx([3.0 / math.sqrt(10), 1.0 / math.sqrt(10)])
+
+
+def test_each_event_loop_batches_separately(monkeypatch):
+    calls = []
+    backend = _local_backend(monkeypatch, calls, max_batch=16, batch_wait_ms=20)
+
+    async def run(text):
+        return await backend.embed([text], "m")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(lambda t: asyncio.run(run(t)), ["a", "bb"]))
+
+    assert [r[0][0] for r in results] == [1.0, 2.0]
+    assert sorted(map(tuple, calls)) == [("a",), ("bb",)]
@@ -10,6 +10,7 @@ from fastapi import HTTPException
 
 from src.mut_engine.routers import access_point_fs as apfs
 from src.mut_engine.routers.access_point_fs import _filter_entries
+from src.mut_engine.services.blob_reader import BlobSource
 from src.mut_engine.services.tree_reader import MutTreeReader
 
 
@@ -457,6 +458,7 @@ async def test_raw_file_returns_unmodified_bytes(monkeypatch):
     raw = b"\x00raw\nbytes"
 
     result = await apfs.raw_file(
+        request=SimpleNamespace(headers={}),
         path="blob.bin",
         start=0,
         limit=None,
@@ -477,6 +479,7 @@ async def test_raw_file_can_return_byte_slice(monkeypatch):
     ops = _FakeOps(files={"blob.bin": raw})
 
     result = await apfs.raw_file(
+        request=SimpleNamespace(headers={}),
         path="blob.bin",
         start=2,
         limit=3,
@@ -491,6 +494,39 @@ async def test_raw_file_can_return_byte_slice(monkeypatch):
     assert ops.ranges == [{"path": "blob.bin", "start": 2, "limit": 3}]
 
 
+@pytest.mark.asyncio
+async def test_raw_file_revalidates_with_the_opened_blob_hash(monkeypatch):
+    _patch_auth(monkeypatch)
+    ops = _FakeOps()
+    ops.open_file_in_scope = lambda _project_id, _scope, _path: BlobSource(
+        blob_hash="abc123", total_size=3, kind="memory", data=b"raw",
+    )
+
+    first = await apfs.raw_file(
+        request=SimpleNamespace(headers={}),
+        path="blob.bin",
+        start=0,
+        limit=None,
+        x_access_key="key",
+        x_mut_user=None,
+        x_puppy_client=None,
+        ops=ops,
+    )
+    assert first.headers["etag"] == '"abc123"'
+
+    again = await apfs.raw_file(
+        request=SimpleNamespace(headers={"if-none-match": '"abc123"'}),
+        path="blob.bin",
+        start=0,
+        limit=None,
+        x_access_key="key",
+        x_mut_user=None,
+        x_puppy_client=None,
+        ops=ops,
+    )
+    assert again.status_code == 304
+
+
 @pytest.mark.asyncio
 async def test_upload_writes_raw_bytes_through_mut_ops(monkeypatch):
     _patch_auth(monkeypatch)
@@ -0,0 +1,103 @@
+"""Async PostgREST access layer: lookup batching and blocking-call debug mode."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.infra.supabase import client as supabase_client
+from src.infra.supabase.async_client import BatchLoader
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_batch_loader_coalesces_same_tick_lookups():
+    calls: list[list[str]] = []
+
+    async def fetch_many(keys):
+        calls.append(sorted(keys))
+        return {k: (f"hash-{k}", f"head-{k}") for k in keys if k != "missing"}
+
+    loader = BatchLoader(fetch_many, ("", ""))
+    results = await asyncio.gather(
+        loader.load("docs"), loader.load("src"), loader.load("docs"), loader.load("missing"),
+    )
+
+    assert calls == [["docs", "missing", "src"]]
+    assert results[0] == results[2] == ("hash-docs", "head-docs")
+    assert results[3] == ("", "")
+
+    # A later tick issues a fresh query
+    assert await loader.load("src") == ("hash-src", "head-src")
+    assert len(calls) == 2
+
+
+@pytest.mark.anyio
+async def test_batch_loader_propagates_fetch_errors():
+    async def fetch_many(keys):
+        raise RuntimeError("db down")
+
+    loader = BatchLoader(fetch_many, None)
+    with pytest.raises(RuntimeError, match="db down"):
+        await loader.load("docs")
+
+
+def test_blocking_debug_flags_only_event_loop_requests(monkeypatch):
+    warnings: list[str] = []
+    monkeypatch.setattr("src.utils.logger.log_warning", warnings.append)
+    monkeypatch.setenv("SUPABASE_BLOCKING_DEBUG", "true")
+    hook = supabase_client._blocking_debug_hooks()["request"][0]
+    request = httpx.Request("GET", "http://db/rest/v1/mut_scope_state")
+
+    hook(request)
+    assert warnings == []
+
+    async def on_loop():
+        hook(request)
+
+    asyncio.run(on_loop())
+    assert len(warnings) == 1
+    assert "mut_scope_state" in warnings[0]
+
+
+def test_blocking_debug_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("SUPABASE_BLOCKING_DEBUG", raising=False)
+    assert supabase_client._blocking_debug_hooks() == {}
+
+
+def test_short_lived_loops_do_not_keep_postgrest_clients(monkeypatch):
+    from src.infra.supabase import async_client
+
+    monkeypatch.setenv("SUPABASE_URL", "http://supabase.test")
+    monkeypatch.setenv("SUPABASE_KEY", "k")
+    closed: list[object] = []
+
+    async def one_shot():
+        async with async_client.async_postgrest() as client:
+            monkeypatch.setattr(client, "aclose", lambda: _record(closed, client))
+        return client
+
+    async def pooled():
+        await async_client.open_async_postgrest()
+        async with async_client.async_postgrest() as first:
+            pass
+        async with async_client.async_postgrest() as second:
+            pass
+        await async_client.close_async_postgrest()
+        return first, second
+
+    client = asyncio.run(one_shot())
+    assert closed == [client]
+    assert len(async_client._clients) == 0
+
+    first, second = asyncio.run(pooled())
+    assert first is second
+    assert len(async_client._clients) == 0
+
+
+async def _record(closed, client):
+    closed.append(client)
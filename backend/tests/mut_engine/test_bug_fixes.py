@@ -278,8 +278,8 @@ class TestP0_4_EphemeralClientMergeConsume:
         assert "mine.txt" in client.files
         assert "initial.txt" in client.files
 
-    def test_pull_called_when_merged(self, server_repo):
-        """When push result has merged=True, client calls pull() to refresh."""
+    def test_refresh_called_when_merged(self, server_repo):
+        """When push result has merged=True, a cloned client calls refresh()."""
         from src.mut_engine.services.ephemeral_client import MutEphemeralClient
         from src.mut_engine.server.repo_manager import MutRepoManager
 
@@ -292,15 +292,15 @@ class TestP0_4_EphemeralClientMergeConsume:
         client = MutEphemeralClient(repo_manager, "test-proj", auth)
         client.clone()
 
-        original_pull = client.pull
-        pull_called = False
+        original_refresh = client.refresh
+        refresh_called = False
 
-        def tracking_pull():
-            nonlocal pull_called
-            pull_called = True
-            return original_pull()
+        def tracking_refresh():
+            nonlocal refresh_called
+            refresh_called = True
+            return original_refresh()
 
-        client.pull = tracking_pull
+        client.refresh = tracking_refresh
 
         from src.mut_engine.adapters.mut.push_adapter import submit_mut_push
 
@@ -315,8 +315,32 @@ class TestP0_4_EphemeralClientMergeConsume:
         ):
             client.push(modified={"b.txt": b"new"}, message="test merge")
 
-        assert pull_called, \
-            "client.pull() should be called when push result has merged=True"
+        assert refresh_called, \
+            "client.refresh() should be called when push result has merged=True"
+
+    def test_pull_on_cloned_client_returns_only_changes(self, server_repo):
+        """pull() after clone() returns the delta since the clone, not the scope."""
+        from src.mut_engine.services.ephemeral_client import MutEphemeralClient
+        from src.mut_engine.server.repo_manager import MutRepoManager
+
+        repo_manager = MagicMock(spec=MutRepoManager)
+        repo_manager.get_server_repo.return_value = server_repo
+
+        auth = _rw_auth()
+        first = _push_file(server_repo, auth, {"a.txt": b"v1", "b.txt": b"same"})
+
+        client = MutEphemeralClient(repo_manager, "test-proj", auth)
+        client.clone()
+        assert client.pull() == {}
+
+        _push_file(
+            server_repo, auth,
+            {"a.txt": b"v2", "b.txt": b"same", "c.txt": b"new"},
+            base_commit_id=first["commit_id"],
+        )
+
+        assert client.pull() == {"a.txt": b"v2", "c.txt": b"new"}
+        assert set(client.files) == {"a.txt", "b.txt", "c.txt"}
 
     def test_hash_cache_refreshes_when_server_head_advanced(self, server_repo):
         """A cached lite client must refresh after a non-conflict rebase."""
@@ -849,6 +873,29 @@ class TestRollbackHookIntegration:
         run_post_push_hook("proj-1", mock_rm, {"status": "already-at-commit"})
         mock_rm.get_repo.assert_not_called()
 
+    def test_batch_grafts_newest_result_without_history_entry(self):
+        """Batch must graft the newest result even if its entry is missing."""
+        from src.mut_engine.services.hooks import run_post_push_batch
+
+        mock_repo = MagicMock()
+        mock_repo.history.get_entry.side_effect = lambda cid: (
+            {"scope_path": "docs", "changes": []} if cid == "cafe000000000001" else None
+        )
+
+        mock_rm = MagicMock()
+        mock_rm.get_server_repo.return_value = mock_repo
+
+        with patch(
+            "src.mut_engine.services.hooks._update_global_root", return_value="",
+        ) as graft:
+            run_post_push_batch("proj-1", mock_rm, [
+                {"status": "ok", "commit_id": "cafe000000000001", "root": "old"},
+                {"status": "ok", "commit_id": "cafe000000000002", "root": "new"},
+            ])
+
+        graft.assert_called_once()
+        assert graft.call_args.args[1]["commit_id"] == "cafe000000000002"
+
 
 class TestGraftEmptyRootCAS:
     """CAS must use the actual DB value (empty string), not a fabricated hash."""
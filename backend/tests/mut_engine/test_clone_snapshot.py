@@ -0,0 +1,67 @@
+"""Shared clone snapshots: one tree walk per scope state, blobs loaded on access."""
+
+import gc
+
+from src.mut_engine.services import clone_snapshot
+from src.mut_engine.services.clone_snapshot import ClonedFiles, acquire_clone_snapshot
+
+
+class _Store:
+    def __init__(self, blobs):
+        self.blobs = blobs
+        self.gets = 0
+
+    def get(self, h):
+        self.gets += 1
+        return self.blobs[h]
+
+
+def _acquire(store, tree_hash, walks):
+    def build():
+        walks.append(tree_hash)
+        return {"a.md": "h1", "dir/b.md": "h2"}
+
+    return acquire_clone_snapshot("p1", "docs", [], tree_hash, store, build)
+
+
+def test_clients_on_same_scope_state_share_one_snapshot():
+    store = _Store({"h1": b"one", "h2": b"two"})
+    walks = []
+
+    first = _acquire(store, "t1", walks)
+    second = _acquire(store, "t1", walks)
+    assert first is second and walks == ["t1"]
+
+    view_a = ClonedFiles(first, first.file_hashes)
+    view_b = ClonedFiles(second, second.file_hashes)
+    assert view_a["a.md"] == b"one" and view_b["a.md"] == b"one"
+    # Only the touched blob is loaded, and only once across both views
+    assert store.gets == 1 and first.loaded_blob_count == 1
+
+    # A new scope head is a different snapshot
+    assert _acquire(store, "t2", walks) is not first
+
+
+def test_snapshot_is_released_with_its_last_holder():
+    store = _Store({})
+    walks = []
+    snapshot = _acquire(store, "t-release", walks)
+    key = ("p1", "docs", (), "t-release")
+    assert clone_snapshot._snapshots.get(key) is snapshot
+
+    del snapshot
+    gc.collect()
+    assert clone_snapshot._snapshots.get(key) is None
+
+
+def test_cloned_files_local_edits_do_not_leak_into_snapshot():
+    store = _Store({"h1": b"one", "h2": b"two"})
+    snapshot = _acquire(store, "t3", [])
+    files = ClonedFiles(snapshot, snapshot.file_hashes)
+
+    files.update({"a.md": b"changed", "new.md": b"new"})
+    files.pop("dir/b.md")
+
+    assert dict(files) == {"a.md": b"changed", "new.md": b"new"}
+    assert snapshot.file_hashes == {"a.md": "h1", "dir/b.md": "h2"}
+    assert ClonedFiles(snapshot, snapshot.file_hashes)["dir/b.md"] == b"two"
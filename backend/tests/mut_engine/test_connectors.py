@@ -3,6 +3,7 @@
 Covers:
   - BaseConnector pull() method
   - SyncEngine decoupling (fetch → compare → MutOps.write)
+  - SyncEngine incremental path (fetch_changes → one bulk_write)
   - Filesystem bootstrap with scope config
   - Unified connections manager routing by provider
 """
@@ -178,6 +179,124 @@ class TestSyncEngineDecoupling:
         assert "mut_engine" not in source
 
 
+# ── SyncEngine Incremental Tests ───────────────────────────────
+
+class IncrementalConnector(BaseConnector):
+    """Connector that answers fetch_changes() with a canned ChangeSet."""
+
+    def __init__(self, changes):
+        self.changes = changes
+        self.seen = None
+        self.fetch_calls = 0
+
+    def spec(self):
+        return ConnectorSpec(
+            provider="inc", display_name="Incremental",
+            capabilities=Capability.PULL | Capability.INCREMENTAL,
+            supported_directions=["inbound"],
+        )
+
+    async def fetch(self, config, credentials):
+        self.fetch_calls += 1
+        return FetchResult(content={"full": True}, content_hash="full-hash")
+
+    async def fetch_changes(self, config, credentials, cursor, etags):
+        self.seen = (cursor, etags)
+        return self.changes
+
+
+class _IncrementalHarness:
+    def __init__(self, connector, state=None):
+        from src.connectors.datasource.schemas import Sync
+
+        self.connector = connector
+        self.sync = Sync(
+            id="sync-1", project_id="proj-1", path="mail", provider="inc",
+            config={"_sync_state": state} if state else {},
+            status="active", created_by="user-1",
+        )
+        self.sync_repo = MagicMock()
+        self.sync_repo.get_by_id.return_value = self.sync
+        self.registry = MagicMock()
+        self.registry.get.return_value = connector
+        self.registry.resolve_credentials = AsyncMock(return_value=None)
+        self.ops = MagicMock()
+        self.ops.bulk_write = AsyncMock(return_value=MagicMock(commit_id="c-1"))
+        self.ops.write_file = AsyncMock(return_value=MagicMock(commit_id="c-full"))
+
+    async def run(self):
+        import sys
+        from types import SimpleNamespace
+        from src.connectors.datasource.engine import SyncEngine
+
+        fake_deps = SimpleNamespace(create_mut_ops=lambda: self.ops)
+        with patch.dict(sys.modules, {"src.mut_engine.dependencies": fake_deps}):
+            engine = SyncEngine(registry=self.registry, sync_repo=self.sync_repo)
+            return await engine.execute("sync-1")
+
+    def saved_state(self):
+        config = self.sync_repo.update_config.call_args.args[1]
+        return config["_sync_state"]
+
+
+class TestSyncEngineIncremental:
+    @pytest.mark.asyncio
+    async def test_changes_applied_as_single_bulk_write(self):
+        from src.connectors.datasource._base import ChangeSet
+
+        h = _IncrementalHarness(
+            IncrementalConnector(ChangeSet(
+                cursor="c2",
+                files={"a.json": b"A2", "b.json": b"B1"},
+                deleted=["old.json"],
+                etags={"a.json": "e-a2", "b.json": "e-b1"},
+            )),
+            state={"cursor": "c1", "etags": {"b.json": "e-b1", "old.json": "e-o"}},
+        )
+
+        result = await h.run()
+
+        assert result["commit_id"] == "c-1"
+        assert h.connector.seen == ("c1", {"b.json": "e-b1", "old.json": "e-o"})
+        assert h.connector.fetch_calls == 0
+        h.ops.bulk_write.assert_awaited_once()
+        call = h.ops.bulk_write.call_args
+        assert call.args[1] == {"mail/a.json": b"A2"}
+        assert call.kwargs["deleted"] == ["mail/old.json"]
+        assert h.saved_state() == {
+            "cursor": "c2", "etags": {"a.json": "e-a2", "b.json": "e-b1"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_empty_changeset_skips_without_fetch(self):
+        from src.connectors.datasource._base import ChangeSet
+
+        h = _IncrementalHarness(
+            IncrementalConnector(ChangeSet(cursor="c9")),
+            state={"cursor": "c8", "etags": {}},
+        )
+
+        assert await h.run() is None
+        assert h.connector.fetch_calls == 0
+        h.ops.bulk_write.assert_not_called()
+        assert h.saved_state()["cursor"] == "c9"
+
+    @pytest.mark.asyncio
+    async def test_full_resync_falls_back_to_fetch_and_saves_cursor(self):
+        from src.connectors.datasource._base import ChangeSet
+
+        h = _IncrementalHarness(
+            IncrementalConnector(ChangeSet(cursor="c1", full_resync=True)),
+        )
+
+        result = await h.run()
+
+        assert result["commit_id"] == "c-full"
+        assert h.connector.seen == (None, {})
+        assert h.connector.fetch_calls == 1
+        assert h.saved_state()["cursor"] == "c1"
+
+
 # ── Unified API Filesystem Output Contract ─────────────────────
 
 class TestUnifiedFilesystemOutput:
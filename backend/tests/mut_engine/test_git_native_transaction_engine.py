@@ -11,6 +11,7 @@ from __future__ import annotations
 import base64
 import asyncio
 import json
+import random
 import socket
 import subprocess
 import threading
@@ -524,6 +525,92 @@ class TestGitNativeSubmission:
             for event in server_repo.audit.events
         )
 
+    @pytest.mark.asyncio
+    async def test_group_commit_folds_same_scope_operations_into_one_commit(
+        self, repo_manager, server_repo,
+    ):
+        engine = GitNativeTransactionEngine(repo_manager, group_commit=True)
+
+        async def write(name: str, content: bytes | None):
+            def splice(store, root_hash):
+                if content is None:
+                    raise ValueError(f"bad write {name}")
+                return splice_put_blob(store, root_hash, f"{name}.txt", content)
+
+            return await engine.apply_operation(
+                OperationWriteIntent(
+                    project_id="test-proj",
+                    scope_path="",
+                    actor=f"papi:{name}",
+                    source_channel="papi",
+                    operation_type="write_file",
+                    message=f"write {name}",
+                ),
+                splice,
+            )
+
+        results = await asyncio.gather(
+            write("a", b"a"),
+            write("b", b"b"),
+            write("c", None),
+            write("d", b"d"),
+            return_exceptions=True,
+        )
+
+        a, b, c, d = results
+        assert isinstance(c, ValueError)
+        assert a.commit_id == b.commit_id == d.commit_id
+        assert a.paths == ["a.txt"]
+        assert b.paths == ["b.txt"]
+        assert d.paths == ["d.txt"]
+        assert _files_for_scope(server_repo) == {
+            "a.txt": b"a",
+            "b.txt": b"b",
+            "d.txt": b"d",
+        }
+        published = [e for e in server_repo.audit.events if "group_size" in e["detail"]]
+        assert len(published) == 1
+        assert published[0]["detail"]["group_size"] == 3
+
+    def test_group_commit_from_threads_with_their_own_loops(
+        self, repo_manager, server_repo,
+    ):
+        engine = GitNativeTransactionEngine(repo_manager, group_commit=True)
+        barrier = threading.Barrier(2)
+
+        async def write(name: str):
+            def splice(store, root_hash):
+                return splice_put_blob(store, root_hash, f"{name}.txt", name.encode())
+
+            return await engine.apply_operation(
+                OperationWriteIntent(
+                    project_id="test-proj",
+                    scope_path="",
+                    actor=f"papi:{name}",
+                    source_channel="papi",
+                    operation_type="write_file",
+                    message=f"write {name}",
+                ),
+                splice,
+            )
+
+        async def publish_pair(prefix: str):
+            barrier.wait()
+            return await asyncio.gather(write(f"{prefix}1"), write(f"{prefix}2"))
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                pool.submit(asyncio.run, publish_pair(prefix)) for prefix in ("x", "y")
+            ]
+            results = [r for fut in futures for r in fut.result(timeout=30)]
+
+        assert sorted(p for r in results for p in r.paths) == [
+            "x1.txt", "x2.txt", "y1.txt", "y2.txt",
+        ]
+        assert set(_files_for_scope(server_repo)) == {
+            "x1.txt", "x2.txt", "y1.txt", "y2.txt",
+        }
+
     @pytest.mark.asyncio
     async def test_git_pushes_to_different_scopes_advance_independent_heads(
         self, repo_manager, server_repo,
@@ -1165,6 +1252,66 @@ def test_version_outbox_worker_marks_failure_for_retry(monkeypatch):
     assert client.failed == [(11, "projection unavailable")]
 
 
+def test_version_outbox_worker_coalesces_rows_per_project(monkeypatch):
+    single_calls = []
+    batch_calls = []
+
+    monkeypatch.setattr(
+        "src.mut_engine.services.version_outbox.run_post_push_hook",
+        lambda project_id, _rm, result, **_kw: single_calls.append((project_id, result["commit_id"])),
+    )
+    monkeypatch.setattr(
+        "src.mut_engine.services.version_outbox.run_post_push_batch",
+        lambda project_id, _rm, results, **_kw: batch_calls.append(
+            (project_id, [r["commit_id"] for r in results])
+        ),
+    )
+    client = _FakeOutboxClient([
+        {"id": 1, "project_id": "p1", "commit_id": "a" * 40, "payload": {"scope_hash": "1" * 40}},
+        {"id": 2, "project_id": "p2", "commit_id": "b" * 40, "payload": {"scope_hash": "2" * 40}},
+        {"id": 3, "project_id": "p1", "commit_id": "c" * 40, "payload": {"scope_hash": "3" * 40}},
+    ])
+
+    processed = process_version_outbox_batch(repo_manager=object(), client=client, limit=10)
+
+    assert processed == 3
+    assert sorted(client.completed) == [1, 2, 3]
+    assert batch_calls == [("p1", ["a" * 40, "c" * 40])]
+    assert single_calls == [("p2", "b" * 40)]
+
+
+def test_version_outbox_worker_replays_project_rows_oldest_first(monkeypatch):
+    batch_calls = []
+    monkeypatch.setattr(
+        "src.mut_engine.services.version_outbox.run_post_push_batch",
+        lambda project_id, _rm, results, **_kw: batch_calls.append(
+            (project_id, [r["commit_id"] for r in results])
+        ),
+    )
+    rows = [
+        {
+            "id": i,
+            "project_id": "p1",
+            "commit_id": str(i) * 40,
+            "payload": {"scope_hash": "f" * 40},
+            "created_at": created_at,
+        }
+        for i, created_at in [
+            (1, "2026-05-13T10:00:00+00:00"),
+            (2, "2026-05-13T10:00:00.5+00:00"),
+            (3, "2026-05-13T10:00:00.5+00:00"),
+            (4, "2026-05-13T10:00:01Z"),
+        ]
+    ]
+    random.Random(7).shuffle(rows)
+    client = _FakeOutboxClient(rows)
+
+    processed = process_version_outbox_batch(repo_manager=object(), client=client, limit=10)
+
+    assert processed == 4
+    assert batch_calls == [("p1", ["1" * 40, "2" * 40, "3" * 40, "4" * 40])]
+
+
 def test_git_project_receive_pack_requires_credentials(
     tmp_path, repo_manager, server_repo,
 ):
@@ -0,0 +1,109 @@
+"""Tests for root_projection — batched and incremental root builds.
+
+The incremental path must produce byte-identical roots to a full rebuild
+(scope registry stays authoritative); it only saves object reads/writes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+from mut.foundation.git_format import MODE_FILE, TreeEntry, encode_tree
+
+from src.mut_engine.application import root_projection
+from src.mut_engine.application.root_projection import (
+    build_root_from_scope_state,
+    graft_subtree,
+    graft_subtrees,
+)
+
+
+class _CountingStore:
+    def __init__(self):
+        self.objects: dict[str, tuple[str, bytes]] = {}
+        self.reads = 0
+        self.writes = 0
+
+    def put_tree(self, content: bytes) -> str:
+        self.writes += 1
+        h = hashlib.sha1(b"tree\0" + content).hexdigest()
+        self.objects[h] = ("tree", content)
+        return h
+
+    def get_object(self, h: str):
+        self.reads += 1
+        return self.objects[h]
+
+
+class _Repo:
+    def __init__(self, store, scopes):
+        self.store = store
+        self.scopes = scopes
+
+    def get_all_scope_hashes(self):
+        return dict(self.scopes)
+
+
+def _tree(store, files: dict[str, str]) -> str:
+    entries = [TreeEntry(name=n, mode=MODE_FILE, sha1_hex=h) for n, h in files.items()]
+    return store.put_tree(encode_tree(entries))
+
+
+def _full(store, scopes: dict[str, str]) -> str:
+    root = scopes.get("") or store.put_tree(encode_tree([]))
+    for path, h in sorted(
+        ((p, h) for p, h in scopes.items() if p), key=lambda i: (i[0].count("/"), i[0])
+    ):
+        root = graft_subtree(store, root, path, h)
+    return root
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memo(monkeypatch):
+    monkeypatch.setattr(root_projection, "_memo", root_projection._ProjectionMemo(16))
+
+
+def test_graft_subtrees_matches_sequential_grafts():
+    store = _CountingStore()
+    scopes = {
+        "": _tree(store, {"README.md": "a" * 40, "docs": "b" * 40}),
+        "docs": _tree(store, {"x.md": "c" * 40}),
+        "docs/api": _tree(store, {"y.md": "d" * 40}),
+        "team/eng/notes": _tree(store, {"z.md": "e" * 40}),
+    }
+    expected = _full(store, scopes)
+    batched = graft_subtrees(store, scopes[""], {p: h for p, h in scopes.items() if p})
+    assert batched == expected
+
+
+def test_incremental_build_grafts_only_changed_scopes():
+    store = _CountingStore()
+    scopes = {"": _tree(store, {"README.md": "a" * 40})}
+    for i in range(50):
+        scopes[f"team/s{i}"] = _tree(store, {"f.md": f"{i:040d}"})
+    scopes["team/s3/nested"] = _tree(store, {"n.md": "f" * 40})
+    repo = _Repo(store, scopes)
+
+    first = build_root_from_scope_state(repo, "", "")
+    assert first == _full(store, scopes)
+
+    new_hash = _tree(store, {"f.md": "9" * 40})
+    store.reads = store.writes = 0
+    second = build_root_from_scope_state(repo, "team/s3", new_hash, base_root=first)
+
+    # team/s3 (regrafting its nested scope), team, root — not 50 spines
+    assert store.writes == 3
+    assert second == _full(store, {**scopes, "team/s3": new_hash})
+
+
+def test_removed_scope_or_unknown_base_falls_back_to_full_build():
+    store = _CountingStore()
+    scopes = {"a": _tree(store, {"x": "1" * 40}), "b": _tree(store, {"y": "2" * 40})}
+    repo = _Repo(store, scopes)
+    first = build_root_from_scope_state(repo, "", "")
+
+    repo.scopes = {"a": scopes["a"]}
+    assert build_root_from_scope_state(repo, "", "", base_root=first) == _full(store, repo.scopes)
+    assert build_root_from_scope_state(repo, "", "", base_root="f" * 40) == _full(store, repo.scopes)
@@ -0,0 +1,82 @@
+"""Scope ownership trie: longest-prefix routing and cache invalidation."""
+
+from src.mut_engine.application import scope_trie
+from src.mut_engine.application.scope_trie import (
+    ScopeTrie,
+    get_scope_trie,
+    invalidate_scope_trie,
+)
+
+
+class FakeScopes:
+    def __init__(self, scopes):
+        self.scopes = scopes
+
+    def list_all(self):
+        return list(self.scopes)
+
+
+class FakeRepo:
+    def __init__(self, project_id, scope_hashes, scopes=()):
+        self.project_id = project_id
+        self.history = object()
+        self.scope_hashes = dict(scope_hashes)
+        self.scopes = FakeScopes(scopes)
+        self.reads = 0
+
+    def get_all_scope_hashes(self):
+        self.reads += 1
+        return dict(self.scope_hashes)
+
+
+def test_owner_is_deepest_containing_scope():
+    trie = ScopeTrie()
+    for path in ["", "docs", "docs/api", "src", "docs/api-v2"]:
+        trie.add(path, published=True)
+
+    expected = {
+        "README.md": "",
+        "docs": "docs",
+        "docs/a.md": "docs",
+        "docs/api": "docs/api",
+        "docs/api/x.md": "docs/api",
+        "docs/api-v2/y.md": "docs/api-v2",
+        "docs/apix": "docs",
+        "src/main.py": "src",
+        "srcx/a": "",
+    }
+    for path, owner in expected.items():
+        assert trie.owner(path) == owner
+
+
+def test_route_uses_published_scopes_below_path():
+    trie = ScopeTrie()
+    trie.add("docs", published=True)
+    trie.add("drafts")  # defined, never pushed
+
+    assert trie.route("docs/a.md") == ("docs", "a.md")
+    assert trie.route("docs") == ("", "docs")
+    assert trie.route("drafts/b.md") == ("", "drafts/b.md")
+
+
+def test_cached_until_invalidated():
+    repo = FakeRepo("p-trie", {"": "h0", "docs": "h1"}, [{"path": "docs", "exclude": []}])
+    invalidate_scope_trie("p-trie")
+
+    first = get_scope_trie(repo)
+    assert get_scope_trie(repo) is first
+    assert repo.reads == 1
+
+    repo.scope_hashes["reports"] = "h2"
+    invalidate_scope_trie("p-trie")
+    assert get_scope_trie(repo).route("reports/q1.md") == ("reports", "q1.md")
+    assert repo.reads == 2
+
+
+def test_cache_expires_after_ttl(monkeypatch):
+    repo = FakeRepo("p-ttl", {"": "h0"})
+    monkeypatch.setattr(scope_trie, "SCOPE_TRIE_TTL_SECONDS", -1)
+
+    get_scope_trie(repo)
+    get_scope_trie(repo)
+    assert repo.reads == 2
@@ -368,6 +368,51 @@ class TestListScopeFiles:
 
         assert files == {"root.txt": b"root"}
 
+    def test_iter_scope_files_streams_nested_tree(self, server_repo, memory_store):
+        blobs = {f"d{i}/f{j}.md": f"{i}-{j}".encode() for i in range(3) for j in range(40)}
+        sub_trees = []
+        for i in range(3):
+            entries = [
+                TreeEntry(name=f"f{j}.md", mode=MODE_FILE,
+                          sha1_hex=memory_store.put_blob(blobs[f"d{i}/f{j}.md"]))
+                for j in range(40)
+            ]
+            sub_trees.append(TreeEntry(
+                name=f"d{i}", mode=MODE_DIR,
+                sha1_hex=memory_store.put_tree(encode_tree(entries)),
+            ))
+        server_repo.history.set_scope_hash("docs", memory_store.put_tree(encode_tree(sub_trees)))
+        scope = {"id": "s1", "path": "docs", "exclude": ["docs/d1"], "mode": "rw"}
+
+        streamed = list(server_repo.iter_scope_files(scope))
+
+        expected = {p: b for p, b in blobs.items() if not p.startswith("d1/")}
+        assert [p for p, _ in streamed] == sorted(expected)
+        assert dict(streamed) == expected == server_repo.list_scope_files(scope)
+
+    def test_scope_hash_cache_holds_paths_not_bytes(self, server_repo, memory_store, monkeypatch):
+        from cachetools import LRUCache
+
+        from src.mut_engine.server.server_repo import (
+            PuppyOneServerRepo,
+            _estimate_hash_map_bytes,
+        )
+
+        cache = LRUCache(maxsize=4096, getsizeof=_estimate_hash_map_bytes)
+        monkeypatch.setattr(PuppyOneServerRepo, "_scope_hashes_cache", cache)
+        blob_hash = memory_store.put_blob(b"x" * 100_000)
+        scope = {"id": "s1", "path": "docs", "exclude": [], "mode": "rw"}
+        for i in range(20):
+            tree_hash = memory_store.put_tree(encode_tree([
+                TreeEntry(name=f"file{i}.md", mode=MODE_FILE, sha1_hex=blob_hash),
+            ]))
+            server_repo.history.set_scope_hash("docs", tree_hash)
+            assert server_repo.scope_file_hashes(scope) == {f"file{i}.md": blob_hash}
+
+        # Budget, not entry count, bounds the cache; large blobs don't count
+        assert cache.currsize <= 4096
+        assert 1 < len(cache) < 20
+
 
 class TestWriteAndBuildScopeTree:
     def test_write_then_build(self, server_repo, memory_store):
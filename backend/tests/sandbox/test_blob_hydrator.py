@@ -0,0 +1,140 @@
+"""Blob hydration tests: content-addressed cache + workspace materialization"""
+
+import hashlib
+import os
+import zlib
+
+import pytest
+
+from src.mut_engine.services.blob_hydrator import BlobCache, hydrate_workspace
+
+
+def _loose(data: bytes) -> tuple[str, bytes]:
+    raw = b"blob %d\0" % len(data) + data
+    return hashlib.sha1(raw).hexdigest(), zlib.compress(raw)
+
+
+class FakeBackend:
+    def __init__(self, objects: dict[str, bytes]):
+        self.objects = objects
+        self.stream_calls: list[str] = []
+
+    async def async_stream(self, h: str, chunk_size: int):
+        self.stream_calls.append(h)
+        data = self.objects[h]
+        for i in range(0, len(data), 7):
+            yield data[i:i + 7]
+
+
+class FakeStore:
+    def __init__(self, objects: dict[str, bytes]):
+        self._backend = FakeBackend(objects)
+
+    def get(self, h: str) -> bytes:
+        return zlib.decompress(self._backend.objects[h]).split(b"\0", 1)[1]
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def blobs():
+    payloads = {
+        "a.json": b'{"k": 1}',
+        "img/logo.png": b"\x89PNG\r\n\x1a\n\x00\xff\xfe binary",
+    }
+    hashes, objects = {}, {}
+    for path, data in payloads.items():
+        h, obj = _loose(data)
+        hashes[path] = h
+        objects[h] = obj
+    return payloads, hashes, FakeStore(objects)
+
+
+@pytest.mark.anyio
+async def test_hydrate_preserves_raw_bytes(tmp_path, blobs):
+    payloads, hashes, store = blobs
+    cache = BlobCache(str(tmp_path / "cache"))
+    ws = tmp_path / "ws"
+
+    result = await hydrate_workspace(store, hashes, str(ws), cache=cache)
+
+    assert not result.failed
+    assert sorted(result.written) == sorted(payloads)
+    for path, data in payloads.items():
+        assert (ws / path).read_bytes() == data
+        assert result.manifest[path].hash == hashes[path]
+        assert result.manifest[path].size == len(data)
+
+
+@pytest.mark.anyio
+async def test_hydrate_skips_unchanged_and_removes_dropped(tmp_path, blobs):
+    payloads, hashes, store = blobs
+    cache = BlobCache(str(tmp_path / "cache"))
+    ws = tmp_path / "ws"
+    first = await hydrate_workspace(store, hashes, str(ws), cache=cache)
+
+    remaining = {"a.json": hashes["a.json"]}
+    second = await hydrate_workspace(
+        store, remaining, str(ws), cache=cache, previous=first.manifest,
+    )
+
+    assert second.skipped == ["a.json"]
+    assert second.written == []
+    assert second.removed == ["img/logo.png"]
+    assert not (ws / "img/logo.png").exists()
+    # Each blob was downloaded exactly once
+    assert sorted(store._backend.stream_calls) == sorted(hashes.values())
+
+
+@pytest.mark.anyio
+async def test_hydrate_link_mode_shares_cache_inode(tmp_path, blobs):
+    _payloads, hashes, store = blobs
+    cache = BlobCache(str(tmp_path / "cache"))
+    ws = tmp_path / "ws"
+
+    await hydrate_workspace(store, hashes, str(ws), cache=cache, link=True)
+
+    cached = os.stat(cache.path_for(hashes["a.json"]))
+    placed = os.stat(ws / "a.json")
+    assert cached.st_ino == placed.st_ino
+
+
+@pytest.mark.anyio
+async def test_hydrate_rejects_corrupt_blob(tmp_path):
+    h, _ = _loose(b"expected")
+    _, wrong = _loose(b"tampered")
+    store = FakeStore({h: wrong})
+    cache = BlobCache(str(tmp_path / "cache"))
+
+    result = await hydrate_workspace(store, {"x.txt": h}, str(tmp_path / "ws"), cache=cache)
+
+    assert [f["path"] for f in result.failed] == ["x.txt"]
+    assert not cache.contains(h)
+
+
+@pytest.mark.anyio
+async def test_diff_workspace_reports_only_real_changes(tmp_path, blobs):
+    from src.mut_engine.services.blob_hydrator import diff_workspace
+
+    payloads, hashes, store = blobs
+    cache = BlobCache(str(tmp_path / "cache"))
+    ws = tmp_path / "ws"
+    manifest = (await hydrate_workspace(store, hashes, str(ws), cache=cache)).manifest
+
+    assert diff_workspace(str(ws), manifest).is_empty
+
+    # Rewritten with identical bytes: mtime moves, hash does not
+    (ws / "a.json").write_bytes(payloads["a.json"])
+    os.utime(ws / "a.json", ns=(1, 1))
+    (ws / "img/logo.png").unlink()
+    (ws / "new.md").write_text("# new")
+    (ws / ".hidden").write_text("ignored")
+
+    diff = diff_workspace(str(ws), manifest)
+
+    assert list(diff.changed) == ["new.md"]
+    assert diff.changed["new.md"].hash == _loose(b"# new")[0]
+    assert diff.deleted == ["img/logo.png"]
@@ -0,0 +1,163 @@
+"""Warm Docker container pool tests"""
+
+import os
+
+import pytest
+
+from src.infra.sandbox.docker_pool import DockerContainerPool
+from src.infra.sandbox.docker_sandbox import DockerSandbox
+
+
+class FakeDocker:
+    """Records docker commands; `run` hands out sequential container ids"""
+
+    def __init__(self, tmp_root: str):
+        self.tmp_root = tmp_root
+        self.commands: list[tuple] = []
+        self.started = 0
+        self.mounts: list[list[str]] = []
+        self.layers: dict[str, str] = {}  # container id -> `docker diff` output
+
+    def _get_sandbox_temp_root(self) -> str:
+        return self.tmp_root
+
+    async def _check_docker_available(self, force_recheck: bool = False) -> bool:
+        return True
+
+    async def _run_docker_command(self, *args: str, timeout: float = 30.0):
+        self.commands.append(args)
+        if args[0] == "diff":
+            return (0, self.layers.get(args[1], ""), "")
+        return (0, "", "")
+
+    async def _try_start_container(self, mount_args, use_custom_image=True, image="json-sandbox"):
+        self.started += 1
+        self.mounts.append(mount_args)
+        return (True, f"container-{self.started:02d}", "")
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def docker(tmp_path):
+    return FakeDocker(str(tmp_path))
+
+
+@pytest.mark.anyio
+async def test_refill_warms_each_lane_with_bound_workspace(docker):
+    pool = DockerContainerPool(docker, size=2)
+    await pool.refill()
+
+    assert pool.idle_count(readonly=False) == 2
+    assert pool.idle_count(readonly=True) == 2
+    ro_mounts = [m[1] for m in docker.mounts if m[1].endswith(":ro")]
+    assert len(ro_mounts) == 2
+    assert all(m[0] == "-v" and m[1].split(":")[1] == "/workspace" for m in docker.mounts)
+
+
+@pytest.mark.anyio
+async def test_claim_prefers_project_affinity_and_isolates_projects(docker):
+    pool = DockerContainerPool(docker, size=1)
+    await pool.refill()
+
+    first = pool.claim(readonly=False, project_id="p1")
+    assert first is not None and first.project_id == "p1"
+    await pool.release(first)
+    await pool.refill()
+
+    # Same project gets its recycled container back
+    again = pool.claim(readonly=False, project_id="p1")
+    assert again is first
+    await pool.release(again)
+
+    # Another project never receives p1's container
+    other = pool.claim(readonly=False, project_id="p2")
+    assert other is not None and other is not first
+
+
+@pytest.mark.anyio
+async def test_release_scrubs_untracked_files(docker):
+    pool = DockerContainerPool(docker, size=1)
+    await pool.refill()
+    container = pool.claim(readonly=False, project_id="p1")
+
+    stray = os.path.join(container.workspace_dir, "agent-output.txt")
+    with open(stray, "w") as f:
+        f.write("left behind")
+    await pool.release(container)
+
+    assert not os.path.exists(stray)
+    assert container in pool._idle[False]
+
+
+@pytest.mark.anyio
+async def test_worn_out_and_stale_containers_are_destroyed(docker):
+    pool = DockerContainerPool(docker, size=1, max_uses=1, idle_ttl=0)
+    await pool.refill()
+
+    worn = pool.claim(readonly=False, project_id="p1")
+    await pool.release(worn)
+    assert ("stop", worn.container_id) in docker.commands
+    assert not os.path.exists(worn.slot_dir)
+
+    pool.max_uses = 10
+    await pool.refill()
+    recycled = pool.claim(readonly=False, project_id="p1")
+    await pool.release(recycled)
+    recycled.released_at -= 1
+    await pool.maintain()
+    assert ("stop", recycled.container_id) in docker.commands
+    assert pool.idle_count(readonly=False, project_id="p1") == 0
+
+
+@pytest.mark.anyio
+async def test_docker_sandbox_uses_pooled_container(docker, monkeypatch):
+    sandbox = DockerSandbox()
+    pool = DockerContainerPool(docker, size=1)
+    sandbox._pool = pool
+    await pool.refill()
+
+    async def _no_cold_start(*args, **kwargs):
+        raise AssertionError("session should not cold-start a container")
+
+    async def _available(force_recheck: bool = False):
+        return True
+
+    monkeypatch.setattr(sandbox, "_check_docker_available", _available)
+    monkeypatch.setattr(sandbox, "_run_docker_command", docker._run_docker_command)
+    monkeypatch.setattr(sandbox, "_try_start_container", _no_cold_start)
+
+    result = await sandbox.start_with_files(
+        "s1", [{"path": "/workspace/notes.md", "content": "hello"}], readonly=False,
+    )
+
+    assert result["success"] is True
+    session = sandbox._sessions["s1"]
+    assert session.pooled is not None
+    with open(os.path.join(session.workspace_dir, "notes.md")) as f:
+        assert f.read() == "hello"
+
+    await sandbox.stop("s1")
+    assert "s1" not in sandbox._sessions
+    sandbox._cleanup_task.cancel()
+
+
+@pytest.mark.anyio
+async def test_container_with_writes_outside_workspace_is_not_recycled(docker):
+    pool = DockerContainerPool(docker, size=1)
+    await pool.refill()
+
+    clean = pool.claim(readonly=False, project_id="p1")
+    docker.layers[clean.container_id] = "C /tmp\nA /tmp/scratch.txt\n"
+    await pool.release(clean)
+    assert pool.claim(readonly=False, project_id="p1") is clean
+
+    # The session left files in $HOME; a later session (possibly another
+    # agent's scope in the same project) must not inherit them
+    docker.layers[clean.container_id] = "C /root\nA /root/.cache/pip\n"
+    await pool.release(clean)
+    assert ("stop", clean.container_id) in docker.commands
+    assert pool.idle_count(readonly=False, project_id="p1") == 0
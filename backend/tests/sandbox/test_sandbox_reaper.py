@@ -1,6 +1,6 @@
 """Tests for sandbox reaper using new AgentSandboxRegistry."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -37,6 +37,7 @@ async def test_reaper_calls_writeback_and_destroy(monkeypatch):
 
     sandbox_service = AsyncMock()
     sandbox_service.exec = AsyncMock(return_value={"success": True, "output": ""})
+    sandbox_service.local_workspace = MagicMock(return_value=None)
     sandbox_service.stop = AsyncMock()
 
     monkeypatch.setattr(
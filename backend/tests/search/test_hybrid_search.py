@@ -0,0 +1,162 @@
+import asyncio
+import datetime as dt
+
+import pytest
+
+from src.infra.chunking.schemas import Chunk
+from src.infra.search.query_cache import QueryEmbeddingCache, SearchResultCache
+from src.infra.search.service import SearchService
+from src.infra.turbopuffer.schemas import (
+    TurbopufferMultiQueryItem,
+    TurbopufferMultiQueryResponse,
+    TurbopufferQueryResponse,
+    TurbopufferRow,
+)
+
+
+def _row(doc_id, chunk_id, content=None, distance=None):
+    attrs = {"chunk_id": chunk_id, "json_pointer": f"/items/{chunk_id}", "chunk_index": 0, "total_chunks": 1}
+    if content is not None:
+        attrs["content"] = content
+    return TurbopufferRow(id=doc_id, distance=distance, attributes=attrs)
+
+
+class FakeEmbedding:
+    default_model = "fake/embed"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_embedding(self, text):
+        self.calls += 1
+        return [0.1, 0.2]
+
+
+class FakeChunkRepo:
+    def __init__(self):
+        self.requested = []
+
+    def get_by_ids(self, ids):
+        self.requested.append(sorted(ids))
+        return [
+            Chunk(
+                id=i, path="p", json_pointer="/", chunk_index=0, total_chunks=1,
+                chunk_text=f"db-{i}", char_start=0, char_end=1, content_hash="h",
+                created_at=dt.datetime.now(dt.timezone.utc),
+                updated_at=dt.datetime.now(dt.timezone.utc),
+            )
+            for i in ids
+        ]
+
+
+class FakeTurbopuffer:
+    def __init__(self, ann, bm25, *, fail_multi=False):
+        self.ann = ann
+        self.bm25 = bm25
+        self.fail_multi = fail_multi
+        self.multi_queries = []
+        self.queries = []
+
+    async def multi_query(self, namespace, *, queries):
+        self.multi_queries.append(queries)
+        if self.fail_multi:
+            raise RuntimeError("attribute content is not full-text indexed")
+        return TurbopufferMultiQueryResponse(
+            results=[
+                TurbopufferMultiQueryItem(rows=self.ann),
+                TurbopufferMultiQueryItem(rows=self.bm25),
+            ]
+        )
+
+    async def query(self, namespace, *, rank_by, top_k, include_attributes):
+        self.queries.append((rank_by, top_k))
+        return TurbopufferQueryResponse(rows=self.ann[:top_k])
+
+
+def _service(tp, repo=None, embedding=None):
+    return SearchService(
+        ops=None,
+        chunk_repo=repo or FakeChunkRepo(),
+        project_service=None,
+        chunking_service=object(),
+        embedding_service=embedding or FakeEmbedding(),
+        turbopuffer_service=tp,
+        embedding_cache=QueryEmbeddingCache(max_entries=16, ttl_seconds=60),
+        result_cache=SearchResultCache(max_entries=16, ttl_seconds=60),
+    )
+
+
+def test_hybrid_fuses_ann_and_bm25_in_one_multi_query():
+    ann = [_row("a", 1, "alpha"), _row("b", 2, "beta")]
+    bm25 = [_row("c", 3, "ERR_4012"), _row("a", 1, "alpha")]
+    tp = FakeTurbopuffer(ann, bm25)
+    svc = _service(tp)
+
+    out = asyncio.run(
+        svc.search_scope(project_id="p", path="t", tool_json_path="", query="ERR_4012", top_k=3)
+    )
+
+    assert len(tp.multi_queries) == 1
+    ranks = [q["rank_by"][1] for q in tp.multi_queries[0]]
+    assert ranks == ["ANN", "BM25"]
+    # "a" appears in both lists, so it wins; the keyword-only hit is still returned
+    assert [r["chunk"]["id"] for r in out][0] == 1
+    assert {r["chunk"]["id"] for r in out} == {1, 2, 3}
+    assert out[0]["chunk"]["chunk_text"] == "alpha"
+
+
+def test_hybrid_falls_back_to_ann_and_backfills_text_from_db():
+    repo = FakeChunkRepo()
+    tp = FakeTurbopuffer([_row("a", 1, distance=0.0), _row("b", 2, distance=1.0)], [], fail_multi=True)
+    svc = _service(tp, repo)
+
+    out = asyncio.run(
+        svc.search_folder(project_id="p", folder_path="docs", query="q", top_k=5)
+    )
+
+    assert len(tp.queries) == 1
+    assert [r["score"] for r in out] == [1.0, 0.5]
+    assert [r["chunk"]["chunk_text"] for r in out] == ["db-1", "db-2"]
+    assert repo.requested == [[1, 2]]
+
+
+def test_offset_pages_past_the_per_page_cap():
+    ann = [_row(f"d{i}", i, f"text {i}") for i in range(30)]
+    tp = FakeTurbopuffer(ann, [])
+    svc = _service(tp)
+
+    page = asyncio.run(
+        svc.search_scope(
+            project_id="p", path="t", tool_json_path="", query="q",
+            top_k=50, offset=20, mode="vector",
+        )
+    )
+
+    # top_k is capped at 20 per page; offset 20 returns ranks 21-30
+    assert tp.queries[0][1] == 40
+    assert [r["chunk"]["id"] for r in page] == list(range(20, 30))
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            svc.search_scope(project_id="p", path="t", tool_json_path="", query="q", mode="bm25")
+        )
+
+
+def test_repeated_query_hits_caches_until_namespace_is_written():
+    tp = FakeTurbopuffer([_row("a", 1, "alpha")], [])
+    embedding = FakeEmbedding()
+    svc = _service(tp, embedding=embedding)
+
+    def search(q):
+        return asyncio.run(
+            svc.search_scope(project_id="p", path="t", tool_json_path="", query=q, mode="vector")
+        )
+
+    first = search("auth  middleware")
+    assert search("auth middleware") == first
+    assert embedding.calls == 1 and len(tp.queries) == 1
+
+    # A re-index bumps the watermark: the vector query runs again, the embedding is reused
+    svc._result_cache.invalidate_namespace(SearchService.build_namespace(project_id="p", path="t"))
+    search("auth middleware")
+    assert embedding.calls == 1 and len(tp.queries) == 2
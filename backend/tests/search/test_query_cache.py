@@ -0,0 +1,62 @@
+from src.infra.search.query_cache import (
+    QueryEmbeddingCache,
+    SearchResultCache,
+    normalize_query,
+)
+
+
+def test_normalize_query_collapses_whitespace_and_width():
+    assert normalize_query("auth \t middleware") == "auth middleware"
+    assert normalize_query("ＡＰＩ  key") == "API key"
+    assert normalize_query("API") != normalize_query("api")
+
+
+def test_embedding_cache_is_keyed_by_model():
+    cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=60)
+    cache.put("m1", "hello  world", [1.0])
+    assert cache.get("m1", "hello world") == [1.0]
+    assert cache.get("m2", "hello world") is None
+
+    # LRU eviction at max_entries
+    cache.put("m1", "a", [2.0])
+    cache.put("m1", "b", [3.0])
+    assert cache.get("m1", "hello world") is None
+
+    disabled = QueryEmbeddingCache(max_entries=0, ttl_seconds=60)
+    disabled.put("m1", "q", [1.0])
+    assert disabled.get("m1", "q") is None
+
+
+def test_result_cache_drops_pages_across_a_namespace_write():
+    cache = SearchResultCache(max_entries=8, ttl_seconds=60)
+    mark = cache.watermark("ns")
+    assert cache.put("ns", mark, ("q", 5), ["page"])
+    assert cache.get("ns", ("q", 5)) == ["page"]
+    assert cache.get("other", ("q", 5)) is None
+
+    cache.invalidate_namespace("ns")
+    assert cache.get("ns", ("q", 5)) is None
+
+    # A query that started before the write must not store its (stale) page
+    assert not cache.put("ns", mark, ("q", 5), ["stale"])
+    assert cache.get("ns", ("q", 5)) is None
+
+
+def test_result_cache_can_be_disabled():
+    cache = SearchResultCache(max_entries=8, ttl_seconds=60, enabled=False)
+    assert not cache.put("ns", cache.watermark("ns"), "k", 1)
+    assert cache.get("ns", "k") is None
+
+
+def test_result_cache_watermarks_are_bounded_and_never_reused():
+    cache = SearchResultCache(max_entries=2, ttl_seconds=60)
+    cache.invalidate_namespace("a")
+    mark = cache.watermark("a")
+    assert cache.put("a", mark, "k", ["old"])
+
+    # Evicting "a"'s mark must not revive pages stored under an earlier one
+    cache.invalidate_namespace("b")
+    cache.invalidate_namespace("c")
+    assert len(cache._watermarks) == 2
+    assert cache.watermark("a") != mark
+    assert cache.get("a", "k") is None
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.infra.turbopuffer.exceptions import TurbopufferNotFound
+from src.infra.turbopuffer.local_store import LocalVectorStore
+
+
+def _rows(n: int, dim: int = 8, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"doc-{i}",
+            "vector": [rng.uniform(-1, 1) for _ in range(dim)],
+            "file_type": "json" if i % 2 else "markdown",
+            "content": f"chunk {i} mentions ERR_{i}",
+        }
+        for i in range(n)
+    ]
+
+
+def test_exact_query_upsert_delete_and_reload(tmp_path):
+    store = LocalVectorStore(root=tmp_path)
+    rows = _rows(50)
+    asyncio.run(store.write("ns", upsert_rows=rows, distance_metric="cosine_distance"))
+
+    resp = asyncio.run(
+        store.query("ns", rank_by=("vector", "ANN", rows[7]["vector"]), top_k=3, include_attributes=True)
+    )
+    assert resp.rows[0].id == "doc-7"
+    assert resp.rows[0].distance == pytest.approx(0.0, abs=1e-5)
+    assert resp.rows[0].attributes["file_type"] == "json"
+
+    # Overwrite doc-7's vector and delete doc-8; both survive a reopen
+    asyncio.run(
+        store.write(
+            "ns",
+            upsert_rows=[{"id": "doc-7", "vector": rows[9]["vector"], "file_type": "json"}],
+            deletes=["doc-8"],
+        )
+    )
+    reopened = LocalVectorStore(root=tmp_path)
+    resp = asyncio.run(
+        reopened.query("ns", rank_by=("vector", "ANN", rows[8]["vector"]), top_k=50)
+    )
+    ids = [r.id for r in resp.rows]
+    assert "doc-8" not in ids and len(ids) == 49
+    meta = asyncio.run(reopened.metadata("ns"))
+    assert meta["approx_row_count"] == 49
+
+
+def test_filters_bm25_and_multi_query(tmp_path):
+    store = LocalVectorStore(root=tmp_path)
+    rows = _rows(20)
+    asyncio.run(
+        store.write(
+            "ns",
+            upsert_rows=rows,
+            schema={"content": {"type": "string", "full_text_search": True}},
+        )
+    )
+
+    resp = asyncio.run(
+        store.query(
+            "ns",
+            rank_by=("vector", "ANN", rows[0]["vector"]),
+            top_k=20,
+            filters=("And", [("file_type", "Eq", "json"), ("id", "NotEq", "x")]),
+            include_attributes=["file_type"],
+        )
+    )
+    assert {r.attributes["file_type"] for r in resp.rows} == {"json"}
+    assert len(resp.rows) == 10
+
+    multi = asyncio.run(
+        store.multi_query(
+            "ns",
+            queries=[
+                {"rank_by": ("vector", "ANN", rows[3]["vector"]), "top_k": 2},
+                {"rank_by": ("content", "BM25", "ERR_12"), "top_k": 2, "include_attributes": True},
+            ],
+        )
+    )
+    assert multi.results[0].rows[0].id == "doc-3"
+    assert multi.results[1].rows[0].id == "doc-12"
+    assert multi.results[1].rows[0].score > 0
+
+
+def test_ivf_search_matches_exact_for_self_queries(tmp_path):
+    store = LocalVectorStore(root=tmp_path, ivf_min_rows=400, nprobe=4)
+    rows = _rows(900, dim=16, seed=1)
+    asyncio.run(store.write("ns", upsert_rows=rows))
+
+    hits = 0
+    for i in range(0, 900, 45):
+        approx = asyncio.run(store.query("ns", rank_by=("vector", "ANN", rows[i]["vector"]), top_k=1))
+        hits += approx.rows[0].id == f"doc-{i}"
+    assert hits >= 18
+
+    # Rows written after the IVF build are still found
+    probe = [1.0] + [0.0] * 15
+    asyncio.run(store.write("ns", upsert_rows=[{"id": "late", "vector": probe}], deletes=["doc-0"]))
+    late = asyncio.run(store.query("ns", rank_by=("vector", "ANN", probe), top_k=1))
+    assert late.rows[0].id == "late"
+    gone = asyncio.run(store.query("ns", rank_by=("vector", "ANN", rows[0]["vector"]), top_k=1))
+    assert gone.rows[0].id != "doc-0"
+
+
+def test_delete_all_removes_namespace(tmp_path):
+    store = LocalVectorStore(root=tmp_path)
+    asyncio.run(store.write("project_1_folder_a/b", upsert_rows=_rows(3)))
+    listed = asyncio.run(store.list_namespaces(prefix="project_1"))
+    assert [n.id for n in listed.namespaces] == ["project_1_folder_a/b"]
+
+    asyncio.run(store.delete_all("project_1_folder_a/b"))
+    with pytest.raises(TurbopufferNotFound):
+        asyncio.run(store.query("project_1_folder_a/b", rank_by=("vector", "ANN", [0.0] * 8)))
+
+
+def test_second_store_on_same_root_sees_writes_without_slot_collisions(tmp_path):
+    # Two stores over one root behave like two worker processes: each keeps its
+    # own in-memory slot map and must catch up from disk before touching it
+    a = LocalVectorStore(root=tmp_path)
+    b = LocalVectorStore(root=tmp_path)
+    rows = _rows(40)
+    asyncio.run(a.write("ns", upsert_rows=rows[:20]))
+    asyncio.run(b.write("ns", upsert_rows=rows[20:30], deletes=["doc-0"]))
+    asyncio.run(a.write("ns", upsert_rows=rows[30:]))
+
+    for store in (a, b, LocalVectorStore(root=tmp_path)):
+        meta = asyncio.run(store.metadata("ns"))
+        assert meta["approx_row_count"] == 39
+        for i in (1, 25, 35):
+            resp = asyncio.run(store.query("ns", rank_by=("vector", "ANN", rows[i]["vector"]), top_k=1))
+            assert resp.rows[0].id == f"doc-{i}"
+
+    asyncio.run(b.delete_all("ns"))
+    with pytest.raises(TurbopufferNotFound):
+        asyncio.run(a.query("ns", rank_by=("vector", "ANN", rows[1]["vector"])))
+
+
+def _write_batches(root: str, offset: int) -> None:
+    store = LocalVectorStore(root=root)
+    rows = _rows(60)[offset : offset + 30]
+    for start in range(0, len(rows), 3):
+        asyncio.run(store.write("ns", upsert_rows=rows[start : start + 3]))
+
+
+def test_concurrent_writer_processes(tmp_path):
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_write_batches, args=(str(tmp_path), off)) for off in (0, 30)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(timeout=60)
+        assert p.exitcode == 0
+
+    store = LocalVectorStore(root=tmp_path)
+    rows = _rows(60)
+    assert asyncio.run(store.metadata("ns"))["approx_row_count"] == 60
+    for i in range(0, 60, 7):
+        resp = asyncio.run(store.query("ns", rank_by=("vector", "ANN", rows[i]["vector"]), top_k=1))
+        assert resp.rows[0].id == f"doc-{i}"
@@ -0,0 +1,47 @@
+-- ============================================================================
+-- claim_mut_version_outbox_batch — also return created_at
+-- ============================================================================
+-- Why
+--   The version outbox worker coalesces a project's claimed rows into one
+--   post-commit replay and projects the newest scope state last. UPDATE ...
+--   RETURNING gives no ordering guarantee, so the worker sorts each project's
+--   rows by (created_at, id) itself and needs created_at in the result.
+--   Adding a column to RETURNS TABLE changes the signature, so drop first.
+
+DROP FUNCTION IF EXISTS public.claim_mut_version_outbox_batch(INT);
+
+CREATE OR REPLACE FUNCTION public.claim_mut_version_outbox_batch(
+    p_limit INT DEFAULT 50
+) RETURNS TABLE (
+    id BIGINT,
+    project_id TEXT,
+    commit_id TEXT,
+    event_type TEXT,
+    payload JSONB,
+    attempts INT,
+    created_at TIMESTAMPTZ
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    WITH picked AS (
+        SELECT o.id
+          FROM public.mut_version_outbox o
+         WHERE o.processed_at IS NULL
+           AND (o.locked_at IS NULL OR o.locked_at < NOW() - INTERVAL '5 minutes')
+           AND o.created_at < NOW() - INTERVAL '15 seconds'
+           AND o.attempts < 25
+         ORDER BY o.created_at ASC, o.id ASC
+         LIMIT GREATEST(1, LEAST(COALESCE(p_limit, 50), 500))
+         FOR UPDATE SKIP LOCKED
+    )
+    UPDATE public.mut_version_outbox o
+       SET locked_at = NOW(),
+           attempts = o.attempts + 1,
+           last_error = NULL
+      FROM picked
+     WHERE o.id = picked.id
+    RETURNING o.id, o.project_id, o.commit_id, o.event_type, o.payload, o.attempts, o.created_at;
+END;
+$$;
@@ -0,0 +1,68 @@
+"""
+HuggingFace嵌入推理吞吐基准
+
+测量不同批大小下的吞吐(texts/sec)，用于为索引负载选择batch_size、
+线程数以及是否开启int8量化。
+
+用法:
+    python examples/benchmark_embedding.py --model BAAI/bge-small-zh-v1.5
+    python examples/benchmark_embedding.py --model ... --batch-sizes 1,8,32,64 --quantize --threads 4
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# 确保能够导入qllama包
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qllama.providers.huggingface import HuggingFaceProvider, HAS_TRANSFORMERS
+
+
+def make_texts(count: int, seed: int = 0):
+    """生成长度不一的测试文本，近似真实文档分块的长度分布"""
+    rng = random.Random(seed)
+    words = ["puppy", "context", "index", "vector", "文档", "检索", "存储", "scope", "commit", "chunk"]
+    return [
+        " ".join(rng.choice(words) for _ in range(rng.randint(8, 256)))
+        for _ in range(count)
+    ]
+
+
+def run_benchmark(model_name: str, batch_sizes, count: int, quantize: bool, threads, device):
+    provider = HuggingFaceProvider(device=device, quantize=quantize, num_threads=threads)
+    texts = make_texts(count)
+
+    # 预热：加载模型并触发首次推理
+    provider.embed(model_name, texts[:4])
+
+    print(f"模型: {model_name}  设备: {device or 'auto'}  量化: {'int8' if quantize else '否'}  线程: {threads or '默认'}")
+    print(f"{'batch_size':>10}  {'texts/sec':>10}  {'总耗时(s)':>10}")
+    for batch_size in batch_sizes:
+        start = time.perf_counter()
+        provider.embed(model_name, texts, batch_size=batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"{batch_size:>10}  {count / elapsed:>10.1f}  {elapsed:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HuggingFace嵌入推理吞吐基准")
+    parser.add_argument("--model", required=True, help="HuggingFace模型名称")
+    parser.add_argument("--batch-sizes", default="1,8,16,32,64", help="逗号分隔的批大小列表")
+    parser.add_argument("--count", type=int, default=512, help="测试文本数量")
+    parser.add_argument("--quantize", action="store_true", help="启用int8动态量化(仅CPU)")
+    parser.add_argument("--threads", type=int, default=None, help="torch CPU线程数")
+    parser.add_argument("--device", default=None, help="推理设备，如cpu/cuda")
+    args = parser.parse_args()
+
+    if not HAS_TRANSFORMERS:
+        print("❌ 未安装transformers/torch，无法运行基准")
+        return
+
+    batch_sizes = [int(b) for b in args.batch_sizes.split(",") if b.strip()]
+    run_benchmark(args.model, batch_sizes, args.count, args.quantize, args.threads, args.device)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,14 +18,32 @@ except ImportError:
 class HuggingFaceProvider(Provider):
     """HuggingFace提供商实现"""
 
-    def __init__(self, cache_dir: Optional[str] = None):
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        device: Optional[str] = None,
+        batch_size: int = 32,
+        max_length: int = 512,
+        quantize: bool = False,
+        num_threads: Optional[int] = None,
+    ):
         """
         初始化HuggingFace提供商
         
         Args:
             cache_dir: 模型缓存目录，默认为None(使用transformers默认缓存目录)
+            device: 推理设备，默认为None(有GPU用cuda，否则cpu)
+            batch_size: 嵌入推理的批大小
+            max_length: 单条文本的最大token数，超出部分截断
+            quantize: 是否对嵌入模型做int8动态量化(仅CPU)
+            num_threads: torch CPU推理线程数，默认为None(使用torch默认值)
         """
         self.cache_dir = cache_dir
+        self.device = device
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.quantize = quantize
+        self.num_threads = num_threads
         self._loaded_models = {}
         
     @classmethod
@@ -115,32 +133,84 @@ class HuggingFaceProvider(Provider):
         
         return self._loaded_models[cache_key]
     
+    def _get_embedding_model(self, model_name: str, device: str, quantize: bool):
+        """
+        获取常驻的嵌入模型：只在首次加载时移动到设备、切换eval模式并按需量化，
+        之后的请求直接复用
+        """
+        cache_key = f"{model_name}_{ModelCapability.EMBEDDING.name}_{device}_{'int8' if quantize else 'fp'}"
+        
+        if cache_key not in self._loaded_models:
+            model = AutoModel.from_pretrained(model_name, cache_dir=self.cache_dir)
+            tokenizer = AutoTokenizer.from_pretrained(model_name, cache_dir=self.cache_dir)
+            model.eval()
+            if quantize:
+                if device != "cpu":
+                    raise ValueError("int8 dynamic quantization is only supported on cpu")
+                model = torch.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            model = model.to(device)
+            self._loaded_models[cache_key] = (model, tokenizer)
+        
+        return self._loaded_models[cache_key]
+    
     def embed(self, model_name: str, texts: List[str], **kwargs) -> List[List[float]]:
-        """生成嵌入向量"""
+        """
+        生成嵌入向量
+        
+        按长度排序后分批推理，使每批的padding最少；池化时用attention mask
+        排除padding token。结果按输入顺序返回。
+        
+        可选参数(未指定时使用初始化时的设置):
+            device, batch_size, max_length, quantize, num_threads
+            normalize: 是否对向量做L2归一化，默认False
+        """
         if not HAS_TRANSFORMERS:
             raise RuntimeError("transformers library is not installed")
-            
-        # 获取或加载模型
-        model, tokenizer = self._get_model(model_name, ModelCapability.EMBEDDING)
+        if not texts:
+            return []
         
-        device = kwargs.get("device", "cuda" if torch.cuda.is_available() else "cpu")
-        model = model.to(device)
+        device = kwargs.get("device") or self.device or ("cuda" if torch.cuda.is_available() else "cpu")
+        batch_size = max(1, int(kwargs.get("batch_size", self.batch_size)))
+        max_length = int(kwargs.get("max_length", self.max_length))
+        quantize = bool(kwargs.get("quantize", self.quantize))
+        num_threads = kwargs.get("num_threads", self.num_threads)
+        normalize = bool(kwargs.get("normalize", False))
         
-        results = []
-        for text in texts:
-            # 对文本进行编码
-            inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True)
-            inputs = {k: v.to(device) for k, v in inputs.items()}
-            
-            # 生成嵌入向量
-            with torch.no_grad():
+        if num_threads and torch.get_num_threads() != int(num_threads):
+            torch.set_num_threads(int(num_threads))
+        
+        # 获取或加载模型(常驻，已在目标设备上)
+        model, tokenizer = self._get_embedding_model(model_name, device, quantize)
+        
+        # 按长度降序排列，长度相近的文本进入同一批
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        
+        with torch.inference_mode():
+            for start in range(0, len(order), batch_size):
+                batch_ids = order[start:start + batch_size]
+                inputs = tokenizer(
+                    [texts[i] for i in batch_ids],
+                    return_tensors="pt",
+                    padding=True,
+                    truncation=True,
+                    max_length=max_length,
+                )
+                inputs = {k: v.to(device) for k, v in inputs.items()}
                 outputs = model(**inputs)
                 
-            # 使用最后一层隐藏状态的平均值作为嵌入向量
-            embeddings = outputs.last_hidden_state.mean(dim=1)
-            embedding = embeddings[0].cpu().numpy().tolist()
-            results.append(embedding)
-            
+                # 使用最后一层隐藏状态在非padding token上的平均值作为嵌入向量
+                mask = inputs["attention_mask"].unsqueeze(-1).to(outputs.last_hidden_state.dtype)
+                summed = (outputs.last_hidden_state * mask).sum(dim=1)
+                embeddings = summed / mask.sum(dim=1).clamp(min=1e-9)
+                if normalize:
+                    embeddings = torch.nn.functional.normalize(embeddings, p=2, dim=1)
+                
+                for i, embedding in zip(batch_ids, embeddings.float().cpu().tolist()):
+                    results[i] = embedding
+        
         return results
     
     def generate(self, model_name: str, prompt: str, **kwargs) -> str: